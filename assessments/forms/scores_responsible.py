@@ -37,6 +37,7 @@ from base.forms.learning_unit.search.simple import filter_by_entities
 from base.models.entity_version import EntityVersion
 from base.models.learning_component_year import LearningComponentYear
 from base.models.learning_unit_year import LearningUnitYear, LearningUnitYearQuerySet
+from base.models.person import get_name_filter
 
 
 class ScoresResponsiblesFilter(django_filters.FilterSet):
@@ -81,15 +82,14 @@ class ScoresResponsiblesFilter(django_filters.FilterSet):
 
     def filter_tutor(self, queryset, name, value):
         return queryset.filter(
-            Q(learningcomponentyear__attributionchargenew__attribution__tutor__person__first_name__icontains=value) |
-            Q(learningcomponentyear__attributionchargenew__attribution__tutor__person__last_name__icontains=value)
+            get_name_filter(
+                value,
+                lookup_prefix='learningcomponentyear__attributionchargenew__attribution__tutor__person__'
+            )
         )
 
     def filter_score_responsible(self, queryset, name, value):
-        return queryset.filter(
-            Q(scoreresponsible__tutor__person__first_name__icontains=value) |
-            Q(scoreresponsible__tutor__person__last_name__icontains=value)
-        )
+        return queryset.filter(get_name_filter(value, lookup_prefix='scoreresponsible__tutor__person__'))
 
     def filter_requirement(self, queryset, name, value):
         return filter_by_entities(name, queryset, value, self.form.cleaned_data['with_entity_subordinated'])
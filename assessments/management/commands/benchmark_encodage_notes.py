@@ -0,0 +1,63 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import time
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from infrastructure.encodage_de_notes.encodage.repository.note_etudiant import NoteEtudiantRepository
+
+
+class Command(BaseCommand):
+    help = 'Replay the encoding of all the scores of an exam session, one by one and in bulk. Nothing is saved.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('year', type=int, help='Academic year of the exam session')
+        parser.add_argument('session', type=int, help='Number of the exam session')
+        parser.add_argument('--skip-one-by-one', action='store_true', help='Only replay the encoding in bulk')
+
+    def handle(self, *args, **options):
+        notes = NoteEtudiantRepository.search(annee_academique=options['year'], numero_session=options['session'])
+        self.stdout.write(
+            '{} scores found for session {} of {}'.format(len(notes), options['session'], options['year'])
+        )
+
+        if not options['skip_one_by_one']:
+            duration, queries = self._measure(lambda: [NoteEtudiantRepository.save(note) for note in notes])
+            self.stdout.write('One by one : {:.2f}s - {} queries'.format(duration, queries))
+
+        duration, queries = self._measure(lambda: NoteEtudiantRepository.save_all(notes))
+        self.stdout.write(self.style.SUCCESS('In bulk : {:.2f}s - {} queries'.format(duration, queries)))
+
+    @staticmethod
+    def _measure(save_notes):
+        with transaction.atomic(), CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            save_notes()
+            duration = time.perf_counter() - start
+            transaction.set_rollback(True)
+        return duration, len(context.captured_queries)
@@ -0,0 +1,46 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.core.management import BaseCommand
+
+from assessments.models.score_encoding_progress import ScoreEncodingProgress
+from infrastructure.encodage_de_notes.shared_kernel.service.progression_encodage_notes import \
+    mettre_a_jour_progressions
+
+
+class Command(BaseCommand):
+    help = 'Recompute the score encoding progress counters of an exam session from the exam enrollments.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('year', type=int, help='Academic year of the exam session')
+        parser.add_argument('session', type=int, help='Number of the exam session')
+
+    def handle(self, *args, **options):
+        mettre_a_jour_progressions(options['year'], options['session'])
+        count = ScoreEncodingProgress.objects.filter(
+            academic_year=options['year'],
+            session_number=options['session'],
+        ).count()
+        self.stdout.write(self.style.SUCCESS('{} progress counters rebuilt'.format(count)))
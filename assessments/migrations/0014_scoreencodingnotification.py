@@ -0,0 +1,26 @@
+# Generated by Django 2.2.13 on 2026-10-18 10:00
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0013_remove_scoresheetaddress_entity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreEncodingNotification',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('program_manager_global_id', models.CharField(max_length=10)),
+                ('academic_year', models.IntegerField()),
+                ('session_number', models.IntegerField()),
+                ('encoded_scores', django.contrib.postgres.fields.jsonb.JSONField(default=list)),
+                ('incomplete_cohorts_before_encoding', django.contrib.postgres.fields.jsonb.JSONField(default=list)),
+            ],
+        ),
+    ]
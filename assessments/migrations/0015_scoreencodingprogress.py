@@ -0,0 +1,42 @@
+# Generated by Django 2.2.13 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0014_scoreencodingnotification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreEncodingProgress',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('learning_unit_code', models.CharField(db_index=True, max_length=20)),
+                ('academic_year', models.IntegerField()),
+                ('session_number', models.IntegerField()),
+                ('cohort_name', models.CharField(max_length=40)),
+                ('deadline', models.DateField(blank=True, null=True)),
+                ('total_count', models.IntegerField(default=0)),
+                ('draft_count', models.IntegerField(default=0)),
+                ('submitted_count', models.IntegerField(default=0)),
+                ('peps_students_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='scoreencodingprogress',
+            index=models.Index(
+                fields=['academic_year', 'session_number', 'cohort_name'],
+                name='score_encoding_progress_idx'
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='scoreencodingprogress',
+            constraint=models.UniqueConstraint(
+                fields=('learning_unit_code', 'academic_year', 'session_number', 'cohort_name', 'deadline'),
+                name='unique_score_encoding_progress'
+            ),
+        ),
+    ]
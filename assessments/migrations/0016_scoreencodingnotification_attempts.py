@@ -0,0 +1,18 @@
+# Generated by Django 2.2.24 on 2026-10-18 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0015_scoreencodingprogress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scoreencodingnotification',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
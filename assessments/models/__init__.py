@@ -2,3 +2,5 @@ from assessments.models import score_responsible
 from assessments.models import score_sheet_address
 from assessments.models import scores_encoding
 from assessments.models import score_history
+from assessments.models import score_encoding_notification
+from assessments.models import score_encoding_progress
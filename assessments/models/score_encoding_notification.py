@@ -0,0 +1,46 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib.postgres.fields import JSONField
+from django.db import models
+
+
+class ScoreEncodingNotification(models.Model):
+    """
+    Scores encoded by a program manager, waiting to be notified by the assessments.tasks.notify_score_encoding task.
+    """
+    created = models.DateTimeField(auto_now_add=True)
+    program_manager_global_id = models.CharField(max_length=10)
+    academic_year = models.IntegerField()
+    session_number = models.IntegerField()
+    # List of {"noma": ..., "code_unite_enseignement": ...}
+    encoded_scores = JSONField(default=list)
+    # List of [code_unite_enseignement, nom_cohorte]
+    incomplete_cohorts_before_encoding = JSONField(default=list)
+    # Failed notifications of these scores, not retried anymore once the limit is reached
+    attempts = models.PositiveSmallIntegerField(default=0)
+
+    def __str__(self):
+        return "{} - {} - {}".format(self.program_manager_global_id, self.academic_year, self.session_number)
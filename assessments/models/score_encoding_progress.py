@@ -0,0 +1,62 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.db import models
+
+
+class ScoreEncodingProgress(models.Model):
+    """
+    Counters of the scores of a learning unit (or class) for a cohort and a deadline.
+    Refreshed each time scores, exam enrollments, deadlines or specific profiles of its students are saved (see
+    infrastructure.encodage_de_notes.shared_kernel.service.progression_encodage_notes) and rebuilt every night.
+    """
+    learning_unit_code = models.CharField(max_length=20, db_index=True)
+    academic_year = models.IntegerField()
+    session_number = models.IntegerField()
+    cohort_name = models.CharField(max_length=40)
+    deadline = models.DateField(blank=True, null=True)
+    total_count = models.IntegerField(default=0)
+    draft_count = models.IntegerField(default=0)
+    submitted_count = models.IntegerField(default=0)
+    peps_students_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['learning_unit_code', 'academic_year', 'session_number', 'cohort_name', 'deadline'],
+                name='unique_score_encoding_progress'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['academic_year', 'session_number', 'cohort_name'], name='score_encoding_progress_idx'),
+        ]
+
+    def __str__(self):
+        return "{} - {} - {} - {}".format(
+            self.learning_unit_code,
+            self.academic_year,
+            self.session_number,
+            self.cohort_name,
+        )
@@ -23,10 +23,16 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 
 from assessments.business import scores_encodings_deadline
+from base.models.exam_enrollment import ExamEnrollment
+from base.models.session_exam_deadline import SessionExamDeadline
+from base.models.student_specific_profile import StudentSpecificProfile
 from base.signals import publisher
+from infrastructure.encodage_de_notes.shared_kernel.service.progression_encodage_notes import \
+    planifier_mise_a_jour_progressions
 
 
 @receiver(publisher.compute_scores_encodings_deadlines)
@@ -42,3 +48,28 @@ def compute_student_score_encoding_deadline(sender, **kwargs):
 @receiver(publisher.compute_all_scores_encodings_deadlines)
 def compute_all_scores_encodings_deadlines(sender, **kwargs):
     scores_encodings_deadline.recompute_all_deadlines(kwargs['academic_calendar'])
+
+
+@receiver(post_save, sender=ExamEnrollment)
+@receiver(pre_delete, sender=ExamEnrollment)
+def refresh_score_encoding_progress_of_exam_enrollment(sender, instance, **kwargs):
+    planifier_mise_a_jour_progressions(ExamEnrollment.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=SessionExamDeadline)
+@receiver(pre_delete, sender=SessionExamDeadline)
+def refresh_score_encoding_progress_of_deadline(sender, instance, **kwargs):
+    planifier_mise_a_jour_progressions(
+        ExamEnrollment.objects.filter(
+            learning_unit_enrollment__offer_enrollment_id=instance.offer_enrollment_id,
+            session_exam__number_session=instance.number_session,
+        )
+    )
+
+
+@receiver(post_save, sender=StudentSpecificProfile)
+@receiver(pre_delete, sender=StudentSpecificProfile)
+def refresh_score_encoding_progress_of_student_profile(sender, instance, **kwargs):
+    planifier_mise_a_jour_progressions(
+        ExamEnrollment.objects.filter(learning_unit_enrollment__offer_enrollment__student_id=instance.student_id)
+    )
@@ -1,4 +1,6 @@
 from . import check_academic_calendar
+from . import notify_score_encoding
+from . import rebuild_score_encoding_progress
 
 from celery.schedules import crontab
 from backoffice.celery import app as celery_app
@@ -7,4 +9,12 @@ celery_app.conf.beat_schedule.update({
         'task': 'assessments.tasks.check_academic_calendar.run',
         'schedule': crontab(minute=0, hour=0, day_of_month='*', month_of_year='*', day_of_week=0)
     },
+    '|Assessments| Notify score encoding': {
+        'task': 'assessments.tasks.notify_score_encoding.run',
+        'schedule': crontab(minute='*'),
+    },
+    '|Assessments| Rebuild score encoding progress': {
+        'task': 'assessments.tasks.rebuild_score_encoding_progress.run',
+        'schedule': crontab(minute=0, hour=3, day_of_month='*', month_of_year='*', day_of_week='*')
+    },
 })
@@ -0,0 +1,58 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+
+from django.conf import settings
+
+from backoffice.celery import app as celery_app
+from infrastructure.encodage_de_notes.encodage.domain.service.notifier_encodage_notes import \
+    NotifierEncodageNotesEnDiffere
+from infrastructure.encodage_de_notes.encodage.repository.note_etudiant import NoteEtudiantRepository
+from infrastructure.encodage_de_notes.shared_kernel.service.attribution_enseignant import \
+    AttributionEnseignantTranslator
+from infrastructure.encodage_de_notes.shared_kernel.service.inscription_examen import InscriptionExamenTranslator
+from infrastructure.encodage_de_notes.shared_kernel.service.signaletique_etudiant import \
+    SignaletiqueEtudiantTranslator
+from infrastructure.encodage_de_notes.soumission.domain.service.signaletique_personne import \
+    SignaletiquePersonneTranslator
+from infrastructure.encodage_de_notes.soumission.repository.adresse_feuille_de_notes import \
+    AdresseFeuilleDeNotesRepository
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+
+@celery_app.task
+def run() -> dict:
+    nombre_envois = NotifierEncodageNotesEnDiffere.envoyer_notifications_en_attente(
+        NoteEtudiantRepository(),
+        AttributionEnseignantTranslator(),
+        SignaletiquePersonneTranslator(),
+        SignaletiqueEtudiantTranslator(),
+        AdresseFeuilleDeNotesRepository(),
+        InscriptionExamenTranslator(),
+    )
+    logger.info("%s score encoding notification batches sent", nombre_envois)
+    return {'Score encoding notification batches sent': nombre_envois}
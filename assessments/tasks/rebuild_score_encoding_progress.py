@@ -0,0 +1,49 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+
+from django.conf import settings
+
+from backoffice.celery import app as celery_app
+from base.models.academic_year import current_academic_years
+from base.models.enums.number_session import NUMBERS_SESSION
+from infrastructure.encodage_de_notes.shared_kernel.service.progression_encodage_notes import \
+    mettre_a_jour_progressions
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+
+@celery_app.task
+def run() -> dict:
+    # Exam enrollments and deadlines are also modified in bulk (without signals) by the synchronizations
+    annees = set()
+    for academic_year in current_academic_years():
+        annees |= {academic_year.year - 1, academic_year.year}
+    for annee in sorted(annees):
+        for numero_session, _ in NUMBERS_SESSION:
+            mettre_a_jour_progressions(annee, numero_session)
+    logger.info("Score encoding progress rebuilt for years %s", sorted(annees))
+    return {'Score encoding progress rebuilt for years': sorted(annees)}
@@ -39,3 +39,6 @@ admin.site.register(tutor_application.TutorApplication,
 
 admin.site.register(attribution_class.AttributionClass,
                     attribution_class.AttributionClassAdmin)
+
+admin.site.register(application_mailing.ApplicationMailing,
+                    application_mailing.ApplicationMailingAdmin)
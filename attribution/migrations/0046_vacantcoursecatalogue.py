@@ -0,0 +1,47 @@
+# Generated by Django 2.2.24 on 2026-10-18 16:00
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0624_learningunitenrollment_full_class_code'),
+        ('attribution', '0045_auto_20210318_0949'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='VacantCourseCatalogue',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=15)),
+                ('year', models.IntegerField()),
+                ('title', models.TextField(blank=True, default='')),
+                ('is_in_team', models.BooleanField(default=False)),
+                ('vacant_declaration_type', models.CharField(blank=True, max_length=100, null=True)),
+                ('lecturing_volume_available', models.DecimalField(decimal_places=2, max_digits=6)),
+                ('practical_volume_available', models.DecimalField(decimal_places=2, max_digits=6)),
+                ('allocation_entity', models.CharField(blank=True, max_length=20, null=True)),
+                ('allocation_entity_parents', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=20), default=list, size=None)),
+                ('learning_unit_year', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='base.LearningUnitYear')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='vacantcoursecatalogue',
+            index=models.Index(fields=['year', 'allocation_entity'], name='vacant_course_entity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacantcoursecatalogue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['allocation_entity_parents'], name='vacant_course_parents_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacantcoursecatalogue',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['code'], name='vacant_course_code_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 2.2.24 on 2026-10-18 17:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0624_learningunitenrollment_full_class_code'),
+        ('attribution', '0046_vacantcoursecatalogue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationMailing',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('campaign', models.CharField(db_index=True, max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('sent', models.BooleanField(default=False)),
+                ('error', models.TextField(blank=True, default='')),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='base.Person')),
+            ],
+            options={
+                'unique_together': {('campaign', 'person')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.24 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attribution', '0047_applicationmailing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationmailing',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from attribution.models import application_mailing
 from attribution.models import attribution_charge_new
 from attribution.models import attribution_class
 from attribution.models import attribution_new
 from attribution.models import tutor_application
+from attribution.models import vacant_course_catalogue
@@ -0,0 +1,56 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib import admin
+from django.db import models
+
+
+class ApplicationMailingAdmin(admin.ModelAdmin):
+    list_display = ('campaign', 'person', 'processed_at', 'sent', 'attempts', 'error')
+    list_filter = ('campaign', 'sent')
+    raw_id_fields = ('person', )
+    search_fields = ['person__first_name', 'person__last_name', 'person__global_id']
+
+
+class ApplicationMailing(models.Model):
+    """
+    One mail of a mailing campaign of the application context.
+    Rows are planned at the start of a campaign and flagged as processed once the mail was sent (or skipped),
+    so that a campaign interrupted by a failure resumes where it stopped
+    (see infrastructure.application.services.mailing).
+    """
+    campaign = models.CharField(max_length=100, db_index=True)
+    person = models.ForeignKey('base.Person', on_delete=models.CASCADE)
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    sent = models.BooleanField(default=False)
+    error = models.TextField(blank=True, default='')
+    attempts = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('campaign', 'person')
+
+    def __str__(self):
+        return "{} - {}".format(self.campaign, self.person)
@@ -0,0 +1,57 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+
+class VacantCourseCatalogue(models.Model):
+    """
+    Vacant courses of an academic year as searched by the tutors during the application period.
+    Rebuilt by the task attribution.tasks.refresh_vacant_course_catalogue and refreshed when a course or its components
+    change (see infrastructure.application.repository.vacant_course).
+    """
+    learning_unit_year = models.OneToOneField('base.LearningUnitYear', on_delete=models.CASCADE, related_name='+')
+    code = models.CharField(max_length=15)
+    year = models.IntegerField()
+    title = models.TextField(blank=True, default='')
+    is_in_team = models.BooleanField(default=False)
+    vacant_declaration_type = models.CharField(max_length=100, blank=True, null=True)
+    lecturing_volume_available = models.DecimalField(max_digits=6, decimal_places=2)
+    practical_volume_available = models.DecimalField(max_digits=6, decimal_places=2)
+    allocation_entity = models.CharField(max_length=20, blank=True, null=True)
+    # Acronyms of the allocation entity and all its parents
+    allocation_entity_parents = ArrayField(models.CharField(max_length=20), default=list)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['year', 'allocation_entity'], name='vacant_course_entity_idx'),
+            GinIndex(fields=['allocation_entity_parents'], name='vacant_course_parents_idx'),
+            GinIndex(fields=['code'], name='vacant_course_code_trgm_idx', opclasses=['gin_trgm_ops']),
+        ]
+
+    def __str__(self):
+        return "{} - {}".format(self.code, self.year)
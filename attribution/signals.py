@@ -0,0 +1,71 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from attribution.tasks import refresh_vacant_course_catalogue
+from base.models.entity_version import EntityVersion
+from base.models.learning_component_year import LearningComponentYear
+from base.models.learning_container_year import LearningContainerYear
+from base.models.learning_unit_year import LearningUnitYear
+from base.models.proposal_learning_unit import ProposalLearningUnit
+from education_group import publisher
+from infrastructure.application.repository import vacant_course
+
+
+@receiver([post_save, post_delete], sender=LearningComponentYear)
+@receiver([post_save, post_delete], sender=ProposalLearningUnit)
+def refresh_vacant_course_of_learning_unit_year(sender, instance, **kwargs):
+    if settings.VACANT_COURSE_CATALOGUE_ENABLED:
+        vacant_course.refresh_vacant_course_catalogue_of_learning_unit_years([instance.learning_unit_year_id])
+
+
+@receiver(post_save, sender=LearningUnitYear)
+def refresh_vacant_course(sender, instance, **kwargs):
+    if settings.VACANT_COURSE_CATALOGUE_ENABLED:
+        vacant_course.refresh_vacant_course_catalogue_of_learning_unit_years([instance.pk])
+
+
+@receiver(publisher.learning_unit_years_created)
+def refresh_vacant_courses_of_created_learning_unit_years(sender, learning_unit_year_ids, **kwargs):
+    if settings.VACANT_COURSE_CATALOGUE_ENABLED:
+        vacant_course.refresh_vacant_course_catalogue_of_learning_unit_years(learning_unit_year_ids)
+
+
+@receiver(post_save, sender=LearningContainerYear)
+def refresh_vacant_courses_of_container(sender, instance, **kwargs):
+    if settings.VACANT_COURSE_CATALOGUE_ENABLED:
+        vacant_course.refresh_vacant_course_catalogue_of_learning_unit_years(
+            LearningUnitYear.objects.filter(learning_container_year=instance).values_list('pk', flat=True)
+        )
+
+
+@receiver([post_save, post_delete], sender=EntityVersion)
+def refresh_vacant_course_catalogue_entities(sender, **kwargs):
+    if settings.VACANT_COURSE_CATALOGUE_ENABLED:
+        transaction.on_commit(lambda: refresh_vacant_course_catalogue.run.delay(only_if_entities_changed=True))
@@ -1,4 +1,5 @@
 from . import check_academic_calendar
+from . import refresh_vacant_course_catalogue
 from . import send_attribution_end_date_reached_summary
 
 from celery.schedules import crontab
@@ -10,6 +11,10 @@ celery_app.conf.beat_schedule.update({
     },
     '|Attribution| Send attributions about to expired': {
         'task': 'attribution.tasks.send_attribution_end_date_reached_summary.run',
-        'schedule': crontab(minute=0, hour=16, day_of_month='*', month_of_year='*', day_of_week=0)
+        'schedule': crontab(minute=0, hour=16, day_of_month='*', month_of_year='*', day_of_week='*')
+    },
+    '|Attribution| Refresh vacant course catalogue': {
+        'task': 'attribution.tasks.refresh_vacant_course_catalogue.run',
+        'schedule': crontab(minute=30, hour=2, day_of_month='*', month_of_year='*', day_of_week='*')
     },
 })
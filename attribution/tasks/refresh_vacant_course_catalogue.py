@@ -0,0 +1,62 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+from typing import List
+
+from django.conf import settings
+
+from attribution.calendar.application_courses_calendar import ApplicationCoursesCalendar
+from backoffice.celery import app as celery_app
+from infrastructure.application.repository import vacant_course
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+
+@celery_app.task
+def run(years: List[int] = None, only_if_entities_changed: bool = False) -> dict:
+    """
+    Rebuild the vacant course catalogue of the years (default: the years of the opened and next application periods)
+    """
+    if not settings.VACANT_COURSE_CATALOGUE_ENABLED:
+        return {}
+    years = years or _get_application_years()
+    refreshed_years = []
+    for year in years:
+        if only_if_entities_changed and vacant_course.is_vacant_course_catalogue_up_to_date_with_entities(year):
+            continue
+        vacant_course.refresh_vacant_course_catalogue(year)
+        refreshed_years.append(year)
+    logger.info("Vacant course catalogue refreshed for years %s", refreshed_years)
+    return {'Vacant course catalogue refreshed': refreshed_years}
+
+
+def _get_application_years() -> List[int]:
+    calendar = ApplicationCoursesCalendar()
+    years = set(calendar.get_target_years_opened())
+    next_event = calendar.get_next_academic_event()
+    if next_event:
+        years.add(next_event.authorized_target_year)
+    return sorted(years)
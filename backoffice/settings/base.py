@@ -202,6 +202,9 @@ DATABASES = {
 
 AUTHENTICATION_BACKENDS = os.environ.get('AUTHENTICATION_BACKENDS', 'django.contrib.auth.backends.ModelBackend').split()
 PERMISSION_CACHE_ENABLED = os.environ.get('PERMISSION_CACHE_ENABLED', 'True').lower() == 'true'
+# Cache the result of has_perm(perm, obj) on the user object, i.e. for the duration of the request.
+# The results are forgotten when a model is saved or deleted.
+PERMISSION_RESULT_CACHE_ENABLED = os.environ.get('PERMISSION_RESULT_CACHE_ENABLED', 'True').lower() == 'true'
 
 # Internationalization
 # https://docs.djangoproject.com/en/1.9/topics/i18n/
@@ -497,6 +500,32 @@ else:
 
 CACHES = {"default": CACHE_CONFIG}
 
+# Program trees are serialized in the cache above and invalidated when their structure changes.
+# The timeout bounds the staleness of node data which is not watched (ex: entity acronyms)
+PROGRAM_TREE_CACHE_ENABLED = os.environ.get(
+    'PROGRAM_TREE_CACHE_ENABLED', 'False' if TESTING else 'True'
+).lower() == 'true'
+PROGRAM_TREE_CACHE_TIMEOUT = int(os.environ.get('PROGRAM_TREE_CACHE_TIMEOUT', 3600))
+ENTITY_HIERARCHY_CACHE_ENABLED = os.environ.get(
+    'ENTITY_HIERARCHY_CACHE_ENABLED', 'False' if TESTING else 'True'
+).lower() == 'true'
+# All the academic events are kept in memory by each process and reloaded when a calendar is saved
+ACADEMIC_CALENDAR_CACHE_ENABLED = os.environ.get(
+    'ACADEMIC_CALENDAR_CACHE_ENABLED', 'False' if TESTING else 'True'
+).lower() == 'true'
+# General information served to the public website, kept serialized in the cache and rebuilt by a Celery task
+# The timeout bounds the staleness of publications which depend on data which is not watched
+GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED = os.environ.get(
+    'GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED', 'False' if TESTING else 'True'
+).lower() == 'true'
+GENERAL_INFORMATION_PUBLICATION_CACHE_TIMEOUT = int(
+    os.environ.get('GENERAL_INFORMATION_PUBLICATION_CACHE_TIMEOUT', 86400)
+)
+# Vacant courses searched during the application period are read from a catalogue rebuilt by a Celery task
+VACANT_COURSE_CATALOGUE_ENABLED = os.environ.get(
+    'VACANT_COURSE_CATALOGUE_ENABLED', 'False' if TESTING else 'True'
+).lower() == 'true'
+
 
 WAFFLE_FLAG_DEFAULT = os.environ.get("WAFFLE_FLAG_DEFAULT", "False").lower() == 'true'
 
@@ -553,5 +582,9 @@ REGISTRATION_ADMINISTRATION_URL = os.environ.get('REGISTRATION_SERVICE_URL', '')
 OSIS_EXPORT_ASYNCHRONOUS_MANAGER_CLS = os.environ.get(
     "OSIS_EXPORT_ASYNCHRONOUS_MANAGER_CLS", "backoffice.settings.osis_export.async_manager.AsyncTaskManager"
 )
+# Excel exports generated by Celery (base.business.async_excel_export) : still pending after the timeout (in seconds),
+# they are considered lost ; their files are deleted after the retention period (in days)
+EXCEL_EXPORT_PENDING_TIMEOUT = int(os.environ.get("EXCEL_EXPORT_PENDING_TIMEOUT", 3600))
+EXCEL_EXPORT_RETENTION_DAYS = int(os.environ.get("EXCEL_EXPORT_RETENTION_DAYS", 7))
 
 OSIS_DOCUMENT_API_SHARED_SECRET = os.environ.get("OSIS_DOCUMENT_API_SHARED_SECRET", "")
@@ -23,8 +23,18 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.pagination import LimitOffsetPagination, CursorPagination
 
 
 class LimitOffsetPaginationWithUpperBound(LimitOffsetPagination):
     max_limit = 100
+
+
+class KeysetPaginationWithUpperBound(CursorPagination):
+    """
+    Paginate on an indexed unique key (WHERE key > last_key LIMIT n) instead of OFFSET,
+    so that the cost of a page does not depend on its depth.
+    """
+    ordering = 'id'
+    page_size_query_param = 'limit'
+    max_page_size = 100
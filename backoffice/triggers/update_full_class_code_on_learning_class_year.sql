@@ -0,0 +1,22 @@
+-- Ce trigger répercute la modification de l acronyme d une classe (ou de son partim)
+-- dans le champ full_class_code des inscriptions à cette classe.
+
+CREATE OR REPLACE FUNCTION update_full_class_code_on_learning_class_year() RETURNS TRIGGER AS
+$$
+BEGIN
+    -- La mise à jour déclenche compute_learning_unit_enrollment_full_class_code sur chaque inscription
+    UPDATE public.base_learningunitenrollment
+    SET learning_class_year_id = learning_class_year_id
+    WHERE learning_class_year_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS UPDATE_FULL_CLASS_CODE_ON_LEARNING_CLASS_YEAR ON public.learning_unit_learningclassyear;
+CREATE TRIGGER UPDATE_FULL_CLASS_CODE_ON_LEARNING_CLASS_YEAR
+    AFTER UPDATE OF acronym, learning_component_year_id
+    ON public.learning_unit_learningclassyear
+    FOR EACH ROW
+    WHEN (OLD.acronym IS DISTINCT FROM NEW.acronym
+        OR OLD.learning_component_year_id IS DISTINCT FROM NEW.learning_component_year_id)
+EXECUTE PROCEDURE update_full_class_code_on_learning_class_year();
@@ -0,0 +1,23 @@
+-- Ce trigger répercute la modification du type d un composant (cours magistral / travaux pratiques)
+-- dans le champ full_class_code des inscriptions aux classes de ce composant.
+
+CREATE OR REPLACE FUNCTION update_full_class_code_on_learning_component_year() RETURNS TRIGGER AS
+$$
+BEGIN
+    -- La mise à jour déclenche compute_learning_unit_enrollment_full_class_code sur chaque inscription
+    UPDATE public.base_learningunitenrollment
+    SET learning_class_year_id = learning_class_year_id
+    WHERE learning_class_year_id IN (
+        SELECT id FROM public.learning_unit_learningclassyear WHERE learning_component_year_id = NEW.id
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS UPDATE_FULL_CLASS_CODE_ON_LEARNING_COMPONENT_YEAR ON public.base_learningcomponentyear;
+CREATE TRIGGER UPDATE_FULL_CLASS_CODE_ON_LEARNING_COMPONENT_YEAR
+    AFTER UPDATE OF type
+    ON public.base_learningcomponentyear
+    FOR EACH ROW
+    WHEN (OLD.type IS DISTINCT FROM NEW.type)
+EXECUTE PROCEDURE update_full_class_code_on_learning_component_year();
@@ -0,0 +1,21 @@
+-- Ce trigger répercute la modification du code d une unité d enseignement
+-- dans le champ full_class_code des inscriptions aux unités d enseignement (et à leurs classes).
+
+CREATE OR REPLACE FUNCTION update_full_class_code_on_learning_unit_year() RETURNS TRIGGER AS
+$$
+BEGIN
+    -- La mise à jour déclenche compute_learning_unit_enrollment_full_class_code sur chaque inscription
+    UPDATE public.base_learningunitenrollment
+    SET learning_unit_year_id = learning_unit_year_id
+    WHERE learning_unit_year_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS UPDATE_FULL_CLASS_CODE_ON_LEARNING_UNIT_YEAR ON public.base_learningunityear;
+CREATE TRIGGER UPDATE_FULL_CLASS_CODE_ON_LEARNING_UNIT_YEAR
+    AFTER UPDATE OF acronym
+    ON public.base_learningunityear
+    FOR EACH ROW
+    WHEN (OLD.acronym IS DISTINCT FROM NEW.acronym)
+EXECUTE PROCEDURE update_full_class_code_on_learning_unit_year();
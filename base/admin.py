@@ -41,6 +41,9 @@ admin.site.register(admission_condition.AdmissionCondition,
 admin.site.register(admission_condition.AdmissionConditionLine,
                     admission_condition.AdmissionConditionLineAdmin)
 
+admin.site.register(async_excel_export.AsyncExcelExport,
+                    async_excel_export.AsyncExcelExportAdmin)
+
 admin.site.register(campus.Campus,
                     campus.CampusAdmin)
 
@@ -143,6 +146,9 @@ admin.site.register(person.Person,
 admin.site.register(person_address.PersonAddress,
                     person_address.PersonAddressAdmin)
 
+admin.site.register(postponement_checkpoint.PostponementCheckpoint,
+                    postponement_checkpoint.PostponementCheckpointAdmin)
+
 admin.site.register(prerequisite.Prerequisite,
                     prerequisite.PrerequisiteAdmin)
 
@@ -25,12 +25,12 @@
 ##############################################################################
 import rules
 from django.db import models
-from django.db.models import Q
 
 from django.utils.translation import gettext_lazy as _
 
 
 from attribution.auth import predicates as attribution_predicates
+from base.models.person import get_name_filter
 from osis_common.models import serializable_model
 from osis_role.contrib.admin import RoleModelAdmin
 from osis_role.contrib.models import RoleModel
@@ -95,7 +95,5 @@ def find_by_id(tutor_id):
 def search(**criterias):
     queryset = Tutor.objects.all()
     if "name" in criterias:
-        full_name = criterias["name"]
-        for name in full_name.split():
-            queryset = queryset.filter(Q(person__first_name__icontains=name) | Q(person__last_name__icontains=name))
+        queryset = queryset.filter(get_name_filter(criterias["name"], lookup_prefix='person__'))
     return queryset.distinct().select_related("person")
@@ -23,11 +23,17 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import collections
 import datetime
+import threading
+import uuid
 from abc import ABC
-from typing import List, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import attr
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import F
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -36,6 +42,8 @@ from base.models.academic_calendar import AcademicCalendar
 from base.models.enums import number_session
 from base.models.enums.academic_calendar_type import AcademicCalendarTypes
 
+VERSION_CACHE_KEY = 'academic_events_version'
+
 
 @attr.s(frozen=True, slots=True)
 class AcademicEvent:
@@ -158,19 +166,15 @@ class AcademicEventCalendarHelper(ABC):
         """
         Return academic event related to target_year provided
         """
-        return next(
-            (academic_event for academic_event in self._get_academic_events
-             if academic_event.authorized_target_year == target_year
-             ),
-            None
-        )
+        return self._get_academic_events_snapshot.get_academic_event(self.event_reference, target_year)
 
     @cached_property
     def _get_academic_events(self) -> List[AcademicEvent]:
-        return sorted(
-            AcademicEventRepository().get_academic_events(self.event_reference),
-            key=lambda academic_event: academic_event.start_date
-        )
+        return list(self._get_academic_events_snapshot.get_academic_events(self.event_reference))
+
+    @cached_property
+    def _get_academic_events_snapshot(self) -> 'AcademicEventsSnapshot':
+        return get_academic_events_snapshot(self.event_reference)
 
     @classmethod
     def ensure_consistency_until_n_plus_6(cls):
@@ -187,13 +191,7 @@ class AcademicEventSessionCalendarHelper(AcademicEventCalendarHelper):
         """
         Return academic session event related to target_year and session provided
         """
-        return next(
-            (academic_session_event for academic_session_event in self._get_academic_events
-             if academic_session_event.authorized_target_year == target_year and
-                academic_session_event.session == session
-             ),
-            None
-        )
+        return self._get_academic_events_snapshot.get_academic_session_event(self.event_reference, target_year, session)
 
     def get_opened_academic_events(self, date=None) -> List[AcademicSessionEvent]:
         return super().get_opened_academic_events(date=date)
@@ -204,13 +202,6 @@ class AcademicEventSessionCalendarHelper(AcademicEventCalendarHelper):
     def get_next_academic_event(self, date=None) -> AcademicSessionEvent:
         return super().get_next_academic_event(date=date)
 
-    @cached_property
-    def _get_academic_events(self) -> List[AcademicSessionEvent]:
-        return sorted(
-            AcademicEventRepository().get_academic_events(self.event_reference),
-            key=lambda academic_session_event: academic_session_event.start_date
-        )
-
 
 class AcademicEventRepository:
     def get_academic_events(self, event_reference: str = None) -> List[Union[AcademicEvent, AcademicSessionEvent]]:
@@ -238,3 +229,93 @@ class AcademicEventRepository:
         academic_event_db.start_date = academic_event.start_date
         academic_event_db.end_date = academic_event.end_date
         academic_event_db.save()
+
+
+class AcademicEventsSnapshot:
+    """
+    All the academic events, sorted by start date and indexed by reference, target year and session.
+    Shared between requests and threads: must not be modified.
+    """
+
+    def __init__(self, academic_events: Iterable[Union[AcademicEvent, AcademicSessionEvent]]):
+        events_by_reference = collections.defaultdict(list)
+        for academic_event in sorted(academic_events, key=lambda event: event.start_date):
+            events_by_reference[academic_event.type].append(academic_event)
+        self._events_by_reference = {
+            reference: tuple(events) for reference, events in events_by_reference.items()
+        }  # type: Dict[str, Tuple[AcademicEvent, ...]]
+
+        # Same behaviour as the helpers: the first event found (by start date) wins
+        self._event_by_target_year = {}  # type: Dict[Tuple[str, int], AcademicEvent]
+        self._session_event_by_target_year = {}  # type: Dict[Tuple[str, int, int], AcademicSessionEvent]
+        for reference, events in self._events_by_reference.items():
+            for academic_event in events:
+                self._event_by_target_year.setdefault(
+                    (reference, academic_event.authorized_target_year),
+                    academic_event
+                )
+                if isinstance(academic_event, AcademicSessionEvent):
+                    self._session_event_by_target_year.setdefault(
+                        (reference, academic_event.authorized_target_year, academic_event.session),
+                        academic_event
+                    )
+
+    def get_academic_events(self, event_reference: str = None) -> Tuple[AcademicEvent, ...]:
+        if event_reference is None:
+            return tuple(sorted(
+                (event for events in self._events_by_reference.values() for event in events),
+                key=lambda event: event.start_date
+            ))
+        return self._events_by_reference.get(event_reference, ())
+
+    def get_academic_event(self, event_reference: str, target_year: int) -> Optional[AcademicEvent]:
+        return self._event_by_target_year.get((event_reference, target_year))
+
+    def get_academic_session_event(
+            self,
+            event_reference: str,
+            target_year: int,
+            session: int
+    ) -> Optional[AcademicSessionEvent]:
+        return self._session_event_by_target_year.get((event_reference, target_year, session))
+
+
+_snapshot = None  # type: Optional[AcademicEventsSnapshot]
+_snapshot_version = None
+_lock = threading.Lock()
+
+
+def get_academic_events_snapshot(event_reference: str = None) -> AcademicEventsSnapshot:
+    """
+    Snapshot of all the academic events.
+    Kept in memory for the process until invalidate() is called by any process.
+    When the cache is disabled, only the events of event_reference are loaded (if provided).
+    """
+    if not settings.ACADEMIC_CALENDAR_CACHE_ENABLED:
+        return AcademicEventsSnapshot(AcademicEventRepository().get_academic_events(event_reference))
+
+    global _snapshot, _snapshot_version
+    with _lock:
+        version = get_shared_version()
+        if _snapshot is None or version != _snapshot_version:
+            _snapshot = AcademicEventsSnapshot(AcademicEventRepository().get_academic_events())
+            _snapshot_version = version
+        return _snapshot
+
+
+def invalidate() -> None:
+    """
+    Force all the processes to reload their academic events once the current transaction is committed
+    """
+    transaction.on_commit(lambda: cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None))
+
+
+def get_shared_version() -> str:
+    """
+    Identifier of the current state of the academic calendars, shared by all the processes and renewed by invalidate()
+    """
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(VERSION_CACHE_KEY)
+    return version
@@ -0,0 +1,183 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+import hashlib
+import importlib
+import tempfile
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone, translation
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+from osis_async.models import AsyncTask
+from osis_async.models.enums import TaskStates
+
+from base.models.async_excel_export import AsyncExcelExport
+from base.tasks import generate_excel_export
+from base.utils.db import advisory_lock
+
+ASYNC_PARAMETER = 'xls_async'
+FILE_GENERATED_PROGRESSION = 90
+
+
+class ExcelExportError(Exception):
+    pass
+
+
+def get_or_create_export(view_obj, name: str) -> AsyncExcelExport:
+    """
+    Register the excel export 'name' of the current search of the view and schedule its generation,
+    unless an identical export of the same person is still pending (for less than EXCEL_EXPORT_PENDING_TIMEOUT)
+    or processing.
+    """
+    request = view_obj.request
+    person = request.user.person
+    filters = request.GET.copy()
+    filters.pop(ASYNC_PARAMETER, None)
+    called_from_class = "{}.{}".format(type(view_obj).__module__, type(view_obj).__qualname__)
+    language = translation.get_language()
+    fingerprint = _get_fingerprint(person.pk, called_from_class, name, filters, language)
+
+    with transaction.atomic():
+        # Serialize the identical requests (ex: double click), otherwise both would miss the export in progress
+        advisory_lock('async_excel_export:{}'.format(fingerprint))
+        export_in_progress = _search_exports_in_progress().filter(fingerprint=fingerprint).first()
+        if export_in_progress:
+            return export_in_progress
+
+        task = AsyncTask.objects.create(name=str(_('Excel export')), description=name, person=person)
+        export = AsyncExcelExport.objects.create(
+            job_uuid=task.uuid,
+            person=person,
+            called_from_class=called_from_class,
+            name=name,
+            path=request.path,
+            filters=filters.urlencode(),
+            language=language,
+            fingerprint=fingerprint,
+        )
+        transaction.on_commit(lambda: generate_excel_export.run.delay(str(export.job_uuid)))
+    return export
+
+
+def generate(job_uuid: str) -> None:
+    """
+    Replay the search of the export in the view it was requested from and store the file it renders.
+    The view dispatch checks again the login and the permissions of the person.
+    """
+    manager = import_string(settings.OSIS_EXPORT_ASYNCHRONOUS_MANAGER_CLS)
+    export = AsyncExcelExport.objects.select_related('person__user').get(job_uuid=job_uuid)
+    if AsyncTask.objects.filter(uuid=job_uuid, state=TaskStates.ERROR.name).exists():
+        # Given up by clean_exports while waiting for a worker
+        return
+    manager.update(job_uuid, progression=0, state=TaskStates.PROCESSING.name, started_at=timezone.now())
+    try:
+        with translation.override(export.language):
+            view = import_string(export.called_from_class).as_view()
+            response = view(_build_request(export))
+        if response.status_code != 200 or not response.has_header('Content-Disposition'):
+            raise ExcelExportError("{} did not render the excel file {}".format(export.called_from_class, export.name))
+        _save_file(export, response)
+        manager.update(job_uuid, progression=FILE_GENERATED_PROGRESSION)
+    except Exception:
+        manager.update(job_uuid, state=TaskStates.ERROR.name, completed_at=timezone.now())
+        raise
+    manager.update(job_uuid, progression=100, state=TaskStates.DONE.name, completed_at=timezone.now())
+
+
+def clean_exports() -> None:
+    """
+    Report as failed the exports pending for too long (lost task or worker) and delete the exports, files included,
+    older than the retention period.
+    """
+    manager = import_string(settings.OSIS_EXPORT_ASYNCHRONOUS_MANAGER_CLS)
+    stale_job_uuids = AsyncExcelExport.objects.annotate(
+        is_pending=Exists(AsyncTask.objects.filter(uuid=OuterRef('job_uuid'), state=TaskStates.PENDING.name)),
+    ).filter(
+        is_pending=True,
+        created_at__lt=_get_pending_limit(),
+    ).values_list('job_uuid', flat=True)
+    for job_uuid in stale_job_uuids:
+        manager.update(job_uuid, state=TaskStates.ERROR.name, completed_at=timezone.now())
+
+    retention_limit = timezone.now() - datetime.timedelta(days=settings.EXCEL_EXPORT_RETENTION_DAYS)
+    for export in AsyncExcelExport.objects.filter(created_at__lt=retention_limit).iterator():
+        if export.file:
+            export.file.delete(save=False)
+        export.delete()
+
+
+def _search_exports_in_progress():
+    tasks = AsyncTask.objects.filter(uuid=OuterRef('job_uuid'))
+    return AsyncExcelExport.objects.annotate(
+        is_processing=Exists(tasks.filter(state=TaskStates.PROCESSING.name)),
+        is_pending=Exists(tasks.filter(state=TaskStates.PENDING.name)),
+    ).filter(
+        Q(is_processing=True) | Q(is_pending=True, created_at__gte=_get_pending_limit())
+    )
+
+
+def _get_pending_limit() -> datetime.datetime:
+    return timezone.now() - datetime.timedelta(seconds=settings.EXCEL_EXPORT_PENDING_TIMEOUT)
+
+
+def _get_fingerprint(person_id: int, called_from_class: str, name: str, filters: QueryDict, language: str) -> str:
+    sorted_filters = sorted((key, values) for key, values in filters.lists())
+    data = [person_id, called_from_class, name, sorted_filters, language]
+    return hashlib.sha256(repr(data).encode()).hexdigest()
+
+
+def _build_request(export: AsyncExcelExport) -> HttpRequest:
+    request = HttpRequest()
+    request.method = 'GET'
+    request.path = request.path_info = export.path
+    request.GET = QueryDict(export.filters)
+    request.user = export.person.user
+    request.LANGUAGE_CODE = export.language
+    request.session = importlib.import_module(settings.SESSION_ENGINE).SessionStore()
+    request._messages = CookieStorage(request)
+    return request
+
+
+def _save_file(export: AsyncExcelExport, response) -> None:
+    export.file_name = _get_file_name(response) or "{}.xlsx".format(export.name)
+    content = response.streaming_content if response.streaming else [response.content]
+    with tempfile.TemporaryFile() as tmp_file:
+        for chunk in content:
+            tmp_file.write(chunk)
+        tmp_file.seek(0)
+        export.file.save(export.file_name, File(tmp_file), save=False)
+    export.save()
+
+
+def _get_file_name(response) -> str:
+    _, _, file_name = response['Content-Disposition'].partition('filename=')
+    return file_name.strip('"')
@@ -28,8 +28,17 @@ from datetime import datetime
 from typing import Iterable, Dict, Optional, List
 
 import attr
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 
+from base.models.academic_year import AcademicYear
+from base.models.entity_faculty import EntityFaculty
 from base.models.entity_version import EntityVersion, find_latest_version
+from base.utils import entity_hierarchy
+from base.utils.db import advisory_lock
+
+ENTITY_FACULTIES_VERSION_CACHE_KEY = 'entity_faculties_version_{academic_year_id}'
 
 
 @attr.s(frozen=True, slots=True)
@@ -78,3 +87,28 @@ def load_main_entity_structure(date: datetime.date) -> MainEntityStructure:
 
     root = next((value for key, value in nodes.items() if not value.parent))
     return MainEntityStructure(root, nodes)
+
+
+def refresh_entity_faculties(academic_year: AcademicYear) -> None:
+    """
+    Rebuild the EntityFaculty rows of the academic year when the entities changed since their last build.
+    """
+    cache_key = ENTITY_FACULTIES_VERSION_CACHE_KEY.format(academic_year_id=academic_year.pk)
+    version = entity_hierarchy.get_shared_version()
+    if settings.ENTITY_HIERARCHY_CACHE_ENABLED and cache.get(cache_key) == version:
+        return
+
+    with transaction.atomic():
+        advisory_lock('entity_faculties:{}'.format(academic_year.pk))
+        if settings.ENTITY_HIERARCHY_CACHE_ENABLED and cache.get(cache_key) == version:
+            return
+        entity_structure = load_main_entity_structure(academic_year.start_date)
+        EntityFaculty.objects.filter(academic_year=academic_year).delete()
+        EntityFaculty.objects.bulk_create(
+            EntityFaculty(
+                academic_year=academic_year,
+                entity_id=entity_id,
+                faculty_id=node.containing_faculty().entity_version.entity_id,
+            ) for entity_id, node in entity_structure.nodes.items()
+        )
+        transaction.on_commit(lambda: cache.set(cache_key, version, timeout=None))
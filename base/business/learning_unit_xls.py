@@ -23,16 +23,22 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import tempfile
 from collections import defaultdict
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple, Any
 
 from django.db.models import QuerySet
 from django.db.models import Subquery, OuterRef
 from django.db.models.expressions import RawSQL
+from django.http import StreamingHttpResponse
 from django.template.defaultfilters import yesno
+from django.utils import timezone
+from django.utils.functional import Promise
 from django.utils.translation import gettext_lazy as _
+from openpyxl import Workbook
 from openpyxl.styles import Alignment, PatternFill, Color, Font
 from openpyxl.utils import get_column_letter
+from openpyxl.writer.write_only import WriteOnlyCell
 
 from attribution.business import attribution_charge_new
 from attribution.business.attribution_class import create_attributions_dictionary
@@ -86,6 +92,8 @@ WRAP_TEXT_ALIGNMENT = Alignment(wrapText=True, vertical="top")
 WITH_ATTRIBUTIONS = 'with_attributions'
 WITH_GRP = 'with_grp'
 NB_COLUMNS_WHICH_COULD_BE_WHITENED = 32
+XLS_CHUNK_SIZE = 500
+XLS_STREAM_BLOCK_SIZE = 64 * 1024
 
 
 def learning_unit_titles_part1() -> List[str]:
@@ -108,16 +116,19 @@ def prepare_xls_content(learning_unit_years: QuerySet,
                         is_external_ue_list: bool,
                         with_grp=False,
                         with_attributions=False) -> List:
-    qs = annotate_qs(learning_unit_years)
-
-    if with_grp:
-        qs = qs.annotate(
-            closest_trainings=RawSQL(SQL_RECURSIVE_QUERY_EDUCATION_GROUP_TO_CLOSEST_TRAININGS, ())
-        ).prefetch_related('element')
+    return [
+        row for _learning_unit_yr, _effective_class, row
+        in _iter_xls_rows(learning_unit_years, is_external_ue_list, with_grp, with_attributions)
+    ]
 
-    result = []
 
-    for learning_unit_yr in qs:
+def _iter_xls_rows(
+        learning_unit_years: QuerySet,
+        is_external_ue_list: bool,
+        with_grp: bool,
+        with_attributions: bool
+) -> Iterator[Tuple[LearningUnitYear, Optional[LearningClassYear], List]]:
+    for learning_unit_yr in _iter_by_chunks(learning_unit_years, with_grp):
         lu_data_part1 = get_data_part1(learning_unit_yr, None, is_external_ue_list)
         lu_data_part2 = get_data_part2(learning_unit_yr, None, with_attributions)
 
@@ -127,23 +138,46 @@ def prepare_xls_content(learning_unit_years: QuerySet,
         lu_data_part1.extend(lu_data_part2)
         if is_external_ue_list:
             lu_data_part1.extend(_get_external_ue_data(learning_unit_yr))
-        result.append(lu_data_part1)
-        effective_classes = _get_effective_classes(learning_unit_yr)
+        yield learning_unit_yr, None, lu_data_part1
 
-        for effective_classe in effective_classes:
+        for effective_classe in _get_effective_classes(learning_unit_yr):
             effective_classe_data_part1 = get_data_part1(learning_unit_yr, effective_classe, is_external_ue_list)
             effective_classe_data_part2 = get_data_part2(learning_unit_yr, effective_classe, with_attributions)
             effective_classe_data_part1.extend(effective_classe_data_part2)
-            result.append(effective_classe_data_part1)
-
-    return result
+            yield learning_unit_yr, effective_classe, effective_classe_data_part1
+
+
+def _iter_by_chunks(learning_unit_years: QuerySet, with_grp: bool) -> Iterator[LearningUnitYear]:
+    """
+    Only the ids of the whole search are kept in memory: learning units, with their volumes, components and
+    classes, are fetched XLS_CHUNK_SIZE at a time and yielded in the order of the search.
+    """
+    ids = list(dict.fromkeys(learning_unit_years.values_list('pk', flat=True)))
+    for start in range(0, len(ids), XLS_CHUNK_SIZE):
+        chunk_ids = ids[start:start + XLS_CHUNK_SIZE]
+        qs = annotate_qs(learning_unit_years.filter(pk__in=chunk_ids)).prefetch_related(
+            'learningcomponentyear_set__learningclassyear_set__attributionclass_set',
+            'learningcomponentyear_set__learningclassyear_set__scoreresponsible_set__tutor__person',
+        )
+        if with_grp:
+            qs = qs.annotate(
+                closest_trainings=RawSQL(SQL_RECURSIVE_QUERY_EDUCATION_GROUP_TO_CLOSEST_TRAININGS, ())
+            ).prefetch_related(
+                'element__children_elements__parent_element__group_year',
+                'element__children_elements__child_element__learning_unit_year',
+            )
+        learning_unit_yr_by_id = {learning_unit_yr.pk: learning_unit_yr for learning_unit_yr in qs}
+        for learning_unit_yr_id in chunk_ids:
+            if learning_unit_yr_id in learning_unit_yr_by_id:
+                yield learning_unit_yr_by_id[learning_unit_yr_id]
 
 
 def _get_effective_classes(learning_unit_yr: LearningUnitYear) -> List[LearningClassYear]:
+    # Sorted in Python in order to use the prefetched components and classes
     return [
         effective_class
-        for component in learning_unit_yr.learningcomponentyear_set.all().order_by('acronym')
-        for effective_class in component.learningclassyear_set.all().order_by('acronym')
+        for component in sorted(learning_unit_yr.learningcomponentyear_set.all(), key=lambda cmp: cmp.acronym or '')
+        for effective_class in sorted(component.learningclassyear_set.all(), key=lambda cls: cls.acronym or '')
     ]
 
 
@@ -213,6 +247,97 @@ def _get_parameters_configurable_list(learning_units, titles, user) -> dict:
     return parameters
 
 
+def create_streaming_xls_with_parameters(
+        user,
+        learning_units: QuerySet,
+        filters,
+        extra_configuration,
+        is_external_ue_list: bool
+) -> StreamingHttpResponse:
+    """
+    Same file as create_xls_with_parameters, written row by row in a write-only workbook so that the memory used
+    does not depend on the number of learning units.
+    """
+    response = StreamingHttpResponse(
+        _generate_streamed_workbook(user, learning_units, filters, extra_configuration, is_external_ue_list),
+        content_type=xls_build.CONTENT_TYPE_XLS
+    )
+    response['Content-Disposition'] = "%s%s" % ("attachment; filename=", "{}.xlsx".format(XLS_FILENAME))
+    return response
+
+
+def _generate_streamed_workbook(user, learning_units: QuerySet, filters, extra_configuration,
+                                is_external_ue_list: bool) -> Iterator[bytes]:
+    with_grp = extra_configuration.get(WITH_GRP)
+    with_attributions = extra_configuration.get(WITH_ATTRIBUTIONS)
+    titles = _prepare_titles(is_external_ue_list, with_attributions, with_grp)
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title=str(WORKSHEET_TITLE))
+    worksheet.append([_styled_cell(worksheet, title, font=BOLD_FONT) for title in titles])
+    wrapped_columns = {
+        idx for idx, title in enumerate(titles) if title == HEADER_PROGRAMS or title in HEADER_TEACHERS
+    }
+    for learning_unit_yr, effective_class, row in _iter_xls_rows(
+            learning_units, is_external_ue_list, with_grp, with_attributions
+    ):
+        proposal = getattr(learning_unit_yr, "proposallearningunit", None)
+        font = PROPOSAL_LINE_STYLES.get(proposal.type) if proposal and not effective_class else None
+        worksheet.append([
+            _styled_cell(worksheet, value, font, WRAP_TEXT_ALIGNMENT if idx in wrapped_columns else None)
+            for idx, value in enumerate(row)
+        ])
+
+    if not is_external_ue_list:
+        _append_proposal_legend_worksheet(workbook)
+    _append_parameters_worksheet(workbook, user, filters)
+
+    with tempfile.TemporaryFile() as xls_file:
+        workbook.save(xls_file)
+        xls_file.seek(0)
+        yield from iter(lambda: xls_file.read(XLS_STREAM_BLOCK_SIZE), b'')
+
+
+def _styled_cell(worksheet, value: Any, font: Font = None, alignment: Alignment = None, fill: PatternFill = None):
+    value = str(value) if isinstance(value, Promise) else value
+    if not (font or alignment or fill):
+        return value
+    cell = WriteOnlyCell(worksheet, value=value)
+    if font:
+        cell.font = font
+    if alignment:
+        cell.alignment = alignment
+    if fill:
+        cell.fill = fill
+    return cell
+
+
+def _append_proposal_legend_worksheet(workbook: Workbook) -> None:
+    legend_ws_data = prepare_proposal_legend_ws_data()
+    fill_by_cell = {cell: fill for fill, cells in DEFAULT_LEGEND_FILLS.items() for cell in cells}
+    worksheet = workbook.create_sheet(title=str(legend_ws_data[xls_build.WORKSHEET_TITLE_KEY]))
+    worksheet.append([
+        _styled_cell(worksheet, title, font=BOLD_FONT) for title in legend_ws_data[xls_build.HEADER_TITLES_KEY]
+    ])
+    for row_number, row in enumerate(legend_ws_data[xls_build.CONTENT_KEY], start=2):
+        worksheet.append([
+            _styled_cell(worksheet, value, fill=fill_by_cell.get("{}{}".format(get_column_letter(idx), row_number)))
+            for idx, value in enumerate(row, start=1)
+        ])
+
+
+def _append_parameters_worksheet(workbook: Workbook, user, filters) -> None:
+    worksheet = workbook.create_sheet(title=str(_('Description')))
+    worksheet.append([_styled_cell(worksheet, _('Description'), font=BOLD_FONT), str(XLS_DESCRIPTION)])
+    worksheet.append([_styled_cell(worksheet, _('User'), font=BOLD_FONT), get_name_or_username(user)])
+    worksheet.append([
+        _styled_cell(worksheet, _('Date'), font=BOLD_FONT),
+        timezone.localtime(timezone.now()).strftime('%d/%m/%Y %H:%M')
+    ])
+    for key, value in (filters or {}).items():
+        worksheet.append([_styled_cell(worksheet, key, font=BOLD_FONT), str(value) if value is not None else ''])
+
+
 def get_significant_volume(volume):
     if volume and volume > 0:
         return volume
@@ -0,0 +1,60 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import Callable, Iterable, List
+
+from django.db import transaction
+
+from base.models.postponement_checkpoint import PostponementCheckpoint
+
+POSTPONEMENT_CHUNK_SIZE = 50
+
+
+def get_pending_keys(job: str, from_year: int, keys: Iterable[str]) -> List[str]:
+    keys = list(dict.fromkeys(keys))
+    keys_done = set(
+        PostponementCheckpoint.objects.filter(job=job, from_year=from_year, key__in=keys).values_list('key', flat=True)
+    )
+    return [key for key in keys if key not in keys_done]
+
+
+def split_in_chunks(keys: List[str], chunk_size: int = POSTPONEMENT_CHUNK_SIZE) -> List[List[str]]:
+    return [keys[index:index + chunk_size] for index in range(0, len(keys), chunk_size)]
+
+
+def postpone_chunk(job: str, from_year: int, keys: List[str], postpone: Callable[[List[str]], None]) -> List[str]:
+    """
+    Postpone the keys of the chunk not yet checkpointed, then checkpoint them, in a single transaction : a failing
+    chunk leaves no row behind and is postponed again by the next run.
+    Two workers postponing the same key cannot both commit, the second one fails on the unique checkpoint.
+    """
+    with transaction.atomic():
+        pending_keys = get_pending_keys(job, from_year, keys)
+        if pending_keys:
+            postpone(pending_keys)
+            PostponementCheckpoint.objects.bulk_create(
+                [PostponementCheckpoint(job=job, from_year=from_year, key=key) for key in pending_keys]
+            )
+    return pending_keys
@@ -63,6 +63,11 @@ class InMemoryGenericRepository(interface.AbstractRepository, metaclass=Singleto
             cls.entities.remove(to_remove)
         cls.entities.append(entity)
 
+    @classmethod
+    def save_all(cls, entities: List['RootEntity']) -> None:
+        for entity in entities:
+            cls.save(entity)
+
     @classmethod
     def get_all_identities(cls) -> List['EntityIdentity']:
         return [entity.entity_id for entity in cls.entities]
@@ -23,21 +23,59 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from collections import defaultdict
-from typing import Dict, List
+from typing import List
 
 from django import forms
+from django.db.models.expressions import RawSQL
 from django.utils.translation import gettext_lazy as _
 from django_filters import filters
 
-from base.business.entity_version import load_main_entity_structure, MainEntityStructure
 from base.forms.learning_unit.search.simple import LearningUnitFilter
 from base.models.academic_year import AcademicYear
 from base.models.entity_version import EntityVersion
 from base.models.learning_unit_year import LearningUnitYear, LearningUnitYearQuerySet
+from base.utils.entity_hierarchy import get_entity_hierarchy
 from base.views.learning_units.search.common import SearchTypes
-from program_management.ddd.repositories.find_roots import find_roots_for_element_ids
-from program_management.models.element import Element
+from program_management.ddd.repositories.find_roots import DEFAULT_ROOT_CATEGORIES
+
+# Same walk up to the roots as GroupElementYearManager.get_root_list, started from all the learning units of the year.
+# A learning unit is borrowed when one of its roots is managed by an entity outside of its requirement faculty.
+SQL_BORROWED_LEARNING_UNIT_YEAR_IDS = """\
+WITH RECURSIVE root_query AS (
+    SELECT gey.child_element_id AS starting_node_id, gey.parent_element_id, egt.name IN %s AS is_root_row
+    FROM base_groupelementyear AS gey
+    INNER JOIN program_management_element AS child_element ON child_element.id = gey.child_element_id
+    INNER JOIN base_learningunityear AS luy ON luy.id = child_element.learning_unit_year_id
+    INNER JOIN program_management_element AS parent_element ON parent_element.id = gey.parent_element_id
+    INNER JOIN education_group_groupyear AS gy ON gy.id = parent_element.group_year_id
+    INNER JOIN base_educationgrouptype AS egt ON egt.id = gy.education_group_type_id
+    WHERE luy.academic_year_id = %s
+
+    UNION ALL
+
+    SELECT child.starting_node_id, parent.parent_element_id, egt.name IN %s AS is_root_row
+    FROM base_groupelementyear AS parent
+    INNER JOIN root_query AS child ON parent.child_element_id = child.parent_element_id AND child.is_root_row = false
+    INNER JOIN program_management_element AS parent_element ON parent_element.id = parent.parent_element_id
+    INNER JOIN education_group_groupyear AS gy ON gy.id = parent_element.group_year_id
+    INNER JOIN base_educationgrouptype AS egt ON egt.id = gy.education_group_type_id
+)
+SELECT luy.id
+FROM root_query
+INNER JOIN program_management_element AS child_element ON child_element.id = root_query.starting_node_id
+INNER JOIN base_learningunityear AS luy ON luy.id = child_element.learning_unit_year_id
+INNER JOIN base_learningcontaineryear AS lcy ON lcy.id = luy.learning_container_year_id
+INNER JOIN program_management_element AS root_element ON root_element.id = root_query.parent_element_id
+INNER JOIN education_group_groupyear AS root_gy ON root_gy.id = root_element.group_year_id
+LEFT JOIN base_entityfaculty AS requirement_faculty
+    ON requirement_faculty.entity_id = lcy.requirement_entity_id AND requirement_faculty.academic_year_id = %s
+LEFT JOIN base_entityfaculty AS management_faculty
+    ON management_faculty.entity_id = root_gy.management_entity_id AND management_faculty.academic_year_id = %s
+WHERE root_query.is_root_row
+    AND root_gy.management_entity_id IS NOT NULL
+    AND requirement_faculty.faculty_id IS DISTINCT FROM management_faculty.faculty_id
+"""
+SQL_RESTRICT_MANAGEMENT_ENTITIES = "    AND root_gy.management_entity_id IN %s\n"
 
 
 class BorrowedLearningUnitSearch(LearningUnitFilter):
@@ -77,64 +115,28 @@ class BorrowedLearningUnitSearch(LearningUnitFilter):
             except EntityVersion.DoesNotExist:
                 return LearningUnitYear.objects.none()
 
-        ids = filter_borrowed_learning_units(
+        return filter_borrowed_learning_units(
             qs,
             academic_year,
             faculty_borrowing_id=faculty_borrowing_id
         )
-        return qs.filter(id__in=ids)
 
 
 def filter_borrowed_learning_units(
         learning_unit_year_qs: LearningUnitYearQuerySet,
         academic_year: AcademicYear,
         faculty_borrowing_id: int = None
-):
-    entity_structure = load_main_entity_structure(academic_year.start_date)
-    entities_borrowing_restriction = _get_faculty_entities(entity_structure, faculty_borrowing_id) \
-        if faculty_borrowing_id else []
-
-    map_element_entities = _get_management_entity_of_roots_by_elements(
-        [luy.element.id for luy in learning_unit_year_qs],
-        entities_borrowing_restriction,
-    )
+) -> LearningUnitYearQuerySet:
+    root_categories_names = tuple(root_type.name for root_type in DEFAULT_ROOT_CATEGORIES)
+    sql = SQL_BORROWED_LEARNING_UNIT_YEAR_IDS
+    params = [root_categories_names, academic_year.pk, root_categories_names, academic_year.pk, academic_year.pk]
+    if faculty_borrowing_id:
+        sql += SQL_RESTRICT_MANAGEMENT_ENTITIES
+        params.append(tuple(_get_faculty_entities(academic_year, faculty_borrowing_id)))
+
+    return learning_unit_year_qs.filter(id__in=RawSQL(sql, params))
+
 
-    return [luy.id for luy in learning_unit_year_qs
-            if _is_borrowed_course(luy, map_element_entities.get(luy.element.id, []), entity_structure)]
-
-
-def _get_faculty_entities(entity_structure: 'MainEntityStructure', faculty_borrowing_id: int) -> List[int]:
-    faculty_entities = entity_structure.get_node(faculty_borrowing_id).get_all_children()
-    faculty_entities += [entity_structure.get_node(faculty_borrowing_id)]
-    return [node.entity_version.entity.id for node in faculty_entities]
-
-
-def _get_management_entity_of_roots_by_elements(
-        element_ids: List[int],
-        entities_restricted: List[int]
-) -> Dict[int, List[int]]:
-    root_child_lists = find_roots_for_element_ids(element_ids)
-    root_element_ids = [list_element["root_id"] for list_element in root_child_lists]
-
-    root_element_qs = Element.objects.filter(id__in=root_element_ids)
-    if entities_restricted:
-        root_element_qs = root_element_qs.filter(group_year__management_entity_id__in=entities_restricted)
-    dict_entity_of_element_id = dict(root_element_qs.values_list("id", "group_year__management_entity"))
-
-    dict_group_year_entities_for_learning_unit_year = defaultdict(list)
-    for list_element in root_child_lists:
-        if dict_entity_of_element_id.get(list_element["root_id"]):
-            dict_group_year_entities_for_learning_unit_year[list_element["child_id"]].append(
-                dict_entity_of_element_id.get(list_element["root_id"])
-            )
-    return dict_group_year_entities_for_learning_unit_year
-
-
-def _is_borrowed_course(
-        luy: 'LearningUnitYearQuerySet',
-        entities_using_luy: List[int],
-        entity_structure: 'MainEntityStructure') -> bool:
-    for entity in entities_using_luy:
-        if not entity_structure.in_same_faculty(luy.learning_container_year.requirement_entity_id, entity):
-            return True
-    return False
+def _get_faculty_entities(academic_year: AcademicYear, faculty_borrowing_id: int) -> List[int]:
+    hierarchy = get_entity_hierarchy(academic_year.start_date)
+    return [faculty_borrowing_id] + hierarchy.get_descendants_ids(faculty_borrowing_id)
@@ -26,6 +26,7 @@ from django.utils.translation import gettext_lazy as _, pgettext_lazy
 from django_filters import FilterSet, filters, OrderingFilter
 
 from backoffice.settings.base import MINIMUM_LUE_YEAR
+from base.forms.utils.filter_field import filter_field_by_search_title, order_by_similarity
 from base.models.learning_unit_year import LearningUnitYear, LearningUnitYearQuerySet
 from ddd.logic.shared_kernel.academic_year.commands import SearchAcademicYearCommand
 from infrastructure.messages_bus import message_bus_instance
@@ -46,10 +47,16 @@ class QuickLearningUnitYearFilter(FilterSet):
     )
     title = filters.CharFilter(
         field_name="full_title",
-        lookup_expr="icontains",
+        method=filter_field_by_search_title,
         max_length=40,
         label=_('Title'),
     )
+    relevance = filters.BooleanFilter(
+        method="order_by_relevance",
+        widget=forms.HiddenInput,
+        required=False,
+        label=_('Relevance'),
+    )
 
     ordering = OrderingFilter(
         fields=(
@@ -80,6 +87,14 @@ class QuickLearningUnitYearFilter(FilterSet):
         choices = [(ac_year.year, str(ac_year)) for ac_year in all_academic_year]
         self.form.fields['academic_year__year'].choices = choices
 
+    def order_by_relevance(self, queryset, name, value):
+        if not value:
+            return queryset
+        return order_by_similarity(
+            queryset,
+            {'acronym': self.form.cleaned_data['acronym'], 'search_title': self.form.cleaned_data['title']}
+        )
+
     def get_queryset(self):
         # Need this close so as to return empty query by default when form is unbound
         # 'changed_data' has been used instead of 'has_changed' here because the hidden field 'academic_year'
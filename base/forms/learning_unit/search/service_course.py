@@ -24,13 +24,14 @@
 #
 ##############################################################################
 from django import forms
+from django.db.models import Subquery, OuterRef, Q, F
 from django.utils.translation import gettext_lazy as _
 from django_filters import filters
 
-from base.business.entity_version import MainEntityStructure, load_main_entity_structure
 from base.forms.learning_unit.search.simple import LearningUnitFilter
 from base.models.academic_year import AcademicYear
-from base.models.learning_unit_year import LearningUnitYear
+from base.models.entity_faculty import EntityFaculty
+from base.models.learning_unit_year import LearningUnitYearQuerySet
 from base.views.learning_units.search.common import SearchTypes
 
 
@@ -52,17 +53,31 @@ class ServiceCourseFilter(LearningUnitFilter):
         qs = super().filter_queryset(queryset)
 
         academic_year = AcademicYear.objects.get(year=self.form.cleaned_data["academic_year__year"])
-        entity_structure = load_main_entity_structure(academic_year.start_date)
-        service_courses_ids = [luy.id for luy in qs if _is_service_course(luy, entity_structure)]
-        return qs.filter(pk__in=service_courses_ids)
+        return filter_service_courses(qs, academic_year)
 
 
-def _is_service_course(luy: 'LearningUnitYear', entity_structure: 'MainEntityStructure'):
-    if not luy.learning_container_year.requirement_entity_id:
-        return False
-    if not luy.learning_container_year.allocation_entity_id:
-        return False
-    return not entity_structure.in_same_faculty(
-        luy.learning_container_year.requirement_entity_id,
-        luy.learning_container_year.allocation_entity_id
+def filter_service_courses(
+        learning_unit_year_qs: LearningUnitYearQuerySet,
+        academic_year: AcademicYear
+) -> LearningUnitYearQuerySet:
+    """
+    Keep the learning units whose requirement and allocation entities are not in the same faculty.
+    Entities outside of the main organization have no faculty.
+    """
+    faculties = EntityFaculty.objects.filter(academic_year=academic_year)
+    return learning_unit_year_qs.filter(
+        learning_container_year__requirement_entity__isnull=False,
+        learning_container_year__allocation_entity__isnull=False,
+    ).annotate(
+        requirement_faculty=Subquery(
+            faculties.filter(entity=OuterRef('learning_container_year__requirement_entity')).values('faculty')[:1]
+        ),
+        allocation_faculty=Subquery(
+            faculties.filter(entity=OuterRef('learning_container_year__allocation_entity')).values('faculty')[:1]
+        ),
+    ).filter(
+        Q(requirement_faculty__isnull=True, allocation_faculty__isnull=False) |
+        Q(requirement_faculty__isnull=False, allocation_faculty__isnull=True) |
+        Q(requirement_faculty__isnull=False, allocation_faculty__isnull=False) &
+        ~Q(requirement_faculty=F('allocation_faculty'))
     )
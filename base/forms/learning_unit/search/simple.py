@@ -35,7 +35,8 @@ from django_filters import FilterSet, filters, OrderingFilter
 
 from backoffice.settings.base import MINIMUM_LUE_YEAR
 from base.business.entity import get_entities_ids
-from base.forms.utils.filter_field import filter_field_by_regex, espace_special_characters
+from base.forms.utils.filter_field import filter_field_by_regex, espace_special_characters, \
+    filter_field_by_search_title
 from base.models.campus import find_main_campuses
 from base.models.enums import quadrimesters, learning_unit_year_subtypes, active_status, learning_container_year_types
 from base.models.enums.learning_container_year_types import LearningContainerYearType
@@ -127,7 +128,7 @@ class LearningUnitFilter(FilterSet):
     )
     title = filters.CharFilter(
         field_name="full_title",
-        method="filter_learning_unit_year_field",
+        method="filter_learning_unit_year_title",
         max_length=40,
         label=_('Title'),
     )
@@ -265,6 +266,9 @@ class LearningUnitFilter(FilterSet):
     def filter_learning_unit_year_field(self, queryset, name, value):
         return filter_field_by_regex(queryset, name, value)
 
+    def filter_learning_unit_year_title(self, queryset, name, value):
+        return filter_field_by_search_title(queryset, name, value)
+
     def filter_only_proposals(self, queryset, name, value):
         if value:
             return queryset.filter(has_proposal=True)
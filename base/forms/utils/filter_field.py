@@ -23,6 +23,11 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from typing import Dict
+
+from django.contrib.postgres.search import TrigramSimilarity
+
+from base.utils.string import normalize_for_search
 
 CHARACTER_TO_ESCAPE = [
     '[',
@@ -44,3 +49,25 @@ def espace_special_characters(value):
     for character in CHARACTER_TO_ESCAPE:
         value = value.replace(character, "\\{}".format(character))
     return r"({})".format(value)
+
+
+def filter_field_by_search_title(queryset, name, value):
+    """
+    Accent-insensitive substring search on the search_title column (trigram indexed) of the model
+    """
+    if value:
+        queryset = queryset.filter(search_title__contains=normalize_for_search(value))
+    return queryset
+
+
+def order_by_similarity(queryset, values_by_field: Dict[str, str]):
+    """
+    Order the queryset by decreasing trigram similarity between the fields and the values searched
+    """
+    similarities = [
+        TrigramSimilarity(field, normalize_for_search(value) if field == 'search_title' else value)
+        for field, value in values_by_field.items() if value
+    ]
+    if not similarities:
+        return queryset
+    return queryset.annotate(search_rank=sum(similarities[1:], similarities[0])).order_by('-search_rank')
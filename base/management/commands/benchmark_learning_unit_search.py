@@ -0,0 +1,72 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import time
+
+from django.core.management import BaseCommand
+from django.db import connection, reset_queries
+from django.test.utils import override_settings
+
+from base.business.entity_version import refresh_entity_faculties
+from base.forms.learning_unit.search.borrowed import filter_borrowed_learning_units
+from base.forms.learning_unit.search.service_course import filter_service_courses
+from base.models.academic_year import AcademicYear
+from base.models.learning_unit_year import LearningUnitYear
+
+PAGE_SIZE = 20
+
+
+class Command(BaseCommand):
+    help = 'Measure the borrowed courses and service courses searches over a whole academic year, ' \
+           'without any other criteria.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('year', type=int, help='Academic year searched, ex: 2021')
+        parser.add_argument('--faculty-borrowing-id', type=int, help='Restrict borrowed courses to this faculty')
+
+    def handle(self, *args, **options):
+        academic_year = AcademicYear.objects.get(year=options['year'])
+        learning_unit_years = LearningUnitYear.objects.filter(academic_year=academic_year).order_by('acronym')
+        refresh_entity_faculties(academic_year)
+
+        searches = [
+            ('Borrowed courses', lambda: filter_borrowed_learning_units(
+                learning_unit_years.exclude(element__isnull=True),
+                academic_year,
+                faculty_borrowing_id=options['faculty_borrowing_id']
+            )),
+            ('Service courses', lambda: filter_service_courses(learning_unit_years, academic_year)),
+        ]
+        with override_settings(DEBUG=True):
+            for label, search in searches:
+                reset_queries()
+                start = time.perf_counter()
+                qs = search()
+                count = qs.count()
+                first_page = list(qs[:PAGE_SIZE])
+                duration = time.perf_counter() - start
+                self.stdout.write('{} : {} results, first page of {} in {:.2f}s ({} queries)'.format(
+                    label, count, len(first_page), duration, len(connection.queries)
+                ))
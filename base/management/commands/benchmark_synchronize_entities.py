@@ -0,0 +1,146 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import time
+from typing import Dict, List
+from unittest import mock
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from base.models.entity_version import EntityVersion
+from base.models.entity_version_address import EntityVersionAddress
+from base.models.enums import entity_type
+from base.tasks import synchronize_entities
+
+EXTERNAL_ID_PREFIX = 'osis.entity_'
+ESB_UNDEFINED_DATE = 99991231
+ESB_DEPARTMENT_TYPES = {
+    entity_type.SECTOR: 'S',
+    entity_type.FACULTY: 'F',
+    entity_type.SCHOOL: 'E',
+    entity_type.INSTITUTE: 'I',
+    entity_type.POLE: 'P',
+    entity_type.DOCTORAL_COMMISSION: 'D',
+    entity_type.PLATFORM: 'T',
+    entity_type.LOGISTICS_ENTITY: 'L',
+}
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Measure the synchronization of the entities with an ESB payload rebuilt from the database, ' \
+           'unchanged and with all the addresses changed. Nothing is written: each run is rolled back.'
+
+    def handle(self, *args, **options):
+        raw_entities = _build_raw_entities()
+        raw_addresses = _build_raw_addresses()
+        self.stdout.write('{} entities found'.format(len(raw_entities)))
+
+        changed_raw_addresses = {
+            esb_id: {**raw_address, 'streetName': '{} bis'.format(raw_address['streetName'] or '')}
+            for esb_id, raw_address in raw_addresses.items()
+        }
+        for label, addresses in [('Unchanged', raw_addresses), ('All addresses changed', changed_raw_addresses)]:
+            duration, queries = self._measure(raw_entities, addresses)
+            self.stdout.write('{} : {:.2f}s - {} queries'.format(label, duration, queries))
+
+    @staticmethod
+    def _measure(raw_entities: List[Dict], raw_addresses: Dict[str, Dict]):
+        with mock.patch(
+                'base.tasks.synchronize_entities.__fetch_entities_from_esb',
+                return_value=raw_entities
+        ), mock.patch(
+            'base.tasks.synchronize_entities.__fetch_address_from_esb',
+            side_effect=lambda raw_entity, **kwargs: raw_addresses.get(raw_entity['entity_id'], _empty_raw_address())
+        ), CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            try:
+                with transaction.atomic():
+                    synchronize_entities.run()
+                    raise _Rollback()
+            except _Rollback:
+                pass
+            duration = time.perf_counter() - start
+        return duration, len(context.captured_queries)
+
+
+def _build_raw_entities() -> List[Dict]:
+    """
+    Last version of each entity synchronized from the ESB, in the format of the ESB entities endpoint
+    """
+    raw_entities = {}
+    entity_versions = EntityVersion.objects.filter(
+        entity__external_id__startswith=EXTERNAL_ID_PREFIX
+    ).select_related('entity', 'parent').order_by('start_date')
+    for entity_version in entity_versions:
+        esb_id = _get_esb_id(entity_version.entity.external_id)
+        raw_entities[esb_id] = {
+            'entity_id': esb_id,
+            'parent_entity_id': _get_esb_id(entity_version.parent.external_id) if entity_version.parent
+            else {"@nil": "true"},
+            'acronym': entity_version.acronym,
+            'name_fr': entity_version.title,
+            'departmentType': ESB_DEPARTMENT_TYPES.get(entity_version.entity_type, 'N'),
+            'begin': _to_esb_date(entity_version.start_date),
+            'end': _to_esb_date(entity_version.end_date),
+            'web': entity_version.entity.website,
+        }
+    return list(raw_entities.values())
+
+
+def _build_raw_addresses() -> Dict[str, Dict]:
+    raw_addresses = {}
+    addresses = EntityVersionAddress.objects.filter(
+        is_main=True,
+        entity_version__entity__external_id__startswith=EXTERNAL_ID_PREFIX
+    ).select_related('entity_version__entity')
+    for address in addresses:
+        entity = address.entity_version.entity
+        raw_addresses[_get_esb_id(entity.external_id)] = {
+            'town': address.city,
+            'streetName': address.street,
+            'streetNumber': address.street_number,
+            'postCode': address.postal_code,
+            'fax': entity.fax,
+            'phone': entity.phone,
+        }
+    return raw_addresses
+
+
+def _empty_raw_address() -> Dict:
+    return {'town': None, 'streetName': None, 'streetNumber': None, 'postCode': None, 'fax': None, 'phone': None}
+
+
+def _get_esb_id(external_id: str) -> str:
+    return external_id[len(EXTERNAL_ID_PREFIX):]
+
+
+def _to_esb_date(date) -> int:
+    return int(date.strftime('%Y%m%d')) if date else ESB_UNDEFINED_DATE
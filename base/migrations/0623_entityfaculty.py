@@ -0,0 +1,41 @@
+# Generated by Django 2.2.24 on 2026-10-18 14:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0622_person_curriculum'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntityFaculty',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('academic_year', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    to='base.AcademicYear',
+                )),
+                ('entity', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='+',
+                    to='base.Entity',
+                )),
+                ('faculty', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='+',
+                    to='base.Entity',
+                )),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='entityfaculty',
+            constraint=models.UniqueConstraint(
+                fields=('academic_year', 'entity'),
+                name='unique_entity_faculty_by_year',
+            ),
+        ),
+    ]
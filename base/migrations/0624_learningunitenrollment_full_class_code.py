@@ -0,0 +1,37 @@
+# Generated by Django 2.2.24 on 2026-10-18 15:00
+
+from django.db import migrations, models
+
+BACKFILL_FULL_CLASS_CODE = """
+    UPDATE base_learningunitenrollment lue
+    SET full_class_code = COALESCE(
+        (
+            SELECT CASE
+                WHEN lcy.type = 'LECTURING' THEN CONCAT(luy.acronym, '-', lcly.acronym)
+                WHEN lcy.type = 'PRACTICAL_EXERCISES' THEN CONCAT(luy.acronym, '_', lcly.acronym)
+            END
+            FROM learning_unit_learningclassyear lcly
+            JOIN base_learningcomponentyear lcy ON lcy.id = lcly.learning_component_year_id
+            WHERE lcly.id = lue.learning_class_year_id
+        ),
+        luy.acronym
+    )
+    FROM base_learningunityear luy
+    WHERE luy.id = lue.learning_unit_year_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0623_entityfaculty'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='learningunitenrollment',
+            name='full_class_code',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=17),
+        ),
+        migrations.RunSQL(BACKFILL_FULL_CLASS_CODE, reverse_sql=migrations.RunSQL.noop),
+    ]
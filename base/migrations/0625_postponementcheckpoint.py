@@ -0,0 +1,26 @@
+# Generated by Django 2.2.24 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0624_learningunitenrollment_full_class_code'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostponementCheckpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.CharField(max_length=50)),
+                ('from_year', models.IntegerField()),
+                ('key', models.CharField(max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'unique_together': {('job', 'from_year', 'key')},
+            },
+        ),
+    ]
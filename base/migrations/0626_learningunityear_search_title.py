@@ -0,0 +1,65 @@
+# Generated by Django 2.2.24 on 2026-10-18 17:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from unidecode import unidecode
+
+BATCH_SIZE = 2000
+
+
+def _normalize_for_search(*values):
+    return unidecode(" ".join(filter(None, values))).lower()
+
+
+def _complete_title(common_title, specific_title):
+    return ' - '.join(filter(None, [common_title, specific_title]))
+
+
+def fill_search_title(apps, schema_editor):
+    LearningUnitYear = apps.get_model('base', 'LearningUnitYear')
+    rows = LearningUnitYear.objects.values_list(
+        'pk',
+        'specific_title',
+        'specific_title_english',
+        'learning_container_year__common_title',
+        'learning_container_year__common_title_english',
+    ).order_by('pk')
+    batch = []
+    for pk, specific_title, specific_title_en, common_title, common_title_en in rows.iterator():
+        batch.append(LearningUnitYear(
+            pk=pk,
+            search_title=_normalize_for_search(
+                _complete_title(common_title, specific_title),
+                _complete_title(common_title_en, specific_title_en),
+            )
+        ))
+        if len(batch) == BATCH_SIZE:
+            LearningUnitYear.objects.bulk_update(batch, ['search_title'])
+            batch = []
+    LearningUnitYear.objects.bulk_update(batch, ['search_title'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0625_postponementcheckpoint'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='learningunityear',
+            name='search_title',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(fill_search_title, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='learningunityear',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['acronym'], name='luy_acronym_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='learningunityear',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_title'], name='luy_search_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 2.2.24 on 2026-10-18 18:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+from unidecode import unidecode
+
+BATCH_SIZE = 2000
+
+
+def _normalize_for_search(*values):
+    return unidecode(" ".join(filter(None, values))).lower()
+
+
+def fill_search_name(apps, schema_editor):
+    Person = apps.get_model('base', 'Person')
+    rows = Person.objects.values_list('pk', 'last_name', 'first_name', 'middle_name').order_by('pk')
+    batch = []
+    for pk, last_name, first_name, middle_name in rows.iterator():
+        batch.append(Person(pk=pk, search_name=_normalize_for_search(last_name, first_name, middle_name)))
+        if len(batch) == BATCH_SIZE:
+            Person.objects.bulk_update(batch, ['search_name'])
+            batch = []
+    Person.objects.bulk_update(batch, ['search_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0626_learningunityear_search_title'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='person',
+            name='search_name',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(fill_search_name, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_name'], name='person_search_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
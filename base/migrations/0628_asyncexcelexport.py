@@ -0,0 +1,31 @@
+# Generated by Django 2.2.24 on 2026-10-18 19:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0627_person_search_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AsyncExcelExport',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_uuid', models.UUIDField(unique=True)),
+                ('called_from_class', models.CharField(max_length=255)),
+                ('name', models.CharField(max_length=50)),
+                ('path', models.CharField(max_length=255)),
+                ('filters', models.TextField(blank=True, default='')),
+                ('language', models.CharField(max_length=30)),
+                ('fingerprint', models.CharField(db_index=True, max_length=64)),
+                ('file', models.FileField(blank=True, upload_to='excel_exports/')),
+                ('file_name', models.CharField(blank=True, default='', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='base.Person')),
+            ],
+        ),
+    ]
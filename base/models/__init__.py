@@ -1,6 +1,7 @@
 from base.models import academic_calendar
 from base.models import academic_year
 from base.models import admission_condition
+from base.models import async_excel_export
 from base.models import authorized_relationship
 from base.models import campus
 from base.models import certificate_aim
@@ -14,6 +15,7 @@ from base.models import education_group_year
 from base.models import education_group_year_domain
 from base.models import entity
 from base.models import entity_calendar
+from base.models import entity_faculty
 from base.models import entity_version
 from base.models import entity_version_address
 from base.models import exam_enrollment
@@ -35,6 +37,7 @@ from base.models import offer_year_calendar
 from base.models import organization
 from base.models import person
 from base.models import person_address
+from base.models import postponement_checkpoint
 from base.models import prerequisite
 from base.models import prerequisite_item
 from base.models import proposal_learning_unit
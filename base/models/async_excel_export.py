@@ -0,0 +1,55 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib import admin
+from django.db import models
+
+
+class AsyncExcelExportAdmin(admin.ModelAdmin):
+    list_display = ('job_uuid', 'person', 'called_from_class', 'name', 'file_name', 'created_at')
+    list_filter = ('name',)
+    search_fields = ['job_uuid', 'person__last_name', 'called_from_class']
+    raw_id_fields = ('person',)
+
+
+class AsyncExcelExport(models.Model):
+    """
+    Excel export of a search view (see base.utils.search.RenderToExcel) generated by a celery worker.
+    The progression of the generation is reported on the osis_async task identified by job_uuid.
+    """
+    job_uuid = models.UUIDField(unique=True)
+    person = models.ForeignKey('base.Person', on_delete=models.CASCADE)
+    called_from_class = models.CharField(max_length=255)
+    name = models.CharField(max_length=50)
+    path = models.CharField(max_length=255)
+    filters = models.TextField(blank=True, default='')
+    language = models.CharField(max_length=30)
+    fingerprint = models.CharField(max_length=64, db_index=True)
+    file = models.FileField(upload_to='excel_exports/', blank=True)
+    file_name = models.CharField(max_length=255, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return "{} - {}".format(self.name, self.job_uuid)
@@ -0,0 +1,45 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.db import models
+
+
+class EntityFaculty(models.Model):
+    """
+    Faculty containing each entity of the main organization at the start of an academic year (the entity itself when
+    it has no faculty above it). Rebuilt by the base.tasks.refresh_entity_faculties task when the entity versions
+    change, it allows to compare faculties in SQL.
+    """
+    academic_year = models.ForeignKey('AcademicYear', on_delete=models.CASCADE)
+    entity = models.ForeignKey('Entity', on_delete=models.CASCADE, related_name='+')
+    faculty = models.ForeignKey('Entity', on_delete=models.CASCADE, related_name='+')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['academic_year', 'entity'], name='unique_entity_faculty_by_year'),
+        ]
+
+    def __str__(self):
+        return "{} - {} - {}".format(self.academic_year, self.entity_id, self.faculty_id)
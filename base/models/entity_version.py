@@ -45,6 +45,7 @@ from base.models.enums import entity_type
 from base.models.enums.entity_type import PEDAGOGICAL_ENTITY_TYPES
 from base.models.enums.organization_type import ACADEMIC_PARTNER, MAIN
 from base.models.utils.func import ArrayConcat
+from base.utils import entity_hierarchy
 from osis_common.models.serializable_model import SerializableModel, SerializableModelAdmin
 from osis_common.utils.datetime import get_tzinfo
 
@@ -280,10 +281,14 @@ class EntityVersionQuerySet(CTEQuerySet):
 
     def descendants(self, entity, date=None):
         """ Return the children entities """
-        tree_qs = self.get_tree(entity, date)
-
-        # Children contain the asked entity as first element, ignore it
-        return self.filter(pk__in=tree_qs.values('id')[1:]).order_by('acronym')
+        entities = entity if isinstance(entity, Iterable) else [entity]
+        hierarchy = entity_hierarchy.get_entity_hierarchy(date)
+        descendants_versions_ids = {
+            hierarchy.get_version(descendant_id).pk
+            for an_entity in entities
+            for descendant_id in hierarchy.get_descendants_ids(getattr(an_entity, 'pk', an_entity))
+        }
+        return self.filter(pk__in=descendants_versions_ids).order_by('acronym')
 
     def pedagogical_entities(self):
         return self.filter(
@@ -428,28 +433,17 @@ class EntityVersion(SerializableModel):
         return self.entity_type == entity_type.FACULTY or self.acronym in PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS
 
     def find_faculty_version(self, academic_yr):
-        if self.entity_type == entity_type.FACULTY or self.acronym in PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS:
-            return self
-        # There is no faculty above the sector
-        elif self.entity_type == entity_type.SECTOR:
-            return None
-        else:
-            parent_entity_version = self._find_latest_version_by_parent(academic_yr.start_date)
-            if parent_entity_version:
-                return parent_entity_version.find_faculty_version(academic_yr)
-
-    def _find_latest_version_by_parent(self, start_date):
-        if not self.parent:
-            return None
-
-        # if a prefetch exist on the parent
-        entity_versions = getattr(self.parent, 'entity_versions', None)
-        if not entity_versions:
-            return find_latest_version_by_entity(self.parent, start_date)
-
-        for entity_version in entity_versions:
-            if entity_version.__contains_given_date(start_date):
-                return entity_version
+        hierarchy = entity_hierarchy.get_entity_hierarchy(academic_yr.start_date)
+        versions = [self]
+        if self.parent_id:
+            versions += hierarchy.get_version_and_ancestors(self.parent_id)
+        for version in versions:
+            if version.is_faculty():
+                return version
+            # There is no faculty above the sector
+            elif version.entity_type == entity_type.SECTOR:
+                return None
+        return None
 
     def get_parent_version(self, date=None):
         if date is None:
@@ -609,17 +603,24 @@ def find_all_current_entities_version() -> EntityVersionQuerySet:
     return find_latest_version(date=now)
 
 
-# TODO Use recursive query instead
 def build_current_entity_version_structure_in_memory(date: datetime.date = None) -> Dict[int, Dict]:
-    if date:
-        all_current_entities_version = find_latest_version(date=date)
-    else:
-        all_current_entities_version = find_all_current_entities_version()
+    """
+    The structure is built once per entity hierarchy (see base.utils.entity_hierarchy) and shared: it must not be
+    modified.
+    """
+    hierarchy = entity_hierarchy.get_entity_hierarchy(date)
+    if hierarchy.structure is None:
+        hierarchy.structure = _build_entity_version_structure(hierarchy)
+    return hierarchy.structure
+
+
+def _build_entity_version_structure(hierarchy: entity_hierarchy.EntityHierarchy) -> Dict[int, Dict]:
+    all_current_entities_version = hierarchy.entity_versions
     entity_version_by_entity_id = _build_entity_version_by_entity_id(all_current_entities_version)
     direct_children_by_entity_version_id = _build_direct_children_by_entity_version_id(entity_version_by_entity_id)
     all_children_by_entity_version_id = _build_all_children_by_entity_version_id(direct_children_by_entity_version_id)
 
-    entity_versions = {}
+    entity_versions = entity_hierarchy.EntityVersionStructure(hierarchy)
     for entity_version in all_current_entities_version:
         entity_versions[entity_version.entity_id] = {
             'entity_version_parent': entity_version_by_entity_id.get(entity_version.parent_id),
@@ -640,6 +641,11 @@ def get_structure_of_entity_version(entity_versions: dict, root: str = None) ->
 
 def get_entity_version_parent_or_itself_from_type(entity_versions: dict, entity: str, entity_type: str)\
         -> EntityVersion:
+    hierarchy = getattr(entity_versions, 'hierarchy', None)
+    if hierarchy:
+        entity_version = hierarchy.get_version_by_acronym(entity)
+        return entity_version and hierarchy.get_version_or_parent_of_type(entity_version.entity_id, entity_type)
+
     entities_version = get_structure_of_entity_version(entity_versions, root=entity)
     if entities_version.get('entity_version') and entities_version.get('entity_version').entity_type == entity_type:
         return entities_version.get('entity_version')
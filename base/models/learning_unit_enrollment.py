@@ -30,6 +30,7 @@ from django.db import models
 from django.db.models import Model
 
 from base.models.enums import learning_unit_enrollment_state
+from base.models.enums.learning_component_year_type import LECTURING, PRACTICAL_EXERCISES
 from osis_common.models.osis_model_admin import OsisModelAdmin
 
 
@@ -74,10 +75,29 @@ class LearningUnitEnrollment(Model):
     )
     offer_enrollment = models.ForeignKey('OfferEnrollment', on_delete=models.PROTECT)
     enrollment_state = models.CharField(max_length=20, choices=learning_unit_enrollment_state.STATES, default="")
+    # Code of the learning unit including the class acronym (ex: LDROI1001-A / LDROI1001_A).
+    # Also kept up to date by the DB triggers of backoffice/triggers/*full_class_code*.sql
+    full_class_code = models.CharField(max_length=17, db_index=True, editable=False, default="")
 
     class Meta:
         unique_together = ('offer_enrollment', 'learning_unit_year', 'learning_class_year', 'enrollment_state',)
 
+    def save(self, *args, **kwargs):
+        self.full_class_code = self.compute_full_class_code()
+        super().save(*args, **kwargs)
+
+    def compute_full_class_code(self) -> str:
+        acronym = self.learning_unit_year.acronym
+        if self.learning_class_year_id:
+            class_year = self.learning_class_year
+            separator = {
+                LECTURING: '-',
+                PRACTICAL_EXERCISES: '_',
+            }.get(class_year.learning_component_year.type)
+            if separator:
+                return "{}{}{}".format(acronym, separator, class_year.acronym)
+        return acronym
+
     @property
     def student(self):
         return self.offer_enrollment.student
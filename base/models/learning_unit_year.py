@@ -27,12 +27,13 @@ import uuid
 from decimal import Decimal
 from typing import List
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator, RegexValidator
 from django.db import models
 from django.db.models import Q, When, CharField, Value, Case, Subquery, OuterRef, F, fields, Exists
 from django.db.models.functions import Concat
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch.dispatcher import receiver
 from django.urls import reverse
 from django.utils import translation
@@ -58,6 +59,7 @@ from base.models.enums.quadrimesters import LearningUnitYearQuadrimester
 from base.models.learning_component_year import LearningComponentYear
 from base.models.learning_unit import LEARNING_UNIT_ACRONYM_REGEX_MODEL
 from base.models.prerequisite_item import PrerequisiteItem
+from base.utils.string import normalize_for_search
 from education_group import publisher
 from osis_common.models.osis_model_admin import OsisModelAdmin
 
@@ -378,6 +380,8 @@ class LearningUnitYear(models.Model):
         verbose_name=_('Other remark in english (intended for publication)')
     )
     faculty_remark = models.TextField(blank=True, null=True, verbose_name=_('Faculty remark (unpublished)'))
+    # Complete titles (french and english) without accents, kept up to date on save for the title searches
+    search_title = models.TextField(blank=True, default='', editable=False)
 
     objects = BaseLearningUnitYearManager()
     objects_with_container = LearningUnitYearWithContainerManager()
@@ -391,12 +395,17 @@ class LearningUnitYear(models.Model):
         permissions = (
             ("can_receive_emails_about_automatic_postponement", "Can receive emails about automatic postponement"),
         )
+        indexes = [
+            GinIndex(fields=['acronym'], name='luy_acronym_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['search_title'], name='luy_search_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ]
 
     def __str__(self):
         return u"%s - %s" % (self.academic_year, self.acronym)
 
     def save(self, *args, **kwargs):
         from learning_unit.ddd.domain.learning_unit_year_identity import LearningUnitYearIdentity
+        self.search_title = self.build_search_title()
         super().save(*args, **kwargs)
         publisher.learning_unit_year_created.send(
             None,
@@ -465,6 +474,9 @@ class LearningUnitYear(models.Model):
             ]))
         return complete_title_english
 
+    def build_search_title(self) -> str:
+        return normalize_for_search(self.complete_title, self.complete_title_english)
+
     @property
     def complete_title_i18n(self):
         complete_title = self.complete_title
@@ -985,6 +997,20 @@ def _learningunityear_delete(sender, instance, **kwargs):
     TranslatedText.objects.filter(entity=LEARNING_UNIT_YEAR, reference=instance.id).delete()
 
 
+@receiver(post_save, sender='base.LearningContainerYear')
+def _update_search_titles_from_container(sender, instance, created=False, **kwargs):
+    if created:
+        return
+    learning_unit_years = []
+    for learning_unit_year in instance.learningunityear_set.all():
+        learning_unit_year.learning_container_year = instance
+        search_title = learning_unit_year.build_search_title()
+        if learning_unit_year.search_title != search_title:
+            learning_unit_year.search_title = search_title
+            learning_unit_years.append(learning_unit_year)
+    LearningUnitYear.objects.bulk_update(learning_unit_years, ['search_title'])
+
+
 def _check_quadrimester_volume(effective_class: 'LearningClassYear', quadri: str) -> List[str]:
     q1_q2_warnings = _get_q1_q2_warnings(effective_class, quadri)
     q1and2_q1or2_warnings = _get_q1and2_q1or2_warnings(effective_class, quadri)
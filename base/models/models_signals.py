@@ -25,16 +25,51 @@
 ##############################################################################
 from django.conf import settings
 from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver, Signal
 
 from base import models as mdl
 from base.auth.roles import program_manager, tutor
+from base.business import academic_calendar
+from base.models.academic_calendar import AcademicCalendar
+from base.models.academic_year import AcademicYear
+from base.models.entity_version import EntityVersion
+from base.models.session_exam_calendar import SessionExamCalendar
+from base.tasks import refresh_entity_faculties
+from base.utils import entity_hierarchy
 from osis_common.models.serializable_model import SerializableModel
 from osis_common.models.signals.authentication import user_created_signal, user_updated_signal
 
 person_created = Signal(providing_args=['person'])
 
 
+@receiver(post_save, sender=EntityVersion)
+@receiver(post_delete, sender=EntityVersion)
+def invalidate_entity_hierarchy(sender, **kwargs):
+    entity_hierarchy.invalidate()
+
+
+@receiver(post_save, sender=EntityVersion)
+@receiver(post_delete, sender=EntityVersion)
+def refresh_faculties_of_entities(sender, **kwargs):
+    transaction.on_commit(lambda: refresh_entity_faculties.run.delay())
+
+
+@receiver(post_save, sender=AcademicYear)
+def refresh_faculties_of_entities_of_academic_year(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: refresh_entity_faculties.run.delay(academic_year_ids=[instance.pk]))
+
+
+@receiver(post_save, sender=AcademicCalendar)
+@receiver(post_delete, sender=AcademicCalendar)
+@receiver(post_save, sender=SessionExamCalendar)
+@receiver(post_delete, sender=SessionExamCalendar)
+def invalidate_academic_events(sender, **kwargs):
+    academic_calendar.invalidate()
+
+
 @receiver(user_created_signal)
 @receiver(user_updated_signal)
 def update_person(sender, **kwargs):
@@ -22,10 +22,14 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import functools
+import operator
 from datetime import date
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import TrigramSimilarity
 from django.core.validators import RegexValidator
 from django.db import models
 from django.db.models import Q
@@ -39,6 +43,7 @@ from base.models.enums import person_source_type
 from base.models.enums.civil_state import CivilState
 from base.models.enums.groups import CENTRAL_MANAGER_GROUP, FACULTY_MANAGER_GROUP, SIC_GROUP, \
     UE_FACULTY_MANAGER_GROUP, CATALOG_VIEWER_GROUP, PROGRAM_MANAGER_GROUP, UE_CENTRAL_MANAGER_GROUP
+from base.utils.string import normalize_for_search
 from osis_common.models.serializable_model import SerializableModel, SerializableModelAdmin, SerializableModelManager
 from osis_common.utils.models import get_object_or_none
 
@@ -154,6 +159,7 @@ class Person(SerializableModel):
     )
     employee = models.BooleanField(default=False)
     managed_entities = models.ManyToManyField("Entity", through="EntityManager")
+    search_name = models.TextField(blank=True, default='', editable=False)
 
     def save(self, **kwargs):
         # When person is created by another application this rule can be applied.
@@ -164,8 +170,12 @@ class Person(SerializableModel):
                         and settings.INTERNAL_EMAIL_SUFFIX in str(self.email).lower():
                     raise AttributeError('Invalid email for external person.')
 
+        self.search_name = self.build_search_name()
         super(Person, self).save()
 
+    def build_search_name(self) -> str:
+        return normalize_for_search(self.last_name, self.first_name, self.middle_name)
+
     def username(self):
         if self.user is None:
             return None
@@ -229,6 +239,9 @@ class Person(SerializableModel):
             ("can_change_attribution", "Can change attribution"),
             ('can_read_persons_roles', 'Can read persons roles'),
         )
+        indexes = [
+            GinIndex(fields=['search_name'], name='person_search_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ]
 
     # TODO: Remove this property in dissertation app
     @cached_property
@@ -296,6 +309,27 @@ def search_employee(full_name):
     return None
 
 
+def get_name_filter(name: str, lookup_prefix: str = '') -> Q:
+    """
+    Accent-insensitive filter on the search_name column (trigram indexed) matching every word of the name
+    """
+    lookup = '{}search_name__contains'.format(lookup_prefix)
+    return functools.reduce(
+        operator.and_,
+        (Q(**{lookup: word}) for word in normalize_for_search(name).split()),
+        Q()
+    )
+
+
+def order_by_name_similarity(queryset, name: str, lookup_prefix: str = ''):
+    """
+    Order the queryset by decreasing trigram similarity between the search_name of the persons and the name searched
+    """
+    return queryset.annotate(
+        name_rank=TrigramSimilarity('{}search_name'.format(lookup_prefix), normalize_for_search(name))
+    ).order_by('-name_rank', '{}last_name'.format(lookup_prefix), '{}first_name'.format(lookup_prefix))
+
+
 def annotate_with_first_last_names():
     queryset = Person.objects.annotate(begin_by_first_name=Lower(Concat('first_name', Value(' '), 'last_name')))
     queryset = queryset.annotate(begin_by_last_name=Lower(Concat('last_name', Value(' '), 'first_name')))
@@ -0,0 +1,50 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.contrib import admin
+from django.db import models
+
+
+class PostponementCheckpointAdmin(admin.ModelAdmin):
+    list_display = ('job', 'from_year', 'key', 'created_at')
+    list_filter = ('job', 'from_year')
+    search_fields = ['key']
+
+
+class PostponementCheckpoint(models.Model):
+    """
+    Unit of work (container, partim, program...) already postponed by a postponement job starting from a year.
+    Written in the same transaction as the postponed rows (see base.business.postponement_jobs).
+    """
+    job = models.CharField(max_length=50)
+    from_year = models.IntegerField()
+    key = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('job', 'from_year', 'key')
+
+    def __str__(self):
+        return "{} - {} - {}".format(self.job, self.from_year, self.key)
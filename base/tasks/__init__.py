@@ -3,6 +3,9 @@ from . import check_academic_calendar
 from . import extend_learning_units
 from . import synchronize_entities
 from . import calendar_reminder_notice
+from . import generate_excel_export
+from . import clean_excel_exports
+from . import refresh_entity_faculties
 
 
 from celery.schedules import crontab
@@ -24,4 +27,12 @@ celery_app.conf.beat_schedule.update({
         'task': 'base.tasks.synchronize_entities.run',
         'schedule': crontab(minute=1)
     },
+    'Refresh entity faculties': {
+        'task': 'base.tasks.refresh_entity_faculties.run',
+        'schedule': crontab(minute=0, hour=2)
+    },
+    'Clean excel exports': {
+        'task': 'base.tasks.clean_excel_exports.run',
+        'schedule': crontab(minute=30)
+    },
 })
@@ -0,0 +1,52 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+from typing import List
+
+from django.conf import settings
+
+from backoffice.celery import app as celery_app
+from base.business.entity_version import refresh_entity_faculties
+from base.models.academic_year import AcademicYear
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+
+@celery_app.task
+def run(academic_year_ids: List[int] = None) -> dict:
+    """
+    Rebuild the faculties of the entities of the academic years (default: all of them) read by the borrowed and
+    service courses searches
+    """
+    academic_years = AcademicYear.objects.order_by('year')
+    if academic_year_ids is not None:
+        academic_years = academic_years.filter(pk__in=academic_year_ids)
+    years = []
+    for academic_year in academic_years:
+        refresh_entity_faculties(academic_year)
+        years.append(academic_year.year)
+    logger.info("Entity faculties refreshed for academic years %s", years)
+    return {'Entity faculties refreshed': years}
@@ -1,28 +1,38 @@
+import collections
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
 import requests
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+
 from backoffice.celery import app as celery_app
 from base.models.entity import Entity
 from base.models.entity_version import EntityVersion
 from base.models.entity_version_address import EntityVersionAddress
 from base.models.enums import organization_type, entity_type
 from base.models.organization import Organization
+from base.utils import entity_hierarchy
 
 from reference.models.country import Country
 
 logger = logging.getLogger(settings.DEFAULT_LOGGER)
 
+ADDRESS_FETCH_MAX_WORKERS = 10
+
 
 @celery_app.task
 def run() -> dict:
     try:
-        raw_entities = __fetch_entities_from_esb()
-        raw_root_entity = next(entity for entity in raw_entities if __is_root_entity(entity))
-        __upsert_entity(raw_root_entity)
-        __save_children_entities(raw_root_entity, raw_entities)
+        raw_entities = __sort_from_root(__fetch_entities_from_esb())
+        raw_addresses = __fetch_addresses_from_esb(raw_entities)
+        __upsert_entities(raw_entities, raw_addresses)
+        entity_hierarchy.invalidate()
         return {'Entities synchronized': 'OK'}
     except FetchEntitiesException:
         return {'Entities synchronized': 'Unable to fetch data from ESB'}
@@ -46,14 +56,30 @@ def __fetch_entities_from_esb():
         raise FetchEntitiesException
 
 
-def __fetch_address_from_esb(raw_entity):
+def __fetch_addresses_from_esb(raw_entities: List[Dict]) -> Dict[str, Dict]:
+    """
+    Fetch the address of each entity, ADDRESS_FETCH_MAX_WORKERS at a time, through a pool of kept-alive connections
+    """
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=ADDRESS_FETCH_MAX_WORKERS) as executor:
+        session.mount('https://', HTTPAdapter(pool_maxsize=ADDRESS_FETCH_MAX_WORKERS))
+        session.mount('http://', HTTPAdapter(pool_maxsize=ADDRESS_FETCH_MAX_WORKERS))
+        raw_addresses = executor.map(
+            lambda raw_entity: __fetch_address_from_esb(raw_entity, session=session),
+            raw_entities
+        )
+        return {
+            raw_entity['entity_id']: raw_address for raw_entity, raw_address in zip(raw_entities, raw_addresses)
+        }
+
+
+def __fetch_address_from_esb(raw_entity, session=requests):
     if not all([settings.ESB_API_URL, settings.ESB_ENTITY_ADDRESS_ENDPOINT]):
         raise ImproperlyConfigured('ESB_API_URL / ESB_ENTITY_ADDRESS_ENDPOINT must be set in configuration')
 
     endpoint = settings.ESB_ENTITY_ADDRESS_ENDPOINT.format(entity_id=raw_entity['entity_id'])
     url = "{esb_api}/{endpoint}".format(esb_api=settings.ESB_API_URL, endpoint=endpoint)
     try:
-        entity_address_wrapper = requests.get(
+        entity_address_wrapper = session.get(
             url,
             headers={"Authorization": settings.ESB_AUTHORIZATION},
             timeout=settings.REQUESTS_TIMEOUT or 20
@@ -65,53 +91,153 @@ def __fetch_address_from_esb(raw_entity):
         raise FetchEntitiesException
 
 
-def __save_children_entities(raw_entity, all_raw_entities):
-    for child_entity in filter(lambda entity: entity['parent_entity_id'] == raw_entity['entity_id'], all_raw_entities):
-        __upsert_entity(child_entity)
-        __save_children_entities(child_entity, all_raw_entities)
+def __sort_from_root(raw_entities: List[Dict]) -> List[Dict]:
+    """
+    Return the entities reachable from the root, each parent before its children
+    """
+    raw_children_by_parent_id = collections.defaultdict(list)
+    for raw_entity in raw_entities:
+        if not __is_root_entity(raw_entity):
+            raw_children_by_parent_id[raw_entity['parent_entity_id']].append(raw_entity)
+
+    raw_root_entity = next(entity for entity in raw_entities if __is_root_entity(entity))
+    sorted_raw_entities = [raw_root_entity]
+    for raw_entity in sorted_raw_entities:
+        sorted_raw_entities.extend(raw_children_by_parent_id[raw_entity['entity_id']])
+    return sorted_raw_entities
+
 
+@transaction.atomic
+def __upsert_entities(raw_entities: List[Dict], raw_addresses: Dict[str, Dict]) -> None:
+    """
+    Compare the entities, versions and main addresses with the existing rows (loaded in three queries) and write the
+    changes only. Entities and versions are still saved one by one : the versions are validated against overlapping
+    dates on save. The addresses are written in bulk.
+    """
+    external_ids = [__build_entity_external_id(raw_entity['entity_id']) for raw_entity in raw_entities]
+    entities_by_external_id = Entity.objects.in_bulk(external_ids, field_name='external_id')
+    entity_versions_by_key = {}
+    for entity_version in EntityVersion.objects.filter(entity__external_id__in=external_ids).order_by('pk'):
+        entity_versions_by_key.setdefault(__get_entity_version_key(entity_version), entity_version)
+    addresses_by_entity_version_id = {
+        address.entity_version_id: address
+        for address in EntityVersionAddress.objects.filter(
+            entity_version__entity__external_id__in=external_ids,
+            is_main=True
+        )
+    }
+    main_organization_id = Organization.objects.only('pk').get(type=organization_type.MAIN).pk
+    belgium_id = Country.objects.only('pk').get(iso_code='BE').pk
 
-def __upsert_entity(raw_entity):
-    raw_address = __fetch_address_from_esb(raw_entity)
+    addresses_to_create = []
+    addresses_to_update = []
+    for raw_entity in raw_entities:
+        raw_address = raw_addresses[raw_entity['entity_id']]
+        entity = __upsert_entity(raw_entity, raw_address, entities_by_external_id, main_organization_id)
+        parent = entities_by_external_id[__build_entity_external_id(raw_entity['parent_entity_id'])] \
+            if not __is_root_entity(raw_entity) else None
+        try:
+            entity_version = __upsert_entity_version(raw_entity, entity, parent, entity_versions_by_key)
+        except AttributeError:
+            logger.info("[Synchronize entities] Overlapping found for " + raw_entity['acronym'])
+            continue
 
-    entity, _ = Entity.objects.update_or_create(
-        external_id=__build_entity_external_id(raw_entity['entity_id']),
-        defaults={
-            'website': raw_entity['web'] or '',
-            'organization': Organization.objects.only('pk').get(type=organization_type.MAIN),
-            'fax': raw_address['fax'] or '',
-            'phone': raw_address['phone'] or ''
+        address_values = {
+            'city': str(raw_address['town'] or ''),
+            'street': str(raw_address['streetName'] or ''),
+            'street_number': str(raw_address['streetNumber'] or ''),
+            'postal_code': str(raw_address['postCode'] or ''),
+            'country_id': belgium_id,
         }
-    )
+        address = addresses_by_entity_version_id.get(entity_version.pk)
+        if address is None:
+            addresses_to_create.append(
+                EntityVersionAddress(entity_version=entity_version, is_main=True, **address_values)
+            )
+        elif __update_fields(address, address_values):
+            address.changed = timezone.now()
+            addresses_to_update.append(address)
 
-    parent = Entity.objects.only('pk').get(external_id=__build_entity_external_id(raw_entity['parent_entity_id'])) \
-        if not __is_root_entity(raw_entity) else None
-    try:
-        entity_version, _ = EntityVersion.objects.update_or_create(
-            entity=entity,
-            acronym=raw_entity['acronym'],
-            parent=parent,
-            title=raw_entity['name_fr'],
-            entity_type=__get_entity_type(raw_entity),
-            start_date=ESBDate(raw_entity['begin']).to_date(),
-            defaults={
-                'end_date': ESBDate(raw_entity['end']).to_date()
-            }
+    EntityVersionAddress.objects.bulk_create(addresses_to_create)
+    EntityVersionAddress.objects.bulk_update(
+        addresses_to_update,
+        ['city', 'street', 'street_number', 'postal_code', 'country', 'changed']
+    )
+    logger.info(
+        "[Synchronize entities] {} entities synchronized, {} addresses created, {} addresses updated".format(
+            len(raw_entities), len(addresses_to_create), len(addresses_to_update)
         )
+    )
 
-        EntityVersionAddress.objects.update_or_create(
-            entity_version=entity_version,
-            is_main=True,
-            defaults={
-                'city': raw_address['town'] or '',
-                'street': raw_address['streetName'] or '',
-                'street_number': raw_address['streetNumber'] or '',
-                'postal_code': raw_address['postCode'] or '',
-                'country': Country.objects.only('pk').get(iso_code='BE'),
-            }
-        )
-    except AttributeError:
-        logger.info("[Synchronize entities] Overlapping found for " + raw_entity['acronym'])
+
+def __upsert_entity(
+        raw_entity: Dict,
+        raw_address: Dict,
+        entities_by_external_id: Dict[str, Entity],
+        main_organization_id: int
+) -> Entity:
+    external_id = __build_entity_external_id(raw_entity['entity_id'])
+    values = {
+        'website': str(raw_entity['web'] or ''),
+        'organization_id': main_organization_id,
+        'fax': str(raw_address['fax'] or ''),
+        'phone': str(raw_address['phone'] or '')
+    }
+    entity = entities_by_external_id.get(external_id)
+    if entity is None:
+        entity = Entity(external_id=external_id, **values)
+        entity.save()
+        entities_by_external_id[external_id] = entity
+    elif __update_fields(entity, values):
+        entity.save()
+    return entity
+
+
+def __upsert_entity_version(
+        raw_entity: Dict,
+        entity: Entity,
+        parent: Entity,
+        entity_versions_by_key: Dict[tuple, EntityVersion]
+) -> EntityVersion:
+    entity_version = EntityVersion(
+        entity=entity,
+        acronym=raw_entity['acronym'],
+        parent=parent,
+        title=raw_entity['name_fr'],
+        entity_type=__get_entity_type(raw_entity),
+        start_date=ESBDate(raw_entity['begin']).to_date(),
+    )
+    end_date = ESBDate(raw_entity['end']).to_date()
+    key = __get_entity_version_key(entity_version)
+    existing_entity_version = entity_versions_by_key.get(key)
+    if existing_entity_version is None:
+        entity_version.end_date = end_date
+        entity_version.save()
+        entity_versions_by_key[key] = entity_version
+    elif __update_fields(existing_entity_version, {'end_date': end_date}):
+        existing_entity_version.save()
+    return entity_versions_by_key[key]
+
+
+def __get_entity_version_key(entity_version: EntityVersion) -> tuple:
+    return (
+        entity_version.entity_id,
+        entity_version.acronym,
+        entity_version.parent_id,
+        entity_version.title,
+        entity_version.entity_type,
+        entity_version.start_date,
+    )
+
+
+def __update_fields(obj, values: Dict) -> bool:
+    """Set the values on obj and return whether any of them changed"""
+    changed = False
+    for field_name, value in values.items():
+        if getattr(obj, field_name) != value:
+            setattr(obj, field_name, value)
+            changed = True
+    return changed
 
 
 def __build_entity_external_id(esb_id) -> str:
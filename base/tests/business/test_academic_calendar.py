@@ -0,0 +1,150 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+from unittest import mock
+
+import attr
+from django.core.cache import cache
+from django.test import TestCase, override_settings, SimpleTestCase
+
+from base.business import academic_calendar
+from base.business.academic_calendar import AcademicEvent, AcademicSessionEvent, AcademicEventsSnapshot
+from base.models.enums.academic_calendar_type import AcademicCalendarTypes
+from base.tests.factories.academic_calendar import OpenAcademicCalendarFactory
+from base.tests.factories.session_exam_calendar import SessionExamCalendarFactory
+from learning_unit.calendar.learning_unit_summary_edition_calendar import LearningUnitSummaryEditionCalendar
+
+
+class TestAcademicEventsSnapshot(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.summary_event_2021 = _build_event(1, AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION, 2021)
+        cls.summary_event_2020 = _build_event(2, AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION, 2020)
+        cls.scores_event_session_1 = AcademicSessionEvent(
+            **attr.asdict(_build_event(3, AcademicCalendarTypes.SCORES_EXAM_SUBMISSION, 2020)),
+            session=1
+        )
+        cls.snapshot = AcademicEventsSnapshot(
+            [cls.summary_event_2021, cls.scores_event_session_1, cls.summary_event_2020]
+        )
+
+    def test_should_index_events_by_reference_sorted_by_start_date(self):
+        self.assertTupleEqual(
+            self.snapshot.get_academic_events(AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION.name),
+            (self.summary_event_2020, self.summary_event_2021)
+        )
+        self.assertTupleEqual(self.snapshot.get_academic_events(AcademicCalendarTypes.DELIBERATION.name), ())
+
+    def test_should_index_events_by_target_year(self):
+        self.assertEqual(
+            self.snapshot.get_academic_event(AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION.name, 2021),
+            self.summary_event_2021
+        )
+        self.assertIsNone(self.snapshot.get_academic_event(AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION.name, 2019))
+
+    def test_should_index_session_events_by_target_year_and_session(self):
+        self.assertEqual(
+            self.snapshot.get_academic_session_event(AcademicCalendarTypes.SCORES_EXAM_SUBMISSION.name, 2020, 1),
+            self.scores_event_session_1
+        )
+        self.assertIsNone(
+            self.snapshot.get_academic_session_event(AcademicCalendarTypes.SCORES_EXAM_SUBMISSION.name, 2020, 2)
+        )
+
+
+@override_settings(ACADEMIC_CALENDAR_CACHE_ENABLED=True)
+class TestGetAcademicEventsSnapshot(TestCase):
+    def setUp(self):
+        cache.delete(academic_calendar.VERSION_CACHE_KEY)
+        patcher = mock.patch('base.business.academic_calendar.transaction.on_commit', side_effect=lambda func: func())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_should_answer_calendar_helpers_without_querying_once_loaded(self):
+        OpenAcademicCalendarFactory(reference=AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION.name)
+        academic_calendar.get_academic_events_snapshot()
+
+        with self.assertNumQueries(0):
+            LearningUnitSummaryEditionCalendar().is_target_year_authorized()
+            LearningUnitSummaryEditionCalendar().get_opened_academic_events()
+
+    def test_should_reload_snapshot_when_an_academic_calendar_is_saved(self):
+        self.assertFalse(LearningUnitSummaryEditionCalendar().is_target_year_authorized())
+
+        calendar = OpenAcademicCalendarFactory(reference=AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION.name)
+
+        self.assertTrue(
+            LearningUnitSummaryEditionCalendar().is_target_year_authorized(target_year=calendar.data_year.year)
+        )
+
+    def test_should_reload_snapshot_when_a_session_exam_calendar_is_saved(self):
+        calendar = OpenAcademicCalendarFactory(reference=AcademicCalendarTypes.SCORES_EXAM_SUBMISSION.name)
+        self.assertIsNone(_get_session_event(calendar, session=1))
+
+        SessionExamCalendarFactory(academic_calendar=calendar, number_session=1)
+
+        self.assertIsNotNone(_get_session_event(calendar, session=1))
+
+    def test_should_answer_academic_event_of_helper_without_querying_once_loaded(self):
+        calendar = OpenAcademicCalendarFactory(reference=AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION.name)
+        academic_calendar.get_academic_events_snapshot()
+
+        with self.assertNumQueries(0):
+            academic_event = LearningUnitSummaryEditionCalendar().get_academic_event(calendar.data_year.year)
+
+        self.assertEqual(academic_event.id, calendar.id)
+
+
+@override_settings(ACADEMIC_CALENDAR_CACHE_ENABLED=False)
+class TestGetAcademicEventsSnapshotWithoutCache(TestCase):
+    def test_should_only_load_events_of_the_reference(self):
+        calendar = OpenAcademicCalendarFactory(reference=AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION.name)
+        OpenAcademicCalendarFactory(reference=AcademicCalendarTypes.EDUCATION_GROUP_EDITION.name)
+
+        snapshot = academic_calendar.get_academic_events_snapshot(AcademicCalendarTypes.SUMMARY_COURSE_SUBMISSION.name)
+
+        self.assertEqual([event.id for event in snapshot.get_academic_events()], [calendar.id])
+
+
+def _get_session_event(calendar, session: int):
+    return academic_calendar.get_academic_events_snapshot().get_academic_session_event(
+        calendar.reference,
+        calendar.data_year.year,
+        session
+    )
+
+
+def _build_event(id: int, reference: AcademicCalendarTypes, target_year: int) -> AcademicEvent:
+    return AcademicEvent(
+        id=id,
+        title=reference.name,
+        authorized_target_year=target_year,
+        start_date=datetime.date(target_year, 9, 15),
+        end_date=datetime.date(target_year + 1, 9, 14),
+        type=reference.name,
+    )
+
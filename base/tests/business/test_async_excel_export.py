@@ -0,0 +1,172 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+import shutil
+import tempfile
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from osis_async.models import AsyncTask
+from osis_async.models.enums import TaskStates
+
+from base.business import async_excel_export
+from base.models.async_excel_export import AsyncExcelExport
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.learning_unit_year import LearningUnitYearFactory
+from base.tests.factories.person import PersonWithPermissionsFactory, PersonFactory
+from base.utils.cache import RequestCache
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def _xls_response(*args, **kwargs):
+    response = HttpResponse(b'xls content')
+    response['Content-Disposition'] = "attachment; filename=learning_units.xlsx"
+    return response
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+@mock.patch('base.business.async_excel_export.transaction.on_commit', side_effect=lambda func: func())
+@mock.patch('base.business.async_excel_export.generate_excel_export.run.delay')
+class TestAsyncExcelExport(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        AcademicYearFactory.produce()
+        cls.luy = LearningUnitYearFactory()
+        cls.url = reverse("learning_units")
+        cls.get_data = {
+            "academic_year": str(cls.luy.academic_year.id),
+            "xls_status": "xls",
+            "xls_async": "true",
+        }
+        cls.person = PersonWithPermissionsFactory("can_access_learningunit")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.client.force_login(self.person.user)
+
+    def test_should_schedule_export_and_return_right_away(self, mock_delay, mock_on_commit):
+        with mock.patch("base.views.learning_units.search.common.create_xls") as mock_create_xls:
+            response = self.client.get(self.url, data=self.get_data)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertFalse(mock_create_xls.called)
+        export = AsyncExcelExport.objects.get()
+        self.assertEqual(response.json()['job_uuid'], str(export.job_uuid))
+        self.assertEqual(export.called_from_class, 'base.views.learning_units.search.simple.LearningUnitSearch')
+        self.assertNotIn('xls_async', export.filters)
+        mock_delay.assert_called_once_with(str(export.job_uuid))
+
+    def test_should_deduplicate_identical_exports_in_progress(self, mock_delay, mock_on_commit):
+        first_response = self.client.get(self.url, data=self.get_data)
+        second_response = self.client.get(self.url, data=self.get_data)
+
+        self.assertEqual(first_response.json()['job_uuid'], second_response.json()['job_uuid'])
+        self.assertEqual(AsyncExcelExport.objects.count(), 1)
+        self.assertEqual(mock_delay.call_count, 1)
+
+    def test_should_not_keep_export_parameters_in_search_cache(self, mock_delay, mock_on_commit):
+        self.client.get(self.url, data=self.get_data)
+
+        cached_data = RequestCache(self.person.user, self.url).cached_data
+        self.assertEqual(cached_data['academic_year'], [str(self.luy.academic_year.id)])
+        self.assertNotIn('xls_status', cached_data)
+        self.assertNotIn('xls_async', cached_data)
+
+    @override_settings(EXCEL_EXPORT_PENDING_TIMEOUT=60)
+    def test_should_report_error_and_allow_new_export_when_pending_for_too_long(self, mock_delay, mock_on_commit):
+        job_uuid = self.client.get(self.url, data=self.get_data).json()['job_uuid']
+        AsyncExcelExport.objects.update(created_at=timezone.now() - datetime.timedelta(minutes=2))
+
+        response = self.client.get(self.url, data=self.get_data)
+        self.assertNotEqual(response.json()['job_uuid'], job_uuid)
+
+        async_excel_export.clean_exports()
+        self.assertEqual(AsyncTask.objects.get(uuid=job_uuid).state, TaskStates.ERROR.name)
+        self.assertEqual(AsyncTask.objects.get(uuid=response.json()['job_uuid']).state, TaskStates.PENDING.name)
+
+    @override_settings(EXCEL_EXPORT_RETENTION_DAYS=7)
+    def test_should_delete_exports_older_than_retention_period(self, mock_delay, mock_on_commit):
+        job_uuid = self.client.get(self.url, data=self.get_data).json()['job_uuid']
+        with mock.patch("base.views.learning_units.search.common.create_xls", side_effect=_xls_response):
+            async_excel_export.generate(job_uuid)
+        export = AsyncExcelExport.objects.get(job_uuid=job_uuid)
+        AsyncExcelExport.objects.update(created_at=timezone.now() - datetime.timedelta(days=8))
+
+        async_excel_export.clean_exports()
+
+        self.assertFalse(AsyncExcelExport.objects.exists())
+        self.assertFalse(export.file.storage.exists(export.file.name))
+
+    def test_should_generate_file_and_report_progression(self, mock_delay, mock_on_commit):
+        job_uuid = self.client.get(self.url, data=self.get_data).json()['job_uuid']
+
+        with mock.patch("base.views.learning_units.search.common.create_xls", side_effect=_xls_response):
+            async_excel_export.generate(job_uuid)
+
+        export = AsyncExcelExport.objects.get(job_uuid=job_uuid)
+        self.assertEqual(export.file_name, 'learning_units.xlsx')
+        self.assertEqual(export.file.read(), b'xls content')
+        task = AsyncTask.objects.get(uuid=job_uuid)
+        self.assertEqual(task.state, TaskStates.DONE.name)
+        self.assertEqual(task.progression, 100)
+
+    def test_should_allow_new_export_when_previous_one_is_done(self, mock_delay, mock_on_commit):
+        job_uuid = self.client.get(self.url, data=self.get_data).json()['job_uuid']
+        with mock.patch("base.views.learning_units.search.common.create_xls", side_effect=_xls_response):
+            async_excel_export.generate(job_uuid)
+
+        response = self.client.get(self.url, data=self.get_data)
+
+        self.assertNotEqual(response.json()['job_uuid'], job_uuid)
+
+    def test_should_report_error_when_view_does_not_render_file(self, mock_delay, mock_on_commit):
+        job_uuid = self.client.get(self.url, data=self.get_data).json()['job_uuid']
+
+        with mock.patch("base.views.learning_units.search.common.create_xls", return_value=HttpResponse()):
+            with self.assertRaises(async_excel_export.ExcelExportError):
+                async_excel_export.generate(job_uuid)
+
+        self.assertEqual(AsyncTask.objects.get(uuid=job_uuid).state, TaskStates.ERROR.name)
+
+    def test_download_restricted_to_person_who_requested_export(self, mock_delay, mock_on_commit):
+        job_uuid = self.client.get(self.url, data=self.get_data).json()['job_uuid']
+        with mock.patch("base.views.learning_units.search.common.create_xls", side_effect=_xls_response):
+            async_excel_export.generate(job_uuid)
+        download_url = reverse('download_excel_export', kwargs={'job_uuid': job_uuid})
+
+        response = self.client.get(download_url)
+        self.assertEqual(b''.join(response.streaming_content), b'xls content')
+
+        self.client.force_login(PersonFactory().user)
+        self.assertEqual(self.client.get(download_url).status_code, 404)
@@ -0,0 +1,79 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from base.business.entity_version import refresh_entity_faculties, ENTITY_FACULTIES_VERSION_CACHE_KEY
+from base.models.entity_faculty import EntityFaculty
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.business.entities import EntitiesHierarchyFactory
+
+
+@override_settings(ENTITY_HIERARCHY_CACHE_ENABLED=True)
+class TestRefreshEntityFaculties(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = AcademicYearFactory(current=True)
+        cls.entities_hierarchy = EntitiesHierarchyFactory()
+
+    def setUp(self):
+        cache.delete(ENTITY_FACULTIES_VERSION_CACHE_KEY.format(academic_year_id=self.academic_year.pk))
+
+    def test_should_map_entities_to_their_containing_faculty(self):
+        refresh_entity_faculties(self.academic_year)
+
+        faculty_by_entity = dict(
+            EntityFaculty.objects.filter(academic_year=self.academic_year).values_list('entity', 'faculty')
+        )
+        self.assertEqual(
+            faculty_by_entity[self.entities_hierarchy.school_1_1_1.entity_id],
+            self.entities_hierarchy.faculty_1_1.entity_id
+        )
+        self.assertEqual(
+            faculty_by_entity[self.entities_hierarchy.faculty_1_1.entity_id],
+            self.entities_hierarchy.faculty_1_1.entity_id
+        )
+        self.assertEqual(
+            faculty_by_entity[self.entities_hierarchy.sector_1.entity_id],
+            self.entities_hierarchy.sector_1.entity_id
+        )
+
+    def test_should_replace_former_rows(self):
+        refresh_entity_faculties(self.academic_year)
+        rows_count = EntityFaculty.objects.filter(academic_year=self.academic_year).count()
+
+        refresh_entity_faculties(self.academic_year)
+
+        self.assertEqual(EntityFaculty.objects.filter(academic_year=self.academic_year).count(), rows_count)
+
+    @mock.patch('django.db.transaction.on_commit', side_effect=lambda func: func())
+    def test_should_not_rebuild_when_entities_did_not_change(self, mock_on_commit):
+        refresh_entity_faculties(self.academic_year)
+
+        with self.assertNumQueries(0):
+            refresh_entity_faculties(self.academic_year)
@@ -24,12 +24,14 @@
 #
 ##############################################################################
 import datetime
+from io import BytesIO
 from typing import List
 
 from django.db.models.expressions import RawSQL, Subquery, OuterRef
 from django.template.defaultfilters import yesno
 from django.test import TestCase
 from django.utils.translation import gettext_lazy as _
+from openpyxl import load_workbook
 
 from assessments.tests.factories.score_responsible import ScoreResponsibleOfClassFactory
 from attribution.business import attribution_charge_new
@@ -42,7 +44,8 @@ from base.business.learning_unit_xls import DEFAULT_LEGEND_FILLS, SPACES, PROPOS
     _get_font_rows, _get_attribution_line, _add_training_data, \
     get_data_part1, _get_parameters_configurable_list, WRAP_TEXT_ALIGNMENT, HEADER_PROGRAMS, XLS_DESCRIPTION, \
     get_data_part2, annotate_qs, learning_unit_titles_part1, prepare_xls_content, _get_attribution_detail, \
-    prepare_xls_content_with_attributions, BOLD_FONT, _prepare_titles, HEADER_TEACHERS, _get_class_score_responsibles
+    prepare_xls_content_with_attributions, BOLD_FONT, _prepare_titles, HEADER_TEACHERS, _get_class_score_responsibles, \
+    create_streaming_xls_with_parameters, WITH_GRP, WITH_ATTRIBUTIONS, WORKSHEET_TITLE
 from base.business.learning_unit_xls import _get_col_letter
 from base.business.learning_unit_xls import get_significant_volume
 from base.models.entity_version import EntityVersion
@@ -891,6 +894,44 @@ class TestLearningUnitXlsClassesDetail(TestCase):
         score_responsibles = _get_class_score_responsibles(self.class_a)
         self.assertEqual(len(score_responsibles), 1)
 
+    def test_prepare_xls_content_with_effective_classes(self):
+        result = prepare_xls_content(self._get_annotated_qs(), is_external_ue_list=False)
+
+        self.assertListEqual(
+            [row[0] for row in result],
+            [
+                self.luy.acronym,
+                self.class_a.effective_class_complete_acronym,
+                self.class_b.effective_class_complete_acronym,
+                self.class_practical_c.effective_class_complete_acronym,
+            ]
+        )
+
+    def test_create_streaming_xls_with_parameters(self):
+        response = create_streaming_xls_with_parameters(
+            UserFactory(),
+            self._get_annotated_qs(),
+            {},
+            {WITH_GRP: True, WITH_ATTRIBUTIONS: True},
+            is_external_ue_list=False
+        )
+
+        workbook = load_workbook(BytesIO(b''.join(response.streaming_content)))
+        worksheet = workbook[str(WORKSHEET_TITLE)]
+        self.assertEqual(worksheet.max_row, 5)
+        self.assertListEqual(
+            [cell.value for cell in worksheet[1]],
+            _prepare_titles(is_external_ue_list=False, with_attributions=True, with_grp=True)
+        )
+        self.assertEqual(worksheet['A2'].value, self.luy.acronym)
+        self.assertEqual(len(workbook.worksheets), 3)
+
+    def _get_annotated_qs(self):
+        return LearningUnitYear.objects.filter(pk=self.luy.pk).annotate(
+            entity_requirement=Subquery(self.entity_requirement),
+            entity_allocation=Subquery(self.entity_allocation),
+        )
+
 
 def _expected_attribution_data(expected: List, luy: LearningUnitYear) -> List[str]:
     expected_attributions = []
@@ -0,0 +1,60 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.test import TestCase
+
+from base.business import postponement_jobs
+from base.models.postponement_checkpoint import PostponementCheckpoint
+
+
+class TestPostponeChunk(TestCase):
+    def test_should_postpone_and_checkpoint_pending_keys_only(self):
+        PostponementCheckpoint.objects.create(job='job', from_year=2020, key='A')
+        postpone = mock.Mock()
+
+        postponed_keys = postponement_jobs.postpone_chunk('job', 2020, ['A', 'B', 'C'], postpone)
+
+        self.assertListEqual(postponed_keys, ['B', 'C'])
+        postpone.assert_called_once_with(['B', 'C'])
+        self.assertCountEqual(
+            PostponementCheckpoint.objects.filter(job='job', from_year=2020).values_list('key', flat=True),
+            ['A', 'B', 'C']
+        )
+
+    def test_should_not_checkpoint_keys_when_postponement_fails(self):
+        postpone = mock.Mock(side_effect=Exception)
+
+        with self.assertRaises(Exception):
+            postponement_jobs.postpone_chunk('job', 2020, ['A'], postpone)
+
+        self.assertListEqual(postponement_jobs.get_pending_keys('job', 2020, ['A']), ['A'])
+
+    def test_should_split_keys_in_chunks(self):
+        self.assertListEqual(
+            postponement_jobs.split_in_chunks(['A', 'B', 'C'], chunk_size=2),
+            [['A', 'B'], ['C']]
+        )
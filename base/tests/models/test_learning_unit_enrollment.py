@@ -23,9 +23,43 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from django.test import TestCase
+
+from base.models.enums.learning_component_year_type import LECTURING, PRACTICAL_EXERCISES
 from base.tests.factories.learning_unit_enrollment import LearningUnitEnrollmentFactory
+from learning_unit.tests.factories.learning_class_year import LearningClassYearFactory
 
 
 def create_learning_unit_enrollment(learning_unit_year, offer_enrollment):
     return LearningUnitEnrollmentFactory(learning_unit_year=learning_unit_year,
                                          offer_enrollment=offer_enrollment)
+
+
+class TestFullClassCode(TestCase):
+    def test_should_be_learning_unit_acronym_when_no_class(self):
+        enrollment = LearningUnitEnrollmentFactory(learning_unit_year__acronym='LDROI1001')
+        self.assertEqual(enrollment.full_class_code, 'LDROI1001')
+
+    def test_should_suffix_class_acronym_with_dash_when_lecturing_class(self):
+        class_year = LearningClassYearFactory(
+            acronym='A',
+            learning_component_year__type=LECTURING,
+            learning_component_year__learning_unit_year__acronym='LDROI1001',
+        )
+        enrollment = LearningUnitEnrollmentFactory(
+            learning_unit_year=class_year.learning_component_year.learning_unit_year,
+            learning_class_year=class_year,
+        )
+        self.assertEqual(enrollment.full_class_code, 'LDROI1001-A')
+
+    def test_should_suffix_class_acronym_with_underscore_when_practical_exercises_class(self):
+        class_year = LearningClassYearFactory(
+            acronym='B',
+            learning_component_year__type=PRACTICAL_EXERCISES,
+            learning_component_year__learning_unit_year__acronym='LDROI1001',
+        )
+        enrollment = LearningUnitEnrollmentFactory(
+            learning_unit_year=class_year.learning_component_year.learning_unit_year,
+            learning_class_year=class_year,
+        )
+        self.assertEqual(enrollment.full_class_code, 'LDROI1001_B')
@@ -92,6 +92,25 @@ class LearningUnitYearTest(TestCase):
             learning_container_year=learning_container_yr
         )
 
+    def test_search_title_should_contain_complete_titles_without_accents(self):
+        learning_unit_year = LearningUnitYearFactory(
+            specific_title="Économie",
+            specific_title_english="Economics",
+            learning_container_year__common_title="Société",
+            learning_container_year__common_title_english="",
+        )
+        self.assertEqual(learning_unit_year.search_title, "societe - economie economics")
+
+    def test_search_title_should_be_updated_when_common_title_changes(self):
+        learning_unit_year = LearningUnitYearFactory(specific_title="Droit", specific_title_english="")
+        learning_container_year = learning_unit_year.learning_container_year
+        learning_container_year.common_title = "Élément"
+        learning_container_year.common_title_english = ""
+        learning_container_year.save()
+
+        learning_unit_year.refresh_from_db()
+        self.assertEqual(learning_unit_year.search_title, "element - droit")
+
     def test_subdivision_computation(self):
         l_container_year = LearningContainerYearFactory(acronym="LBIR1212", academic_year=self.academic_year)
         l_unit_1 = LearningUnitYearFactory(acronym="LBIR1212", learning_container_year=l_container_year,
@@ -23,12 +23,15 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from unittest import mock
+
 from django.contrib.auth.models import User
 from django.test import TestCase
 
 from base.auth.roles.tutor import Tutor
 from base.models import models_signals as mdl_signals, person as mdl_person
 from base.models.person import Person
+from base.tests.factories.academic_year import AcademicYearFactory
 from base.tests.factories.education_group_year import EducationGroupYearFactory
 from base.tests.factories.entity_manager import EntityManagerFactory
 from base.tests.factories.entity_version import EntityVersionFactory
@@ -181,3 +184,25 @@ class AddToGroupsSignalsTest(TestCase):
         self.create_test_entity_manager()
         self.assertTrue(self.is_member('entity_managers'),
                         'entity_manager_foo should be in entity_managers group')
+
+
+@mock.patch('base.models.models_signals.transaction.on_commit', side_effect=lambda func: func())
+@mock.patch('base.models.models_signals.refresh_entity_faculties.run.delay')
+class RefreshEntityFacultiesSignalsTest(TestCase):
+    def test_should_refresh_all_academic_years_when_entity_version_saved(self, mock_delay, mock_on_commit):
+        EntityVersionFactory()
+
+        mock_delay.assert_any_call()
+
+    def test_should_refresh_created_academic_year(self, mock_delay, mock_on_commit):
+        academic_year = AcademicYearFactory()
+
+        mock_delay.assert_called_once_with(academic_year_ids=[academic_year.pk])
+
+    def test_should_not_refresh_academic_year_when_updated(self, mock_delay, mock_on_commit):
+        academic_year = AcademicYearFactory()
+        mock_delay.reset_mock()
+
+        academic_year.save()
+
+        self.assertFalse(mock_delay.called)
@@ -146,6 +146,35 @@ class PersonTest(PersonTestCase):
         self.assertEqual(len(person.search_employee(a_lastname)), 2)
         self.assertEqual(len(person.search_employee("{} {}".format(a_lastname, a_firstname))), 1)
 
+    def test_search_name_built_on_save(self):
+        a_person = PersonFactory(last_name="Lefèvre", first_name="François", middle_name="Émile")
+        self.assertEqual(a_person.search_name, "lefevre francois emile")
+
+        a_person.first_name = "Zoé"
+        a_person.save()
+        self.assertEqual(a_person.search_name, "lefevre zoe emile")
+
+    def test_get_name_filter_should_be_accent_insensitive_and_match_every_word(self):
+        francois = PersonFactory(last_name="Lefèvre", first_name="François")
+        PersonFactory(last_name="Lefèvre", first_name="Zoé")
+
+        self.assertQuerysetEqual(
+            person.Person.objects.filter(person.get_name_filter("francois LEFEVRE")),
+            [francois],
+            transform=lambda obj: obj
+        )
+
+    def test_order_by_name_similarity(self):
+        dupont = PersonFactory(last_name="Dupont", first_name="Marc")
+        dupontel = PersonFactory(last_name="Dupontel", first_name="Albert")
+
+        queryset = person.Person.objects.filter(pk__in=[dupont.pk, dupontel.pk])
+        self.assertQuerysetEqual(
+            person.order_by_name_similarity(queryset, "dupont marc"),
+            [dupont, dupontel],
+            transform=lambda obj: obj
+        )
+
     def test_change_to_invalid_language(self):
         user = UserFactory()
         user.save()
@@ -0,0 +1,51 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.test import TestCase
+
+from base.models.entity_faculty import EntityFaculty
+from base.tasks import refresh_entity_faculties
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.business.entities import EntitiesHierarchyFactory
+
+
+class TestRefreshEntityFaculties(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = AcademicYearFactory(current=True)
+        cls.next_academic_year = AcademicYearFactory(year=cls.academic_year.year + 1)
+        cls.entities_hierarchy = EntitiesHierarchyFactory()
+
+    def test_should_refresh_all_academic_years_by_default(self):
+        refresh_entity_faculties.run()
+
+        self.assertTrue(EntityFaculty.objects.filter(academic_year=self.academic_year).exists())
+        self.assertTrue(EntityFaculty.objects.filter(academic_year=self.next_academic_year).exists())
+
+    def test_should_only_refresh_given_academic_years(self):
+        refresh_entity_faculties.run(academic_year_ids=[self.next_academic_year.pk])
+
+        self.assertFalse(EntityFaculty.objects.filter(academic_year=self.academic_year).exists())
+        self.assertTrue(EntityFaculty.objects.filter(academic_year=self.next_academic_year).exists())
@@ -24,8 +24,11 @@
 import datetime
 
 import mock
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
+from base.models.entity import Entity
 from base.models.entity_version import EntityVersion
 from base.models.entity_version_address import EntityVersionAddress
 from base.models.enums import entity_type
@@ -95,6 +98,48 @@ class TestSynchronizeEntities(TestCase):
         result = synchronize_entities.run()
         self.assertEqual(result, {'Entities synchronized': 'Unable to fetch data from ESB'})
 
+    def test_synchronize_entities_should_fetch_each_address_once(self):
+        synchronize_entities.run()
+
+        fetched_entity_ids = [call[0][0]['entity_id'] for call in self.mocked_fetch_address.call_args_list]
+        self.assertCountEqual(fetched_entity_ids, ["01000000", "01000472"])
+
+    def test_synchronize_entities_should_update_changed_address_only(self):
+        synchronize_entities.run()
+        self.mocked_fetch_address.return_value = dict(
+            _mock_fetch_address_from_esb_return_value(),
+            streetName="Place de l'Université"
+        )
+
+        synchronize_entities.run()
+
+        streets = EntityVersionAddress.objects.values_list('street', flat=True)
+        self.assertCountEqual(streets, ["Place de l'Université", "Place de l'Université"])
+        self.assertEqual(EntityVersion.objects.count(), 2)
+
+    def test_synchronize_unchanged_entities_should_run_a_constant_number_of_queries(self):
+        self.mocked_fetch_entities.return_value = _build_fake_esb_entities(children_count=3)
+        synchronize_entities.run()
+        with CaptureQueriesContext(connection) as small_tree_queries:
+            synchronize_entities.run()
+
+        self.mocked_fetch_entities.return_value = _build_fake_esb_entities(children_count=30)
+        synchronize_entities.run()
+        with CaptureQueriesContext(connection) as large_tree_queries:
+            synchronize_entities.run()
+
+        self.assertEqual(Entity.objects.count(), 31)
+        self.assertEqual(len(large_tree_queries), len(small_tree_queries))
+
+
+def _build_fake_esb_entities(children_count):
+    root, child = _mock_fetch_entities_from_esb_return_value()
+    children = [
+        dict(child, entity_id="0200{:04d}".format(index), acronym="CHILD{}".format(index))
+        for index in range(children_count)
+    ]
+    return [root] + children
+
 
 def _mock_fetch_entities_from_esb_return_value():
     return [
@@ -1,5 +1,8 @@
+from unittest import mock
+
+from django.db import transaction
 from django.db.models import F
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
 
 import base.utils.db
 
@@ -34,4 +37,38 @@ class TestConvertOrderByStringsToExpressions(SimpleTestCase):
         self.assertEqual(
             result,
             (F("acronym"), F("academic_year").desc(), F("title"))
-        )
\ No newline at end of file
+        )
+
+class TestCallOnceOnCommit(TestCase):
+    def test_should_call_once_with_items_collected_during_the_transaction(self):
+        func = mock.Mock()
+        base.utils.db.call_once_on_commit(func, [1, 2])
+        base.utils.db.call_once_on_commit(func, [2, 3])
+
+        callbacks = [callback for _, callback in transaction.get_connection().run_on_commit]
+        self.assertEqual(len(callbacks), 1)
+        func.assert_not_called()
+        callbacks[0]()
+        func.assert_called_once_with({1, 2, 3})
+
+    def test_should_call_immediately_when_on_commit_runs_immediately(self):
+        func = mock.Mock()
+        with mock.patch('django.db.transaction.on_commit', side_effect=lambda callback: callback()):
+            base.utils.db.call_once_on_commit(func, [1])
+            base.utils.db.call_once_on_commit(func, [2])
+        self.assertEqual(func.call_count, 2)
+
+    def test_should_not_extend_batch_registered_outside_of_the_current_savepoint(self):
+        func = mock.Mock()
+        base.utils.db.call_once_on_commit(func, [1])
+        try:
+            with transaction.atomic():
+                base.utils.db.call_once_on_commit(func, [2])
+                raise ValueError()
+        except ValueError:
+            pass
+
+        callbacks = [callback for _, callback in transaction.get_connection().run_on_commit]
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        func.assert_called_once_with({1})
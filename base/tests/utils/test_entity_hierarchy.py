@@ -0,0 +1,97 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from base.models.enums import entity_type
+from base.tests.factories.entity_version import EntityVersionFactory
+from base.utils import entity_hierarchy
+from base.utils.entity_hierarchy import EntityHierarchy
+
+
+def _version(entity_id, parent_id, acronym, type=entity_type.SCHOOL):
+    return SimpleNamespace(entity_id=entity_id, parent_id=parent_id, acronym=acronym, entity_type=type)
+
+
+class TestEntityHierarchy(SimpleTestCase):
+    def setUp(self):
+        self.root = _version(1, None, 'UCL', entity_type.SECTOR)
+        self.faculty = _version(2, 1, 'DRT', entity_type.FACULTY)
+        self.school = _version(3, 2, 'BUDR')
+        self.other_faculty = _version(4, 1, 'ESPO', entity_type.FACULTY)
+        self.hierarchy = EntityHierarchy([self.root, self.faculty, self.school, self.other_faculty])
+
+    def test_get_descendants_ids(self):
+        self.assertCountEqual(self.hierarchy.get_descendants_ids(1), [2, 3, 4])
+        self.assertListEqual(self.hierarchy.get_descendants_ids(2), [3])
+        self.assertListEqual(self.hierarchy.get_descendants_ids(3), [])
+        self.assertListEqual(self.hierarchy.get_descendants_ids(999), [])
+
+    def test_is_descendant(self):
+        self.assertTrue(self.hierarchy.is_descendant(3, 1))
+        self.assertTrue(self.hierarchy.is_descendant(3, 2))
+        self.assertFalse(self.hierarchy.is_descendant(3, 4))
+        self.assertFalse(self.hierarchy.is_descendant(2, 2))
+
+    def test_get_version_and_ancestors(self):
+        self.assertListEqual(self.hierarchy.get_version_and_ancestors(3), [self.school, self.faculty, self.root])
+
+    def test_get_version_or_parent_of_type(self):
+        self.assertEqual(self.hierarchy.get_version_or_parent_of_type(3, entity_type.FACULTY), self.faculty)
+        self.assertEqual(self.hierarchy.get_version_or_parent_of_type(2, entity_type.FACULTY), self.faculty)
+        self.assertIsNone(self.hierarchy.get_version_or_parent_of_type(1, entity_type.FACULTY))
+
+    def test_get_version_by_acronym(self):
+        self.assertEqual(self.hierarchy.get_version_by_acronym('budr'), self.school)
+
+
+@override_settings(ENTITY_HIERARCHY_CACHE_ENABLED=True)
+class TestGetEntityHierarchy(TestCase):
+    def setUp(self):
+        cache.delete(entity_hierarchy.VERSION_CACHE_KEY)
+        patcher = mock.patch('base.utils.entity_hierarchy.transaction.on_commit', side_effect=lambda func: func())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_should_build_hierarchy_once_per_date(self):
+        entity_hierarchy.get_entity_hierarchy(datetime.date(2020, 9, 15))
+
+        with self.assertNumQueries(0):
+            entity_hierarchy.get_entity_hierarchy(datetime.date(2020, 9, 15))
+
+    def test_should_rebuild_hierarchy_when_an_entity_version_is_saved(self):
+        self.assertListEqual(entity_hierarchy.get_entity_hierarchy().entity_versions, [])
+
+        entity_version = EntityVersionFactory()
+
+        self.assertEqual(
+            entity_hierarchy.get_entity_hierarchy().get_version(entity_version.entity_id),
+            entity_version
+        )
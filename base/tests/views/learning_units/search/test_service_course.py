@@ -51,7 +51,7 @@ class TestExcelGeneration(TestRenderToExcelMixin, TestCase):
         }
         cls.tuples_xls_status_value_with_xls_method_function = (
             ("xls", "base.views.learning_units.search.common.create_xls"),
-            ("xls_with_parameters", "base.views.learning_units.search.common.create_xls_with_parameters"),
+            ("xls_with_parameters", "base.views.learning_units.search.common.create_streaming_xls_with_parameters"),
             ("xls_attributions", "base.views.learning_units.search.common.create_xls_attributions"),
             ("xls_comparison", "base.views.learning_units.search.common.create_xls_comparison"),
             ("xls_educational_specifications",
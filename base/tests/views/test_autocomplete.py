@@ -234,6 +234,17 @@ class TestPersonAutoComplete(TestCase):
             transform=lambda obj: obj
         )
 
+    def test_get_queryset_with_unaccented_full_name(self):
+        francois = PersonFactory(first_name="François", last_name="Lefèvre", middle_name='', employee=True)
+        autocomplete_instance = EmployeeAutocomplete()
+        autocomplete_instance.q = "lefevre francois"
+
+        self.assertQuerysetEqual(
+            autocomplete_instance.get_queryset(),
+            [francois],
+            transform=lambda obj: obj
+        )
+
     def test_get_queryset_with_global_id(self):
         autocomplete_instance = EmployeeAutocomplete()
         autocomplete_instance.q = self.henry.global_id
@@ -1099,6 +1099,18 @@ class TestLearningUnitComponents(TestCase):
             self.assertEqual(volumes[VOLUME_Q1], 30)
             self.assertEqual(volumes[VOLUME_Q2], 0)
 
+    def test_learning_unit_components_should_link_classes(self):
+        component = self.generated_container.generated_container_years[0].list_components[0]
+        learning_class_year = LearningClassYearFactory(learning_component_year=component)
+
+        response = self.client.get(reverse(learning_unit_components, args=[self.learning_unit_year.id]))
+
+        self.assertContains(response, reverse('class_identification', args=[
+            self.learning_unit_year.academic_year.year,
+            self.learning_unit_year.acronym,
+            learning_class_year.acronym,
+        ]))
+
 
 class TestLearningAchievements(TestCase):
     @classmethod
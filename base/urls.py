@@ -305,6 +305,7 @@ urlpatterns = [
 
     url(r'^search/', include([
         url(r'^tutors/$', search.search_tutors, name="search_tutors"),
+        path('excel_exports/<uuid:job_uuid>/', search.download_excel_export, name="download_excel_export"),
     ])),
 
     url(r'^studies/$', common.studies, name='studies'),
@@ -23,6 +23,9 @@
 #    see http://www.gnu.org/licenses/.
 #
 ############################################################################
+from typing import Callable, Iterable, Set
+
+from django.db import transaction, connection
 from django.db.models import F
 
 
@@ -44,3 +47,41 @@ def dict_fetchall(cursor):  # Inspired from https://docs.djangoproject.com
     desc = cursor.description
     columns = [col[0] for col in desc]
     return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def advisory_lock(key: str, shared: bool = False) -> None:
+    """
+    Take a PostgreSQL advisory lock on the key until the end of the current transaction.
+    Shared locks only wait for the exclusive locks taken on the same key.
+    """
+    function = 'pg_advisory_xact_lock_shared' if shared else 'pg_advisory_xact_lock'
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT {}(hashtext(%s))".format(function), [key])
+
+
+class _OnCommitBatch:
+    def __init__(self, func: Callable[[Set], None]):
+        self.func = func
+        self.items = set()
+
+    def __call__(self):
+        self.func(self.items)
+
+
+def call_once_on_commit(func: Callable[[Set], None], items: Iterable) -> None:
+    """
+    Collect the items during the current transaction and call func only once with all of them when it commits.
+    Outside of an atomic block, func is called immediately.
+    Items are only added to a batch registered within the current savepoints, so that they are discarded with it
+    when one of these savepoints is rolled back.
+    """
+    conn = transaction.get_connection()
+    if conn.in_atomic_block:
+        for savepoint_ids, callback in conn.run_on_commit:
+            if isinstance(callback, _OnCommitBatch) and callback.func == func \
+                    and savepoint_ids.issuperset(conn.savepoint_ids):
+                callback.items.update(items)
+                return
+    batch = _OnCommitBatch(func)
+    batch.items.update(items)
+    transaction.on_commit(batch)
@@ -0,0 +1,180 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import collections
+import datetime
+import threading
+import uuid
+from typing import Dict, List, Optional, Iterable, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+VERSION_CACHE_KEY = 'entity_hierarchy_version'
+MAX_DATES_IN_MEMORY = 16
+
+
+class EntityHierarchy:
+    """
+    Tree of the entity versions valid at a date.
+    Entities are numbered in the order of a depth-first traversal: the descendants of an entity are the entities
+    numbered between its own number (excluded) and the last number of its subtree (included).
+    """
+
+    def __init__(self, entity_versions: Iterable['EntityVersion']):
+        # Same behaviour as _build_entity_version_by_entity_id: last version found wins
+        self.entity_versions = list(entity_versions)
+        self._version_by_entity_id = {version.entity_id: version for version in self.entity_versions}
+        self._version_by_acronym = {version.acronym: version for version in self._version_by_entity_id.values()}
+        self._entity_ids_in_order = []
+        self._first = {}
+        self._last = {}
+        self._number_entities()
+        self.structure = None
+
+    def _number_entities(self):
+        children_ids = collections.defaultdict(list)
+        roots_ids = []
+        for entity_id, version in self._version_by_entity_id.items():
+            if version.parent_id in self._version_by_entity_id and version.parent_id != entity_id:
+                children_ids[version.parent_id].append(entity_id)
+            else:
+                roots_ids.append(entity_id)
+
+        for root_id in roots_ids:
+            stack = [(root_id, False)]
+            while stack:
+                entity_id, subtree_done = stack.pop()
+                if subtree_done:
+                    self._last[entity_id] = len(self._entity_ids_in_order) - 1
+                    continue
+                if entity_id in self._first:
+                    continue
+                self._first[entity_id] = len(self._entity_ids_in_order)
+                self._entity_ids_in_order.append(entity_id)
+                stack.append((entity_id, True))
+                stack.extend((child_id, False) for child_id in reversed(children_ids[entity_id]))
+
+    def get_version(self, entity_id: int) -> Optional['EntityVersion']:
+        return self._version_by_entity_id.get(entity_id)
+
+    def get_version_by_acronym(self, acronym: str) -> Optional['EntityVersion']:
+        return self._version_by_acronym.get(acronym.upper())
+
+    def get_descendants_ids(self, entity_id: int) -> List[int]:
+        if entity_id not in self._first:
+            return []
+        return self._entity_ids_in_order[self._first[entity_id] + 1:self._last[entity_id] + 1]
+
+    def is_descendant(self, entity_id: int, ancestor_entity_id: int) -> bool:
+        if entity_id not in self._first or ancestor_entity_id not in self._first:
+            return False
+        return self._first[ancestor_entity_id] < self._first[entity_id] <= self._last[ancestor_entity_id]
+
+    def get_version_and_ancestors(self, entity_id: int) -> List['EntityVersion']:
+        """
+        :return: the version of the entity followed by the versions of its parents, up to the root
+        """
+        versions = []
+        version = self.get_version(entity_id)
+        while version and version not in versions:
+            versions.append(version)
+            version = self.get_version(version.parent_id)
+        return versions
+
+    def get_version_or_parent_of_type(self, entity_id: int, entity_type: str) -> Optional['EntityVersion']:
+        return next(
+            (version for version in self.get_version_and_ancestors(entity_id) if version.entity_type == entity_type),
+            None
+        )
+
+
+class EntityVersionStructure(dict):
+    """
+    Result of build_current_entity_version_structure_in_memory, keeping the hierarchy it was built from.
+    Shared between requests: must not be modified.
+    """
+    def __init__(self, hierarchy: EntityHierarchy, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hierarchy = hierarchy
+
+
+_hierarchies = collections.OrderedDict()  # type: Dict[datetime.date, EntityHierarchy]
+_hierarchies_version = None
+_lock = threading.Lock()
+
+
+def get_entity_hierarchy(date: Union[datetime.date, datetime.datetime] = None) -> EntityHierarchy:
+    """
+    Hierarchy of the entities at the date (default: today).
+    Kept in memory for the process until invalidate() is called by any process.
+    """
+    date = _to_date(date or timezone.now())
+    if not settings.ENTITY_HIERARCHY_CACHE_ENABLED:
+        return _build_hierarchy(date)
+
+    global _hierarchies_version
+    with _lock:
+        version = get_shared_version()
+        if version != _hierarchies_version:
+            _hierarchies.clear()
+            _hierarchies_version = version
+        if date not in _hierarchies:
+            _hierarchies[date] = _build_hierarchy(date)
+            while len(_hierarchies) > MAX_DATES_IN_MEMORY:
+                _hierarchies.popitem(last=False)
+        _hierarchies.move_to_end(date)
+        return _hierarchies[date]
+
+
+def invalidate() -> None:
+    """
+    Force all the processes to rebuild their hierarchies once the current transaction is committed
+    """
+    transaction.on_commit(lambda: cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None))
+
+
+def get_shared_version() -> str:
+    """
+    Identifier of the current state of the entities, shared by all the processes and renewed by invalidate()
+    """
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(VERSION_CACHE_KEY)
+    return version
+
+
+def _build_hierarchy(date: datetime.date) -> EntityHierarchy:
+    from base.models.entity_version import find_latest_version
+    return EntityHierarchy(find_latest_version(date=date))
+
+
+def _to_date(date: Union[datetime.date, datetime.datetime]) -> datetime.date:
+    if isinstance(date, datetime.datetime):
+        return timezone.localtime(date).date() if timezone.is_aware(date) else date.date()
+    return date
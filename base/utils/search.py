@@ -26,8 +26,10 @@
 import urllib
 
 from django.http import JsonResponse, QueryDict
+from django.urls import reverse
 from django_filters.views import FilterView
 
+from base.business import async_excel_export
 from base.templatetags import pagination
 from base.utils.cache import SearchParametersCache
 
@@ -73,6 +75,8 @@ class SearchMixin:
 class RenderToExcel:
     """
         View Mixin to generate excel when xls_status parameter is set.
+        When the xls_async parameter is also set, the excel is generated by a celery worker and the response
+        only contains the uuid of the async task reporting the progression and the url to download the file.
 
         name: value of xls_status so as to generate the excel
         render_method: function to generate the excel.
@@ -86,6 +90,30 @@ class RenderToExcel:
         class Wrapped(filter_class):
             def render_to_response(obj, context, **response_kwargs):
                 if obj.request.GET.get('xls_status') == self.name:
+                    if obj.request.GET.get(async_excel_export.ASYNC_PARAMETER):
+                        return self.render_async_export(obj)
                     return self.render_method(obj, context, **response_kwargs)
                 return super().render_to_response(context, **response_kwargs)
+
+        # The export parameters must not be restored from the search cache (CacheFilterMixin) on the next searches
+        if hasattr(filter_class, 'cache_exclude_params'):
+            cache_exclude_params = list(filter_class.cache_exclude_params or [])
+            Wrapped.cache_exclude_params = cache_exclude_params + [
+                param for param in ('xls_status', async_excel_export.ASYNC_PARAMETER)
+                if param not in cache_exclude_params
+            ]
+        # Keep the path of the decorated view importable by the worker generating the async exports
+        Wrapped.__name__ = filter_class.__name__
+        Wrapped.__qualname__ = filter_class.__qualname__
+        Wrapped.__module__ = filter_class.__module__
         return Wrapped
+
+    def render_async_export(self, view_obj) -> JsonResponse:
+        export = async_excel_export.get_or_create_export(view_obj, self.name)
+        return JsonResponse(
+            {
+                'job_uuid': str(export.job_uuid),
+                'download_url': reverse('download_excel_export', kwargs={'job_uuid': export.job_uuid}),
+            },
+            status=202
+        )
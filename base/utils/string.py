@@ -37,6 +37,13 @@ def unaccent(s: str) -> str:
     return unidecode(lower_cased_character)
 
 
+def normalize_for_search(*values: str) -> str:
+    """
+    Accent-insensitive and lower cased text of the values, as stored in the search columns
+    """
+    return unidecode(" ".join(filter(None, values))).lower()
+
+
 def is_a_translation_of(translated_string: str, translation_string) -> bool:
     """
     Check whether translated_string is a valid translation of translation_string.
@@ -28,8 +28,7 @@ from typing import Set
 
 from dal import autocomplete
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Subquery, OuterRef, BooleanField, Q, Value
-from django.db.models.functions import Concat
+from django.db.models import Subquery, OuterRef, BooleanField, Q
 from django.http import JsonResponse
 from django.utils.html import format_html
 
@@ -39,7 +38,7 @@ from base.models.entity_version import find_pedagogical_entities_version, Entity
 from base.models.enums.academic_calendar_type import AcademicCalendarTypes
 from base.models.enums.organization_type import ACADEMIC_PARTNER, MAIN
 from base.models.organization import Organization
-from base.models.person import Person
+from base.models.person import Person, get_name_filter, order_by_name_similarity
 from learning_unit.auth.roles.central_manager import CentralManager
 from learning_unit.auth.roles.faculty_manager import FacultyManager
 from osis_role.contrib.forms.fields import EntityRoleChoiceFieldMixin
@@ -158,19 +157,12 @@ class EntityRequirementAutocomplete(LoginRequiredMixin, EntityRoleChoiceFieldMix
 
 class EmployeeAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
     def get_queryset(self):
-        qs = Person.employees.annotate(
-            fullname=Concat('last_name', Value(' '), 'first_name'),
-            fullname_inverted=Concat('first_name', Value(' '), 'last_name'),
-        )
+        qs = Person.employees.all()
         if self.q:
-            qs = qs.filter(
-                Q(last_name__icontains=self.q) |
-                Q(first_name__icontains=self.q) |
-                Q(middle_name__icontains=self.q) |
-                Q(global_id__icontains=self.q) |
-                Q(fullname__icontains=self.q) |
-                Q(fullname_inverted__icontains=self.q)
-            )
+            name_filter = get_name_filter(self.q)
+            if any(character.isdigit() for character in self.q):
+                name_filter |= Q(global_id__contains=self.q.strip())
+            return order_by_name_similarity(qs.filter(name_filter), self.q)
         return qs.order_by("last_name", "first_name")
 
     def get_result_label(self, result):
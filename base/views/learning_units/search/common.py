@@ -33,8 +33,8 @@ from django.utils.translation import gettext_lazy as _
 from django_filters.views import FilterView
 
 from base.business import learning_unit_year_with_context
-from base.business.learning_unit_xls import create_xls, create_xls_with_parameters, WITH_GRP, WITH_ATTRIBUTIONS, \
-    create_xls_attributions
+from base.business.learning_unit_xls import create_xls, WITH_GRP, WITH_ATTRIBUTIONS, create_xls_attributions, \
+    create_streaming_xls_with_parameters
 from base.business.learning_units.xls_comparison import create_xls_comparison, create_xls_proposal_comparison
 from base.business.learning_units.xls_educational_information_and_specifications import \
     create_xls_educational_information_and_specifications
@@ -166,17 +166,13 @@ def _create_xls_ue_utilizations_with_one_training_per_line(view_obj, context, **
 
 def _create_ue_list_with_parameters(context, view_obj, is_external_ue_list=False):
     user = view_obj.request.user
-    luys = context["filter"].qs.prefetch_related(
-        'learningcomponentyear_set__learningclassyear_set',
-        'learningcomponentyear_set__learningclassyear_set__attributionclass_set',
-        'learningcomponentyear_set__learningclassyear_set__scoreresponsible_set',
-    )
+    luys = context["filter"].qs
     filters = _get_filter(context["form"], view_obj.search_type)
     other_params = {
         WITH_GRP: view_obj.request.GET.get('with_grp') == 'true',
         WITH_ATTRIBUTIONS: view_obj.request.GET.get('with_attributions') == 'true'
     }
-    return create_xls_with_parameters(user, luys, filters, other_params, is_external_ue_list)
+    return create_streaming_xls_with_parameters(user, luys, filters, other_params, is_external_ue_list)
 
 
 def _create_xls_external_ue_with_parameters(view_obj, context, **response_kwargs):
@@ -24,11 +24,13 @@
 #
 ##############################################################################
 from django.contrib.auth.decorators import login_required, permission_required
-from django.shortcuts import redirect, render
+from django.http import FileResponse, Http404
+from django.shortcuts import redirect, render, get_object_or_404
 from django.views.decorators.http import require_POST
 
 from base.forms.search.search_tutor import TutorSearchForm
 from base.auth.roles.tutor import Tutor
+from base.models.async_excel_export import AsyncExcelExport
 from base.utils.cache import RequestCache
 from base.views.common import paginate_queryset
 
@@ -56,3 +58,11 @@ def clear_filter(request):
     path = request.POST['current_url']
     RequestCache(request.user, path).clear()
     return redirect(path)
+
+
+@login_required
+def download_excel_export(request, job_uuid):
+    export = get_object_or_404(AsyncExcelExport, job_uuid=job_uuid, person__user=request.user)
+    if not export.file:
+        raise Http404
+    return FileResponse(export.file.open('rb'), as_attachment=True, filename=export.file_name)
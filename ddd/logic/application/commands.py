@@ -53,6 +53,11 @@ class GetAttributionsAboutToExpireCommand(interface.CommandRequest):
     global_id = attr.ib(type=str)
 
 
+@attr.s(frozen=True, slots=True)
+class SearchAttributionsAboutToExpireCommand(interface.CommandRequest):
+    global_ids = attr.ib(type=List[str])
+
+
 @attr.s(frozen=True, slots=True)
 class ApplyOnVacantCourseCommand(interface.CommandRequest):
     code = attr.ib(type=str)
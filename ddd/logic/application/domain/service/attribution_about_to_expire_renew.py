@@ -24,13 +24,13 @@
 #
 ##############################################################################
 from functools import partial
-from typing import List
+from typing import List, Dict, Optional
 
 import uuid
 
 from attribution.models.enums.function import Functions
 from base.ddd.utils.business_validator import MultipleBusinessExceptions, execute_functions_and_aggregate_exceptions
-from ddd.logic.application.domain.model.applicant import Applicant
+from ddd.logic.application.domain.model.applicant import Applicant, ApplicantIdentity
 from ddd.logic.application.domain.model.application import Application, ApplicationIdentity
 from ddd.logic.application.domain.model.application_calendar import ApplicationCalendar
 from ddd.logic.application.domain.model._attribution import Attribution
@@ -41,7 +41,7 @@ from ddd.logic.application.domain.validator.exceptions import AttributionAboutTo
     AttributionAboutToExpireFunctionException, VacantCourseNotFound, AttributionSubstituteException, \
     AttributionAboutToExpireWithoutVolumeException, VolumesAskedShouldBeLowerOrEqualToVolumeAvailable, \
     AutomaticRenewalImpossibleVolumesVacantLowerThanVolumesToRenew
-from ddd.logic.application.dtos import AttributionAboutToExpireDTO, LearningUnitModificationProposalFromServiceDTO
+from ddd.logic.application.dtos import AttributionAboutToExpireDTO
 from ddd.logic.application.repository.i_vacant_course_repository import IVacantCourseRepository
 from ddd.logic.learning_unit.domain.model.learning_unit import LearningUnitIdentity
 from ddd.logic.shared_kernel.academic_year.builder.academic_year_identity_builder import AcademicYearIdentityBuilder
@@ -78,84 +78,113 @@ class AttributionAboutToExpireRenew(interface.DomainService):
             vacant_course_repository: IVacantCourseRepository,
             learning_unit_service: ILearningUnitService,
     ) -> List[AttributionAboutToExpireDTO]:
-        attributions_about_to_expire = applicant.get_attributions_about_to_expire(
-            AcademicYearIdentityBuilder.build_from_year(application_calendar.authorized_target_year.year - 1)
-        )
-        attributions_filtered = _filter_attribution_by_renewable_functions(attributions_about_to_expire)
-        attributions_filtered = _filter_only_courses(attributions_filtered)
-        if not attributions_filtered:
-            return []
+        return cls.get_lists_with_renewal_availability(
+            application_calendar,
+            [applicant],
+            {applicant.entity_id: all_existing_applications},
+            vacant_course_repository,
+            learning_unit_service,
+        )[applicant.entity_id]
+
+    @classmethod
+    def get_lists_with_renewal_availability(
+            cls,
+            application_calendar: ApplicationCalendar,
+            applicants: List[Applicant],
+            existing_applications_by_applicant: Dict[ApplicantIdentity, List[Application]],
+            vacant_course_repository: IVacantCourseRepository,
+            learning_unit_service: ILearningUnitService,
+    ) -> Dict[ApplicantIdentity, List[AttributionAboutToExpireDTO]]:
+        """
+        Same as get_list_with_renewal_availability for several applicants: the courses of all the applicants are
+        looked up at once.
+        """
+        attributions_filtered_by_applicant = {}
+        for applicant in applicants:
+            attributions_about_to_expire = applicant.get_attributions_about_to_expire(
+                AcademicYearIdentityBuilder.build_from_year(application_calendar.authorized_target_year.year - 1)
+            )
+            attributions_filtered = _filter_attribution_by_renewable_functions(attributions_about_to_expire)
+            attributions_filtered_by_applicant[applicant.entity_id] = _filter_only_courses(attributions_filtered)
+
+        attribution_codes = {
+            attribution.course_id.code
+            for attributions_filtered in attributions_filtered_by_applicant.values()
+            for attribution in attributions_filtered
+        }
+        if not attribution_codes:
+            return {applicant.entity_id: [] for applicant in applicants}
 
         # Lookup if some courses have proposal modification
         learning_unit_in_modification_proposals = learning_unit_service.search_learning_unit_modification_proposal_dto(
-            codes=[attribution.course_id.code for attribution in attributions_filtered],
+            codes=sorted(attribution_codes),
             year=application_calendar.authorized_target_year.year
         )
+        new_code_by_old_code = {}
+        for modification_proposal in learning_unit_in_modification_proposals:
+            new_code_by_old_code.setdefault(modification_proposal.old_code, modification_proposal.code)
 
         # Lookup vacant course on next year for current attribution
+        next_academic_year = AcademicYearIdentityBuilder.build_from_year(
+            year=application_calendar.authorized_target_year.year
+        )
+        vacant_course_codes = sorted(attribution_codes) + [
+            modification_proposal.code for modification_proposal in learning_unit_in_modification_proposals
+        ]
         vacant_course_ids = [
-            VacantCourseIdentity(
-                academic_year=AcademicYearIdentityBuilder.build_from_year(
-                    year=application_calendar.authorized_target_year.year
-                ),
-                code=attribution.course_id.code
-            ) for attribution in attributions_filtered
-        ] + [
-            VacantCourseIdentity(
-                academic_year=AcademicYearIdentityBuilder.build_from_year(
-                    year=application_calendar.authorized_target_year.year
-                ),
-                code=modification_proposal.code
-            )
-            for modification_proposal in learning_unit_in_modification_proposals
+            VacantCourseIdentity(academic_year=next_academic_year, code=code) for code in vacant_course_codes
         ]
-        vacant_courses = vacant_course_repository.search(vacant_course_ids)
+        vacant_course_by_code = {}
+        for vacant_course in vacant_course_repository.search(vacant_course_ids):
+            vacant_course_by_code.setdefault(vacant_course.code, vacant_course)
 
         learning_unit_ids = [
             LearningUnitIdentity(academic_year=vacant_course_id.academic_year, code=vacant_course_id.code)
             for vacant_course_id in vacant_course_ids
         ]
-        vacant_courses_volumes = learning_unit_service.search_learning_unit_volumes_dto(learning_unit_ids)
-
-        attributions_about_to_expire_dto = []
-        for attribution_about_to_expire in attributions_filtered:
-            unavailable_renewal_reason = _get_unavailable_renewal_reason(
-                attribution_about_to_expire,
-                vacant_courses,
-                learning_unit_in_modification_proposals,
-                all_existing_applications
-            )
-
-            course_code = next(
-                (modification_proposal.code for modification_proposal in learning_unit_in_modification_proposals if
-                 modification_proposal.old_code == attribution_about_to_expire.course_id.code),
-                attribution_about_to_expire.course_id.code
-            )
-            vacant_course_next_year = _get_vacant_course_by_code(course_code, vacant_courses)
-            vacant_course_next_year_volume = next((
-                vc_volume for vc_volume in vacant_courses_volumes
-                if vc_volume.code == course_code
-            ), None)
-
-            attribution_dto = AttributionAboutToExpireDTO(
-                code=attribution_about_to_expire.course_id.code,
-                year=attribution_about_to_expire.course_id.year,
-                lecturing_volume=attribution_about_to_expire.lecturing_volume,
-                practical_volume=attribution_about_to_expire.practical_volume,
-                function=attribution_about_to_expire.function,
-                end_year=attribution_about_to_expire.end_year.year,
-                start_year=attribution_about_to_expire.start_year.year,
-                title=attribution_about_to_expire.course_title,
-                total_lecturing_volume_course=getattr(vacant_course_next_year_volume, 'lecturing_volume_total', None),
-                total_practical_volume_course=getattr(vacant_course_next_year_volume, 'practical_volume_total', None),
-                lecturing_volume_available=getattr(vacant_course_next_year, 'lecturing_volume_available', None),
-                practical_volume_available=getattr(vacant_course_next_year, 'practical_volume_available', None),
-                unavailable_renewal_reason=unavailable_renewal_reason,
-                is_renewable=unavailable_renewal_reason is None,
-            )
-            attributions_about_to_expire_dto.append(attribution_dto)
-
-        return attributions_about_to_expire_dto
+        vacant_course_volume_by_code = {}
+        for vacant_course_volume in learning_unit_service.search_learning_unit_volumes_dto(learning_unit_ids):
+            vacant_course_volume_by_code.setdefault(vacant_course_volume.code, vacant_course_volume)
+
+        attributions_about_to_expire_by_applicant = {}
+        for applicant_id, attributions_filtered in attributions_filtered_by_applicant.items():
+            attributions_about_to_expire_dto = []
+            for attribution_about_to_expire in attributions_filtered:
+                course_code = new_code_by_old_code.get(
+                    attribution_about_to_expire.course_id.code,
+                    attribution_about_to_expire.course_id.code
+                )
+                vacant_course_next_year = vacant_course_by_code.get(course_code)
+                vacant_course_next_year_volume = vacant_course_volume_by_code.get(course_code)
+                unavailable_renewal_reason = _get_unavailable_renewal_reason(
+                    attribution_about_to_expire,
+                    vacant_course_next_year,
+                    existing_applications_by_applicant.get(applicant_id, [])
+                )
+
+                attribution_dto = AttributionAboutToExpireDTO(
+                    code=attribution_about_to_expire.course_id.code,
+                    year=attribution_about_to_expire.course_id.year,
+                    lecturing_volume=attribution_about_to_expire.lecturing_volume,
+                    practical_volume=attribution_about_to_expire.practical_volume,
+                    function=attribution_about_to_expire.function,
+                    end_year=attribution_about_to_expire.end_year.year,
+                    start_year=attribution_about_to_expire.start_year.year,
+                    title=attribution_about_to_expire.course_title,
+                    total_lecturing_volume_course=getattr(
+                        vacant_course_next_year_volume, 'lecturing_volume_total', None
+                    ),
+                    total_practical_volume_course=getattr(
+                        vacant_course_next_year_volume, 'practical_volume_total', None
+                    ),
+                    lecturing_volume_available=getattr(vacant_course_next_year, 'lecturing_volume_available', None),
+                    practical_volume_available=getattr(vacant_course_next_year, 'practical_volume_available', None),
+                    unavailable_renewal_reason=unavailable_renewal_reason,
+                    is_renewable=unavailable_renewal_reason is None,
+                )
+                attributions_about_to_expire_dto.append(attribution_dto)
+            attributions_about_to_expire_by_applicant[applicant_id] = attributions_about_to_expire_dto
+        return attributions_about_to_expire_by_applicant
 
     @classmethod
     def renew(
@@ -232,17 +261,9 @@ def _filter_only_courses(attributions_about_to_expire: List[Attribution]):
 
 def _get_unavailable_renewal_reason(
         attribution_about_to_expire: Attribution,
-        vacant_courses_next_year: List[VacantCourse],
-        learning_unit_in_modification_proposals: List[LearningUnitModificationProposalFromServiceDTO],
+        vacant_course_next_year: Optional[VacantCourse],
         all_existing_applications: List[Application]
 ) -> str:
-    course_code = next(
-        (modification_proposal.code for modification_proposal in learning_unit_in_modification_proposals if
-         modification_proposal.old_code == attribution_about_to_expire.course_id.code),
-        attribution_about_to_expire.course_id.code
-    )
-
-    vacant_course_next_year = _get_vacant_course_by_code(course_code, vacant_courses_next_year)
     if vacant_course_next_year is None:
         return VacantCourseNotFound().message
 
@@ -260,10 +281,6 @@ def _get_unavailable_renewal_reason(
         return first_exception.message
 
 
-def _get_vacant_course_by_code(code: str, vacant_courses: List[VacantCourse]):
-    return next((vac_course for vac_course in vacant_courses if vac_course.code == code), None)
-
-
 def _should_attribution_about_to_expire_with_volume(attribution_about_to_expire: Attribution):
     if not attribution_about_to_expire.practical_volume and not attribution_about_to_expire.lecturing_volume:
         raise AttributionAboutToExpireWithoutVolumeException()
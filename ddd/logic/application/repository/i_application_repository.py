@@ -41,6 +41,7 @@ class IApplicationRepository(interface.AbstractRepository):
             cls,
             entity_ids: Optional[List[ApplicationIdentity]] = None,
             applicant_id: Optional[ApplicantIdentity] = None,
+            applicant_ids: Optional[List[ApplicantIdentity]] = None,
             **kwargs
     ) -> List[Application]:
         pass
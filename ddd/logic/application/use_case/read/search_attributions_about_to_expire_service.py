@@ -0,0 +1,65 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import List, Dict
+
+from ddd.logic.application.commands import SearchAttributionsAboutToExpireCommand
+from ddd.logic.application.domain.builder.applicant_identity_builder import ApplicantIdentityBuilder
+from ddd.logic.application.domain.service.attribution_about_to_expire_renew import AttributionAboutToExpireRenew
+from ddd.logic.application.domain.service.i_learning_unit_service import ILearningUnitService
+from ddd.logic.application.dtos import AttributionAboutToExpireDTO
+from ddd.logic.application.repository.i_applicant_respository import IApplicantRepository
+from ddd.logic.application.repository.i_application_calendar_repository import IApplicationCalendarRepository
+from ddd.logic.application.repository.i_application_repository import IApplicationRepository
+from ddd.logic.application.repository.i_vacant_course_repository import IVacantCourseRepository
+
+
+def search_attributions_about_to_expire(
+        cmd: SearchAttributionsAboutToExpireCommand,
+        application_repository: IApplicationRepository,
+        application_calendar_repository: IApplicationCalendarRepository,
+        applicant_repository: IApplicantRepository,
+        vacant_course_repository: IVacantCourseRepository,
+        learning_unit_service: ILearningUnitService,
+) -> Dict[str, List[AttributionAboutToExpireDTO]]:
+    # Given
+    application_calendar = application_calendar_repository.get_current_application_calendar()
+    applicant_ids = [ApplicantIdentityBuilder.build_from_global_id(global_id=global_id) for global_id in cmd.global_ids]
+    applicants = applicant_repository.search(entity_ids=applicant_ids)
+    existing_applications_by_applicant = {applicant.entity_id: [] for applicant in applicants}
+    for application in application_repository.search(applicant_ids=applicant_ids):
+        existing_applications_by_applicant.setdefault(application.applicant_id, []).append(application)
+
+    attributions_about_to_expire_by_applicant = AttributionAboutToExpireRenew.get_lists_with_renewal_availability(
+        application_calendar,
+        applicants,
+        existing_applications_by_applicant,
+        vacant_course_repository,
+        learning_unit_service
+    )
+    return {
+        applicant_id.global_id: attributions_about_to_expire
+        for applicant_id, attributions_about_to_expire in attributions_about_to_expire_by_applicant.items()
+    }
@@ -123,7 +123,7 @@ class EncoderNotesEnLot(interface.DomainService):
                 code_unite_enseignement=note.code_unite_enseignement,
                 annee_academique=note.annee_academique,
             )
-            note_etudiant_repo.save(note)
+        note_etudiant_repo.save_all(notes_a_persister)
 
         if notes_a_persister:
             historiser_note_service.historiser_encodage(
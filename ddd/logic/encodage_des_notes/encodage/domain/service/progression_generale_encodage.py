@@ -23,20 +23,19 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from typing import Optional, List
+from typing import Optional, List, Set
+
+import attr
 
 from ddd.logic.encodage_des_notes.encodage.domain.model.gestionnaire_parcours import GestionnaireParcours
-from ddd.logic.encodage_des_notes.encodage.repository.note_etudiant import INoteEtudiantRepository
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_attribution_enseignant import \
     IAttributionEnseignantTranslator
-from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_inscription_examen import IInscriptionExamenTranslator
-from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_signaletique_etudiant import \
-    ISignaletiqueEtudiantTranslator
+from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_progression_encodage_notes import \
+    IProgressionEncodageNotesTranslator
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_unite_enseignement import IUniteEnseignementTranslator
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.progression_generale import ProgressionGeneral
-from ddd.logic.encodage_des_notes.shared_kernel.dtos import ProgressionGeneraleEncodageNotesDTO, PeriodeEncodageNotesDTO
-from ddd.logic.encodage_des_notes.soumission.repository.i_note_etudiant import INoteEtudiantRepository as \
-    INoteEtudiantSoumissionRepository
+from ddd.logic.encodage_des_notes.shared_kernel.dtos import ProgressionGeneraleEncodageNotesDTO, \
+    PeriodeEncodageNotesDTO, ProgressionEncodageNotesCohorteDTO
 from ddd.logic.encodage_des_notes.soumission.repository.i_responsable_de_notes import IResponsableDeNotesRepository
 from osis_common.ddd import interface
 
@@ -48,12 +47,9 @@ class ProgressionGeneraleEncodage(interface.DomainService):
             cls,
             gestionnaire: GestionnaireParcours,
             periode_encodage: PeriodeEncodageNotesDTO,
-            note_etudiant_repo: 'INoteEtudiantRepository',
-            note_etudiant_soumission_repo: 'INoteEtudiantSoumissionRepository',
+            progression_encodage_notes_translator: 'IProgressionEncodageNotesTranslator',
             responsable_notes_repo: 'IResponsableDeNotesRepository',
-            signaletique_etudiant_translator: 'ISignaletiqueEtudiantTranslator',
             unite_enseignement_translator: 'IUniteEnseignementTranslator',
-            inscription_examen_translator: 'IInscriptionExamenTranslator',
             attribution_translator: 'IAttributionEnseignantTranslator',
 
             noms_cohortes: Optional[List[str]],
@@ -65,34 +61,53 @@ class ProgressionGeneraleEncodage(interface.DomainService):
         if noms_cohortes:
             gestionnaire.verifier_gere_cohortes(set(noms_cohortes))
             cohortes = noms_cohortes
-        notes_identites = note_etudiant_repo.search_notes_identites(
-            noms_cohortes=cohortes,
-            annee_academique=periode_encodage.annee_concernee,
-            numero_session=periode_encodage.session_concernee,
-            code_unite_enseignement=code_unite_enseignement,
-            note_manquante=seulement_notes_manquantes
+        codes_unites_enseignement = _get_codes_unites_enseignement_attribues(
+            attribution_translator,
+            enseignant,
+            periode_encodage
         )
-        notes_identites = _filtrer_par_enseignant(attribution_translator, enseignant, notes_identites, periode_encodage)
+        progressions_cohortes = []
+        if codes_unites_enseignement is None or codes_unites_enseignement:
+            progressions_cohortes = progression_encodage_notes_translator.search(
+                annee=periode_encodage.annee_concernee,
+                numero_session=periode_encodage.session_concernee,
+                noms_cohortes=set(cohortes),
+                code_unite_enseignement=code_unite_enseignement,
+                codes_unites_enseignement=codes_unites_enseignement,
+                seulement_notes_manquantes=seulement_notes_manquantes,
+            )
+        if seulement_notes_manquantes:
+            progressions_cohortes = [
+                _ne_compter_que_notes_manquantes(progression) for progression in progressions_cohortes
+            ]
 
-        return ProgressionGeneral().get(
-            notes_identites,
-            note_etudiant_soumission_repo,
+        return ProgressionGeneral().get_depuis_progressions_cohortes(
+            progressions_cohortes,
             responsable_notes_repo,
             periode_encodage,
-            signaletique_etudiant_translator,
             unite_enseignement_translator,
-            inscription_examen_translator=inscription_examen_translator
         )
 
 
-def _filtrer_par_enseignant(attribution_translator, enseignant, notes_identites, periode_encodage):
+def _get_codes_unites_enseignement_attribues(
+        attribution_translator: 'IAttributionEnseignantTranslator',
+        enseignant: Optional[str],
+        periode_encodage: 'PeriodeEncodageNotesDTO',
+) -> Optional[Set[str]]:
     if enseignant:
         attributions = attribution_translator.search_attributions_enseignant_par_nom_prenom_annee(
             annee=periode_encodage.annee_concernee,
             nom_prenom=enseignant,
         )
-        codes_unites_enseignement = {attrib.code_unite_enseignement for attrib in attributions}
-        return {
-            note for note in notes_identites if note.code_unite_enseignement in codes_unites_enseignement
-        }
-    return notes_identites
+        return {attrib.code_unite_enseignement for attrib in attributions}
+    return None
+
+
+def _ne_compter_que_notes_manquantes(
+        progression: 'ProgressionEncodageNotesCohorteDTO'
+) -> 'ProgressionEncodageNotesCohorteDTO':
+    return attr.evolve(
+        progression,
+        quantite_notes_soumises=0,
+        quantite_total_notes=progression.quantite_notes_manquantes,
+    )
@@ -82,6 +82,11 @@ class INoteEtudiantRepository(interface.AbstractRepository):
     def save(cls, entity: 'NoteEtudiant') -> None:
         pass
 
+    @classmethod
+    @abc.abstractmethod
+    def save_all(cls, entities: List['NoteEtudiant']) -> None:
+        pass
+
     @classmethod
     @abc.abstractmethod
     def get_all_identities(cls) -> List['IdentiteNoteEtudiant']:
@@ -0,0 +1,145 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from base.ddd.utils.business_validator import MultipleBusinessExceptions
+from ddd.logic.encodage_des_notes.encodage.domain.service.progression_generale_encodage import \
+    ProgressionGeneraleEncodage
+from ddd.logic.encodage_des_notes.encodage.test.factory.gestionnaire_parcours import \
+    GestionnaireParcoursDROI1BAFactory
+from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_attribution_enseignant import \
+    IAttributionEnseignantTranslator
+from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_progression_encodage_notes import \
+    IProgressionEncodageNotesTranslator
+from ddd.logic.encodage_des_notes.shared_kernel.dtos import PeriodeEncodageNotesDTO, DateDTO, \
+    ProgressionEncodageNotesCohorteDTO
+
+
+class ProgressionGeneraleEncodageTest(SimpleTestCase):
+
+    def setUp(self) -> None:
+        self.gestionnaire = GestionnaireParcoursDROI1BAFactory()
+        self.periode_encodage = PeriodeEncodageNotesDTO(
+            annee_concernee=2020,
+            session_concernee=1,
+            debut_periode_soumission=DateDTO(jour=1, mois=1, annee=2021),
+            fin_periode_soumission=DateDTO(jour=31, mois=1, annee=2021),
+        )
+        self.progression_cohorte = ProgressionEncodageNotesCohorteDTO(
+            code_unite_enseignement='LDROI1001',
+            annee_academique=2020,
+            numero_session=1,
+            nom_cohorte='DROI1BA',
+            date_echeance=DateDTO(jour=20, mois=1, annee=2021),
+            quantite_notes_brouillon=1,
+            quantite_notes_soumises=3,
+            quantite_total_notes=10,
+            quantite_etudiants_peps=0,
+        )
+
+        self.progression_translator = mock.Mock(spec=IProgressionEncodageNotesTranslator)
+        self.progression_translator.search.return_value = [self.progression_cohorte]
+        self.attribution_translator = mock.Mock(spec=IAttributionEnseignantTranslator)
+        self.responsable_notes_repo = mock.Mock()
+        self.unite_enseignement_translator = mock.Mock()
+
+        progression_generale_patcher = mock.patch(
+            'ddd.logic.encodage_des_notes.encodage.domain.service.progression_generale_encodage.ProgressionGeneral'
+        )
+        self.mock_progression_generale = progression_generale_patcher.start().return_value
+        self.addCleanup(progression_generale_patcher.stop)
+
+    def _get(self, **kwargs):
+        params = {
+            'noms_cohortes': None,
+            'code_unite_enseignement': None,
+            'enseignant': None,
+        }
+        params.update(kwargs)
+        return ProgressionGeneraleEncodage().get(
+            gestionnaire=self.gestionnaire,
+            periode_encodage=self.periode_encodage,
+            progression_encodage_notes_translator=self.progression_translator,
+            responsable_notes_repo=self.responsable_notes_repo,
+            unite_enseignement_translator=self.unite_enseignement_translator,
+            attribution_translator=self.attribution_translator,
+            **params
+        )
+
+    def _progressions_cohortes_transmises(self):
+        return self.mock_progression_generale.get_depuis_progressions_cohortes.call_args[0][0]
+
+    def test_should_search_progressions_of_cohortes_gerees_for_periode_encodage(self):
+        self._get()
+
+        self.progression_translator.search.assert_called_once_with(
+            annee=2020,
+            numero_session=1,
+            noms_cohortes={'DROI1BA'},
+            code_unite_enseignement=None,
+            codes_unites_enseignement=None,
+            seulement_notes_manquantes=False,
+        )
+        self.assertListEqual(self._progressions_cohortes_transmises(), [self.progression_cohorte])
+
+    def test_should_raise_exception_when_cohorte_not_geree(self):
+        with self.assertRaises(MultipleBusinessExceptions):
+            self._get(noms_cohortes=['ECGE1BA'])
+        self.assertFalse(self.progression_translator.search.called)
+
+    def test_should_restrict_search_to_unites_enseignement_attribuees_a_enseignant(self):
+        self.attribution_translator.search_attributions_enseignant_par_nom_prenom_annee.return_value = [
+            mock.Mock(code_unite_enseignement='LDROI1001'),
+        ]
+
+        self._get(enseignant='Durant')
+
+        self.attribution_translator.search_attributions_enseignant_par_nom_prenom_annee.assert_called_once_with(
+            annee=2020,
+            nom_prenom='Durant',
+        )
+        self.assertEqual(
+            self.progression_translator.search.call_args[1]['codes_unites_enseignement'],
+            {'LDROI1001'}
+        )
+
+    def test_should_not_search_progressions_when_enseignant_sans_attribution(self):
+        self.attribution_translator.search_attributions_enseignant_par_nom_prenom_annee.return_value = []
+
+        self._get(enseignant='Durant')
+
+        self.assertFalse(self.progression_translator.search.called)
+        self.assertListEqual(self._progressions_cohortes_transmises(), [])
+
+    def test_should_only_count_notes_manquantes(self):
+        self._get(seulement_notes_manquantes=True)
+
+        progression = self._progressions_cohortes_transmises()[0]
+        self.assertEqual(progression.quantite_notes_soumises, 0)
+        self.assertEqual(progression.quantite_total_notes, 7)
+        self.assertEqual(progression.quantite_notes_manquantes, 7)
@@ -102,7 +102,7 @@ class EncoderNoteTest(SimpleTestCase):
             NoteEtudiantGestionnaireRepository=lambda: self.repository,
             PeriodeEncodageNotesTranslator=lambda: self.periode_encodage_notes_translator,
             CohortesDuGestionnaireTranslator=lambda: self.cohortes_gestionnaire_trans,
-            NotifierEncodageNotes=lambda: self.notifier_notes_domain_service,
+            NotifierEncodageNotesEnDiffere=lambda: self.notifier_notes_domain_service,
             HistoriserEncodageNotesService=lambda: self.historiser_note_service,
             InscriptionExamenTranslator=lambda: self.inscription_examen_trans,
             EncoderNotesRapportRepository=lambda: self.rapport_repository
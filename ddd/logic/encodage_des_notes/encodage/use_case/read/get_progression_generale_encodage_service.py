@@ -28,16 +28,12 @@ from ddd.logic.encodage_des_notes.encodage.commands import GetProgressionGeneral
 from ddd.logic.encodage_des_notes.encodage.domain.service.i_cohortes_du_gestionnaire import ICohortesDuGestionnaire
 from ddd.logic.encodage_des_notes.encodage.domain.service.progression_generale_encodage import \
     ProgressionGeneraleEncodage
-from ddd.logic.encodage_des_notes.encodage.repository.note_etudiant import INoteEtudiantRepository
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_attribution_enseignant import \
     IAttributionEnseignantTranslator
-from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_inscription_examen import IInscriptionExamenTranslator
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_periode_encodage_notes import \
     IPeriodeEncodageNotesTranslator
-from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_signaletique_etudiant import \
-    ISignaletiqueEtudiantTranslator
-from ddd.logic.encodage_des_notes.soumission.repository.i_note_etudiant import INoteEtudiantRepository as \
-    INoteEtudiantSoumissionRepository
+from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_progression_encodage_notes import \
+    IProgressionEncodageNotesTranslator
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.periode_encodage_ouverte import PeriodeEncodageOuverte
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_unite_enseignement import IUniteEnseignementTranslator
 from ddd.logic.encodage_des_notes.shared_kernel.dtos import ProgressionGeneraleEncodageNotesDTO
@@ -46,14 +42,11 @@ from ddd.logic.encodage_des_notes.soumission.repository.i_responsable_de_notes i
 
 def get_progression_generale_gestionnaire(
         cmd: 'GetProgressionGeneraleGestionnaireCommand',
-        note_etudiant_repo: 'INoteEtudiantRepository',
-        note_etudiant_soumission_repo: 'INoteEtudiantSoumissionRepository',
+        progression_encodage_notes_translator: 'IProgressionEncodageNotesTranslator',
         responsable_notes_repo: 'IResponsableDeNotesRepository',
         periode_encodage_note_translator: 'IPeriodeEncodageNotesTranslator',
-        signaletique_etudiant_translator: 'ISignaletiqueEtudiantTranslator',
         unite_enseignement_translator: 'IUniteEnseignementTranslator',
         cohortes_gestionnaire_translator: 'ICohortesDuGestionnaire',
-        inscription_examen_translator: 'IInscriptionExamenTranslator',
         attribution_translator: 'IAttributionEnseignantTranslator',
 ) -> 'ProgressionGeneraleEncodageNotesDTO':
     # GIVEN
@@ -68,12 +61,9 @@ def get_progression_generale_gestionnaire(
     return ProgressionGeneraleEncodage().get(
         gestionnaire=gestionnaire,
         periode_encodage=periode_encodage,
-        note_etudiant_repo=note_etudiant_repo,
-        note_etudiant_soumission_repo=note_etudiant_soumission_repo,
+        progression_encodage_notes_translator=progression_encodage_notes_translator,
         responsable_notes_repo=responsable_notes_repo,
-        signaletique_etudiant_translator=signaletique_etudiant_translator,
         unite_enseignement_translator=unite_enseignement_translator,
-        inscription_examen_translator=inscription_examen_translator,
         attribution_translator=attribution_translator,
 
         noms_cohortes=cmd.noms_cohortes,
@@ -0,0 +1,50 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import abc
+from typing import List, Set
+
+from ddd.logic.encodage_des_notes.shared_kernel.dtos import ProgressionEncodageNotesCohorteDTO
+from osis_common.ddd import interface
+
+
+class IProgressionEncodageNotesTranslator(interface.DomainService):
+    """
+    Counters of the scores per learning unit, cohort and deadline, maintained when the scores are saved.
+    Students unenrolled from the exam are not counted.
+    """
+
+    @classmethod
+    @abc.abstractmethod
+    def search(
+            cls,
+            annee: int,
+            numero_session: int,
+            noms_cohortes: Set[str],
+            code_unite_enseignement: str = None,
+            codes_unites_enseignement: Set[str] = None,
+            seulement_notes_manquantes: bool = False,
+    ) -> List['ProgressionEncodageNotesCohorteDTO']:
+        raise NotImplementedError
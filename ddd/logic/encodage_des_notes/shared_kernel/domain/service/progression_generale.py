@@ -29,7 +29,8 @@ from typing import List, Dict, Set, Tuple, Optional
 
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_inscription_examen import IInscriptionExamenTranslator
 from ddd.logic.encodage_des_notes.shared_kernel.dtos import PeriodeEncodageNotesDTO, DateEcheanceDTO, \
-    ProgressionEncodageNotesUniteEnseignementDTO, ProgressionGeneraleEncodageNotesDTO, EnseignantDTO
+    ProgressionEncodageNotesUniteEnseignementDTO, ProgressionGeneraleEncodageNotesDTO, EnseignantDTO, \
+    ProgressionEncodageNotesCohorteDTO
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_signaletique_etudiant import \
     ISignaletiqueEtudiantTranslator
 from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_unite_enseignement import IUniteEnseignementTranslator
@@ -114,6 +115,67 @@ class ProgressionGeneral(interface.DomainService):
             progression_generale=progressions,
         )
 
+    @classmethod
+    def get_depuis_progressions_cohortes(
+        cls,
+        progressions_cohortes: List['ProgressionEncodageNotesCohorteDTO'],
+        responsable_notes_repo: 'IResponsableDeNotesRepository',
+        periode_encodage: 'PeriodeEncodageNotesDTO',
+        unite_enseignement_translator: 'IUniteEnseignementTranslator',
+    ) -> 'ProgressionGeneraleEncodageNotesDTO':
+        progressions_cohortes = [progression for progression in progressions_cohortes if progression.date_echeance]
+        if not progressions_cohortes:
+            return ProgressionGeneraleEncodageNotesDTO(
+                annee_academique=periode_encodage.annee_concernee,
+                numero_session=periode_encodage.session_concernee,
+                progression_generale=[]
+            )
+
+        identites_unites_enseignements = {
+            UniteEnseignementIdentiteBuilder.build_from_code_and_annee(
+                code_unite_enseignement=progression.code_unite_enseignement,
+                annee_academique=progression.annee_academique,
+            ) for progression in progressions_cohortes
+        }
+        detail_unite_enseignement_par_code = _get_detail_unite_enseignement_par_code(
+            {(identite.code_unite_enseignement, identite.annee_academique)
+             for identite in identites_unites_enseignements},
+            unite_enseignement_translator,
+        )
+        responsable_notes_par_code = _get_responsable_notes_par_unite_enseignement(
+            identites_unites_enseignements,
+            responsable_notes_repo,
+        )
+
+        progressions = []
+        progressions_ordonnees_ue = sorted(
+            progressions_cohortes,
+            key=lambda progression: (progression.code_unite_enseignement, progression.date_echeance.to_date())
+        )
+        for code_ue, progressions_par_ue in itertools.groupby(
+                progressions_ordonnees_ue, lambda progression: progression.code_unite_enseignement
+        ):
+            progressions_par_ue = list(progressions_par_ue)
+            responsable_notes = responsable_notes_par_code.get(code_ue)
+            progressions.append(
+                ProgressionEncodageNotesUniteEnseignementDTO(
+                    code_unite_enseignement=detail_unite_enseignement_par_code[code_ue].code,
+                    intitule_complet_unite_enseignement=detail_unite_enseignement_par_code[code_ue].intitule_complet,
+                    dates_echeance=_get_dates_echeances_depuis_progressions_cohortes(progressions_par_ue),
+                    a_etudiants_peps=any(progression.quantite_etudiants_peps for progression in progressions_par_ue),
+                    responsable_note=EnseignantDTO(
+                        nom=responsable_notes.nom,
+                        prenom=responsable_notes.prenom,
+                    ) if responsable_notes else EnseignantDTO(nom='', prenom='')
+                )
+            )
+
+        return ProgressionGeneraleEncodageNotesDTO(
+            annee_academique=periode_encodage.annee_concernee,
+            numero_session=periode_encodage.session_concernee,
+            progression_generale=progressions,
+        )
+
     @classmethod
     def _get_notes_pour_etudiants_non_desinscrits(
             cls,
@@ -216,3 +278,24 @@ def _get_dates_echeances_par_unite_enseignement(
                 )
             )
     return dates_echeances_par_unite_enseignement
+
+
+def _get_dates_echeances_depuis_progressions_cohortes(
+    progressions_ordonnees: List['ProgressionEncodageNotesCohorteDTO'],
+) -> List[DateEcheanceDTO]:
+    dates_echeances = []
+    for date_limite_de_remise, progressions_grouped in itertools.groupby(
+            progressions_ordonnees, lambda progression: progression.date_echeance.to_date()
+    ):
+        progressions_grouped = list(progressions_grouped)
+        dates_echeances.append(
+            DateEcheanceDTO(
+                jour=date_limite_de_remise.day,
+                mois=date_limite_de_remise.month,
+                annee=date_limite_de_remise.year,
+                quantite_notes_brouillon=sum(prog.quantite_notes_brouillon for prog in progressions_grouped),
+                quantite_notes_soumises=sum(prog.quantite_notes_soumises for prog in progressions_grouped),
+                quantite_total_notes=sum(prog.quantite_total_notes for prog in progressions_grouped),
+            )
+        )
+    return dates_echeances
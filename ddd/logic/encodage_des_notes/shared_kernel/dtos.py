@@ -272,6 +272,23 @@ class ProgressionGeneraleEncodageNotesDTO(interface.DTO):
     progression_generale = attr.ib(type=List[ProgressionEncodageNotesUniteEnseignementDTO])
 
 
+@attr.s(frozen=True, slots=True)
+class ProgressionEncodageNotesCohorteDTO(interface.DTO):
+    code_unite_enseignement = attr.ib(type=str)
+    annee_academique = attr.ib(type=int)
+    numero_session = attr.ib(type=int)
+    nom_cohorte = attr.ib(type=str)
+    date_echeance = attr.ib(type=Optional[DateDTO])
+    quantite_notes_brouillon = attr.ib(type=int)
+    quantite_notes_soumises = attr.ib(type=int)
+    quantite_total_notes = attr.ib(type=int)
+    quantite_etudiants_peps = attr.ib(type=int)
+
+    @property
+    def quantite_notes_manquantes(self) -> int:
+        return self.quantite_total_notes - self.quantite_notes_soumises
+
+
 def get_type_peps_display(type_peps: str, sous_type_peps: str) -> str:
     if type_peps == peps_type.PepsTypes.SPORT.name:
         return "{} - {}".format(
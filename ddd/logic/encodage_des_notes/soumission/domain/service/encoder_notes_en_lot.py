@@ -109,7 +109,7 @@ class EncoderNotesEtudiantEnLot(interface.DomainService):
                 code_unite_enseignement=note.code_unite_enseignement,
                 annee_academique=note.annee,
             )
-            note_etudiant_repo.save(note)
+        note_etudiant_repo.save_all(notes_a_persister)
 
         if notes_a_persister:
             historiser_note_service.historiser_encodage(cmd.matricule_fgs_enseignant, notes_a_persister)
@@ -54,10 +54,10 @@ class SoumettreNotesEnLot(interface.DomainService):
 
             note_a_soumettre.soumettre()
 
-            note_etudiant_repo.save(note_a_soumettre)
-
             notes_soumises.append(note_a_soumettre)
 
+        note_etudiant_repo.save_all(notes_soumises)
+
         if notes_soumises:
             historiser_note_service.historiser_soumission(cmd.matricule_fgs_enseignant, notes_soumises)
 
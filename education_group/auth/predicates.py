@@ -127,7 +127,7 @@ def is_education_group_type_authorized_according_to_user_scope(
         return any(
             obj.education_group_type.name in role.get_allowed_education_group_types()
             for role in self.context['role_qs']
-            if obj.management_entity_id in self.context['role_qs'].filter(pk=role.pk).get_entities_ids()
+            if obj.management_entity_id in self.context['role_qs'].get_entities_ids_by_role()[role.pk]
         )
     return None
 
@@ -234,7 +234,7 @@ def is_user_linked_to_all_scopes_of_management_entity(self, user, obj: Union['Gr
         user_scopes = {
             entity_id: scope for role in self.context['role_qs']
             for scope in role.scopes if hasattr(role, 'scopes')
-            for entity_id in self.context['role_qs'].filter(pk=role.pk).get_entities_ids()
+            for entity_id in self.context['role_qs'].get_entities_ids_by_role()[role.pk]
         }
         return user_scopes.get(obj.management_entity_id) == Scope.ALL.value
     return None
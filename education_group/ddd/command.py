@@ -565,12 +565,12 @@ class GetTrainingEmptyFieldsOnWarningCommand(interface.CommandRequest):
 
 @attr.s(frozen=True, slots=True)
 class PostponeTrainingsUntilNPlus6Command(interface.CommandRequest):
-    pass
+    acronyms = attr.ib(type=Optional[List[str]], default=None)
 
 
 @attr.s(frozen=True, slots=True)
 class PostponeMiniTrainingsUntilNPlus6Command(interface.CommandRequest):
-    pass
+    acronyms = attr.ib(type=Optional[List[str]], default=None)
 
 
 @attr.s(frozen=True, slots=True)
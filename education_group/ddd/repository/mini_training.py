@@ -157,7 +157,7 @@ class MiniTrainingRepository(interface.AbstractRepository):
         return []
 
     @classmethod
-    def search_mini_trainings_last_occurence(cls, from_year: int) -> List['MiniTraining']:
+    def search_mini_trainings_last_occurence(cls, from_year: int, acronyms: List[str] = None) -> List['MiniTraining']:
         subquery_max_existing_year_for_mini_training = EducationGroupYearModelDb.objects.filter(
             academic_year__year__gte=from_year,
             education_group=OuterRef("education_group")
@@ -174,6 +174,8 @@ class MiniTrainingRepository(interface.AbstractRepository):
         ).exclude(
             acronym__startswith="common"
         )
+        if acronyms is not None:
+            qs = qs.filter(acronym__in=acronyms)
         return [_convert_education_group_year_to_mini_training(row) for row in qs]
 
     @classmethod
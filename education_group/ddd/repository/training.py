@@ -45,6 +45,7 @@ from base.models.education_group_year import EducationGroupYear as EducationGrou
 from base.models.education_group_year_domain import EducationGroupYearDomain as EducationGroupYearDomainModelDb
 from base.models.entity import Entity
 from base.models.entity_version import EntityVersion
+from base.models.entity_version_address import EntityVersionAddress
 from base.models.enums.academic_type import AcademicTypes
 from base.models.enums.active_status import ActiveStatusEnum
 from base.models.enums.activity_presence import ActivityPresence
@@ -169,7 +170,7 @@ class TrainingRepository(interface.AbstractRepository):
         return [_convert_education_group_year_to_dto(education_group_year_db) for education_group_year_db in qs]
 
     @classmethod
-    def search_trainings_last_occurence(cls, from_year: int) -> List['Training']:
+    def search_trainings_last_occurence(cls, from_year: int, acronyms: List[str] = None) -> List['Training']:
         subquery_max_existing_year_for_training = EducationGroupYear.objects.filter(
             academic_year__year__gte=from_year,
             education_group=OuterRef("education_group")
@@ -186,6 +187,8 @@ class TrainingRepository(interface.AbstractRepository):
         ).exclude(
             acronym__startswith="common"
         )
+        if acronyms is not None:
+            qs = qs.filter(acronym__in=acronyms)
         dtos = [_convert_education_group_year_to_dto(education_group_year_db) for education_group_year_db in qs]
         return [TrainingBuilder.build_from_repository_dto(dto) for dto in dtos]
 
@@ -210,8 +213,8 @@ def _convert_education_group_year_to_dto(
         _CoorganizationDTO(
             coorg.organization.name,
             coorg.organization.name,
-            coorg.organization.main_address.country.name if coorg.organization.main_address else None,
-            coorg.organization.main_address.city if coorg.organization.main_address else None,
+            coorg.main_address_country_name,
+            coorg.main_address_city,
             coorg.organization.logo.url if coorg.organization.logo else None,
             coorg.all_students, coorg.enrollment_place, coorg.diploma, coorg.is_producing_cerfificate,
             coorg.is_producing_annexe
@@ -282,12 +285,9 @@ def _convert_education_group_year_to_dto(
         'diploma_aims': certificate_aims,
     }
     if obj.is_bachelor:
-        try:
-            cohort_first_year = obj.cohortyear_set.get_first_year_bachelor()
-            first_year_administration_entity = cohort_first_year.administration_entity.most_recent_acronym \
-                if cohort_first_year.administration_entity else None
-        except CohortYearModelDb.DoesNotExist:
-            first_year_administration_entity = None
+        cohort_first_year = next(iter(obj.first_year_bachelor_cohorts), None)
+        first_year_administration_entity = cohort_first_year.administration_entity.most_recent_acronym \
+            if cohort_first_year and cohort_first_year.administration_entity else None
 
         return BachelorDto(
             first_year_bachelor_administration_entity_acronym=first_year_administration_entity,
@@ -483,7 +483,10 @@ def _get_training_base_queryset() -> QuerySet:
         'secondary_domains',
         Prefetch(
             'educationgrouporganization_set',
-            EducationGroupOrganizationModelDb.objects.all().select_related('organization').order_by('all_students')
+            EducationGroupOrganizationModelDb.objects.all().select_related('organization').annotate(
+                main_address_country_name=_get_organization_main_address_subquery('country__name'),
+                main_address_city=_get_organization_main_address_subquery('city'),
+            ).order_by('all_students')
         ),
         Prefetch(
             'administration_entity',
@@ -511,6 +514,37 @@ def _get_training_base_queryset() -> QuerySet:
                 'certificate_aim'
             ).order_by('certificate_aim')
         ),
+        Prefetch(
+            'cohortyear_set',
+            CohortYearModelDb.objects.filter(name=CohortName.FIRST_YEAR.name).prefetch_related(
+                Prefetch(
+                    'administration_entity',
+                    Entity.objects.all().annotate(
+                        most_recent_acronym=Subquery(
+                            EntityVersion.objects.filter(
+                                entity__id=OuterRef('pk')
+                            ).order_by('-start_date').values('acronym')[:1]
+                        )
+                    )
+                ),
+            ),
+            to_attr='first_year_bachelor_cohorts'
+        ),
+    )
+
+
+def _get_organization_main_address_subquery(field: str) -> Subquery:
+    """
+    Same value as organization.main_address.<field> : main address of the current root entity version
+    """
+    current_root_entity_version = EntityVersion.objects.current(now()).filter(
+        entity__organization=OuterRef(OuterRef('organization_id'))
+    ).only_roots().order_by('-start_date').values('pk')[:1]
+    return Subquery(
+        EntityVersionAddress.objects.filter(
+            entity_version=Subquery(current_root_entity_version),
+            is_main=True,
+        ).values(field)[:1]
     )
 
 
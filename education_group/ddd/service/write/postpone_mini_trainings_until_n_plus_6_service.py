@@ -40,7 +40,10 @@ def postpone_minitrainings_until_n_plus_6(cmd: PostponeMiniTrainingsUntilNPlus6C
         academic_year_repository.AcademicYearRepository()
 
     )
-    mini_trainings_to_postpone = repo.search_mini_trainings_last_occurence(current_academic_year.year)
+    mini_trainings_to_postpone = repo.search_mini_trainings_last_occurence(
+        current_academic_year.year,
+        acronyms=cmd.acronyms
+    )
 
     result = []
     for mini_training in mini_trainings_to_postpone:
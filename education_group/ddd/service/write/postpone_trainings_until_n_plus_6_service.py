@@ -40,7 +40,7 @@ def postpone_trainings_until_n_plus_6(cmd: PostponeTrainingsUntilNPlus6Command)
         academic_year_repository.AcademicYearRepository()
 
     )
-    trainings_to_postpone = repo.search_trainings_last_occurence(current_academic_year.year)
+    trainings_to_postpone = repo.search_trainings_last_occurence(current_academic_year.year, acronyms=cmd.acronyms)
 
     result = []
     for training in trainings_to_postpone:
@@ -0,0 +1,49 @@
+# Generated by Django 2.2.24 on 2026-10-18 17:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from unidecode import unidecode
+
+BATCH_SIZE = 2000
+
+
+def fill_search_title(apps, schema_editor):
+    GroupYear = apps.get_model('education_group', 'GroupYear')
+    rows = GroupYear.objects.values_list('pk', 'title_fr', 'title_en').order_by('pk')
+    batch = []
+    for pk, title_fr, title_en in rows.iterator():
+        batch.append(GroupYear(pk=pk, search_title=unidecode(" ".join(filter(None, [title_fr, title_en]))).lower()))
+        if len(batch) == BATCH_SIZE:
+            GroupYear.objects.bulk_update(batch, ['search_title'])
+            batch = []
+    GroupYear.objects.bulk_update(batch, ['search_title'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('education_group', '0023_copy_11ba_in_new_model'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='groupyear',
+            name='search_title',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(fill_search_title, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='groupyear',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['acronym'], name='groupyear_acronym_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='groupyear',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['partial_acronym'], name='groupyear_code_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='groupyear',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_title'], name='groupyear_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -24,10 +24,13 @@
 #
 ##############################################################################
 from ckeditor.fields import RichTextField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models import Case, When, Q, Value, CharField
 from django.db.models.functions import Concat
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from reversion.admin import VersionAdmin
@@ -37,6 +40,7 @@ from base.models.campus import Campus
 from base.models.entity import Entity
 from base.models.enums.education_group_categories import Categories
 from base.models.enums.education_group_types import GroupType, MiniTrainingType
+from base.utils.string import normalize_for_search
 from education_group.models.enums.constraint_type import ConstraintTypes
 from osis_common.models.osis_model_admin import OsisModelAdmin
 
@@ -222,6 +226,9 @@ class GroupYear(models.Model):
         verbose_name=_("Learning location"),
         on_delete=models.PROTECT
     )
+    # Titles (french and english) without accents, kept up to date on save for the title searches.
+    # The titles copied between an offer and its root groups by the DB triggers are handled by the receivers below.
+    search_title = models.TextField(blank=True, default='', editable=False)
 
     objects = GroupYearManager.from_queryset(GroupYearQuerySet)()
     objects_version = GroupYearVersionManager.from_queryset(GroupYearQuerySet)()
@@ -231,6 +238,11 @@ class GroupYear(models.Model):
         index_together = [
             ("partial_acronym", "academic_year"),
         ]
+        indexes = [
+            GinIndex(fields=['acronym'], name='groupyear_acronym_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['partial_acronym'], name='groupyear_code_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['search_title'], name='groupyear_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ]
 
     def __str__(self):
         return "{} ({})".format(self.acronym,
@@ -241,6 +253,7 @@ class GroupYear(models.Model):
             raise AttributeError(
                 _('Please enter an academic year greater or equal to group start year.')
             )
+        self.search_title = normalize_for_search(self.title_fr, self.title_en)
         super().save(*args, **kwargs)
 
     def delete(self, using=None, keep_parents=False):
@@ -280,3 +293,29 @@ class GroupYear(models.Model):
         return entity_version.find_entity_version_according_academic_year(
             self.management_entity, self.academic_year
         )
+
+
+@receiver(post_save, sender='base.EducationGroupYear')
+def _update_search_titles_from_offer(sender, instance, created=False, **kwargs):
+    # The titles of the offer are copied to the root groups of its versions by a DB trigger
+    if not created:
+        _update_search_titles(GroupYear.objects.filter(educationgroupversion__offer=instance))
+
+
+@receiver(post_save, sender=GroupYear)
+def _update_search_titles_of_versions(sender, instance, created=False, **kwargs):
+    # The titles of a root group are copied to all the versions of its offer by a DB trigger
+    if not created:
+        _update_search_titles(
+            GroupYear.objects.filter(educationgroupversion__offer__educationgroupversion__root_group=instance)
+        )
+
+
+def _update_search_titles(group_years) -> None:
+    group_years_to_update = []
+    for group_year in group_years.only('title_fr', 'title_en', 'search_title'):
+        search_title = normalize_for_search(group_year.title_fr, group_year.title_en)
+        if group_year.search_title != search_title:
+            group_year.search_title = search_title
+            group_years_to_update.append(group_year)
+    GroupYear.objects.bulk_update(group_years_to_update, ['search_title'])
@@ -29,4 +29,5 @@ group_created = Signal(providing_args=['group_identity'])
 group_deleted = Signal(providing_args=['group_identity'])
 
 learning_unit_year_created = Signal(providing_args=['learning_unit_identity'])
+learning_unit_years_created = Signal(providing_args=['learning_unit_year_ids'])
 learning_unit_year_deleted = Signal(providing_args=['learning_unit_identity'])
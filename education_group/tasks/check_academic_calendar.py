@@ -1,4 +1,5 @@
 from backoffice.celery import app as celery_app
+from base.business import academic_calendar
 from education_group.calendar.dissertation_submission_calendar import DissertationSubmissionCalendar
 from education_group.calendar.education_group_extended_daily_management import \
     EducationGroupExtendedDailyManagementCalendar
@@ -17,4 +18,5 @@ def run() -> dict:
     EducationGroupSwitchCalendar.ensure_consistency_until_n_plus_6()
     DissertationSubmissionCalendar.ensure_consistency_until_n_plus_6()
     ExamEnrollmentSubmissionCalendar.ensure_consistency_until_n_plus_6()
+    academic_calendar.invalidate()
     return {}
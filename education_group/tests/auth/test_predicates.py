@@ -504,7 +504,10 @@ class TestIsUserLinkedToAllScopes(TestCase):
     def test_case_is_linked_to_all_scopes_of_child_entities(self, mock_get_tree):
         parent_entity = EntityFactory()
         child_entity = EntityVersionFactory(parent=parent_entity).entity
-        mock_get_tree.return_value = [{'entity_id': parent_entity.pk}, {'entity_id': child_entity.pk}]
+        mock_get_tree.return_value = [
+            {'entity_id': parent_entity.pk, 'parents': []},
+            {'entity_id': child_entity.pk, 'parents': [parent_entity.pk]},
+        ]
         self.education_group_year.management_entity_id = child_entity.pk
         person = FacultyManagerFactory(entity=parent_entity, with_child=True).person
         self.predicate_context_mock.target.context['role_qs'] = FacultyManager.objects.filter(person=person)
@@ -141,3 +141,15 @@ class GroupYearFieldForTrigger(TestCase):
                         file_name='update_group_years_unversioned_fields.sql'
                     )
                 self.assertIn(field, model_fields, error_msg)
+
+
+class TestGroupYearSearchTitle(TestCase):
+    def test_should_update_search_title_of_root_groups_when_offer_saved(self):
+        standard_version = StandardEducationGroupVersionFactory()
+        # Titles copied by the DB trigger of the offer
+        GroupYear.objects.filter(pk=standard_version.root_group.pk).update(title_fr='Économie', title_en='Economics')
+
+        standard_version.offer.save()
+
+        standard_version.root_group.refresh_from_db()
+        self.assertEqual(standard_version.root_group.search_title, 'economie economics')
@@ -24,7 +24,7 @@
 #
 ##############################################################################
 from collections import OrderedDict
-from typing import List
+from typing import List, Dict
 
 from django.conf import settings
 from django.db.models import OuterRef, Subquery, fields, F
@@ -38,7 +38,7 @@ from cms.models import translated_text
 from cms.models.text_label import TextLabel
 from cms.models.translated_text import TranslatedText
 from cms.models.translated_text_label import TranslatedTextLabel
-from education_group.ddd.domain.group import Group
+from education_group.ddd.domain.group import Group, GroupIdentity
 
 
 def get_sections_of_common(year: int, language_code: str):
@@ -141,15 +141,27 @@ def __get_translated_labels(reference_pk: int, labels: List[str], language_code:
 
 
 def get_contacts(group: Group):
+    return get_contacts_by_group([group])[group.entity_id]
+
+
+def get_contacts_by_group(groups: List[Group]) -> Dict['GroupIdentity', dict]:
+    contacts_by_group = {group.entity_id: {} for group in groups}
+    if not groups:
+        return contacts_by_group
     qs = EducationGroupPublicationContact.objects.filter(
-        education_group_year__educationgroupversion__root_group__partial_acronym=group.code,
-        education_group_year__educationgroupversion__root_group__academic_year__year=group.year
+        education_group_year__educationgroupversion__root_group__partial_acronym__in={g.code for g in groups},
+        education_group_year__educationgroupversion__root_group__academic_year__year__in={g.year for g in groups},
+    ).annotate(
+        group_code=F('education_group_year__educationgroupversion__root_group__partial_acronym'),
+        group_year=F('education_group_year__educationgroupversion__root_group__academic_year__year'),
     )
-    contacts_by_type = {}
     for publication_contact in qs:
-        contact_formated = __get_contact_formated(publication_contact)
-        contacts_by_type.setdefault(publication_contact.type, []).append(contact_formated)
-    return contacts_by_type
+        contacts_by_type = contacts_by_group.get(GroupIdentity(code=publication_contact.group_code,
+                                                               year=publication_contact.group_year))
+        if contacts_by_type is not None:
+            contact_formated = __get_contact_formated(publication_contact)
+            contacts_by_type.setdefault(publication_contact.type, []).append(contact_formated)
+    return contacts_by_group
 
 
 def __get_contact_formated(publication_contact):
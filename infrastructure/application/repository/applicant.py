@@ -23,12 +23,10 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-import functools
-import operator
 from typing import Optional, List
 
 from django.db import models
-from django.db.models import F, QuerySet, Q, Subquery, OuterRef, Case, When, Exists
+from django.db.models import F, QuerySet, Subquery, OuterRef, Case, When, Exists
 
 from attribution.models.attribution_charge_new import AttributionChargeNew
 from attribution.models.attribution_new import AttributionNew
@@ -49,20 +47,17 @@ class ApplicantRepository(IApplicantRepository):
         qs = _applicant_base_qs()
 
         if entity_ids is not None:
-            filter_clause = functools.reduce(
-                operator.or_,
-                ((Q(global_id=entity_id.global_id)) for entity_id in entity_ids)
-            )
-            qs = qs.filter(filter_clause)
+            qs = qs.filter(global_id__in=[entity_id.global_id for entity_id in entity_ids])
 
-        attributions_qs = _prefetch_attributions(qs)
+        attributions_by_global_id = {}
+        for attribution in _prefetch_attributions(qs):
+            attributions_by_global_id.setdefault(attribution.applicant_id_global_id, []).append(attribution)
         results = []
         for row_as_dict in qs:
-            attribution_filtered = [
-                attribution for attribution in attributions_qs
-                if attribution.applicant_id_global_id == row_as_dict['global_id']
-            ]
-            dto_from_database = ApplicantFromRepositoryDTO(**row_as_dict, attributions=attribution_filtered)
+            dto_from_database = ApplicantFromRepositoryDTO(
+                **row_as_dict,
+                attributions=attributions_by_global_id.get(row_as_dict['global_id'], [])
+            )
             results.append(ApplicantBuilder.build_from_repository_dto(dto_from_database))
         return results
 
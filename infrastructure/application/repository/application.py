@@ -53,6 +53,7 @@ class ApplicationRepository(IApplicationRepository):
             cls,
             entity_ids: Optional[List[ApplicationIdentity]] = None,
             applicant_id: Optional[ApplicantIdentity] = None,
+            applicant_ids: Optional[List[ApplicantIdentity]] = None,
             **kwargs
     ) -> List[Application]:
         qs = _application_base_qs()
@@ -65,6 +66,8 @@ class ApplicationRepository(IApplicationRepository):
             qs = qs.filter(filter_clause)
         if applicant_id is not None:
             qs = qs.filter(person__global_id=applicant_id.global_id)
+        if applicant_ids is not None:
+            qs = qs.filter(person__global_id__in=[applicant_id.global_id for applicant_id in applicant_ids])
         results = []
         for row_as_dict in qs:
             dto_from_database = ApplicationFromRepositoryDTO(**row_as_dict)
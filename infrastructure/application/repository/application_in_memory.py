@@ -44,6 +44,7 @@ class ApplicationInMemoryRepository(IApplicationRepository):
             cls,
             entity_ids: Optional[List[ApplicationIdentity]] = None,
             applicant_id: Optional[ApplicantIdentity] = None,
+            applicant_ids: Optional[List[ApplicantIdentity]] = None,
             **kwargs
     ) -> List[Application]:
         results = cls.applications
@@ -51,6 +52,8 @@ class ApplicationInMemoryRepository(IApplicationRepository):
             results = filter(lambda application: application.entity_id in entity_ids, results)
         if applicant_id is not None:
             results = filter(lambda application: application.applicant_id == applicant_id, results)
+        if applicant_ids is not None:
+            results = filter(lambda application: application.applicant_id in applicant_ids, results)
         return list(results)
 
     def search_by_applicant_dto(
@@ -27,15 +27,19 @@ import datetime
 import functools
 import operator
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Iterable, Set
 
+from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
 from django.db.models import F, QuerySet, OuterRef, Subquery, Q, Value, Case, When
 from django.db.models.expressions import RawSQL, Exists
 from django.db.models.functions import Cast
 from django_cte import With
 
+from attribution.models.vacant_course_catalogue import VacantCourseCatalogue
+from base.models.academic_year import AcademicYear
 from base.models.entity_version import EntityVersion
 from base.models.enums import learning_container_year_types
 from base.models.enums.proposal_type import ProposalType
@@ -43,12 +47,27 @@ from base.models.enums.vacant_declaration_type import VacantDeclarationType
 from base.models.learning_unit_year import LearningUnitYear, LearningUnitYearQuerySet
 from base.models.proposal_learning_unit import ProposalLearningUnit
 from base.models.utils.func import ArrayConcat
+from base.utils import entity_hierarchy
+from base.utils.db import advisory_lock, call_once_on_commit
 from ddd.logic.application.domain.builder.vacant_course_builder import VacantCourseBuilder
 from ddd.logic.application.domain.model.vacant_course import VacantCourseIdentity, VacantCourse
 from ddd.logic.application.dtos import VacantCourseFromRepositoryDTO, VacantCourseDTO
 from ddd.logic.application.repository.i_vacant_course_repository import IVacantCourseRepository
 from ddd.logic.shared_kernel.academic_year.domain.model.academic_year import AcademicYearIdentity
 
+CATALOGUE_ENTITIES_VERSION_CACHE_KEY = 'vacant_course_catalogue_entities_version_{year}'
+CATALOGUE_FIELDS = [
+    'code',
+    'year',
+    'title',
+    'is_in_team',
+    'vacant_declaration_type',
+    'lecturing_volume_available',
+    'practical_volume_available',
+    'allocation_entity',
+    'allocation_entity_parents',
+]
+
 
 class VacantCourseRepository(IVacantCourseRepository):
     @classmethod
@@ -77,24 +96,21 @@ class VacantCourseRepository(IVacantCourseRepository):
             vacant_declaration_types: List[VacantDeclarationType] = None,
             **kwargs
     ) -> List[VacantCourseDTO]:
-        qs = _vacant_course_base_qs()
-        if allocation_entity_code and with_allocation_entity_children:
-            qs = _annotate_allocation_entity_parents(qs)
-
-        if code is not None:
-            qs = qs.filter(learning_container_year__acronym__icontains=code)
-        if academic_year_id is not None:
-            qs = qs.filter(learning_container_year__academic_year__year=academic_year_id.year)
-        if vacant_declaration_types is not None:
-            qs = qs.filter(
-                learning_container_year__type_declaration_vacant__in=[enum.name for enum in vacant_declaration_types]
+        if academic_year_id is not None and _is_catalogued(academic_year_id.year):
+            qs = _search_vacant_course_catalogue(
+                code,
+                academic_year_id.year,
+                allocation_entity_code,
+                with_allocation_entity_children,
+                vacant_declaration_types,
             )
-        if allocation_entity_code and not with_allocation_entity_children:
-            qs = qs.filter(allocation_entity=allocation_entity_code)
-        if allocation_entity_code and with_allocation_entity_children:
-            qs = qs.filter(
-                Q(allocation_entity=allocation_entity_code)
-                | Q(allocation_entity_parents__contains=[allocation_entity_code])
+        else:
+            qs = _search_vacant_course_base_qs(
+                code,
+                academic_year_id,
+                allocation_entity_code,
+                with_allocation_entity_children,
+                vacant_declaration_types,
             )
         results = []
         for row_as_dict in qs:
@@ -122,6 +138,171 @@ class VacantCourseRepository(IVacantCourseRepository):
         return VacantCourseBuilder.build_from_repository_dto(dto_from_database)
 
 
+def _search_vacant_course_base_qs(
+        code: Optional[str],
+        academic_year_id: Optional[AcademicYearIdentity],
+        allocation_entity_code: Optional[str],
+        with_allocation_entity_children: bool,
+        vacant_declaration_types: Optional[List[VacantDeclarationType]],
+) -> QuerySet:
+    qs = _vacant_course_base_qs()
+    if allocation_entity_code and with_allocation_entity_children:
+        qs = _annotate_allocation_entity_parents(qs)
+
+    if code is not None:
+        qs = qs.filter(learning_container_year__acronym__icontains=code)
+    if academic_year_id is not None:
+        qs = qs.filter(learning_container_year__academic_year__year=academic_year_id.year)
+    if vacant_declaration_types is not None:
+        qs = qs.filter(
+            learning_container_year__type_declaration_vacant__in=[enum.name for enum in vacant_declaration_types]
+        )
+    if allocation_entity_code and not with_allocation_entity_children:
+        qs = qs.filter(allocation_entity=allocation_entity_code)
+    if allocation_entity_code and with_allocation_entity_children:
+        qs = qs.filter(
+            Q(allocation_entity=allocation_entity_code)
+            | Q(allocation_entity_parents__contains=[allocation_entity_code])
+        )
+    return qs
+
+
+def _search_vacant_course_catalogue(
+        code: Optional[str],
+        year: int,
+        allocation_entity_code: Optional[str],
+        with_allocation_entity_children: bool,
+        vacant_declaration_types: Optional[List[VacantDeclarationType]],
+) -> QuerySet:
+    qs = VacantCourseCatalogue.objects.filter(year=year)
+    if code is not None:
+        # Codes are stored in upper case: a case sensitive LIKE can use the trigram index
+        qs = qs.filter(code__contains=code.upper())
+    if vacant_declaration_types is not None:
+        qs = qs.filter(vacant_declaration_type__in=[enum.name for enum in vacant_declaration_types])
+    if allocation_entity_code and not with_allocation_entity_children:
+        qs = qs.filter(allocation_entity=allocation_entity_code)
+    if allocation_entity_code and with_allocation_entity_children:
+        qs = qs.filter(
+            Q(allocation_entity=allocation_entity_code)
+            | Q(allocation_entity_parents__contains=[allocation_entity_code])
+        )
+    return qs.values(
+        "code",
+        "year",
+        "title",
+        "is_in_team",
+        "vacant_declaration_type",
+        "lecturing_volume_available",
+        "practical_volume_available",
+        "allocation_entity",
+    )
+
+
+def _is_catalogued(year: int) -> bool:
+    return settings.VACANT_COURSE_CATALOGUE_ENABLED and VacantCourseCatalogue.objects.filter(year=year).exists()
+
+
+def refresh_vacant_course_catalogue(year: int, learning_unit_year_ids: Iterable[int] = None) -> None:
+    """
+    Recompute the vacant courses of the academic year in the catalogue.
+    If learning_unit_year_ids is given, only the rows of these learning unit years are recomputed.
+    Only the rows whose values changed are written.
+    """
+    entities_version = entity_hierarchy.get_shared_version()
+    with transaction.atomic():
+        # Serialize the refreshes of a same year. Locking the academic year row instead would block every insert
+        # referencing it (learning unit years, enrollments...) until the end of the refresh.
+        advisory_lock('vacant_course_catalogue:{}'.format(year))
+        academic_year = AcademicYear.objects.get(year=year)
+        qs = _vacant_course_base_qs().filter(learning_container_year__academic_year=academic_year)
+        catalogue_qs = VacantCourseCatalogue.objects.filter(year=year)
+        if learning_unit_year_ids is not None:
+            learning_unit_year_ids = set(learning_unit_year_ids)
+            qs = qs.filter(pk__in=learning_unit_year_ids)
+            catalogue_qs = catalogue_qs.filter(learning_unit_year_id__in=learning_unit_year_ids)
+
+        hierarchy = entity_hierarchy.get_entity_hierarchy(academic_year.start_date)
+        rows = qs.values(
+            "code",
+            "year",
+            "title",
+            "is_in_team",
+            "vacant_declaration_type",
+            "lecturing_volume_available",
+            "practical_volume_available",
+            "allocation_entity",
+            learning_unit_year_id=F('pk'),
+            allocation_entity_id=F('learning_container_year__allocation_entity_id'),
+        )
+        vacant_courses = {
+            row['learning_unit_year_id']: VacantCourseCatalogue(
+                learning_unit_year_id=row['learning_unit_year_id'],
+                code=row['code'],
+                year=row['year'],
+                title=row['title'] or '',
+                is_in_team=row['is_in_team'],
+                vacant_declaration_type=row['vacant_declaration_type'],
+                lecturing_volume_available=row['lecturing_volume_available'],
+                practical_volume_available=row['practical_volume_available'],
+                allocation_entity=row['allocation_entity'],
+                allocation_entity_parents=[
+                    version.acronym for version in hierarchy.get_version_and_ancestors(row['allocation_entity_id'])
+                ],
+            ) for row in rows
+        }
+        catalogued_courses = {course.learning_unit_year_id: course for course in catalogue_qs}
+
+        VacantCourseCatalogue.objects.filter(
+            pk__in=[
+                course.pk for learning_unit_year_id, course in catalogued_courses.items()
+                if learning_unit_year_id not in vacant_courses
+            ]
+        ).delete()
+        courses_to_create = []
+        courses_to_update = []
+        for learning_unit_year_id, course in vacant_courses.items():
+            catalogued_course = catalogued_courses.get(learning_unit_year_id)
+            if catalogued_course is None:
+                courses_to_create.append(course)
+            elif _has_changed(catalogued_course, course):
+                course.pk = catalogued_course.pk
+                courses_to_update.append(course)
+        VacantCourseCatalogue.objects.bulk_create(courses_to_create, batch_size=1000)
+        VacantCourseCatalogue.objects.bulk_update(courses_to_update, CATALOGUE_FIELDS, batch_size=1000)
+    if learning_unit_year_ids is None:
+        cache.set(CATALOGUE_ENTITIES_VERSION_CACHE_KEY.format(year=year), entities_version, timeout=None)
+
+
+def _has_changed(catalogued_course: VacantCourseCatalogue, course: VacantCourseCatalogue) -> bool:
+    return any(getattr(catalogued_course, field) != getattr(course, field) for field in CATALOGUE_FIELDS)
+
+
+def is_vacant_course_catalogue_up_to_date_with_entities(year: int) -> bool:
+    cached_version = cache.get(CATALOGUE_ENTITIES_VERSION_CACHE_KEY.format(year=year))
+    return cached_version is not None and cached_version == entity_hierarchy.get_shared_version()
+
+
+def refresh_vacant_course_catalogue_of_learning_unit_years(learning_unit_year_ids: Iterable[int]) -> None:
+    """
+    Refresh, once the current transaction is committed, the rows of the learning unit years of the catalogued years.
+    The learning unit years saved during the transaction are refreshed together.
+    """
+    call_once_on_commit(_refresh_learning_unit_years, learning_unit_year_ids)
+
+
+def _refresh_learning_unit_years(learning_unit_year_ids: Set[int]) -> None:
+    years_with_ids = LearningUnitYear.objects.filter(
+        pk__in=learning_unit_year_ids,
+        academic_year__year__in=VacantCourseCatalogue.objects.values('year'),
+    ).values_list('academic_year__year', 'pk')
+    ids_by_year = {}
+    for year, learning_unit_year_id in years_with_ids:
+        ids_by_year.setdefault(year, set()).add(learning_unit_year_id)
+    for year, ids in sorted(ids_by_year.items()):
+        refresh_vacant_course_catalogue(year, ids)
+
+
 def _vacant_course_base_qs() -> QuerySet:
     main_qs = LearningUnitYearQuerySet.annotate_entity_allocation_acronym(
         LearningUnitYear.objects.filter(
@@ -25,19 +25,21 @@
 ##############################################################################
 import datetime
 import logging
+from typing import Dict, List, Optional
 
 from django.conf import settings
 from django.utils.translation import pgettext_lazy
 
 from base.business.education_group import DATE_FORMAT
 from base.models.person import Person
-from ddd.logic.application.commands import GetAttributionsAboutToExpireCommand
+from ddd.logic.application.commands import SearchAttributionsAboutToExpireCommand
 from ddd.logic.application.domain.model.application_calendar import ApplicationCalendar
 from ddd.logic.application.domain.service.attributions_end_date_reached_summary import \
     IAttributionsEndDateReachedSummary
+from ddd.logic.application.dtos import AttributionAboutToExpireDTO
 from ddd.logic.application.repository.i_applicant_respository import IApplicantRepository
-from osis_common.messaging import message_config, send_message as message_service
-from osis_common.models.message_history import MessageHistory
+from infrastructure.application.services import mailing
+from osis_common.messaging import message_config
 
 logger = logging.getLogger(settings.DEFAULT_LOGGER)
 
@@ -53,77 +55,81 @@ class AttributionsEndDateReachedSummary(IAttributionsEndDateReachedSummary):
             application_calendar: ApplicationCalendar,
             applicant_repository: IApplicantRepository
     ):
-        from infrastructure.messages_bus import message_bus_instance
-
         today_date = datetime.date.today()
-        if application_calendar.start_date == today_date:
-            applicants = applicant_repository.search()
-
-            for applicant in applicants:
-                person = Person.objects.filter(global_id=applicant.entity_id.global_id).first()
-
-                if person.email and not mail_already_sent(today=today_date, receiver_email=person.email):
-                    try:
-                        cmd = GetAttributionsAboutToExpireCommand(global_id=applicant.entity_id.global_id)
-                        attributions_about_to_expire = message_bus_instance.invoke(cmd)
-                    except Exception as e:
-                        logger.info(
-                            "[AttributionEndDateReachedSummary - {}] An error occured during retrieval attributions "
-                            "about to expire for {} : {}".format(today_date, person.email, str(e))
-                        )
-                        continue
+        campaign = "ending_attributions_{}".format(application_calendar.entity_id.uuid)
 
-                    if attributions_about_to_expire:
-                        receivers = [message_config.create_receiver(person.id, person.email, person.language)]
-                        table_ending_attributions = message_config.create_table(
-                            'ending_attributions',
-                            [pgettext_lazy("applications", "Code"), 'Title', 'Vol. 1', 'Vol. 2'],
-                            [
-                                (
-                                    attributions_ending.code,
-                                    attributions_ending.title,
-                                    attributions_ending.lecturing_volume,
-                                    attributions_ending.practical_volume,
-                                )
-                                for attributions_ending in attributions_about_to_expire
-                            ]
-                        )
-                        template_base_data = {
-                            'first_name': person.first_name,
-                            'last_name': person.last_name,
-                            'end_date': application_calendar.end_date.strftime(DATE_FORMAT)
-                        }
-                        message_content = message_config.create_message_content(
-                            HTML_TEMPLATE_REF,
-                            TXT_TEMPLATE_REF,
-                            [table_ending_attributions],
-                            receivers,
-                            template_base_data,
-                            None
-                        )
-                        message_service.send_messages(message_content)
-                        logger.info(
-                            "[AttributionEndDateReachedSummary - {}] Mail sent to {}".format(today_date, person.email)
-                        )
-                    else:
-                        logger.info(
-                            "[AttributionEndDateReachedSummary - {}] No attributions about to expire for {}".format(
-                                today_date, person.email
-                            )
-                        )
-        else:
+        if application_calendar.start_date == today_date and not mailing.is_campaign_planned(campaign):
+            global_ids = [applicant.entity_id.global_id for applicant in applicant_repository.search()]
+            person_ids = Person.objects.filter(
+                global_id__in=global_ids,
+            ).exclude(email__isnull=True).exclude(email='').values_list('pk', flat=True)
+            mailing.plan_campaign(campaign, person_ids)
+        elif not mailing.is_campaign_planned(campaign):
             logger.info(
                 "[AttributionEndDateReachedSummary - {}] Application course start date not reached".format(today_date)
             )
+            return
 
+        # Resume the campaign (if any mail is still pending) until the end of the application calendar
+        if application_calendar.start_date <= today_date <= application_calendar.end_date:
+            progress = mailing.run_campaign(
+                campaign,
+                lambda persons: cls._build_messages(application_calendar, persons),
+            )
+            logger.info("[AttributionEndDateReachedSummary - {}] {}".format(today_date, progress))
 
-def mail_already_sent(today, receiver_email: str) -> bool:
-    # FIXME: fix reference on send method of message_service in order to prevent use subject...
-    mail_already_sent_today = MessageHistory.objects.filter(
-        subject="Charges d'enseignement de vos cours arrivant à échéance",
-        sent__date=today,
-        receiver_email=receiver_email
-    ).exists()
-    if mail_already_sent_today:
-        logger.info("[AttributionEndDateReachedSummary - {}] Mail already sent to {}".format(today, receiver_email))
-    return mail_already_sent_today
+    @classmethod
+    def _build_messages(
+            cls,
+            application_calendar: ApplicationCalendar,
+            persons: List[Person]
+    ) -> Dict[int, Optional[dict]]:
+        from infrastructure.messages_bus import message_bus_instance
+
+        cmd = SearchAttributionsAboutToExpireCommand(global_ids=[person.global_id for person in persons])
+        attributions_about_to_expire_by_global_id = message_bus_instance.invoke(cmd)
+        end_date = application_calendar.end_date.strftime(DATE_FORMAT)
+        return {
+            person.pk: cls._build_message(
+                person,
+                attributions_about_to_expire_by_global_id.get(person.global_id),
+                end_date
+            ) for person in persons
+        }
+
+    @classmethod
+    def _build_message(
+            cls,
+            person: Person,
+            attributions_about_to_expire: Optional[List[AttributionAboutToExpireDTO]],
+            end_date: str
+    ) -> Optional[dict]:
+        if not attributions_about_to_expire:
+            return None
+        receivers = [message_config.create_receiver(person.id, person.email, person.language)]
+        table_ending_attributions = message_config.create_table(
+            'ending_attributions',
+            [pgettext_lazy("applications", "Code"), 'Title', 'Vol. 1', 'Vol. 2'],
+            [
+                (
+                    attributions_ending.code,
+                    attributions_ending.title,
+                    attributions_ending.lecturing_volume,
+                    attributions_ending.practical_volume,
+                )
+                for attributions_ending in attributions_about_to_expire
+            ]
+        )
+        template_base_data = {
+            'first_name': person.first_name,
+            'last_name': person.last_name,
+            'end_date': end_date
+        }
+        return message_config.create_message_content(
+            HTML_TEMPLATE_REF,
+            TXT_TEMPLATE_REF,
+            [table_ending_attributions],
+            receivers,
+            template_base_data,
+            None
+        )
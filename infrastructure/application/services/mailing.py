@@ -0,0 +1,117 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from attribution.models.application_mailing import ApplicationMailing
+from base.models.person import Person
+from osis_common.messaging import send_message as message_service
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+MAILING_CHUNK_SIZE = 200
+MAILING_MAX_ATTEMPTS = 3
+
+# Build the message content of each person of a chunk. A person without message (None) has nothing to receive.
+MessagesBuilder = Callable[[List[Person]], Dict[int, Optional[dict]]]
+
+
+def plan_campaign(campaign: str, person_ids: Iterable[int]) -> None:
+    ApplicationMailing.objects.bulk_create(
+        [ApplicationMailing(campaign=campaign, person_id=person_id) for person_id in person_ids],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+def is_campaign_planned(campaign: str) -> bool:
+    return ApplicationMailing.objects.filter(campaign=campaign).exists()
+
+
+def run_campaign(campaign: str, build_messages: MessagesBuilder, chunk_size: int = MAILING_CHUNK_SIZE) -> dict:
+    """
+    Send the mails of the campaign which are still pending (never processed or failed during a previous run),
+    chunk by chunk. Each chunk is flagged as processed before the next one is loaded, so the campaign can be resumed.
+    A mail which failed MAILING_MAX_ATTEMPTS times is not retried anymore.
+    """
+    pending_mailings = ApplicationMailing.objects.filter(
+        Q(processed_at__isnull=True) | (~Q(error='') & Q(attempts__lt=MAILING_MAX_ATTEMPTS)),
+        campaign=campaign,
+    ).select_related('person').order_by('id')
+    progress = {'total': pending_mailings.count(), 'sent': 0, 'skipped': 0, 'failed': 0}
+
+    last_id = 0
+    while True:
+        chunk = list(pending_mailings.filter(id__gt=last_id)[:chunk_size])
+        if not chunk:
+            break
+        last_id = chunk[-1].id
+        _process_chunk(campaign, chunk, build_messages, progress)
+        logger.info(
+            "[Mailing {}] {sent} sent, {skipped} skipped, {failed} failed on {total} mails".format(campaign, **progress)
+        )
+    return progress
+
+
+def _process_chunk(campaign: str, chunk: List[ApplicationMailing], build_messages: MessagesBuilder, progress: dict):
+    errors_by_person_id = {}
+    try:
+        messages_by_person_id = build_messages([mailing.person for mailing in chunk])
+    except Exception:
+        logger.exception("[Mailing {}] Unable to build the messages of a chunk, build them one by one".format(campaign))
+        messages_by_person_id = {}
+        for mailing in chunk:
+            try:
+                messages_by_person_id.update(build_messages([mailing.person]))
+            except Exception as e:
+                logger.exception("[Mailing {}] Unable to build the message of {}".format(campaign, mailing.person))
+                errors_by_person_id[mailing.person_id] = str(e) or repr(e)
+
+    for mailing in chunk:
+        message_content = messages_by_person_id.get(mailing.person_id)
+        mailing.error = errors_by_person_id.get(mailing.person_id, '')
+        if message_content:
+            try:
+                message_service.send_messages(message_content)
+                mailing.sent = True
+            except Exception as e:
+                logger.exception("[Mailing {}] Unable to send mail to {}".format(campaign, mailing.person.email))
+                mailing.error = str(e) or repr(e)
+        mailing.processed_at = timezone.now()
+        mailing.attempts += 1
+
+        if mailing.error:
+            progress['failed'] += 1
+        elif mailing.sent:
+            progress['sent'] += 1
+        else:
+            progress['skipped'] += 1
+
+    ApplicationMailing.objects.bulk_update(chunk, ['processed_at', 'sent', 'error', 'attempts'])
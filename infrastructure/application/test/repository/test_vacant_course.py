@@ -26,10 +26,12 @@
 from decimal import Decimal
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from attribution.models.vacant_course_catalogue import VacantCourseCatalogue
 from base.models.enums import learning_container_year_types
 from base.models.enums.proposal_type import ProposalType
+from base.models.learning_component_year import LearningComponentYear
 from base.models.enums.vacant_declaration_type import VacantDeclarationType
 from base.tests.factories.entity_version import MainEntityVersionFactory
 from base.tests.factories.learning_component_year import LecturingLearningComponentYearFactory, \
@@ -39,7 +41,8 @@ from base.tests.factories.proposal_learning_unit import ProposalLearningUnitFact
 from ddd.logic.application.domain.model.vacant_course import VacantCourseIdentity, VacantCourse
 from ddd.logic.application.dtos import VacantCourseDTO
 from ddd.logic.shared_kernel.academic_year.domain.model.academic_year import AcademicYearIdentity
-from infrastructure.application.repository.vacant_course import VacantCourseRepository
+from infrastructure.application.repository.vacant_course import VacantCourseRepository, \
+    refresh_vacant_course_catalogue
 
 
 class VacantCourseRepositoryGet(TestCase):
@@ -264,3 +267,92 @@ class VacantCourseRepositorySearchDTO(TestCase):
         ProposalLearningUnitFactory(learning_unit_year=self.ldroi1200_db, type=ProposalType.SUPPRESSION.name)
         filtered_results = self.repository.search_vacant_course_dto(code=self.ldroi1200_db.acronym)
         self.assertEqual(len(filtered_results), 0)
+
+
+@override_settings(VACANT_COURSE_CATALOGUE_ENABLED=True)
+class VacantCourseRepositorySearchDTOFromCatalogue(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        root_entity = MainEntityVersionFactory(acronym="UCL", parent=None)
+        drt_entity = MainEntityVersionFactory(acronym="DRT", parent_id=root_entity.entity_id)
+
+        cls.ldroi1200_db = LearningUnitYearFactory(
+            acronym='LDROI1200',
+            academic_year__year=2020,
+            learning_container_year__acronym='LDROI1200',
+            learning_container_year__allocation_entity=drt_entity.entity,
+            learning_container_year__academic_year__year=2020,
+            learning_container_year__container_type=learning_container_year_types.COURSE,
+            learning_container_year__type_declaration_vacant=VacantDeclarationType.RESEVED_FOR_INTERNS.name,
+        )
+        LecturingLearningComponentYearFactory(learning_unit_year=cls.ldroi1200_db, volume_declared_vacant=Decimal(15))
+
+        cls.ldroi2000_db = LearningUnitYearFactory(
+            acronym='LDROI2000',
+            academic_year__year=2020,
+            learning_container_year__acronym='LDROI2000',
+            learning_container_year__allocation_entity=MainEntityVersionFactory(
+                acronym="BUDR",
+                parent_id=drt_entity.entity_id
+            ).entity,
+            learning_container_year__academic_year__year=2020,
+            learning_container_year__container_type=learning_container_year_types.COURSE,
+            learning_container_year__type_declaration_vacant=VacantDeclarationType.OPEN_FOR_EXTERNS.name,
+        )
+        PracticalLearningComponentYearFactory(learning_unit_year=cls.ldroi2000_db, volume_declared_vacant=Decimal(10))
+
+        refresh_vacant_course_catalogue(2020)
+        cls.repository = VacantCourseRepository()
+
+    def test_assert_filter_by_code_case_insensitive(self):
+        results = self.repository.search_vacant_course_dto(code="droi12", academic_year_id=AcademicYearIdentity(2020))
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].code, 'LDROI1200')
+        self.assertEqual(results[0].lecturing_volume_available, Decimal(15))
+        self.assertEqual(results[0].allocation_entity_code, 'DRT')
+
+    def test_assert_filter_by_allocation_entity_code_with_children(self):
+        results = self.repository.search_vacant_course_dto(
+            academic_year_id=AcademicYearIdentity(2020),
+            allocation_entity_code="DRT",
+            with_allocation_entity_children=True
+        )
+        self.assertCountEqual([result.code for result in results], ['LDROI1200', 'LDROI2000'])
+
+        results = self.repository.search_vacant_course_dto(
+            academic_year_id=AcademicYearIdentity(2020),
+            allocation_entity_code="DRT",
+        )
+        self.assertEqual([result.code for result in results], ['LDROI1200'])
+
+    def test_assert_filter_by_vacant_declaration_types(self):
+        results = self.repository.search_vacant_course_dto(
+            academic_year_id=AcademicYearIdentity(2020),
+            vacant_declaration_types=[VacantDeclarationType.OPEN_FOR_EXTERNS]
+        )
+        self.assertEqual([result.code for result in results], ['LDROI2000'])
+
+    def test_refresh_of_learning_unit_year_assert_course_in_suppression_proposal_removed(self):
+        ProposalLearningUnitFactory(learning_unit_year=self.ldroi1200_db, type=ProposalType.SUPPRESSION.name)
+        refresh_vacant_course_catalogue(2020, [self.ldroi1200_db.pk])
+
+        results = self.repository.search_vacant_course_dto(academic_year_id=AcademicYearIdentity(2020))
+        self.assertEqual([result.code for result in results], ['LDROI2000'])
+
+    def test_refresh_assert_only_changed_rows_rewritten(self):
+        ldroi1200_catalogued = VacantCourseCatalogue.objects.get(learning_unit_year=self.ldroi1200_db)
+        ldroi2000_catalogued = VacantCourseCatalogue.objects.get(learning_unit_year=self.ldroi2000_db)
+        LearningComponentYear.objects.filter(learning_unit_year=self.ldroi2000_db).update(
+            volume_declared_vacant=Decimal(5)
+        )
+
+        refresh_vacant_course_catalogue(2020)
+
+        self.assertEqual(
+            VacantCourseCatalogue.objects.get(learning_unit_year=self.ldroi1200_db).pk,
+            ldroi1200_catalogued.pk
+        )
+        ldroi2000_refreshed = VacantCourseCatalogue.objects.get(learning_unit_year=self.ldroi2000_db)
+        self.assertEqual(ldroi2000_refreshed.pk, ldroi2000_catalogued.pk)
+        self.assertEqual(ldroi2000_refreshed.practical_volume_available, Decimal(5))
@@ -0,0 +1,96 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.test import TestCase
+
+from attribution.models.application_mailing import ApplicationMailing
+from base.tests.factories.person import PersonFactory
+from infrastructure.application.services import mailing
+
+
+@mock.patch('infrastructure.application.services.mailing.message_service.send_messages')
+class MailingCampaignTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.campaign = 'campaign'
+        cls.persons = [PersonFactory() for _ in range(5)]
+        mailing.plan_campaign(cls.campaign, [person.pk for person in cls.persons])
+
+    def test_should_not_plan_twice_the_same_person(self, mock_send):
+        mailing.plan_campaign(self.campaign, [self.persons[0].pk])
+        self.assertEqual(ApplicationMailing.objects.filter(campaign=self.campaign).count(), len(self.persons))
+
+    def test_should_send_messages_by_chunk_and_skip_persons_without_message(self, mock_send):
+        build_messages = mock.Mock(side_effect=lambda persons: {person.pk: {'person': person.pk} for person in persons})
+        build_messages_without_last = mock.Mock(
+            side_effect=lambda persons: {**build_messages(persons), self.persons[-1].pk: None}
+        )
+
+        progress = mailing.run_campaign(self.campaign, build_messages_without_last, chunk_size=2)
+
+        self.assertDictEqual(progress, {'total': 5, 'sent': 4, 'skipped': 1, 'failed': 0})
+        self.assertEqual(build_messages_without_last.call_count, 3)
+        self.assertEqual(mock_send.call_count, 4)
+        self.assertFalse(ApplicationMailing.objects.filter(processed_at__isnull=True).exists())
+
+    def test_should_resume_only_failed_and_pending_mails(self, mock_send):
+        failing_person = self.persons[0]
+        mock_send.side_effect = lambda message: None if message['person'] != failing_person.pk else 1 / 0
+        build_messages = mock.Mock(side_effect=lambda persons: {person.pk: {'person': person.pk} for person in persons})
+
+        progress = mailing.run_campaign(self.campaign, build_messages, chunk_size=2)
+        self.assertDictEqual(progress, {'total': 5, 'sent': 4, 'skipped': 0, 'failed': 1})
+
+        mock_send.reset_mock(side_effect=True)
+        progress = mailing.run_campaign(self.campaign, build_messages, chunk_size=2)
+        self.assertDictEqual(progress, {'total': 1, 'sent': 1, 'skipped': 0, 'failed': 0})
+        mock_send.assert_called_once_with({'person': failing_person.pk})
+
+    def test_should_build_messages_one_by_one_when_chunk_fails(self, mock_send):
+        failing_person = self.persons[0]
+
+        def build_messages(persons):
+            if failing_person in persons:
+                raise ValueError("Invalid data")
+            return {person.pk: {'person': person.pk} for person in persons}
+
+        progress = mailing.run_campaign(self.campaign, build_messages, chunk_size=2)
+
+        self.assertDictEqual(progress, {'total': 5, 'sent': 4, 'skipped': 0, 'failed': 1})
+        failed_mailing = ApplicationMailing.objects.get(person=failing_person)
+        self.assertEqual(failed_mailing.error, "Invalid data")
+
+    def test_should_not_retry_mails_which_reached_max_attempts(self, mock_send):
+        mock_send.side_effect = ValueError("SMTP unavailable")
+        build_messages = mock.Mock(side_effect=lambda persons: {person.pk: {'person': person.pk} for person in persons})
+
+        for _ in range(mailing.MAILING_MAX_ATTEMPTS):
+            mailing.run_campaign(self.campaign, build_messages)
+        progress = mailing.run_campaign(self.campaign, build_messages)
+
+        self.assertEqual(progress['total'], 0)
+        self.assertEqual(mock_send.call_count, mailing.MAILING_MAX_ATTEMPTS * len(self.persons))
@@ -23,16 +23,15 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-import functools
-import operator
 from typing import List
 
 from django.db import models
-from django.db.models import F, QuerySet, OuterRef, Subquery, Case, When, Q
+from django.db.models import F, QuerySet, OuterRef, Subquery, Case, When
 
 from attribution.models.attribution_charge_new import AttributionChargeNew as AttributionChargeNewDb
 from attribution.models.attribution_new import AttributionNew as AttributionNewDb, AttributionNew
 from base.models.enums.learning_component_year_type import LECTURING, PRACTICAL_EXERCISES
+from base.models.person import get_name_filter
 from ddd.logic.effective_class_repartition.domain.model.tutor import TutorIdentity
 from ddd.logic.effective_class_repartition.domain.service.i_tutor_attribution import \
     ITutorAttributionToLearningUnitTranslator
@@ -91,19 +90,9 @@ class TutorAttributionToLearningUnitTranslator(ITutorAttributionToLearningUnitTr
             annee: int,
             nom_prenom: str,
     ) -> List['TutorAttributionToLearningUnitDTO']:
-        filters = [
-            Q(tutor__person__first_name__icontains=mot)
-            | Q(tutor__person__last_name__icontains=mot)
-            for mot in nom_prenom.split(' ')
-        ]
-        qs = _get_common_qs()
-        qs = qs.filter(
+        qs = _get_common_qs().filter(
+            get_name_filter(nom_prenom, lookup_prefix='tutor__person__'),
             learning_container_year__academic_year__year=annee,
-        ).filter(
-            functools.reduce(
-                operator.and_,
-                filters
-            )
         )
         qs = _annotate_qs(qs)
         qs = _value_qs(qs).order_by('last_name', 'first_name')
@@ -22,18 +22,23 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import logging
 from collections import defaultdict
 from typing import List, Dict, Iterable, Any, Callable, Tuple, Optional, Set
 
 import attr
 from django.conf import settings
+from django.db import transaction
+from django.db.models import F
 from django.utils import translation
 from django.utils.translation import gettext_lazy
 
+from assessments.models.score_encoding_notification import ScoreEncodingNotification
 from base.models.person import Person
 from base.utils.send_mail import _get_txt_complementary_first_col_header
 from base.utils.string import unaccent
-from ddd.logic.encodage_des_notes.encodage.domain.model.gestionnaire_parcours import GestionnaireParcours
+from ddd.logic.encodage_des_notes.encodage.domain.model.gestionnaire_parcours import GestionnaireParcours, \
+    IdentiteGestionnaire
 from ddd.logic.encodage_des_notes.encodage.domain.model.note_etudiant import IdentiteNoteEtudiant, NoteEtudiant
 from ddd.logic.encodage_des_notes.encodage.domain.service.cohorte_non_complete import CodeUniteEnseignement, NomCohorte
 from ddd.logic.encodage_des_notes.encodage.domain.service.i_notifier_encodage_notes import INotifierEncodageNotes
@@ -58,6 +63,8 @@ ENCODAGE_COMPLET_MAIL_TEMPLATE = "assessments_all_scores_by_pgm_manager"
 CORRECTION_ENCODAGE_COMPLET_MAIL_TEMPLATE = "assessments_correction_encodage_complet"
 DEFAULT_LANGUAGE = settings.LANGUAGE_CODE_FR
 
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
 
 @attr.s(frozen=True, slots=True)
 class DonneesEmail:
@@ -486,6 +493,125 @@ class NotifierEncodageNotes(INotifierEncodageNotes):
         return None
 
 
+class NotifierEncodageNotesEnDiffere(INotifierEncodageNotes):
+    """
+    Only record the encoding : the notifications are sent by the assessments.tasks.notify_score_encoding task, which
+    merges all the encodings recorded since its last run.
+    """
+    MAX_ATTEMPTS_ENVOI = 3
+
+    @classmethod
+    def notifier(
+            cls,
+            identites_notes_encodees: List['IdentiteNoteEtudiant'],
+            cohortes_non_entierement_encodees_avant_encodage: List[Tuple[CodeUniteEnseignement, NomCohorte]],
+            gestionnaire_parcours: 'GestionnaireParcours',
+            *args,
+            **kwargs
+    ) -> None:
+        if not identites_notes_encodees:
+            return
+        ScoreEncodingNotification.objects.create(
+            program_manager_global_id=gestionnaire_parcours.entity_id.matricule_fgs_gestionnaire,
+            academic_year=identites_notes_encodees[0].annee_academique,
+            session_number=identites_notes_encodees[0].numero_session,
+            encoded_scores=[
+                {'noma': identite.noma, 'code_unite_enseignement': identite.code_unite_enseignement}
+                for identite in identites_notes_encodees
+            ],
+            incomplete_cohorts_before_encoding=[
+                list(cohorte) for cohorte in cohortes_non_entierement_encodees_avant_encodage
+            ],
+        )
+
+    @classmethod
+    def envoyer_notifications_en_attente(
+            cls,
+            note_etudiant_repository: 'INoteEtudiantRepository',
+            attribution_enseignant_translator: 'IAttributionEnseignantTranslator',
+            signaletique_personne_translator: 'ISignaletiquePersonneTranslator',
+            signaletique_etudiant_translator: 'ISignaletiqueEtudiantTranslator',
+            adresse_feuille_de_notes_repo: 'IAdresseFeuilleDeNotesRepository',
+            inscr_exam_translator: 'IInscriptionExamenTranslator',
+    ) -> int:
+        """
+        Send one batch of notifications per program manager and session for all the recorded encodings.
+        A cohort is considered incomplete before encoding when it was before any of the merged encodings.
+        A failed batch is retried by the next runs, until its encodings failed MAX_ATTEMPTS_ENVOI times.
+        Return the number of batches sent.
+        """
+        encodages_en_attente = ScoreEncodingNotification.objects.filter(attempts__lt=cls.MAX_ATTEMPTS_ENVOI)
+        cles = encodages_en_attente.values_list(
+            'program_manager_global_id',
+            'academic_year',
+            'session_number',
+        ).distinct()
+        nombre_envois = 0
+        for matricule, annee_academique, numero_session in list(cles):
+            evenements = []
+            try:
+                with transaction.atomic():
+                    evenements = list(
+                        encodages_en_attente.select_for_update(skip_locked=True).filter(
+                            program_manager_global_id=matricule,
+                            academic_year=annee_academique,
+                            session_number=numero_session,
+                        ).order_by('created')
+                    )
+                    if not evenements:
+                        continue
+                    NotifierEncodageNotes.notifier(
+                        _fusionner_notes_encodees(evenements),
+                        _fusionner_cohortes_non_entierement_encodees(evenements),
+                        GestionnaireParcours(
+                            entity_id=IdentiteGestionnaire(matricule_fgs_gestionnaire=matricule),
+                            cohortes_gerees=set(),
+                        ),
+                        note_etudiant_repository,
+                        attribution_enseignant_translator,
+                        signaletique_personne_translator,
+                        signaletique_etudiant_translator,
+                        adresse_feuille_de_notes_repo,
+                        inscr_exam_translator,
+                    )
+                    ScoreEncodingNotification.objects.filter(pk__in=[evenement.pk for evenement in evenements]).delete()
+                    nombre_envois += 1
+            except Exception:
+                # Kept for the next runs : some mails of the batch may have been sent, hence the limited attempts
+                logger.exception(
+                    "Unable to notify score encoding of %s for session %s of %s",
+                    matricule, numero_session, annee_academique
+                )
+                ScoreEncodingNotification.objects.filter(
+                    pk__in=[evenement.pk for evenement in evenements]
+                ).update(attempts=F('attempts') + 1)
+        return nombre_envois
+
+
+def _fusionner_notes_encodees(evenements: List['ScoreEncodingNotification']) -> List['IdentiteNoteEtudiant']:
+    identites = {}  # Ordered set
+    for evenement in evenements:
+        for note in evenement.encoded_scores:
+            identite = IdentiteNoteEtudiant(
+                noma=note['noma'],
+                code_unite_enseignement=note['code_unite_enseignement'],
+                annee_academique=evenement.academic_year,
+                numero_session=evenement.session_number,
+            )
+            identites[identite] = None
+    return list(identites)
+
+
+def _fusionner_cohortes_non_entierement_encodees(
+        evenements: List['ScoreEncodingNotification']
+) -> List[Tuple[CodeUniteEnseignement, NomCohorte]]:
+    return list({
+        (code_unite_enseignement, nom_cohorte)
+        for evenement in evenements
+        for code_unite_enseignement, nom_cohorte in evenement.incomplete_cohorts_before_encoding
+    })
+
+
 def groupby(datas: Iterable[Any], key: Callable) -> Dict:
     result = defaultdict(list)
     for data in datas:
@@ -29,10 +29,9 @@ from typing import List, Optional, Set, Tuple
 
 from django.db.models import CharField, Q, OuterRef, Case, When, F, DateField, Value, BooleanField, \
     Subquery, ExpressionWrapper
-from django.db.models.functions import Concat, Coalesce, Cast, Replace
+from django.db.models.functions import Coalesce, Cast, Replace
 
 from base.models.enums.exam_enrollment_justification_type import JustificationTypes
-from base.models.enums.learning_component_year_type import LECTURING, PRACTICAL_EXERCISES
 from base.models.exam_enrollment import ExamEnrollment
 from base.models.session_exam_deadline import SessionExamDeadline
 from ddd.logic.encodage_des_notes.encodage.builder.note_etudiant_builder import NoteEtudiantBuilder
@@ -40,6 +39,9 @@ from ddd.logic.encodage_des_notes.encodage.domain.model.note_etudiant import Ide
 from ddd.logic.encodage_des_notes.encodage.dtos import NoteEtudiantFromRepositoryDTO
 from ddd.logic.encodage_des_notes.encodage.repository.note_etudiant import INoteEtudiantRepository
 from education_group.models.enums.cohort_name import CohortName
+from infrastructure.encodage_de_notes.shared_kernel.repository import exam_enrollment
+from infrastructure.encodage_de_notes.shared_kernel.service.progression_encodage_notes import \
+    mettre_a_jour_progressions_unites_enseignement
 from osis_common.ddd.interface import ApplicationService
 
 
@@ -234,28 +236,7 @@ class NoteEtudiantRepository(INoteEtudiantRepository):
             qs = qs.filter(score_final__isnull=True, justification_final__isnull=True)
 
         qs = qs.annotate(
-            code_unite_enseignement=Case(
-                When(
-                    learning_unit_enrollment__learning_class_year__learning_component_year__type=LECTURING,
-                    then=Concat(
-                        'learning_unit_enrollment__learning_unit_year__acronym',
-                        Value('-'),
-                        'learning_unit_enrollment__learning_class_year__acronym',
-                        output_field=CharField()
-                    )
-                ),
-                When(
-                    learning_unit_enrollment__learning_class_year__learning_component_year__type=PRACTICAL_EXERCISES,
-                    then=Concat(
-                        'learning_unit_enrollment__learning_unit_year__acronym',
-                        Value('_'),
-                        'learning_unit_enrollment__learning_class_year__acronym',
-                        output_field=CharField()
-                    )
-                ),
-                default=F('learning_unit_enrollment__learning_unit_year__acronym'),
-                output_field=CharField()
-            ),
+            code_unite_enseignement=F('learning_unit_enrollment__full_class_code'),
         )
         if code_unite_enseignement:
             qs = qs.filter(code_unite_enseignement__icontains=code_unite_enseignement)
@@ -279,7 +260,11 @@ class NoteEtudiantRepository(INoteEtudiantRepository):
 
     @classmethod
     def save(cls, entity: 'NoteEtudiant') -> None:
-        _save_note(entity)
+        _save_notes([entity])
+
+    @classmethod
+    def save_all(cls, entities: List['NoteEtudiant']) -> None:
+        _save_notes(entities)
 
     @classmethod
     def get_all_identities(cls) -> List['IdentiteNoteEtudiant']:
@@ -290,41 +275,18 @@ class NoteEtudiantRepository(INoteEtudiantRepository):
         return cls.search([entity_id])[0]
 
 
-def _save_note(note: 'NoteEtudiant'):
-    db_obj = ExamEnrollment.objects.annotate(
-        code_unite_enseignement=Case(
-            When(
-                learning_unit_enrollment__learning_class_year__learning_component_year__type=LECTURING,
-                then=Concat(
-                    'learning_unit_enrollment__learning_unit_year__acronym',
-                    Value('-'),
-                    'learning_unit_enrollment__learning_class_year__acronym',
-                    output_field=CharField()
-                )
-            ),
-            When(
-                learning_unit_enrollment__learning_class_year__learning_component_year__type=PRACTICAL_EXERCISES,
-                then=Concat(
-                    'learning_unit_enrollment__learning_unit_year__acronym',
-                    Value('_'),
-                    'learning_unit_enrollment__learning_class_year__acronym',
-                    output_field=CharField()
-                )
-            ),
-            default=F('learning_unit_enrollment__learning_unit_year__acronym'),
-            output_field=CharField()
-        ),
-    ).get(
-        code_unite_enseignement=note.code_unite_enseignement,
-        learning_unit_enrollment__learning_unit_year__academic_year__year=note.annee_academique,
-        session_exam__number_session=note.numero_session,
-        learning_unit_enrollment__offer_enrollment__student__registration_id=note.entity_id.noma
+def _save_notes(notes: List['NoteEtudiant']) -> None:
+    exam_enrollments = exam_enrollment.search_exam_enrollments(
+        (note.noma, note.code_unite_enseignement, note.annee_academique, note.numero_session) for note in notes
+    )
+    for note in notes:
+        db_obj = exam_enrollments[(note.noma, note.code_unite_enseignement, note.annee_academique, note.numero_session)]
+        db_obj.score_final = note.note.value if note.is_chiffree else None
+        db_obj.justification_final = note.note.value.name if note.is_justification else None
+    exam_enrollment.bulk_update_scores(exam_enrollments.values())
+    mettre_a_jour_progressions_unites_enseignement(
+        (note.code_unite_enseignement, note.annee_academique, note.numero_session) for note in notes
     )
-
-    db_obj.score_final = note.note.value if note.is_chiffree else None
-    db_obj.justification_final = note.note.value.name if note.is_justification else None
-
-    db_obj.save()
 
 
 def _fetch_session_exams(
@@ -346,16 +308,7 @@ def _fetch_session_exams(
     ).values('date_limite_de_remise')
     qs = ExamEnrollment.objects.all()
     if codes_unite_enseignement:
-        codes_unite_enseignement_sans_acronyme_classe = {
-            code.replace('-', '').replace('_', '')[:-1]
-            for code in codes_unite_enseignement
-        }
-        codes_unite_enseignement_pour_filtre = codes_unite_enseignement_sans_acronyme_classe.union(
-            codes_unite_enseignement
-        )
-        qs = qs.filter(
-            learning_unit_enrollment__learning_unit_year__acronym__in=codes_unite_enseignement_pour_filtre
-        )
+        qs = qs.filter(learning_unit_enrollment__full_class_code__in=codes_unite_enseignement)
     if noms_cohortes:
         noms_cohortes_avec_11ba_remplace_par_equivalent_1ba = [
             cohorte.replace('11BA', '1BA')
@@ -366,28 +319,7 @@ def _fetch_session_exams(
             noms_cohortes_avec_11ba_remplace_par_equivalent_1ba
         )
     return qs.annotate(
-        code_unite_enseignement=Case(
-            When(
-                learning_unit_enrollment__learning_class_year__learning_component_year__type=LECTURING,
-                then=Concat(
-                    'learning_unit_enrollment__learning_unit_year__acronym',
-                    Value('-'),
-                    'learning_unit_enrollment__learning_class_year__acronym',
-                    output_field=CharField()
-                )
-            ),
-            When(
-                learning_unit_enrollment__learning_class_year__learning_component_year__type=PRACTICAL_EXERCISES,
-                then=Concat(
-                    'learning_unit_enrollment__learning_unit_year__acronym',
-                    Value('_'),
-                    'learning_unit_enrollment__learning_class_year__acronym',
-                    output_field=CharField()
-                )
-            ),
-            default=F('learning_unit_enrollment__learning_unit_year__acronym'),
-            output_field=CharField()
-        ),
+        code_unite_enseignement=F('learning_unit_enrollment__full_class_code'),
         annee_academique=F('learning_unit_enrollment__learning_unit_year__academic_year__year'),
         numero_session=F('session_exam__number_session'),
         note_decimale_autorisee=Case(
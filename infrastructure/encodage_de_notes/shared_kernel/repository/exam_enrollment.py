@@ -0,0 +1,91 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from typing import Dict, Iterable, Tuple
+
+from django.db.models import F
+from django.utils import timezone
+
+from base.models.exam_enrollment import ExamEnrollment
+from base.models.exceptions import JustificationValueException
+
+Noma = str
+CodeUniteEnseignement = str
+AnneeAcademique = int
+NumeroSession = int
+CleNoteEtudiant = Tuple[Noma, CodeUniteEnseignement, AnneeAcademique, NumeroSession]
+
+# bulk_update() does not go through save() : 'changed' (auto_now) is set explicitly
+EXAM_ENROLLMENT_SCORE_FIELDS = ['score_draft', 'justification_draft', 'score_final', 'justification_final', 'changed']
+
+
+def search_exam_enrollments(cles: Iterable[CleNoteEtudiant]) -> Dict[CleNoteEtudiant, ExamEnrollment]:
+    """
+    Resolve in a single query the exam enrollments targeted by (noma, code_unite_enseignement, annee, session).
+    Raise ExamEnrollment.DoesNotExist if one of them is not found, ExamEnrollment.MultipleObjectsReturned if one of
+    them is found more than once.
+    """
+    cles = set(cles)
+    if not cles:
+        return {}
+    qs = ExamEnrollment.objects.annotate(
+        code_unite_enseignement=F('learning_unit_enrollment__full_class_code'),
+        noma=F('learning_unit_enrollment__offer_enrollment__student__registration_id'),
+        annee_academique=F('learning_unit_enrollment__learning_unit_year__academic_year__year'),
+        numero_session=F('session_exam__number_session'),
+    ).filter(
+        noma__in={cle[0] for cle in cles},
+        code_unite_enseignement__in={cle[1] for cle in cles},
+        annee_academique__in={cle[2] for cle in cles},
+        numero_session__in={cle[3] for cle in cles},
+    )
+    exam_enrollments = {}
+    cles_en_double = set()
+    for db_obj in qs:
+        cle = (db_obj.noma, db_obj.code_unite_enseignement, db_obj.annee_academique, db_obj.numero_session)
+        if cle in exam_enrollments:
+            cles_en_double.add(cle)
+        exam_enrollments[cle] = db_obj
+    cles_en_double &= cles
+    if cles_en_double:
+        raise ExamEnrollment.MultipleObjectsReturned(
+            "More than one ExamEnrollment matching query: {}".format(sorted(cles_en_double))
+        )
+    cles_inconnues = cles - exam_enrollments.keys()
+    if cles_inconnues:
+        raise ExamEnrollment.DoesNotExist(
+            "ExamEnrollment matching query does not exist: {}".format(sorted(cles_inconnues))
+        )
+    return {cle: exam_enrollments[cle] for cle in cles}
+
+
+def bulk_update_scores(exam_enrollments: Iterable[ExamEnrollment]) -> None:
+    exam_enrollments = list(exam_enrollments)
+    if any(not db_obj.justification_valid() for db_obj in exam_enrollments):
+        raise JustificationValueException
+    now = timezone.now()
+    for db_obj in exam_enrollments:
+        db_obj.changed = now
+    ExamEnrollment.objects.bulk_update(exam_enrollments, fields=EXAM_ENROLLMENT_SCORE_FIELDS)
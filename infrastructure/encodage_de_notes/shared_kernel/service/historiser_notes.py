@@ -24,8 +24,31 @@
 #
 ##############################################################################
 import uuid
+from typing import List, Tuple
+
+from osis_history.models import HistoryEntry
+
+HistoryUuid = str
+MessageFr = str
+MessageEn = str
 
 
 def get_history_identity(code_unite_enseignement: str, annee_academique: int, numero_session: int) -> str:
     name = "{}{}{}".format(code_unite_enseignement, str(annee_academique), str(numero_session))
     return str(uuid.uuid3(uuid.NAMESPACE_OID, name=name))
+
+
+def add_history_entries(
+        entries: List[Tuple[HistoryUuid, MessageFr, MessageEn]],
+        author: str,
+        tags: List[str]
+) -> None:
+    HistoryEntry.objects.bulk_create(
+        HistoryEntry(
+            object_uuid=object_uuid,
+            message_fr=message_fr,
+            message_en=message_en,
+            author=author,
+            tags=tags,
+        ) for object_uuid, message_fr, message_en in entries
+    )
@@ -0,0 +1,218 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import collections
+from typing import List, Set, Optional, Iterable, Tuple
+
+from django.db import transaction
+from django.db.models import F, Case, When, Value, CharField, DateField, ExpressionWrapper, OuterRef, Subquery, \
+    BooleanField, Q, Exists, QuerySet
+from django.db.models.functions import Replace
+
+from assessments.models.score_encoding_progress import ScoreEncodingProgress
+from base.models.enums import exam_enrollment_state
+from base.models.exam_enrollment import ExamEnrollment
+from base.models.session_exam_deadline import SessionExamDeadline
+from base.models.student_specific_profile import StudentSpecificProfile
+from base.utils.db import advisory_lock, call_once_on_commit
+from ddd.logic.encodage_des_notes.shared_kernel.domain.service.i_progression_encodage_notes import \
+    IProgressionEncodageNotesTranslator
+from ddd.logic.encodage_des_notes.shared_kernel.dtos import ProgressionEncodageNotesCohorteDTO, DateDTO
+from education_group.models.enums.cohort_name import CohortName
+
+
+class ProgressionEncodageNotesTranslator(IProgressionEncodageNotesTranslator):
+
+    @classmethod
+    def search(
+            cls,
+            annee: int,
+            numero_session: int,
+            noms_cohortes: Set[str],
+            code_unite_enseignement: str = None,
+            codes_unites_enseignement: Set[str] = None,
+            seulement_notes_manquantes: bool = False,
+    ) -> List['ProgressionEncodageNotesCohorteDTO']:
+        qs = ScoreEncodingProgress.objects.filter(
+            academic_year=annee,
+            session_number=numero_session,
+            cohort_name__in=noms_cohortes,
+        )
+        if code_unite_enseignement:
+            qs = qs.filter(learning_unit_code__icontains=code_unite_enseignement)
+        if codes_unites_enseignement is not None:
+            qs = qs.filter(learning_unit_code__in=codes_unites_enseignement)
+        if seulement_notes_manquantes:
+            qs = qs.filter(submitted_count__lt=F('total_count'))
+        return [
+            ProgressionEncodageNotesCohorteDTO(
+                code_unite_enseignement=progress.learning_unit_code,
+                annee_academique=progress.academic_year,
+                numero_session=progress.session_number,
+                nom_cohorte=progress.cohort_name,
+                date_echeance=DateDTO.build_from_date(progress.deadline) if progress.deadline else None,
+                quantite_notes_brouillon=progress.draft_count,
+                quantite_notes_soumises=progress.submitted_count,
+                quantite_total_notes=progress.total_count,
+                quantite_etudiants_peps=progress.peps_students_count,
+            ) for progress in qs.order_by('learning_unit_code', 'deadline')
+        ]
+
+
+@transaction.atomic
+def mettre_a_jour_progressions(
+        annee: int,
+        numero_session: int,
+        codes_unites_enseignement: Optional[Set[str]] = None,
+) -> None:
+    """
+    Recompute the counters of the given learning units (all learning units of the session if None) from the exam
+    enrollments. Only the rows of the touched learning units are rewritten.
+    """
+    _verrouiller_progressions(annee, numero_session, codes_unites_enseignement)
+
+    compteurs = collections.defaultdict(collections.Counter)
+    for row in _search_inscriptions_examen(annee, numero_session, codes_unites_enseignement):
+        compteur = compteurs[(row['code_unite_enseignement'], row['nom_cohorte'], row['date_echeance'])]
+        compteur['total'] += 1
+        compteur['soumises'] += row['note_soumise']
+        compteur['brouillon'] += row['note_brouillon']
+        compteur['peps'] += row['etudiant_peps']
+
+    progressions_existantes = ScoreEncodingProgress.objects.filter(academic_year=annee, session_number=numero_session)
+    if codes_unites_enseignement is not None:
+        progressions_existantes = progressions_existantes.filter(learning_unit_code__in=codes_unites_enseignement)
+    progressions_existantes.delete()
+    ScoreEncodingProgress.objects.bulk_create(
+        ScoreEncodingProgress(
+            learning_unit_code=code_unite_enseignement,
+            academic_year=annee,
+            session_number=numero_session,
+            cohort_name=nom_cohorte,
+            deadline=date_echeance,
+            total_count=compteur['total'],
+            draft_count=compteur['brouillon'],
+            submitted_count=compteur['soumises'],
+            peps_students_count=compteur['peps'],
+        ) for (code_unite_enseignement, nom_cohorte, date_echeance), compteur in compteurs.items()
+    )
+
+
+def mettre_a_jour_progressions_unites_enseignement(cles: Iterable[Tuple[str, int, int]]) -> None:
+    """
+    :param cles: (code_unite_enseignement, annee, numero_session) of the saved scores
+    """
+    codes_par_session = collections.defaultdict(set)
+    for code_unite_enseignement, annee, numero_session in cles:
+        codes_par_session[(annee, numero_session)].add(code_unite_enseignement)
+    for (annee, numero_session), codes_unites_enseignement in sorted(codes_par_session.items()):
+        mettre_a_jour_progressions(annee, numero_session, codes_unites_enseignement)
+
+
+def planifier_mise_a_jour_progressions(inscriptions_examen: QuerySet) -> None:
+    """
+    Refresh, when the current transaction commits, the counters of the learning units of the exam enrollments.
+    Used when exam enrollments, deadlines or student profiles are modified outside of the score encoding.
+    """
+    cles = inscriptions_examen.values_list(
+        'learning_unit_enrollment__full_class_code',
+        'learning_unit_enrollment__learning_unit_year__academic_year__year',
+        'session_exam__number_session',
+    ).distinct()
+    call_once_on_commit(mettre_a_jour_progressions_unites_enseignement, set(cles))
+
+
+def _verrouiller_progressions(annee: int, numero_session: int, codes_unites_enseignement: Optional[Set[str]]) -> None:
+    # Concurrent refreshes of the same learning unit would both delete the same rows then insert duplicates
+    cle_session = 'score_encoding_progress:{}:{}'.format(annee, numero_session)
+    if codes_unites_enseignement is None:
+        advisory_lock(cle_session)
+        return
+    advisory_lock(cle_session, shared=True)
+    for code_unite_enseignement in sorted(codes_unites_enseignement):
+        advisory_lock('{}:{}'.format(cle_session, code_unite_enseignement))
+
+
+def _search_inscriptions_examen(
+        annee: int,
+        numero_session: int,
+        codes_unites_enseignement: Optional[Set[str]],
+) -> Iterable[dict]:
+    qs = ExamEnrollment.objects.filter(
+        learning_unit_enrollment__learning_unit_year__academic_year__year=annee,
+        session_exam__number_session=numero_session,
+        enrollment_state=exam_enrollment_state.ENROLLED,
+    )
+    if codes_unites_enseignement is not None:
+        qs = qs.filter(learning_unit_enrollment__full_class_code__in=codes_unites_enseignement)
+
+    subqs_deadline = SessionExamDeadline.objects.filter(
+        number_session=OuterRef("session_exam__number_session"),
+        offer_enrollment=OuterRef('learning_unit_enrollment__offer_enrollment')
+    ).annotate(
+        date_limite_de_remise=Case(
+            When(deadline_tutor__isnull=True, then=F('deadline')),
+            default=ExpressionWrapper(F('deadline') - F('deadline_tutor'), output_field=DateField())
+        )
+    ).values('date_limite_de_remise')
+    subqs_peps = StudentSpecificProfile.objects.filter(
+        student=OuterRef('learning_unit_enrollment__offer_enrollment__student'),
+    )
+    qs = qs.annotate(
+        code_unite_enseignement=F('learning_unit_enrollment__full_class_code'),
+        nom_cohorte=Case(
+            When(
+                learning_unit_enrollment__offer_enrollment__cohort_year__name=CohortName.FIRST_YEAR.name,
+                then=Replace(
+                    'learning_unit_enrollment__offer_enrollment__education_group_year__acronym',
+                    Value('1BA'),
+                    Value('11BA')
+                )
+            ),
+            default=F('learning_unit_enrollment__offer_enrollment__education_group_year__acronym'),
+            output_field=CharField()
+        ),
+        date_echeance=Subquery(subqs_deadline[:1], output_field=DateField()),
+        note_soumise=Case(
+            When(Q(score_final__isnull=False) | Q(justification_final__isnull=False), then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField()
+        ),
+        note_brouillon=Case(
+            When(Q(score_final__isnull=False) | Q(justification_final__isnull=False), then=Value(False)),
+            When(Q(score_draft__isnull=False) | Q(justification_draft__isnull=False), then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField()
+        ),
+        etudiant_peps=Exists(subqs_peps),
+    )
+    return qs.values(
+        'code_unite_enseignement',
+        'nom_cohorte',
+        'date_echeance',
+        'note_soumise',
+        'note_brouillon',
+        'etudiant_peps',
+    ).iterator()
@@ -29,12 +29,11 @@ import attr
 from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 
-from osis_history.utilities import add_history_entry
-
 from base.models.person import Person
 from ddd.logic.encodage_des_notes.soumission.domain.model.note_etudiant import NoteEtudiant
 from ddd.logic.encodage_des_notes.soumission.domain.service.i_historiser_notes import IHistoriserNotesService
-from infrastructure.encodage_de_notes.shared_kernel.service.historiser_notes import get_history_identity
+from infrastructure.encodage_de_notes.shared_kernel.service.historiser_notes import get_history_identity, \
+    add_history_entries
 
 TAGS = ['encodage_de_notes', 'soumission']
 
@@ -75,38 +74,28 @@ class HistoriserNotesService(IHistoriserNotesService):
         author = Person.objects.get(global_id=matricule)
         historique_notes = cls._build_historique_notes(notes_soumises)
 
+        entries = []
         for historique in historique_notes:
             with translation.override('fr-be'):
                 message_fr = str(historique.get_soumission_text())
             with translation.override('en'):
                 message_en = str(historique.get_soumission_text())
-
-            add_history_entry(
-                historique.get_history_identity(),
-                message_fr,
-                message_en,
-                author=author.full_name,
-                tags=TAGS,
-            )
+            entries.append((historique.get_history_identity(), message_fr, message_en))
+        add_history_entries(entries, author=author.full_name, tags=TAGS)
 
     @classmethod
     def historiser_encodage(cls, matricule: str, notes_encodees: List['NoteEtudiant']) -> None:
         author = Person.objects.get(global_id=matricule)
         historique_notes = cls._build_historique_notes(notes_encodees)
 
+        entries = []
         for historique in historique_notes:
             with translation.override('fr-be'):
                 message_fr = str(historique.get_encodage_text())
             with translation.override('en'):
                 message_en = str(historique.get_encodage_text())
-
-            add_history_entry(
-                historique.get_history_identity(),
-                message_fr,
-                message_en,
-                author=author.full_name,
-                tags=TAGS,
-            )
+            entries.append((historique.get_history_identity(), message_fr, message_en))
+        add_history_entries(entries, author=author.full_name, tags=TAGS)
 
     @classmethod
     def _build_historique_notes(cls, notes: List['NoteEtudiant']) -> List['HistoriqueNotes']:
@@ -31,9 +31,8 @@ import attr
 from django.db import connection
 from django.db.models import F, Case, CharField, Value, When, BooleanField, ExpressionWrapper, DateField, Q, OuterRef, \
     Subquery
-from django.db.models.functions import Coalesce, Cast, Concat, Replace
+from django.db.models.functions import Coalesce, Cast, Replace
 
-from base.models.enums.learning_component_year_type import LECTURING, PRACTICAL_EXERCISES
 from base.models.exam_enrollment import ExamEnrollment
 from base.models.session_exam_deadline import SessionExamDeadline
 from ddd.logic.encodage_des_notes.soumission.builder.note_etudiant_builder import NoteEtudiantBuilder
@@ -42,6 +41,9 @@ from ddd.logic.encodage_des_notes.soumission.dtos import NoteEtudiantFromReposit
     DateEcheanceNoteDTO
 from ddd.logic.encodage_des_notes.soumission.repository.i_note_etudiant import INoteEtudiantRepository, SearchCriteria
 from education_group.models.enums.cohort_name import CohortName
+from infrastructure.encodage_de_notes.shared_kernel.repository import exam_enrollment
+from infrastructure.encodage_de_notes.shared_kernel.service.progression_encodage_notes import \
+    mettre_a_jour_progressions_unites_enseignement
 from osis_common.ddd.interface import ApplicationService
 
 
@@ -165,10 +167,7 @@ class NoteEtudiantRepository(INoteEtudiantRepository):
             with connection.cursor() as cursor:
                 raw_query = '''
                     SELECT 
-                        CASE WHEN base_learningcomponentyear.type = 'LECTURING' THEN CONCAT(base_learningunityear.acronym, '-' , learning_unit_learningclassyear.acronym)
-                             WHEN base_learningcomponentyear.type = 'PRACTICAL_EXERCISES' THEN CONCAT(base_learningunityear.acronym, '_' , learning_unit_learningclassyear.acronym)
-                             ELSE base_learningunityear.acronym
-                        END AS code_unite_enseignement, 
+                        base_learningunitenrollment.full_class_code AS code_unite_enseignement, 
                         base_academicyear.year AS annee_academique, 
                         base_sessionexam.number_session AS numero_session, 
                         base_student.registration_id AS noma,
@@ -195,8 +194,6 @@ class NoteEtudiantRepository(INoteEtudiantRepository):
                     FROM base_examenrollment
                     JOIN base_learningunitenrollment on base_learningunitenrollment.id = base_examenrollment.learning_unit_enrollment_id
                     JOIN base_learningunityear on base_learningunityear.id = base_learningunitenrollment.learning_unit_year_id
-                    LEFT JOIN learning_unit_learningclassyear on learning_unit_learningclassyear.id = base_learningunitenrollment.learning_class_year_id
-                    LEFT JOIN base_learningcomponentyear on base_learningcomponentyear.id = learning_unit_learningclassyear.learning_component_year_id
                     JOIN base_academicyear on base_academicyear.id = base_learningunityear.academic_year_id
                     JOIN base_sessionexam on base_sessionexam.id = base_examenrollment.session_exam_id       
                     JOIN base_offerenrollment on base_offerenrollment.id = base_learningunitenrollment.offer_enrollment_id
@@ -204,7 +201,7 @@ class NoteEtudiantRepository(INoteEtudiantRepository):
                     WHERE base_academicyear.year = %(academic_year)s AND
                         base_sessionexam.number_session = %(number_session)s  AND
                         base_student.registration_id in %(registration_ids)s AND
-                        base_learningunityear.acronym in %(simplified_acronyms)s
+                        base_learningunitenrollment.full_class_code in %(codes_unites_enseignement)s
                     ORDER BY code_unite_enseignement, annee_academique, echeance
                 '''
                 cursor.execute(raw_query, parameters)
@@ -233,7 +230,11 @@ class NoteEtudiantRepository(INoteEtudiantRepository):
 
     @classmethod
     def save(cls, entity: 'NoteEtudiant') -> None:
-        _save_note(entity)
+        _save_notes([entity])
+
+    @classmethod
+    def save_all(cls, entities: List['NoteEtudiant']) -> None:
+        _save_notes(entities)
 
     @classmethod
     def get_all_identities(cls) -> List['IdentiteNoteEtudiant']:
@@ -244,44 +245,22 @@ class NoteEtudiantRepository(INoteEtudiantRepository):
         return cls.search([entity_id])[0]
 
 
-def _save_note(note: 'NoteEtudiant'):
-    db_obj = ExamEnrollment.objects.annotate(
-        code_unite_enseignement=Case(
-            When(
-                learning_unit_enrollment__learning_class_year__learning_component_year__type=LECTURING,
-                then=Concat(
-                    'learning_unit_enrollment__learning_unit_year__acronym',
-                    Value('-'),
-                    'learning_unit_enrollment__learning_class_year__acronym',
-                    output_field=CharField()
-                )
-            ),
-            When(
-                learning_unit_enrollment__learning_class_year__learning_component_year__type=PRACTICAL_EXERCISES,
-                then=Concat(
-                    'learning_unit_enrollment__learning_unit_year__acronym',
-                    Value('_'),
-                    'learning_unit_enrollment__learning_class_year__acronym',
-                    output_field=CharField()
-                )
-            ),
-            default=F('learning_unit_enrollment__learning_unit_year__acronym'),
-            output_field=CharField()
-        ),
-    ).get(
-        code_unite_enseignement=note.code_unite_enseignement,
-        learning_unit_enrollment__learning_unit_year__academic_year__year=note.annee,
-        session_exam__number_session=note.numero_session,
-        learning_unit_enrollment__offer_enrollment__student__registration_id=note.entity_id.noma
+def _save_notes(notes: List['NoteEtudiant']) -> None:
+    exam_enrollments = exam_enrollment.search_exam_enrollments(
+        (note.noma, note.code_unite_enseignement, note.annee, note.numero_session) for note in notes
+    )
+    for note in notes:
+        db_obj = exam_enrollments[(note.noma, note.code_unite_enseignement, note.annee, note.numero_session)]
+        if note.est_soumise:
+            db_obj.score_final = note.note.value if note.is_chiffree else None
+            db_obj.justification_final = note.note.value.name if note.is_justification else None
+        else:
+            db_obj.score_draft = note.note.value if note.is_chiffree else None
+            db_obj.justification_draft = note.note.value.name if note.is_justification else None
+    exam_enrollment.bulk_update_scores(exam_enrollments.values())
+    mettre_a_jour_progressions_unites_enseignement(
+        (note.code_unite_enseignement, note.annee, note.numero_session) for note in notes
     )
-    if note.est_soumise:
-        db_obj.score_final = note.note.value if note.is_chiffree else None
-        db_obj.justification_final = note.note.value.name if note.is_justification else None
-    else:
-        db_obj.score_draft = note.note.value if note.is_chiffree else None
-        db_obj.justification_draft = note.note.value.name if note.is_justification else None
-
-    db_obj.save()
 
 
 def _fetch_session_exams():
@@ -295,28 +274,7 @@ def _fetch_session_exams():
         )
     ).values('date_limite_de_remise')
     return ExamEnrollment.objects.annotate(
-        acronym=Case(
-            When(
-                learning_unit_enrollment__learning_class_year__learning_component_year__type=LECTURING,
-                then=Concat(
-                    'learning_unit_enrollment__learning_unit_year__acronym',
-                    Value('-'),
-                    'learning_unit_enrollment__learning_class_year__acronym',
-                    output_field=CharField()
-                )
-            ),
-            When(
-                learning_unit_enrollment__learning_class_year__learning_component_year__type=PRACTICAL_EXERCISES,
-                then=Concat(
-                    'learning_unit_enrollment__learning_unit_year__acronym',
-                    Value('_'),
-                    'learning_unit_enrollment__learning_class_year__acronym',
-                    output_field=CharField()
-                )
-            ),
-            default=F('learning_unit_enrollment__learning_unit_year__acronym'),
-            output_field=CharField()
-        ),
+        acronym=F('learning_unit_enrollment__full_class_code'),
         year=F('learning_unit_enrollment__learning_unit_year__academic_year__year'),
         number_session=F('session_exam__number_session'),
         credits_unite_enseignement=F('learning_unit_enrollment__learning_unit_year__credits'),
@@ -373,22 +331,19 @@ def _fetch_session_exams():
 
 
 def _get_dates_echeances_query_parameters(notes_identites: Set[IdentiteNoteEtudiant]) -> Dict:
-    simplified_acronyms = set()
+    codes_unites_enseignement = set()
     registration_ids = set()
     academic_year = None
     number_session = None
 
     for note_identite in notes_identites:
-        simplified_acronyms.add(
-            note_identite.code_unite_enseignement.replace('_', '').replace('-', '')[:-1]
-        )
-        simplified_acronyms.add(note_identite.code_unite_enseignement)
+        codes_unites_enseignement.add(note_identite.code_unite_enseignement)
         registration_ids.add(note_identite.noma)
         academic_year = note_identite.annee_academique
         number_session = note_identite.numero_session
 
     return {
-        "simplified_acronyms": tuple(simplified_acronyms),
+        "codes_unites_enseignement": tuple(codes_unites_enseignement),
         "academic_year": academic_year,
         "number_session": number_session,
         "registration_ids": tuple(registration_ids),
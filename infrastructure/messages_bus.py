@@ -32,6 +32,7 @@ from ddd.logic.application.commands import (
     GetChargeSummaryCommand,
     RenewMultipleAttributionsCommand,
     SearchApplicationByApplicantCommand,
+    SearchAttributionsAboutToExpireCommand,
     SearchVacantCoursesCommand,
     SendApplicationsSummaryCommand,
     UpdateApplicationCommand,
@@ -39,6 +40,8 @@ from ddd.logic.application.commands import (
 )
 from ddd.logic.application.use_case.read.get_attributions_about_to_expire_service import \
     get_attributions_about_to_expire
+from ddd.logic.application.use_case.read.search_attributions_about_to_expire_service import \
+    search_attributions_about_to_expire
 from ddd.logic.application.use_case.read.get_charge_summary_service import get_charge_summary
 from ddd.logic.application.use_case.read.search_applications_by_applicant_service import \
     search_applications_by_applicant
@@ -201,7 +204,8 @@ from infrastructure.effective_class_repartition.repository.tutor import TutorRep
 from infrastructure.encodage_de_notes.encodage.domain.service.cohortes_du_gestionnaire import \
     CohortesDuGestionnaireTranslator
 from infrastructure.encodage_de_notes.encodage.domain.service.historiser_notes import HistoriserEncodageNotesService
-from infrastructure.encodage_de_notes.encodage.domain.service.notifier_encodage_notes import NotifierEncodageNotes
+from infrastructure.encodage_de_notes.encodage.domain.service.notifier_encodage_notes import \
+    NotifierEncodageNotesEnDiffere
 from infrastructure.encodage_de_notes.encodage.repository.note_etudiant import NoteEtudiantRepository as \
     NoteEtudiantGestionnaireRepository
 from infrastructure.encodage_de_notes.shared_kernel.repository.encoder_notes_rapport import \
@@ -209,6 +213,8 @@ from infrastructure.encodage_de_notes.shared_kernel.repository.encoder_notes_rap
 from infrastructure.encodage_de_notes.shared_kernel.service.attribution_enseignant import \
     AttributionEnseignantTranslator
 from infrastructure.encodage_de_notes.shared_kernel.service.inscription_examen import InscriptionExamenTranslator
+from infrastructure.encodage_de_notes.shared_kernel.service.progression_encodage_notes import \
+    ProgressionEncodageNotesTranslator
 from infrastructure.encodage_de_notes.shared_kernel.service.periode_encodage_notes import \
     PeriodeEncodageNotesTranslator
 from infrastructure.encodage_de_notes.shared_kernel.service.signaletique_etudiant import \
@@ -339,6 +345,10 @@ class MessageBusCommands(AbstractMessageBusCommands):
             cmd, ApplicationRepository(), ApplicationCalendarRepository(),
             ApplicantRepository(), VacantCourseRepository(), LearningUnitTranslator()
         ),
+        SearchAttributionsAboutToExpireCommand: lambda cmd: search_attributions_about_to_expire(
+            cmd, ApplicationRepository(), ApplicationCalendarRepository(),
+            ApplicantRepository(), VacantCourseRepository(), LearningUnitTranslator()
+        ),
         SendApplicationsSummaryCommand: lambda cmd: send_applications_summary(
             cmd, ApplicationRepository(), ApplicationCalendarRepository(), ApplicantRepository(),
             ApplicationsMailSummary()
@@ -437,7 +447,7 @@ class MessageBusCommands(AbstractMessageBusCommands):
             NoteEtudiantGestionnaireRepository(),
             PeriodeEncodageNotesTranslator(),
             CohortesDuGestionnaireTranslator(),
-            NotifierEncodageNotes(),
+            NotifierEncodageNotesEnDiffere(),
             AttributionEnseignantTranslator(),
             SignaletiquePersonneTranslator(),
             SignaletiqueEtudiantTranslator(),
@@ -461,14 +471,11 @@ class MessageBusCommands(AbstractMessageBusCommands):
         ),
         GetProgressionGeneraleGestionnaireCommand: lambda cmd: get_progression_generale_gestionnaire(
             cmd,
-            NoteEtudiantGestionnaireRepository(),
-            NoteEtudiantRepository(),
+            ProgressionEncodageNotesTranslator(),
             ResponsableDeNotesRepository(),
             PeriodeEncodageNotesTranslator(),
-            SignaletiqueEtudiantTranslator(),
             UniteEnseignementTranslator(),
             CohortesDuGestionnaireTranslator(),
-            InscriptionExamenTranslator(),
             AttributionEnseignantTranslator(),
         ),
         GetPeriodeEncodageCommand: lambda cmd: get_periode_encodage(
@@ -23,76 +23,265 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from typing import List, Union
+from decimal import Decimal
+from typing import Dict, List, Optional, Union
 
-from ddd.logic.preparation_programme_annuel_etudiant.commands import GetFormationCommand
+from django.conf import settings
+from django.db.models import F, OuterRef, Subquery
+
+from base.models.enums.education_group_types import TrainingType, MiniTrainingType
+from base.models.enums.learning_component_year_type import LECTURING, PRACTICAL_EXERCISES
+from base.models.enums.quadrimesters import DerogationQuadrimester
+from base.models.group_element_year import GroupElementYear
+from base.models.learning_component_year import LearningComponentYear
+from base.utils.cache import OsisCache
 from ddd.logic.preparation_programme_annuel_etudiant.domain.service.i_catalogue_formations import \
     ICatalogueFormationsTranslator
 from ddd.logic.preparation_programme_annuel_etudiant.domain.validator.exceptions import FormationIntrouvableException
 from ddd.logic.preparation_programme_annuel_etudiant.dtos import FormationDTO, \
-    ContenuGroupementCatalogueDTO, UniteEnseignementDTO, UniteEnseignementCatalogueDTO, GroupementCatalogueDTO
-from program_management.ddd.dtos import ProgrammeDeFormationDTO, ContenuNoeudDTO, ElementType
+    ContenuGroupementCatalogueDTO, UniteEnseignementCatalogueDTO, GroupementCatalogueDTO
+from program_management.ddd.repositories import program_tree_cache
+from program_management.models.education_group_version import EducationGroupVersion
+
+ElementId = int
+GroupRecord = Dict
+LinkRecord = Dict
+
+
+class FormationCache(OsisCache):
+    """
+    FormationDTO read model of a program.
+
+    The key carries the version of the program tree cache (see program_tree_cache.get_version) : every change
+    invalidating the program tree also makes the cached formation unreachable.
+    """
+    PREFIX_KEY = 'formation_{code}_{annee}_{version}'
+
+    def __init__(self, code: str, annee: int, root_id: ElementId):
+        self.code = code
+        self.annee = annee
+        self.version = program_tree_cache.get_version(root_id)
+
+    @property
+    def key(self):
+        return self.PREFIX_KEY.format(code=self.code, annee=self.annee, version=self.version)
+
+    def set_cached_data(self, formation: 'FormationDTO', timeout=None):
+        super().set_cached_data(formation, timeout=timeout or settings.PROGRAM_TREE_CACHE_TIMEOUT)
 
 
 class CatalogueFormationsTranslator(ICatalogueFormationsTranslator):
     @classmethod
     def get_formation(cls, code_programme: str, annee: int) -> 'FormationDTO':
-        from infrastructure.messages_bus import message_bus_instance
-        program_management_formation_dto = message_bus_instance.invoke(
-            GetFormationCommand(
-                annee=annee,
-                code=code_programme,
-            )
-        )
-        if program_management_formation_dto:
-            return _build_formation_dto(program_management_formation_dto)
-        raise FormationIntrouvableException(code_programme=code_programme, annee=annee)
+        racine = _get_racine(code_programme, annee)
+        if racine is None:
+            raise FormationIntrouvableException(code_programme=code_programme, annee=annee)
+        if not program_tree_cache.is_enabled():
+            return _build_formation_dto(racine)
+
+        formation_cache = FormationCache(code_programme, annee, racine['element_id'])
+        formation = formation_cache.cached_data
+        if formation is None:
+            formation = _build_formation_dto(racine)
+            formation_cache.set_cached_data(formation)
+        return formation
+
+
+_GROUP_VALUES = [
+    'group_code',
+    'group_title',
+    'group_title_fr',
+    'group_remark_fr',
+    'group_credits',
+    'group_type',
+    'group_offer_title_fr',
+    'group_offer_partial_title_fr',
+    'group_version_name',
+    'group_version_title_fr',
+    'group_transition_name',
+]
+
+
+def _annotate_group(prefix: str) -> Dict[str, F]:
+    return {
+        'group_code': F(prefix + 'partial_acronym'),
+        'group_title': F(prefix + 'acronym'),
+        'group_title_fr': F(prefix + 'title_fr'),
+        'group_remark_fr': F(prefix + 'remark_fr'),
+        'group_credits': F(prefix + 'credits'),
+        'group_type': F(prefix + 'education_group_type__name'),
+        'group_offer_title_fr': F(prefix + 'educationgroupversion__offer__title'),
+        'group_offer_partial_title_fr': F(prefix + 'educationgroupversion__offer__partial_title'),
+        'group_version_name': F(prefix + 'educationgroupversion__version_name'),
+        'group_version_title_fr': F(prefix + 'educationgroupversion__title_fr'),
+        'group_transition_name': F(prefix + 'educationgroupversion__transition_name'),
+    }
+
+
+def _get_racine(code_programme: str, annee: int) -> Optional[GroupRecord]:
+    return EducationGroupVersion.objects.filter(
+        root_group__partial_acronym=code_programme,
+        offer__academic_year__year=annee,
+    ).order_by(
+        'version_name'
+    ).annotate(
+        element_id=F('root_group__element__pk'),
+        offer_acronym=F('offer__acronym'),
+        offer_year=F('offer__academic_year__year'),
+        **_annotate_group('root_group__')
+    ).values(
+        'element_id',
+        'offer_acronym',
+        'offer_year',
+        *_GROUP_VALUES
+    ).first()
+
 
+def _search_liens(root_id: ElementId) -> Dict[ElementId, List[LinkRecord]]:
+    """
+    Return the links of the tree, with the data of their child group or learning unit, grouped by parent element
+    and ordered as in the tree : the structure is fetched by one recursive query and the links by a second one.
+    """
+    structure = GroupElementYear.objects.get_adjacency_list([root_id])
+    link_ids = list(dict.fromkeys(link['id'] for link in structure))
+    if not link_ids:
+        return {}
 
-def _build_formation_dto(program_management_formation_dto: ProgrammeDeFormationDTO) -> FormationDTO:
+    subquery_component = LearningComponentYear.objects.filter(
+        learning_unit_year_id=OuterRef('child_element__learning_unit_year_id')
+    ).values('hourly_volume_total_annual')
+    links = GroupElementYear.objects.filter(
+        pk__in=link_ids
+    ).annotate(
+        learning_unit_year_id=F('child_element__learning_unit_year_id'),
+        learning_unit_code=F('child_element__learning_unit_year__acronym'),
+        learning_unit_specific_title=F('child_element__learning_unit_year__specific_title'),
+        learning_unit_common_title=F('child_element__learning_unit_year__learning_container_year__common_title'),
+        learning_unit_credits=F('child_element__learning_unit_year__credits'),
+        learning_unit_quadrimester=F('child_element__learning_unit_year__quadrimester'),
+        learning_unit_volume_pm=Subquery(subquery_component.filter(type=LECTURING)[:1]),
+        learning_unit_volume_pp=Subquery(subquery_component.filter(type=PRACTICAL_EXERCISES)[:1]),
+        **_annotate_group('child_element__group_year__')
+    ).values(
+        'pk',
+        'parent_element_id',
+        'child_element_id',
+        'block',
+        'is_mandatory',
+        'relative_credits',
+        'learning_unit_year_id',
+        'learning_unit_code',
+        'learning_unit_specific_title',
+        'learning_unit_common_title',
+        'learning_unit_credits',
+        'learning_unit_quadrimester',
+        'learning_unit_volume_pm',
+        'learning_unit_volume_pp',
+        *_GROUP_VALUES
+    )
+    links_by_id = {link['pk']: link for link in links}
+
+    links_by_parent_id = {}
+    for link_id in link_ids:
+        link = links_by_id[link_id]
+        links_by_parent_id.setdefault(link['parent_element_id'], []).append(link)
+    return links_by_parent_id
+
+
+def _build_formation_dto(racine: GroupRecord) -> FormationDTO:
+    links_by_parent_id = _search_liens(racine['element_id'])
     return FormationDTO(
-        racine=__build_groupement_contenu(program_management_formation_dto.racine),
-        annee=program_management_formation_dto.annee,
-        sigle=program_management_formation_dto.sigle,
-        version=program_management_formation_dto.version,
-        transition_name=program_management_formation_dto.transition_name,
-        intitule_formation=program_management_formation_dto.intitule_formation,
+        racine=__build_groupement_contenu(racine, racine['element_id'], links_by_parent_id),
+        annee=racine['offer_year'],
+        sigle=racine['offer_acronym'],
+        version=racine['group_version_name'],
+        transition_name=racine['group_transition_name'],
+        intitule_formation="{}{}".format(
+            racine['group_offer_title_fr'],
+            "[ {} ]".format(racine['group_version_title_fr']) if racine['group_version_title_fr'] else ''
+        ),
     )
 
 
-def __build_groupement_contenu(contenu_noeud: ContenuNoeudDTO) -> ContenuGroupementCatalogueDTO:
+def __build_groupement_contenu(
+        group: GroupRecord,
+        element_id: ElementId,
+        links_by_parent_id: Dict[ElementId, List[LinkRecord]],
+        lien_parent: LinkRecord = None
+) -> ContenuGroupementCatalogueDTO:
     return ContenuGroupementCatalogueDTO(
         groupement_contenant=GroupementCatalogueDTO(
-            code=contenu_noeud.code,
-            intitule=contenu_noeud.intitule,
-            obligatoire=contenu_noeud.obligatoire,
-            remarque=contenu_noeud.remarque,
-            credits=contenu_noeud.credits,
-            intitule_complet=contenu_noeud.intitule_complet,
+            code=group['group_code'],
+            intitule=group['group_title'],
+            obligatoire=lien_parent['is_mandatory'] if lien_parent else False,
+            remarque=group['group_remark_fr'],
+            credits=_get_credits(lien_parent),
+            intitule_complet=_get_intitule_complet_groupement(group),
         ),
-        contenu_ordonne_catalogue=__build_contenu_ordonne_catalogue(contenu_noeud.contenu_ordonne)
+        contenu_ordonne_catalogue=__build_contenu_ordonne_catalogue(element_id, links_by_parent_id)
     )
 
 
-def __build_contenu_ordonne_catalogue(contenu_ordonne: List[Union['UniteEnseignementDTO', 'ContenuNoeudDTO']]):
+def __build_contenu_ordonne_catalogue(
+        element_id: ElementId,
+        links_by_parent_id: Dict[ElementId, List[LinkRecord]]
+) -> List[Union['UniteEnseignementCatalogueDTO', 'ContenuGroupementCatalogueDTO']]:
     contenu_ordonne_catalogue = []
-    for element in contenu_ordonne:
-        if element.type == ElementType.UNITE_ENSEIGNEMENT.name:
+    for lien in links_by_parent_id.get(element_id, []):
+        if lien['learning_unit_year_id']:
+            contenu_ordonne_catalogue.append(_build_unite_enseignement(lien))
+        elif lien['group_code']:
             contenu_ordonne_catalogue.append(
-                UniteEnseignementCatalogueDTO(
-                    bloc=element.bloc,
-                    code=element.code,
-                    intitule_complet=element.intitule_complet,
-                    quadrimestre=element.quadrimestre,
-                    quadrimestre_texte=element.quadrimestre_texte,
-                    credits_absolus=element.credits_absolus,
-                    volume_annuel_pm=element.volume_annuel_pm,
-                    volume_annuel_pp=element.volume_annuel_pp,
-                    obligatoire=element.obligatoire,
-                    credits_relatifs=element.credits_relatifs,
-                    session_derogation=element.session_derogation,
-                )
+                __build_groupement_contenu(lien, lien['child_element_id'], links_by_parent_id, lien_parent=lien)
             )
-        elif element.type == ElementType.GROUPEMENT.name:
-            contenu_ordonne_catalogue.append(__build_groupement_contenu(element))
     return contenu_ordonne_catalogue
+
+
+def _build_unite_enseignement(lien: LinkRecord) -> UniteEnseignementCatalogueDTO:
+    quadrimestre = DerogationQuadrimester[lien['learning_unit_quadrimester']] \
+        if lien['learning_unit_quadrimester'] else None
+    return UniteEnseignementCatalogueDTO(
+        bloc=lien['block'],
+        code=lien['learning_unit_code'],
+        intitule_complet=_get_intitule_unite_enseignement(
+            lien['learning_unit_common_title'],
+            lien['learning_unit_specific_title']
+        ),
+        quadrimestre=quadrimestre,
+        quadrimestre_texte=quadrimestre.value if quadrimestre else "",
+        credits_absolus=lien['learning_unit_credits'],
+        volume_annuel_pm=lien['learning_unit_volume_pm'],
+        volume_annuel_pp=lien['learning_unit_volume_pp'],
+        obligatoire=lien['is_mandatory'],
+        credits_relatifs=lien['relative_credits'],
+        session_derogation='',
+    )
+
+
+def _get_intitule_unite_enseignement(common_title: Optional[str], specific_title: Optional[str]) -> str:
+    if common_title and specific_title:
+        return "{} - {}".format(common_title, specific_title)
+    return specific_title or common_title or ""
+
+
+def _get_intitule_complet_groupement(group: GroupRecord) -> str:
+    if group['group_type'] in TrainingType.finality_types():
+        return "{}{}".format(group['group_offer_partial_title_fr'], _format_version_complete_name(group))
+    if group['group_type'] == MiniTrainingType.OPTION.name:
+        return "{}{}".format(group['group_offer_title_fr'], _format_version_complete_name(group))
+    return group['group_title_fr']
+
+
+def _format_version_complete_name(group: GroupRecord) -> str:
+    # Same label as program_management.formatter.format_version_complete_name in french
+    version_label = "-".join(filter(None, [group['group_version_name'], group['group_transition_name']]))
+    version_label = "[{}]".format(version_label) if version_label else ""
+    if group['group_version_title_fr']:
+        return " - {} {}".format(group['group_version_title_fr'], version_label)
+    return " {}".format(version_label)
+
+
+def _get_credits(lien: Optional[LinkRecord]) -> Optional[Decimal]:
+    if lien:
+        return lien['relative_credits'] or lien['group_credits'] or 0
+    return None
@@ -23,54 +23,128 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from decimal import Decimal
 from typing import List, Union
 from unittest import mock
 
-from django.test import SimpleTestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.group_element_year import GroupElementYearFactory, GroupElementYearChildLeafFactory
+from base.tests.factories.learning_component_year import LecturingLearningComponentYearFactory
+from ddd.logic.preparation_programme_annuel_etudiant.domain.validator.exceptions import FormationIntrouvableException
 from ddd.logic.preparation_programme_annuel_etudiant.dtos import UniteEnseignementCatalogueDTO, \
     ContenuGroupementCatalogueDTO
 from infrastructure.preparation_programme_annuel_etudiant.domain.service.catalogue_formations import \
     CatalogueFormationsTranslator
-from program_management.ddd.domain.program_tree_version import STANDARD
-from program_management.ddd.dtos import ProgrammeDeFormationDTO, ContenuNoeudDTO, UniteEnseignementDTO
-
-ANNEE = 2021
-
-
-class CatalogueFormationsTranslatorTest(SimpleTestCase):
+from program_management.ddd.dtos import ContenuNoeudDTO, UniteEnseignementDTO
+from program_management.ddd.repositories.program_tree_version import ProgramTreeVersionRepository
+from program_management.tests.factories.education_group_version import StandardEducationGroupVersionFactory
+from program_management.tests.factories.element import ElementGroupYearFactory
+
+
+class CatalogueFormationsTranslatorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """
+            ECGE1BA
+            |-Contenu
+              |-LESPO1113
+            |-LECGE1001
+        """
+        cls.academic_year = AcademicYearFactory(current=True)
+        cls.version = StandardEducationGroupVersionFactory(
+            root_group__academic_year=cls.academic_year,
+            offer__academic_year=cls.academic_year,
+        )
+        cls.root_element = ElementGroupYearFactory(group_year=cls.version.root_group)
+        cls.link_contenu = GroupElementYearFactory(
+            parent_element=cls.root_element,
+            child_element__group_year__academic_year=cls.academic_year,
+            order=0,
+        )
+        cls.link_unite_contenu = GroupElementYearChildLeafFactory(
+            parent_element=cls.link_contenu.child_element,
+            child_element__learning_unit_year__academic_year=cls.academic_year,
+            order=0,
+        )
+        cls.link_unite = GroupElementYearChildLeafFactory(
+            parent_element=cls.root_element,
+            child_element__learning_unit_year__academic_year=cls.academic_year,
+            order=1,
+        )
+        LecturingLearningComponentYearFactory(
+            learning_unit_year=cls.link_unite.child_element.learning_unit_year,
+            hourly_volume_total_annual=40,
+        )
+        cls.code = cls.version.root_group.partial_acronym
 
     def setUp(self) -> None:
         self.translator = CatalogueFormationsTranslator()
-        self.patch_message_bus = mock.patch(
-            "infrastructure.utils.MessageBus.invoke",
-            return_value=_build_ProgrammeDeFormationDTO()
+        cache.clear()
 
+    def test_should_convertir_version_standard(self):
+        program_to_translate = ProgramTreeVersionRepository().get_dto_from_year_and_code(
+            code=self.code,
+            year=self.academic_year.year,
         )
-        self.message_bus_mocked = self.patch_message_bus.start()
-        self.addCleanup(self.patch_message_bus.stop)
-
-    def test_should_convertir_version_standard(self,):
-        program_to_translate = self.message_bus_mocked.return_value
 
         formation_dto = self.translator.get_formation(
-            code_programme=program_to_translate.code,
-            annee=program_to_translate.annee,
+            code_programme=self.code,
+            annee=self.academic_year.year,
         )
 
         self.assertEqual(program_to_translate.annee, formation_dto.annee)
         self.assertEqual(program_to_translate.sigle, formation_dto.sigle)
         self.assertEqual(program_to_translate.version, formation_dto.version)
+        self.assertEqual(program_to_translate.transition_name, formation_dto.transition_name)
         self.assertEqual(program_to_translate.intitule_formation, formation_dto.intitule_formation)
 
         self._assert_equal_contenu_conversion(formation_dto.racine, program_to_translate.racine)
 
+        self.assertEqual(len(formation_dto.racine.contenu_ordonne_catalogue), 2)
         self._assert_equal_groupements_contenus(
             formation_dto.racine.contenu_ordonne_catalogue,
             program_to_translate.racine.contenu_ordonne,
         )
 
+    def test_should_raise_exception_when_formation_does_not_exist(self):
+        with self.assertRaises(FormationIntrouvableException):
+            self.translator.get_formation(code_programme='UNKNOWN', annee=self.academic_year.year)
+
+    def test_should_load_formation_in_three_queries(self):
+        with self.assertNumQueries(3):
+            self.translator.get_formation(code_programme=self.code, annee=self.academic_year.year)
+
+    @override_settings(PROGRAM_TREE_CACHE_ENABLED=True)
+    def test_should_load_formation_from_cache_when_already_loaded(self):
+        formation_dto = self.translator.get_formation(code_programme=self.code, annee=self.academic_year.year)
+
+        with self.assertNumQueries(1):
+            cached_formation_dto = self.translator.get_formation(
+                code_programme=self.code,
+                annee=self.academic_year.year
+            )
+
+        self.assertEqual(cached_formation_dto, formation_dto)
+
+    @override_settings(PROGRAM_TREE_CACHE_ENABLED=True)
+    @mock.patch(
+        'program_management.ddd.repositories.program_tree_cache.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    def test_should_invalidate_cached_formation_when_tree_changes(self, *mocks):
+        self.translator.get_formation(code_programme=self.code, annee=self.academic_year.year)
+
+        GroupElementYearChildLeafFactory(
+            parent_element=self.root_element,
+            child_element__learning_unit_year__academic_year=self.academic_year,
+            order=2,
+        )
+
+        formation_dto = self.translator.get_formation(code_programme=self.code, annee=self.academic_year.year)
+        self.assertEqual(len(formation_dto.racine.contenu_ordonne_catalogue), 3)
+
     def _assert_equal_groupements_contenus(
             self,
             formation_groupements_contenus: List[Union['UniteEnseignementCatalogueDTO', 'ContenuGroupementCatalogueDTO']],
@@ -114,53 +188,10 @@ class CatalogueFormationsTranslatorTest(SimpleTestCase):
         self.assertEqual(unite_contenue.code, unite_contenu_dans_programme.code)
         self.assertEqual(unite_contenue.intitule_complet, unite_contenu_dans_programme.intitule_complet)
         self.assertEqual(unite_contenue.quadrimestre, unite_contenu_dans_programme.quadrimestre)
+        self.assertEqual(unite_contenue.quadrimestre_texte, unite_contenu_dans_programme.quadrimestre_texte)
         self.assertEqual(unite_contenue.credits_absolus, unite_contenu_dans_programme.credits_absolus)
         self.assertEqual(unite_contenue.volume_annuel_pm, unite_contenu_dans_programme.volume_annuel_pm)
         self.assertEqual(unite_contenue.volume_annuel_pp, unite_contenu_dans_programme.volume_annuel_pp)
         self.assertEqual(unite_contenue.obligatoire, unite_contenu_dans_programme.obligatoire)
         self.assertEqual(unite_contenue.credits_relatifs, unite_contenu_dans_programme.credits_relatifs)
         self.assertEqual(unite_contenue.session_derogation, unite_contenu_dans_programme.session_derogation)
-
-
-def _build_ProgrammeDeFormationDTO():
-    return ProgrammeDeFormationDTO(
-        annee=ANNEE,
-        sigle='ECGE1BA',
-        code='LECGE100B',
-        version=STANDARD,
-        transition_name='',
-        intitule_formation='Bachelier en sciences économiques et de gestion',
-        racine=ContenuNoeudDTO(
-            intitule='ECGE1BA',
-            code='LECGE100B',
-            obligatoire=True,
-            remarque='Remarque',
-            credits=Decimal(10),
-            intitule_complet='Bachelier en sciences économiques et de gestion ',
-            contenu_ordonne=[
-                ContenuNoeudDTO(
-                    intitule='Contenu :',
-                    obligatoire=True,
-                    remarque='Remarque',
-                    credits=Decimal(10),
-                    intitule_complet='Contenu :',
-                    code='LECGE100T',
-                    contenu_ordonne=[
-                        UniteEnseignementDTO(
-                            bloc=1,
-                            code='LESPO1113pp',
-                            intitule_complet='Sociologie et anthropologie des mondes contemporains',
-                            quadrimestre='Q1or2',
-                            quadrimestre_texte='Q1 ou Q2',
-                            credits_absolus=Decimal(5),
-                            volume_annuel_pm=40,
-                            volume_annuel_pp=0,
-                            obligatoire=False,
-                            credits_relatifs=5,
-                            session_derogation='',
-                        )
-                    ]
-                )
-            ]
-        )
-    )
@@ -308,6 +308,17 @@ class TestSearchParNomPrenomEnseignantTranslator(TestCase):
         result = self.translator.search_par_nom_prenom_enseignant(self.annee, recherche)
         self.assertEqual(1, len(result))
 
+    def test_should_trouver_enseignant_sans_tenir_compte_des_accents(self):
+        AttributionNewFactory(
+            learning_container_year__academic_year__year=self.annee,
+            tutor__person__last_name='Lefèvre',
+            tutor__person__first_name='François',
+        )
+        recherche = 'Francois lefevre'
+        result = self.translator.search_par_nom_prenom_enseignant(self.annee, recherche)
+        self.assertEqual(1, len(result))
+        self.assertEqual("Lefèvre", result[0].last_name)
+
     def test_should_ordonner_par_ordre_alphabetique(self):
         AttributionNewFactory(
             learning_container_year__academic_year__year=self.annee,
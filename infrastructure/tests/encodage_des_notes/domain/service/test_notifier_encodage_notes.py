@@ -25,14 +25,15 @@
 from unittest import mock
 
 import attr
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
 
 from ddd.logic.encodage_des_notes.encodage.domain.model._note import NoteManquante
 from ddd.logic.encodage_des_notes.encodage.test.factory.gestionnaire_parcours import GestionnaireParcoursDROI1BAFactory
 from ddd.logic.encodage_des_notes.encodage.test.factory.note_etudiant import NoteEtudiantChiffreeFactory, \
     NoteEtudiantJustificationFactory, NoteManquanteEtudiantFactory
+from assessments.models.score_encoding_notification import ScoreEncodingNotification
 from infrastructure.encodage_de_notes.encodage.domain.service.notifier_encodage_notes import NotifierEncodageNotes, \
-    ENCODAGE_COMPLET_MAIL_TEMPLATE, CORRECTION_ENCODAGE_COMPLET_MAIL_TEMPLATE
+    ENCODAGE_COMPLET_MAIL_TEMPLATE, CORRECTION_ENCODAGE_COMPLET_MAIL_TEMPLATE, NotifierEncodageNotesEnDiffere
 from infrastructure.encodage_de_notes.encodage.repository.in_memory.note_etudiant import NoteEtudiantInMemoryRepository
 from infrastructure.encodage_de_notes.shared_kernel.service.in_memory.attribution_enseignant import \
     AttributionEnseignantTranslatorInMemory
@@ -335,3 +336,86 @@ class TestEnvoyerMailEncodageComplet(SimpleTestCase):
         self.assertTrue(mock_send_mail.called)
         self.assertNotIn(ENCODAGE_COMPLET_MAIL_TEMPLATE, args['html_template_ref'])
         self.assertIn(CORRECTION_ENCODAGE_COMPLET_MAIL_TEMPLATE, args['html_template_ref'])
+
+
+@mock.patch(
+    "infrastructure.encodage_de_notes.encodage.domain.service.notifier_encodage_notes.NotifierEncodageNotes.notifier"
+)
+class TestNotifierEncodageNotesEnDiffere(TestCase):
+    def setUp(self):
+        self.gestionnaire_parcours = GestionnaireParcoursDROI1BAFactory(
+            entity_id__matricule_fgs_gestionnaire="00321234"
+        )
+        self.note_etudiant_repo = NoteEtudiantInMemoryRepository()
+
+    def test_should_only_enregistrer_encodage(self, mock_notifier):
+        note = NoteEtudiantChiffreeFactory(entity_id__code_unite_enseignement="LDROI1001")
+
+        NotifierEncodageNotesEnDiffere().notifier(
+            [note.entity_id],
+            [("LDROI1001", "DROI1BA")],
+            self.gestionnaire_parcours,
+            self.note_etudiant_repo,
+        )
+
+        self.assertFalse(mock_notifier.called)
+        self.assertEqual(ScoreEncodingNotification.objects.count(), 1)
+
+    def test_should_fusionner_encodages_en_attente_du_meme_gestionnaire(self, mock_notifier):
+        note_1 = NoteEtudiantChiffreeFactory(entity_id__code_unite_enseignement="LDROI1001")
+        note_2 = NoteEtudiantChiffreeFactory(
+            entity_id__code_unite_enseignement="LDROI1002",
+            entity_id__annee_academique=note_1.annee_academique,
+            entity_id__numero_session=note_1.numero_session,
+        )
+        NotifierEncodageNotesEnDiffere().notifier(
+            [note_1.entity_id],
+            [("LDROI1001", "DROI1BA")],
+            self.gestionnaire_parcours,
+        )
+        NotifierEncodageNotesEnDiffere().notifier(
+            [note_2.entity_id, note_1.entity_id],
+            [("LDROI1002", "DROI1BA")],
+            self.gestionnaire_parcours,
+        )
+
+        nombre_envois = NotifierEncodageNotesEnDiffere.envoyer_notifications_en_attente(
+            self.note_etudiant_repo,
+            AttributionEnseignantTranslatorInMemory(),
+            SignaletiquePersonneTranslatorInMemory(),
+            SignaletiqueEtudiantTranslatorInMemory(),
+            AdresseFeuilleDeNotesInMemoryRepository(),
+            InscriptionExamenTranslatorInMemory(),
+        )
+
+        self.assertEqual(nombre_envois, 1)
+        identites_notes_encodees, cohortes_non_entierement_encodees, gestionnaire = mock_notifier.call_args[0][:3]
+        self.assertListEqual(identites_notes_encodees, [note_1.entity_id, note_2.entity_id])
+        self.assertCountEqual(cohortes_non_entierement_encodees, [("LDROI1001", "DROI1BA"), ("LDROI1002", "DROI1BA")])
+        self.assertEqual(gestionnaire.entity_id, self.gestionnaire_parcours.entity_id)
+        self.assertFalse(ScoreEncodingNotification.objects.exists())
+
+    def test_should_stop_retrying_batch_after_max_attempts(self, mock_notifier):
+        mock_notifier.side_effect = Exception
+        note = NoteEtudiantChiffreeFactory(entity_id__code_unite_enseignement="LDROI1001")
+        NotifierEncodageNotesEnDiffere().notifier(
+            [note.entity_id],
+            [("LDROI1001", "DROI1BA")],
+            self.gestionnaire_parcours,
+        )
+
+        for _ in range(NotifierEncodageNotesEnDiffere.MAX_ATTEMPTS_ENVOI + 1):
+            NotifierEncodageNotesEnDiffere.envoyer_notifications_en_attente(
+                self.note_etudiant_repo,
+                AttributionEnseignantTranslatorInMemory(),
+                SignaletiquePersonneTranslatorInMemory(),
+                SignaletiqueEtudiantTranslatorInMemory(),
+                AdresseFeuilleDeNotesInMemoryRepository(),
+                InscriptionExamenTranslatorInMemory(),
+            )
+
+        self.assertEqual(mock_notifier.call_count, NotifierEncodageNotesEnDiffere.MAX_ATTEMPTS_ENVOI)
+        self.assertEqual(
+            ScoreEncodingNotification.objects.get().attempts,
+            NotifierEncodageNotesEnDiffere.MAX_ATTEMPTS_ENVOI
+        )
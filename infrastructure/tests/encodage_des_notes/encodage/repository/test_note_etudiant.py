@@ -22,6 +22,8 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from unittest import mock
+
 from django.test import TestCase
 
 from base.tests.factories.exam_enrollment import ExamEnrollmentFactory
@@ -70,6 +72,20 @@ class TestNoteEtudiant(TestCase):
 
         assert_attrs_instances_are_equal(note_chiffree, self.repo.get(note_chiffree.entity_id))
 
+    @mock.patch('infrastructure.encodage_de_notes.encodage.repository.note_etudiant.'
+                'mettre_a_jour_progressions_unites_enseignement')
+    def test_should_save_all_notes_etudiant_in_bulk(self, mock_mettre_a_jour_progressions):
+        notes = [NoteEtudiantChiffreeFactory(), NoteEtudiantJustificationFactory(), NoteManquanteEtudiantFactory()]
+        for note in notes:
+            self._create_save_necessary_data(note)
+
+        with self.assertNumQueries(2):
+            self.repo.save_all(notes)
+        self.assertTrue(mock_mettre_a_jour_progressions.called)
+
+        for note in notes:
+            assert_attrs_instances_are_equal(note, self.repo.get(note.entity_id))
+
     def test_should_search_notes_etudiant_by_entity_id(self):
         note_chiffree = NoteEtudiantChiffreeFactory()
         self._create_save_necessary_data(note_chiffree)
@@ -0,0 +1,67 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from base.models.exam_enrollment import ExamEnrollment
+from base.tests.factories.exam_enrollment import ExamEnrollmentFactory
+from infrastructure.encodage_de_notes.shared_kernel.repository import exam_enrollment
+
+
+class TestExamEnrollment(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.exam_enrollment = ExamEnrollmentFactory(session_exam__number_session=1)
+        learning_unit_enrollment = cls.exam_enrollment.learning_unit_enrollment
+        cls.cle = (
+            learning_unit_enrollment.offer_enrollment.student.registration_id,
+            learning_unit_enrollment.full_class_code,
+            learning_unit_enrollment.learning_unit_year.academic_year.year,
+            1,
+        )
+
+    def test_should_raise_when_exam_enrollment_found_more_than_once(self):
+        ExamEnrollmentFactory(
+            learning_unit_enrollment=self.exam_enrollment.learning_unit_enrollment,
+            session_exam=self.exam_enrollment.session_exam,
+        )
+
+        with self.assertRaises(ExamEnrollment.MultipleObjectsReturned):
+            exam_enrollment.search_exam_enrollments([self.cle])
+
+    def test_should_set_changed_when_updating_scores(self):
+        last_change = timezone.now() - datetime.timedelta(days=1)
+        ExamEnrollment.objects.filter(pk=self.exam_enrollment.pk).update(changed=last_change)
+        db_obj = exam_enrollment.search_exam_enrollments([self.cle])[self.cle]
+        db_obj.score_draft = 12
+
+        exam_enrollment.bulk_update_scores([db_obj])
+
+        db_obj.refresh_from_db()
+        self.assertEqual(db_obj.score_draft, 12)
+        self.assertGreater(db_obj.changed, last_change)
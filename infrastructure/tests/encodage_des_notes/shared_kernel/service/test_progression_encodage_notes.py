@@ -0,0 +1,134 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+
+from assessments.models.score_encoding_progress import ScoreEncodingProgress
+from base.models.enums import exam_enrollment_state
+from base.tests.factories.exam_enrollment import ExamEnrollmentFactory
+from base.tests.factories.learning_unit_year import LearningUnitYearFactory
+from base.tests.factories.session_exam_deadline import SessionExamDeadlineFactory
+from base.tests.factories.student_specific_profile import StudentSpecificProfileFactory
+from ddd.logic.encodage_des_notes.shared_kernel.dtos import DateDTO
+from infrastructure.encodage_de_notes.shared_kernel.service.progression_encodage_notes import \
+    ProgressionEncodageNotesTranslator, mettre_a_jour_progressions
+
+
+class ProgressionEncodageNotesTranslatorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.luy = LearningUnitYearFactory(acronym='LDROI1001', academic_year__year=2020)
+        cls.deadline = datetime.date(2021, 1, 15)
+        cls.submitted = cls._create_exam_enrollment(score_final=12)
+        cls.draft = cls._create_exam_enrollment(score_draft=8)
+        cls.missing = cls._create_exam_enrollment()
+        StudentSpecificProfileFactory(student=cls.missing.learning_unit_enrollment.offer_enrollment.student)
+        cls._create_exam_enrollment(enrollment_state=exam_enrollment_state.NOT_ENROLLED)
+
+    @classmethod
+    def _create_exam_enrollment(cls, **kwargs):
+        enrollment = ExamEnrollmentFactory(
+            session_exam__number_session=1,
+            learning_unit_enrollment__learning_unit_year=cls.luy,
+            learning_unit_enrollment__offer_enrollment__education_group_year__acronym='DROI1BA',
+            **kwargs
+        )
+        SessionExamDeadlineFactory(
+            offer_enrollment=enrollment.learning_unit_enrollment.offer_enrollment,
+            number_session=1,
+            deadline=cls.deadline,
+            deadline_tutor=0,
+        )
+        return enrollment
+
+    def test_should_count_notes_of_enrolled_students_per_cohort_and_deadline(self):
+        mettre_a_jour_progressions(2020, 1, {'LDROI1001'})
+
+        progression = ScoreEncodingProgress.objects.get(learning_unit_code='LDROI1001')
+        self.assertEqual(progression.cohort_name, 'DROI1BA')
+        self.assertEqual(progression.deadline, self.deadline)
+        self.assertEqual(progression.total_count, 3)
+        self.assertEqual(progression.submitted_count, 1)
+        self.assertEqual(progression.draft_count, 1)
+        self.assertEqual(progression.peps_students_count, 1)
+
+    def test_should_replace_counters_when_notes_are_updated(self):
+        mettre_a_jour_progressions(2020, 1, {'LDROI1001'})
+        self.draft.score_final = 8
+        self.draft.save()
+
+        mettre_a_jour_progressions(2020, 1, {'LDROI1001'})
+
+        progression = ScoreEncodingProgress.objects.get(learning_unit_code='LDROI1001')
+        self.assertEqual(progression.submitted_count, 2)
+        self.assertEqual(progression.draft_count, 0)
+
+    def test_should_search_only_cohortes_with_notes_manquantes(self):
+        mettre_a_jour_progressions(2020, 1)
+
+        result = ProgressionEncodageNotesTranslator().search(
+            annee=2020,
+            numero_session=1,
+            noms_cohortes={'DROI1BA'},
+            seulement_notes_manquantes=True,
+        )
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].date_echeance, DateDTO.build_from_date(self.deadline))
+        self.assertEqual(result[0].quantite_notes_manquantes, 2)
+
+        self.missing.score_final = 10
+        self.missing.save()
+        self.draft.score_final = 8
+        self.draft.save()
+        mettre_a_jour_progressions(2020, 1)
+
+        result = ProgressionEncodageNotesTranslator().search(
+            annee=2020,
+            numero_session=1,
+            noms_cohortes={'DROI1BA'},
+            seulement_notes_manquantes=True,
+        )
+        self.assertFalse(result)
+
+    @mock.patch('django.db.transaction.on_commit', side_effect=lambda func: func())
+    def test_should_refresh_counters_when_exam_enrollment_is_saved(self, mock_on_commit):
+        mettre_a_jour_progressions(2020, 1)
+        self.missing.score_final = 10
+        self.missing.save()
+
+        progression = ScoreEncodingProgress.objects.get(learning_unit_code='LDROI1001')
+        self.assertEqual(progression.submitted_count, 2)
+
+    @mock.patch('django.db.transaction.on_commit', side_effect=lambda func: func())
+    def test_should_refresh_counters_when_student_specific_profile_is_deleted(self, mock_on_commit):
+        mettre_a_jour_progressions(2020, 1)
+        self.missing.learning_unit_enrollment.offer_enrollment.student.studentspecificprofile.delete()
+
+        progression = ScoreEncodingProgress.objects.get(learning_unit_code='LDROI1001')
+        self.assertEqual(progression.peps_students_count, 0)
@@ -24,6 +24,7 @@
 #
 ##############################################################################
 import datetime
+from unittest import mock
 
 from django.test import TestCase
 
@@ -91,6 +92,20 @@ class NoteEtudiantRepositoryTest(TestCase):
 
         assert_attrs_instances_are_equal(note_etudiant, note_retrieved_from_repo)
 
+    @mock.patch('infrastructure.encodage_de_notes.soumission.repository.note_etudiant.'
+                'mettre_a_jour_progressions_unites_enseignement')
+    def test_should_save_all_notes_in_bulk(self, mock_mettre_a_jour_progressions):
+        notes = [NoteChiffreEtudiantFactory(est_soumise=True), NoteJustificationEtudiantFactory()]
+        for note in notes:
+            self._create_save_necessary_data(note)
+
+        with self.assertNumQueries(2):
+            self.note_etudiant_repository.save_all(notes)
+        self.assertTrue(mock_mettre_a_jour_progressions.called)
+
+        for note in notes:
+            assert_attrs_instances_are_equal(note, self.note_etudiant_repository.get(note.entity_id))
+
     def test_should_raise_exception_if_no_note(self):
         note_etudiant_not_persisted = NoteChiffreEtudiantFactory()
 
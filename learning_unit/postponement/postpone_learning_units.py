@@ -42,6 +42,7 @@ from base.models.proposal_learning_unit import ProposalLearningUnit
 from base.models.teaching_material import TeachingMaterial
 from cms.enums import entity_name
 from cms.models.translated_text import TranslatedText
+from education_group import publisher
 
 POSTPONEMENT_RANGE = 6
 
@@ -56,7 +57,10 @@ class PostponeLearningUnits:
     def until_year(self) -> int:
         return self.from_year + POSTPONEMENT_RANGE
 
-    def load_container_years_to_postpone(self) -> Iterable[LearningContainerYear]:
+    def load_container_years_to_postpone(
+            self,
+            learning_container_ids: List[int] = None
+    ) -> Iterable[LearningContainerYear]:
         last_occurence_qs = LearningContainerYear.objects.filter(
             academic_year__year__gte=self.from_year,
             learning_container=OuterRef("learning_container")
@@ -77,21 +81,26 @@ class PostponeLearningUnits:
             type=ProposalType.CREATION.name
         )
 
-        return LearningContainerYear.objects.filter(
+        qs = LearningContainerYear.objects.filter(
             academic_year__year=Subquery(last_occurence_qs[:1]),
-        ).annotate(
+        )
+        if learning_container_ids is not None:
+            qs = qs.filter(learning_container_id__in=learning_container_ids)
+        return qs.annotate(
             is_mobility=Exists(is_mobility_qs),
             is_proposal_creation=Exists(is_proposal_creation)
         ).exclude(
             Q(is_mobility=True) | Q(is_proposal_creation=True)
         ).prefetch_related(
             'learningunityear_set',
+            'learningunityear_set__learning_unit__end_year',
             'learningunityear_set__externallearningunityear',
             'learningunityear_set__learningcomponentyear_set',
-            'learningunityear_set__learningachievement_set'
+            'learningunityear_set__learningachievement_set',
+            'learningunityear_set__teachingmaterial_set',
         ).distinct()
 
-    def load_partims_not_aligned_with_full(self) -> Iterable[LearningUnitYear]:
+    def load_partims_not_aligned_with_full(self, learning_unit_ids: List[int] = None) -> Iterable[LearningUnitYear]:
         last_occurence_qs = LearningUnitYear.objects.filter(
             academic_year__year__gte=self.from_year,
             learning_unit=OuterRef("learning_unit")
@@ -107,29 +116,36 @@ class PostponeLearningUnits:
             mobility=True,
             learning_unit_year=OuterRef('id')
         )
-        return LearningUnitYear.objects.filter(
+        qs = LearningUnitYear.objects.filter(
             academic_year__year=Subquery(last_occurence_qs[:1]),
             subtype=learning_unit_year_subtypes.PARTIM,
-        ).annotate(
+        )
+        if learning_unit_ids is not None:
+            qs = qs.filter(learning_unit_id__in=learning_unit_ids)
+        return qs.annotate(
             is_mobility=Exists(is_mobility_qs),
         ).exclude(
             is_mobility=True
+        ).select_related(
+            'learning_unit__end_year',
+            'learning_container_year',
         ).prefetch_related(
             'externallearningunityear',
             'learningcomponentyear_set',
-            'learningachievement_set'
+            'learningachievement_set',
+            'teachingmaterial_set',
         ).distinct()
 
-    def postpone(self):
-        for lcy in self.load_container_years_to_postpone():
+    def postpone(self, learning_container_ids: List[int] = None):
+        for lcy in self.load_container_years_to_postpone(learning_container_ids):
+            default_values = self.load_initial_values_before_proposal(lcy)
             for year in range(lcy.academic_year.year + 1, self.compute_container_year_end_year(lcy) + 1):
-                default_values = self.load_initial_values_before_proposal(lcy)
                 self.postpone_learning_container_year(lcy, year, default_values)
 
-    def postpone_partims(self):
-        for luy in self.load_partims_not_aligned_with_full():
+    def postpone_partims(self, learning_unit_ids: List[int] = None):
+        for luy in self.load_partims_not_aligned_with_full(learning_unit_ids):
             for year in range(luy.academic_year.year + 1, self.compute_learning_unit_year_end_year(luy) + 1):
-                self.postpone_learning_unit_year(luy, year, self.get_empty_initial_values())
+                self.postpone_learning_unit_years([luy], year, self.get_empty_initial_values())
 
     def postpone_learning_container_year(
             self,
@@ -137,57 +153,98 @@ class PostponeLearningUnits:
             for_year: int,
             initial_values_before_proposal: Dict
     ):
-        create_learning_container_year_from_template(
+        new_lcy = create_learning_container_year_from_template(
             from_lcy,
-            for_year,
+            self.get_academic_year_id(for_year),
             initial_values_before_proposal[LearningContainerYear.__name__]
         )
+        self.postpone_learning_unit_years(
+            from_lcy.learningunityear_set.all(),
+            for_year,
+            initial_values_before_proposal,
+            learning_container_year=new_lcy
+        )
 
-        for luy in from_lcy.learningunityear_set.all():
-            self.postpone_learning_unit_year(luy, for_year, initial_values_before_proposal)
-
-    def postpone_learning_unit_year(
+    def postpone_learning_unit_years(
             self,
-            from_luy: LearningUnitYear,
+            from_luys: Iterable[LearningUnitYear],
             for_year: int,
-            initial_values_before_proposal: Dict
-    ):
-        if not self.compute_learning_unit_year_end_year(from_luy) >= for_year:
-            return
-
-        create_learning_unit_year_from_template(
-            from_luy,
-            for_year,
-            initial_values_before_proposal[LearningUnitYear.__name__]
-        )
+            initial_values_before_proposal: Dict,
+            learning_container_year: LearningContainerYear = None
+    ) -> List[LearningUnitYear]:
+        """
+        Copy the learning unit years and their components, teaching materials, achievements, external data and cms
+        into for_year with one bulk insert by table.
+        """
+        from_luys = [luy for luy in from_luys if self.compute_learning_unit_year_end_year(luy) >= for_year]
+        if not from_luys:
+            return []
+
+        new_luys = LearningUnitYear.objects.bulk_create([
+            build_learning_unit_year_from_template(
+                luy,
+                self.get_academic_year_id(for_year),
+                learning_container_year or self.get_learning_container_year(luy, for_year),
+                initial_values_before_proposal[LearningUnitYear.__name__]
+            ) for luy in from_luys
+        ])
+        new_luy_id_by_template_id = {
+            from_luy.id: new_luy.id for from_luy, new_luy in zip(from_luys, new_luys)
+        }
 
-        for component in from_luy.learningcomponentyear_set.all():
-            create_component_year_from_template(
+        component_defaults = initial_values_before_proposal[LearningComponentYear.__name__]
+        LearningComponentYear.objects.bulk_create([
+            build_from_template(
                 component,
-                for_year,
-                initial_values_before_proposal[LearningComponentYear.__name__].get(component.type, {})
+                {
+                    'learning_unit_year_id': new_luy_id_by_template_id[luy.id],
+                    **component_defaults.get(component.type, {})
+                }
+            ) for luy in from_luys for component in luy.learningcomponentyear_set.all()
+        ])
+        TeachingMaterial.objects.bulk_create([
+            build_from_template(material, {'learning_unit_year_id': new_luy_id_by_template_id[luy.id]})
+            for luy in from_luys for material in luy.teachingmaterial_set.all()
+        ])
+        LearningAchievement.objects.bulk_create([
+            build_from_template(achievement, {'learning_unit_year_id': new_luy_id_by_template_id[luy.id]})
+            for luy in from_luys for achievement in luy.learningachievement_set.all()
+        ])
+        ExternalLearningUnitYear.objects.bulk_create([
+            build_from_template(
+                luy.externallearningunityear,
+                {'learning_unit_year_id': new_luy_id_by_template_id[luy.id]}
             )
+            for luy in from_luys if luy.is_external()
+        ])
+        self.postpone_cms(new_luy_id_by_template_id)
 
-        for material in from_luy.teachingmaterial_set.all():
-            create_teaching_material_from_template(material, for_year)
-
-        for achievement in from_luy.learningachievement_set.all():
-            create_learning_achievement_from_template(achievement, for_year)
+        publisher.learning_unit_years_created.send(None, learning_unit_year_ids=[luy.id for luy in new_luys])
+        return new_luys
 
-        if from_luy.is_external():
-            create_external_learning_unit_year_from_template(from_luy.externallearningunityear, for_year)
-
-        self.postpone_cms(from_luy, for_year)
-
-    def postpone_cms(self, from_luy: LearningUnitYear, for_year: int):
+    def postpone_cms(self, new_luy_id_by_template_id: Dict[int, int]):
         cms_query = TranslatedText.objects.filter(
             entity=entity_name.LEARNING_UNIT_YEAR,
-            reference=from_luy.id
+            reference__in=list(new_luy_id_by_template_id.keys())
         ).exclude(
             text_label__label__in=CMS_LABEL_PEDAGOGY_FORCE_MAJEURE
         )
-        for cms in cms_query:
-            create_cms_from_template(cms, for_year)
+        TranslatedText.objects.bulk_create([
+            build_from_template(cms, {'reference': new_luy_id_by_template_id[cms.reference]}) for cms in cms_query
+        ])
+
+    def get_academic_year_id(self, year: int) -> int:
+        return self._academic_year_ids_by_year[year]
+
+    @cached_property
+    def _academic_year_ids_by_year(self) -> Dict[int, int]:
+        return dict(AcademicYear.objects.filter(year__gt=self.from_year).values_list('year', 'id'))
+
+    def get_learning_container_year(self, luy: LearningUnitYear, year: int) -> LearningContainerYear:
+        return LearningContainerYear.objects.get(
+            learning_container_id=luy.learning_container_year.learning_container_id,
+            academic_year__year=year
+        )
 
     def load_initial_values_before_proposal(self, lcy: LearningContainerYear) -> Dict:
         proposal = ProposalLearningUnit.objects.filter(learning_unit_year__learning_container_year=lcy).first()
@@ -276,6 +333,15 @@ class PostponeLearningUnits:
         return AcademicYear.objects.get(id=end_year_id).year
 
     def compute_learning_unit_year_end_year(self, luy: LearningUnitYear) -> int:
+        if luy.id not in self._end_year_by_learning_unit_year_id:
+            self._end_year_by_learning_unit_year_id[luy.id] = self._compute_learning_unit_year_end_year(luy)
+        return self._end_year_by_learning_unit_year_id[luy.id]
+
+    @cached_property
+    def _end_year_by_learning_unit_year_id(self) -> Dict[int, int]:
+        return {}
+
+    def _compute_learning_unit_year_end_year(self, luy: LearningUnitYear) -> int:
         proposal = ProposalLearningUnit.objects.filter(
             learning_unit_year__learning_unit=luy.learning_unit
         ).first()
@@ -291,98 +357,34 @@ class PostponeLearningUnits:
 
 def create_learning_container_year_from_template(
         template_lcy: LearningContainerYear,
-        to_year: int,
+        academic_year_id: int,
         defaults: Dict
 ) -> LearningContainerYear:
-    acy = AcademicYear.objects.get(year=to_year)
-    field_values = get_fields_values(template_lcy)
-    field_values['academic_year_id'] = acy.id
-    field_values.update(defaults)
-    return LearningContainerYear.objects.create(**field_values)
+    new_lcy = build_from_template(template_lcy, {'academic_year_id': academic_year_id, **defaults})
+    new_lcy.save()
+    return new_lcy
 
 
-def create_learning_unit_year_from_template(
+def build_learning_unit_year_from_template(
         template_luy: LearningUnitYear,
-        to_year: int,
+        academic_year_id: int,
+        learning_container_year: LearningContainerYear,
         defaults: Dict
 ) -> LearningUnitYear:
-    acy = AcademicYear.objects.get(year=to_year)
-    lcy = LearningContainerYear.objects.get(
-        learning_container=template_luy.learning_container_year.learning_container,
-        academic_year__year=to_year
+    new_luy = build_from_template(
+        template_luy,
+        {'academic_year_id': academic_year_id, 'learning_container_year_id': learning_container_year.id, **defaults}
     )
-    field_values = get_fields_values(template_luy)
-    field_values['academic_year_id'] = acy.id
-    field_values['learning_container_year_id'] = lcy.id
-    field_values.update(defaults)
-    return LearningUnitYear.objects.create(**field_values)
-
-
-def create_external_learning_unit_year_from_template(
-        template_external_luy: ExternalLearningUnitYear,
-        to_year: int
-) -> ExternalLearningUnitYear:
-    luy = LearningUnitYear.objects.get(
-        learning_unit=template_external_luy.learning_unit_year.learning_unit,
-        academic_year__year=to_year
-    )
-    field_values = get_fields_values(template_external_luy)
-    field_values['learning_unit_year_id'] = luy.id
-    return ExternalLearningUnitYear.objects.create(**field_values)
+    # The titles may differ from the template (initial values of a proposal) and bulk_create bypasses save()
+    new_luy.learning_container_year = learning_container_year
+    new_luy.search_title = new_luy.build_search_title()
+    return new_luy
 
 
-def create_component_year_from_template(
-        template_component_year: LearningComponentYear,
-        to_year: int,
-        defaults: Dict
-) -> LearningComponentYear:
-    luy = LearningUnitYear.objects.get(
-        learning_unit=template_component_year.learning_unit_year.learning_unit,
-        academic_year__year=to_year
-    )
-    field_values = get_fields_values(template_component_year)
-    field_values['learning_unit_year_id'] = luy.id
-    field_values.update(defaults)
-    return LearningComponentYear.objects.create(**field_values)
-
-
-def create_teaching_material_from_template(
-        template_teaching_material: TeachingMaterial,
-        to_year: int
-) -> TeachingMaterial:
-    luy = LearningUnitYear.objects.get(
-        learning_unit=template_teaching_material.learning_unit_year.learning_unit,
-        academic_year__year=to_year
-    )
-    field_values = get_fields_values(template_teaching_material)
-    field_values['learning_unit_year_id'] = luy.id
-    return TeachingMaterial.objects.create(**field_values)
-
-
-def create_learning_achievement_from_template(
-        template_achievement: LearningAchievement,
-        to_year: int
-) -> LearningAchievement:
-    luy = LearningUnitYear.objects.get(
-        learning_unit=template_achievement.learning_unit_year.learning_unit,
-        academic_year__year=to_year
-    )
-    field_values = get_fields_values(template_achievement)
-    field_values['learning_unit_year_id'] = luy.id
-    return LearningAchievement.objects.create(**field_values)
-
-
-def create_cms_from_template(
-        template_cms: TranslatedText,
-        to_year: int
-) -> TranslatedText:
-    luy = LearningUnitYear.objects.get(
-        learning_unit__learningunityear__id=template_cms.reference,
-        academic_year__year=to_year
-    )
-    field_values = get_fields_values(template_cms)
-    field_values['reference'] = luy.id
-    return TranslatedText.objects.create(**field_values)
+def build_from_template(template_obj: Model, values: Dict) -> Model:
+    field_values = get_fields_values(template_obj)
+    field_values.update(values)
+    return type(template_obj)(**field_values)
 
 
 def get_fields_values(model_obj: Model) -> Dict:
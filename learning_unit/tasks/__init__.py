@@ -1,4 +1,5 @@
 from . import check_academic_calendar
+from . import postpone_learning_units_until_n_plus_6
 
 from celery.schedules import crontab
 from backoffice.celery import app as celery_app
@@ -1,4 +1,5 @@
 from backoffice.celery import app as celery_app
+from base.business import academic_calendar
 from learning_unit.calendar.learning_unit_enrollment_calendar import LearningUnitEnrollmentCalendar
 from learning_unit.calendar.learning_unit_force_majeur_summary_edition import \
     LearningUnitForceMajeurSummaryEditionCalendar
@@ -16,4 +17,5 @@ def run() -> dict:
     LearningUnitEnrollmentCalendar.ensure_consistency_until_n_plus_6()
     LearningUnitExtendedProposalManagementCalendar.ensure_consistency_until_n_plus_6()
     LearningUnitLimitedProposalManagementCalendar.ensure_consistency_until_n_plus_6()
+    academic_calendar.invalidate()
     return {}
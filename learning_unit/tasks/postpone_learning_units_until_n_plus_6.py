@@ -23,12 +23,85 @@
 #
 ##############################################################################
 
+import logging
+from typing import List
+
+from celery import chain, group
+from django.conf import settings
+
 from backoffice.celery import app as celery_app
+from base.business import postponement_jobs
 from learning_unit.postponement import postpone_learning_units
 
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+LEARNING_CONTAINERS_JOB = 'learning_containers_until_n_plus_6'
+PARTIMS_JOB = 'partims_until_n_plus_6'
+
 
 @celery_app.task
 def run() -> dict:
-    postpone_learning_units.PostponeLearningUnits().postpone()
-    postpone_learning_units.PostponeLearningUnits().postpone_partims()
-    return {}
+    """
+    Postpone the learning containers by chunks spread across the workers, then the partims not aligned with their
+    full. Chunks already postponed by a previous run are skipped.
+    """
+    postponement = postpone_learning_units.PostponeLearningUnits()
+    learning_container_ids = postponement.load_container_years_to_postpone().prefetch_related(
+        None
+    ).values_list('learning_container_id', flat=True)
+    pending_keys = postponement_jobs.get_pending_keys(
+        LEARNING_CONTAINERS_JOB,
+        postponement.from_year,
+        [str(learning_container_id) for learning_container_id in learning_container_ids]
+    )
+    chunks = postponement_jobs.split_in_chunks(pending_keys)
+    logger.info("Postponement of {} learning containers in {} chunks".format(len(pending_keys), len(chunks)))
+
+    partims_postponement = run_partims.si(postponement.from_year)
+    if chunks:
+        chain(
+            group(postpone_learning_containers.si(postponement.from_year, chunk) for chunk in chunks),
+            partims_postponement
+        ).apply_async()
+    else:
+        partims_postponement.apply_async()
+    return {'learning_containers': len(pending_keys), 'chunks': len(chunks)}
+
+
+@celery_app.task
+def run_partims(from_year: int) -> dict:
+    postponement = postpone_learning_units.PostponeLearningUnits()
+    learning_unit_ids = postponement.load_partims_not_aligned_with_full().prefetch_related(
+        None
+    ).values_list('learning_unit_id', flat=True)
+    pending_keys = postponement_jobs.get_pending_keys(
+        PARTIMS_JOB,
+        from_year,
+        [str(learning_unit_id) for learning_unit_id in learning_unit_ids]
+    )
+    chunks = postponement_jobs.split_in_chunks(pending_keys)
+    if chunks:
+        group(postpone_partims.si(from_year, chunk) for chunk in chunks).apply_async()
+    return {'partims': len(pending_keys), 'chunks': len(chunks)}
+
+
+@celery_app.task
+def postpone_learning_containers(from_year: int, keys: List[str]) -> List[str]:
+    postponement = postpone_learning_units.PostponeLearningUnits()
+    return postponement_jobs.postpone_chunk(
+        LEARNING_CONTAINERS_JOB,
+        from_year,
+        keys,
+        lambda pending_keys: postponement.postpone(learning_container_ids=[int(key) for key in pending_keys])
+    )
+
+
+@celery_app.task
+def postpone_partims(from_year: int, keys: List[str]) -> List[str]:
+    postponement = postpone_learning_units.PostponeLearningUnits()
+    return postponement_jobs.postpone_chunk(
+        PARTIMS_JOB,
+        from_year,
+        keys,
+        lambda pending_keys: postponement.postpone_partims(learning_unit_ids=[int(key) for key in pending_keys])
+    )
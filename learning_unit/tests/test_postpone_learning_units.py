@@ -25,11 +25,15 @@
 
 from django.test import TestCase
 
+from base.models.enums.proposal_type import ProposalType
+from base.models.learning_component_year import LearningComponentYear
 from base.models.learning_unit_year import LearningUnitYear
 from base.tests.factories.academic_year import AcademicYearFactory
 from base.tests.factories.external_learning_unit_year import ExternalLearningUnitYearFactory
 from base.tests.factories.learning_unit_year import LearningUnitYearWithComponentsFactory
+from base.tests.factories.proposal_learning_unit import ProposalLearningUnitFactory
 from learning_unit.postponement.postpone_learning_units import PostponeLearningUnits
+from program_management.models.element import Element
 
 
 class TestPostponeLearningUnits(TestCase):
@@ -75,3 +79,32 @@ class TestPostponeLearningUnits(TestCase):
             list(range(self.current_academic_year.year, self.current_academic_year.year + 7)),
             transform=lambda luy: luy.academic_year.year
         )
+
+    def test_should_postpone_components_and_elements_with_learning_unit_years(self):
+        PostponeLearningUnits().postpone()
+
+        self.assertEqual(
+            LearningComponentYear.objects.filter(learning_unit_year__acronym=self.luy.acronym).count(),
+            2 * 7
+        )
+        self.assertEqual(Element.objects.filter(learning_unit_year__acronym=self.luy.acronym).count(), 7)
+
+    def test_should_only_postpone_given_learning_containers(self):
+        PostponeLearningUnits().postpone(learning_container_ids=[])
+
+        self.assertEqual(LearningUnitYear.objects.filter(acronym=self.luy.acronym).count(), 1)
+
+    def test_should_compute_search_title_of_postponed_years_from_initial_values_of_proposal(self):
+        ProposalLearningUnitFactory(
+            learning_unit_year=self.luy,
+            type=ProposalType.MODIFICATION.name,
+            initial_data={'learning_unit_year': {'specific_title': 'Intitulé initial'}},
+        )
+
+        PostponeLearningUnits().postpone()
+
+        next_luy = LearningUnitYear.objects.get(
+            acronym=self.luy.acronym,
+            academic_year__year=self.current_academic_year.year + 1
+        )
+        self.assertIn('intitule initial', next_luy.search_title)
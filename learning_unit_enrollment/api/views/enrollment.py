@@ -26,16 +26,19 @@
 import logging
 
 from django.conf import settings
-from django.db.models import Case, When, Q, F, Value, CharField
+from django.db.models import Case, When, Q, F, Value, CharField, QuerySet
 from django.db.models.functions import Concat, Replace
+from django.http import StreamingHttpResponse
 from django.utils.functional import cached_property
 from django_filters import rest_framework as filters
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics
 from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
 
 from backoffice.settings.rest_framework.filters import MultipleColumnOrderingFilter
-from base.models.enums.learning_component_year_type import LECTURING, PRACTICAL_EXERCISES
+from backoffice.settings.rest_framework.pagination import KeysetPaginationWithUpperBound
+from backoffice.settings.rest_framework.renderers import NDJSONRenderer
 from base.models.enums.offer_enrollment_state import SUBSCRIBED, PROVISORY
 from base.models.learning_unit_enrollment import LearningUnitEnrollment
 from base.models.person import Person
@@ -44,6 +47,10 @@ from learning_unit_enrollment.api.serializers.enrollment import EnrollmentSerial
 
 logger = logging.getLogger(settings.DEFAULT_LOGGER)
 
+PAGINATION_MODE_PARAM = 'pagination'
+KEYSET_PAGINATION_MODE = 'keyset'
+STREAMING_CHUNK_SIZE = 2000
+
 
 class EnrollmentFilter(filters.FilterSet):
     ordering = MultipleColumnOrderingFilter(
@@ -74,42 +81,64 @@ class LearningUnitEnrollmentsListView(generics.ListAPIView):
     ]
     filterset_class = EnrollmentFilter
     filter_backends = [DjangoFilterBackend, SearchFilter]
+    renderer_classes = list(api_settings.DEFAULT_RENDERER_CLASSES) + [NDJSONRenderer]
+
+    @property
+    def pagination_class(self):
+        # ?pagination=keyset : pages are fetched by id (WHERE id > cursor) instead of OFFSET
+        request = getattr(self, 'request', None)
+        if request is not None and request.query_params.get(PAGINATION_MODE_PARAM) == KEYSET_PAGINATION_MODE:
+            return KeysetPaginationWithUpperBound
+        return api_settings.DEFAULT_PAGINATION_CLASS
+
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format == NDJSONRenderer.format:
+            return self._stream_enrollments()
+        return super().list(request, *args, **kwargs)
+
+    def _stream_enrollments(self) -> StreamingHttpResponse:
+        queryset = self.filter_queryset(self.get_queryset())
+        if not queryset.ordered:
+            queryset = queryset.order_by('id')
+        rows = (
+            NDJSONRenderer.render_row(self.get_serializer(enrollment).data)
+            for enrollment in queryset.iterator(chunk_size=STREAMING_CHUNK_SIZE)
+        )
+        return StreamingHttpResponse(rows, content_type=NDJSONRenderer.media_type)
 
     def get_paginated_response(self, data):
         response = super().get_paginated_response(data)
-        response.data.update({'enrolled_students_count': self.get_queryset().count()})
+        response.data.update({'enrolled_students_count': self._count_enrolled_students()})
         return response
 
+    def _count_enrolled_students(self) -> int:
+        paginated_count = getattr(self.paginator, 'count', None)
+        is_searched = bool(self.request.query_params.get(api_settings.SEARCH_PARAM))
+        if paginated_count is not None and not is_searched:
+            return paginated_count
+        return self.get_enrollments_queryset().count()
+
     @property
     def year(self):
         return self.kwargs['year']
 
-    def get_queryset(self):
-        if self._acronym_corresponds_to_ue():
-            full_acronym = self.kwargs['acronym']
-        else:
+    def get_enrollments_queryset(self) -> QuerySet:
+        acronym = self.kwargs['acronym']
+        full_class_codes = {acronym}
+        if not self._acronym_corresponds_to_ue():
             # Which means Classe or Partim
-            full_acronym = self.kwargs['acronym'][:-1]
+            full_class_codes |= {acronym[:-1] + separator + acronym[-1] for separator in ('-', '_')}
 
         return LearningUnitEnrollment.objects.filter(
+            Q(full_class_code__in=full_class_codes) |
+            Q(learning_unit_year__learning_container_year__acronym=acronym),
             learning_unit_year__academic_year__year=self.year,
-            learning_unit_year__acronym__contains=full_acronym,
             offer_enrollment__enrollment_state__in=[SUBSCRIBED, PROVISORY]
-        ).annotate(
+        )
+
+    def get_queryset(self):
+        return self.get_enrollments_queryset().annotate(
             learning_unit_academic_year=F('learning_unit_year__academic_year__year'),
-            learning_unit_acronym=Case(
-                When(
-                    Q(learning_class_year__isnull=False),
-                    then=Concat(F('learning_unit_year__acronym'), F('learning_class_year__acronym'))
-                ),
-                default=F('learning_unit_year__acronym')
-            )
-        ).filter(
-            (
-                Q(learning_unit_acronym=self.kwargs['acronym']) |
-                Q(learning_unit_year__learning_container_year__acronym=self.kwargs['acronym'])
-            )
-        ).annotate(
             student_last_name=F('offer_enrollment__student__person__last_name'),
             student_first_name=F('offer_enrollment__student__person__first_name'),
             student_email=F('offer_enrollment__student__person__email'),
@@ -125,28 +154,7 @@ class LearningUnitEnrollmentsListView(generics.ListAPIView):
                 output_field=CharField()
             ),
             specific_profile=F('offer_enrollment__student__studentspecificprofile__type'),
-            learning_unit_acronym=Case(
-                When(
-                    learning_class_year__learning_component_year__type=LECTURING,
-                    then=Concat(
-                        'learning_unit_year__acronym',
-                        Value('-'),
-                        'learning_class_year__acronym',
-                        output_field=CharField()
-                    )
-                ),
-                When(
-                    learning_class_year__learning_component_year__type=PRACTICAL_EXERCISES,
-                    then=Concat(
-                        'learning_unit_year__acronym',
-                        Value('_'),
-                        'learning_class_year__acronym',
-                        output_field=CharField()
-                    )
-                ),
-                default=F('learning_unit_year__acronym'),
-                output_field=CharField()
-            )
+            learning_unit_acronym=F('full_class_code'),
         ).select_related(
             'offer_enrollment__student__studentspecificprofile',
             'offer_enrollment__student__person',
@@ -176,7 +184,7 @@ class MyLearningUnitEnrollmentsListView(LearningUnitEnrollmentsListView):
     def person(self) -> Person:
         return self.request.user.person
 
-    def get_queryset(self):
+    def get_enrollments_queryset(self) -> QuerySet:
         return LearningUnitEnrollment.objects.filter(
             offer_enrollment__student__person=self.person,
             learning_unit_year__academic_year__year=self.year,
@@ -193,7 +201,10 @@ class MyLearningUnitEnrollmentsListView(LearningUnitEnrollmentsListView):
             )
         ).filter(
             program=self.kwargs['program_code']
-        ).annotate(
+        )
+
+    def get_queryset(self):
+        return self.get_enrollments_queryset().annotate(
             learning_unit_academic_year=F('learning_unit_year__academic_year__year'),
             learning_unit_acronym=Case(
                 When(
@@ -23,6 +23,8 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import json
+
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -166,6 +168,42 @@ class LearningUnitEnrollmentsListViewTestCase(APITestCase):
 
         self.assertCountEqual(results_acronyms, expected_acronyms)
 
+    def test_should_paginate_by_keyset_when_asked(self):
+        other_enrollment = LearningUnitEnrollmentFactory(learning_unit_year=self.ue_enrollment.learning_unit_year)
+
+        response = self.client.get(self.url, data={'pagination': 'keyset', 'limit': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first_page = response.json()
+        self.assertEqual(len(first_page['results']), 1)
+        self.assertEqual(first_page['enrolled_students_count'], 2)
+        self.assertIsNotNone(first_page['next'])
+
+        response = self.client.get(first_page['next'])
+        second_page = response.json()
+        self.assertEqual(len(second_page['results']), 1)
+        self.assertIsNone(second_page['next'])
+        self.assertCountEqual(
+            [first_page['results'][0]['student_registration_id'], second_page['results'][0]['student_registration_id']],
+            [
+                self.ue_enrollment.offer_enrollment.student.registration_id,
+                other_enrollment.offer_enrollment.student.registration_id,
+            ]
+        )
+
+    def test_should_stream_all_enrollments_as_ndjson(self):
+        LearningUnitEnrollmentFactory(learning_unit_year=self.ue_enrollment.learning_unit_year)
+
+        response = self.client.get(self.url, data={'format': 'ndjson'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            json.loads(lines[0])['learning_unit_acronym'],
+            self.ue_enrollment.learning_unit_year.acronym
+        )
+
     def _create_ue_with_partims(self):
         current_academic_year = create_current_academic_year()
         learning_container_year = LearningContainerYearFactory(
@@ -23,6 +23,9 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import collections
+from typing import Dict, Set, Iterable
+
 import rules
 from django.contrib.auth.models import Group, User
 from django.core.exceptions import ImproperlyConfigured
@@ -96,12 +99,50 @@ class RoleModel(models.Model, metaclass=RoleModelMeta):
 
 
 class EntityRoleModelQueryset(models.QuerySet):
-    def get_entities_ids(self):
-        person_entities = self.values('entity_id', 'with_child')
-        entities_with_child = {entity['entity_id'] for entity in person_entities if entity['with_child']}
-        entity_version_tree = EntityVersion.objects.get_tree(entities_with_child)
-        entities_without_child = {entity['entity_id'] for entity in person_entities if not entity['with_child']}
-        return entities_without_child | {node['entity_id'] for node in entity_version_tree}
+    def get_entities_ids(self) -> Set[int]:
+        """
+        Entities of the roles, with their descendants when the role is given with_child.
+        Computed once per queryset instance: the role querysets are kept for the whole request by the permission
+        backend, so entity trees are not resolved again for each permission check.
+        """
+        if getattr(self, '_entities_ids_cache', None) is None and \
+                getattr(self, '_entities_ids_by_role_cache', None) is not None:
+            self._entities_ids_cache = set().union(*self._entities_ids_by_role_cache.values())
+        if getattr(self, '_entities_ids_cache', None) is None:
+            person_entities = list(self.values('entity_id', 'with_child'))
+            descendants = _get_descendants_by_entity(
+                {entity['entity_id'] for entity in person_entities if entity['with_child']}
+            )
+            self._entities_ids_cache = set()
+            for entity in person_entities:
+                self._entities_ids_cache |= _get_role_entities_ids(entity, descendants)
+        return self._entities_ids_cache
+
+    def get_entities_ids_by_role(self) -> Dict[int, Set[int]]:
+        """
+        Same as get_entities_ids but grouped by role (pk): {role_id: entities_ids}
+        """
+        if getattr(self, '_entities_ids_by_role_cache', None) is None:
+            roles = list(self.values('pk', 'entity_id', 'with_child'))
+            descendants = _get_descendants_by_entity({role['entity_id'] for role in roles if role['with_child']})
+            self._entities_ids_by_role_cache = {
+                role['pk']: _get_role_entities_ids(role, descendants) for role in roles
+            }
+        return self._entities_ids_by_role_cache
+
+
+def _get_descendants_by_entity(entities_ids: Iterable[int]) -> Dict[int, Set[int]]:
+    descendants = collections.defaultdict(set)
+    for node in EntityVersion.objects.get_tree(list(entities_ids)):
+        root_entity_id = node['parents'][0] if node['parents'] else node['entity_id']
+        descendants[root_entity_id].add(node['entity_id'])
+    return descendants
+
+
+def _get_role_entities_ids(role_values: Dict, descendants: Dict[int, Set[int]]) -> Set[int]:
+    if role_values['with_child']:
+        return {role_values['entity_id']} | descendants.get(role_values['entity_id'], set())
+    return {role_values['entity_id']}
 
 
 class EntityRoleModel(RoleModel):
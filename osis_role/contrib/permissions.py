@@ -23,11 +23,21 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+import threading
+from typing import Any, Dict, Iterable
+
 import rules
+from django.conf import settings
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth.models import Permission, Group
+from django.db import models
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
 
 from osis_role import role, errors
+from osis_role.contrib.models import EntityRoleModelQueryset
+
+_NOT_CACHEABLE = object()
 
 
 class ObjectPermissionBackend(ModelBackend):
@@ -35,14 +45,22 @@ class ObjectPermissionBackend(ModelBackend):
         if not user_obj.is_active or user_obj.is_anonymous:
             return False
 
+        result_cache_key = _get_result_cache_key(perm, *args, **kwargs)
+        results_cache = _get_results_cache(user_obj)
+        if result_cache_key in results_cache:
+            result, error = results_cache[result_cache_key]
+            errors.set_permission_error(user_obj, perm, error)
+            return result
+
         errors.clear_permission_error(user_obj, perm)
-        results = set()
-        for role_mdl in _get_relevant_roles(user_obj, perm):
-            rule_set = role_mdl.rule_set()
-            role_qs = role_mdl.objects.filter(person=getattr(user_obj, 'person', None))
-            _add_role_queryset_to_perms_context(rule_set, perm, role_qs)
-            results.add(rule_set.test_rule(perm, user_obj, *args, **kwargs))
-        return any(results) or super().has_perm(user_obj, perm, obj=kwargs.get('obj'))
+        result = any(
+            _test_rule(role_mdl, perm, _get_role_queryset(user_obj, role_mdl), user_obj, *args, **kwargs)
+            for role_mdl in _get_relevant_roles(user_obj, perm)
+        ) or super().has_perm(user_obj, perm, obj=kwargs.get('obj'))
+
+        if result_cache_key is not _NOT_CACHEABLE:
+            results_cache[result_cache_key] = (result, errors.get_permission_error(user_obj, perm))
+        return result
 
     def has_module_perms(self, user_obj, app_label, *args, **kwargs):
         if not user_obj.is_active or user_obj.is_anonymous:
@@ -50,7 +68,7 @@ class ObjectPermissionBackend(ModelBackend):
         roles_assigned = _get_roles_assigned_to_user(user_obj)
         all_perms = []
         for r in roles_assigned:
-            all_perms += [key for key in r.rule_set().keys() if app_label in key]
+            all_perms += [key for key in _get_rule_set(r).keys() if app_label in key]
         return any(app_label in perm for perm in all_perms) or super().has_module_perms(user_obj, app_label)
 
     def _get_group_permissions(self, user_obj, obj=None):
@@ -63,9 +81,44 @@ class ObjectPermissionBackend(ModelBackend):
         return Permission.objects.filter(pk__in=sub_qs)
 
 
+def has_perms_bulk(user_obj, perm: str, objects: Iterable[Any]) -> Dict[Any, bool]:
+    """
+    Check a permission for a batch of objects (ex: the rows of a result table).
+    The relevant roles, their rows and the entities scope of the user are resolved once, then the rule of each role is
+    evaluated in memory for each object, without going through the authentication backends for each of them.
+    Related objects used by the predicates should be fetched beforehand (select_related).
+    :return: {obj: has_perm}
+    """
+    objects = list(objects)
+    if not user_obj.is_active or user_obj.is_anonymous:
+        return {obj: False for obj in objects}
+    # Fallback of ObjectPermissionBackend.has_perm on the model permissions, which do not depend on the object
+    if user_obj.is_superuser or ModelBackend.has_perm(ObjectPermissionBackend(), user_obj, perm):
+        return {obj: True for obj in objects}
+
+    role_querysets = {
+        role_mdl: _get_prefetched_role_queryset(user_obj, role_mdl)
+        for role_mdl in _get_relevant_roles(user_obj, perm)
+    }
+    return {
+        obj: any(_test_rule(role_mdl, perm, role_qs, user_obj, obj) for role_mdl, role_qs in role_querysets.items())
+        for obj in objects
+    }
+
+
+def _get_prefetched_role_queryset(user_obj, role_mdl):
+    role_qs = _get_role_queryset(user_obj, role_mdl)
+    if isinstance(role_qs, models.QuerySet):
+        list(role_qs)  # Fill the result cache of the queryset with the role rows
+    if isinstance(role_qs, EntityRoleModelQueryset):
+        role_qs.get_entities_ids_by_role()
+        role_qs.get_entities_ids()
+    return role_qs
+
+
 def _get_relevant_roles(user_obj, perm):
     roles_assigned = _get_roles_assigned_to_user(user_obj)
-    return {r for r in roles_assigned if r.rule_set().rule_exists(perm)}
+    return {r for r in roles_assigned if _get_rule_set(r).rule_exists(perm)}
 
 
 def _get_roles_assigned_to_user(user_obj):
@@ -74,18 +127,79 @@ def _get_roles_assigned_to_user(user_obj):
     return {r for r in role.role_manager.roles if r.group_name in user_obj._group_cache}
 
 
-def _add_role_queryset_to_perms_context(rule_set, perm, qs):
+def _get_role_queryset(user_obj, role_mdl):
+    """
+    Role rows of the user, kept on the user object (i.e. for the request) so that they are fetched once
+    """
+    if not hasattr(user_obj, '_role_qs_cache'):
+        user_obj._role_qs_cache = {}
+    if role_mdl not in user_obj._role_qs_cache:
+        user_obj._role_qs_cache[role_mdl] = role_mdl.objects.filter(person=getattr(user_obj, 'person', None))
+    return user_obj._role_qs_cache[role_mdl]
+
+
+def _get_result_cache_key(perm, obj=None, *args, **kwargs):
+    if not settings.PERMISSION_RESULT_CACHE_ENABLED or args or kwargs:
+        return _NOT_CACHEABLE
+    if obj is None:
+        return perm, None
+    if isinstance(obj, models.Model) and obj.pk is not None:
+        return perm, obj._meta.label, obj.pk
+    return _NOT_CACHEABLE
+
+
+def _get_results_cache(user_obj) -> dict:
+    """
+    Results of has_perm kept on the user object (i.e. for the request), forgotten as soon as a model is saved or
+    deleted by the current thread
+    """
+    data_version = getattr(_data_version, 'value', 0)
+    if getattr(user_obj, '_perm_results_cache_version', None) != data_version:
+        user_obj._perm_results_cache = {}
+        user_obj._perm_results_cache_version = data_version
+    return user_obj._perm_results_cache
+
+
+@receiver(post_save)
+@receiver(post_delete)
+@receiver(m2m_changed)
+def _invalidate_results_caches(sender, **kwargs):
+    _data_version.value = getattr(_data_version, 'value', 0) + 1
+
+
+_rule_sets = {}
+_compiled_rules = {}
+_role_context = threading.local()
+_data_version = threading.local()
+
+
+@rules.predicate(name='cache_role_qs')
+def _set_role_context_fn(*args, **kwargs):
+    _set_role_context_fn.context['perm_name'] = _role_context.perm
+    _set_role_context_fn.context['role_qs'] = _role_context.role_qs
+    return True
+
+
+def _get_rule_set(role_mdl):
+    """
+    Rule sets are static: build them once per process instead of once per permission check
     """
-    :param rule_set: Set of rules for a specific role
-    :param perm: Django permission name
-    :param qs: Queryset which represent the role found on database
-    :return: rule_set with cached predicate
+    if role_mdl not in _rule_sets:
+        _rule_sets[role_mdl] = role_mdl.rule_set()
+    return _rule_sets[role_mdl]
+
+
+def _test_rule(role_mdl, perm, role_qs, user_obj, *args, **kwargs):
     """
-    if perm in rule_set:
-        @rules.predicate(name='cache_role_qs')
-        def cache_role_qs_fn(*args, **kwargs):
-            cache_role_qs_fn.context['perm_name'] = perm
-            cache_role_qs_fn.context['role_qs'] = qs
-            return True
-        rule_set[perm] = cache_role_qs_fn & rule_set[perm]
-    return rule_set
+    Evaluate the rule of the role with the role queryset and the permission name available in the predicates context.
+    The rule set of the role is never modified: the predicate filling the context is combined once per (role, perm).
+    """
+    if (role_mdl, perm) not in _compiled_rules:
+        _compiled_rules[(role_mdl, perm)] = _set_role_context_fn & _get_rule_set(role_mdl)[perm]
+
+    previous_context = getattr(_role_context, 'perm', None), getattr(_role_context, 'role_qs', None)
+    _role_context.perm, _role_context.role_qs = perm, role_qs
+    try:
+        return _compiled_rules[(role_mdl, perm)].test(user_obj, *args, **kwargs)
+    finally:
+        _role_context.perm, _role_context.role_qs = previous_context
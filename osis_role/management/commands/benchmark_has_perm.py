@@ -0,0 +1,59 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand
+from django.test.utils import override_settings
+
+from osis_role.contrib.permissions import ObjectPermissionBackend
+
+
+class Command(BaseCommand):
+    help = 'Measure the cost of ObjectPermissionBackend.has_perm over a large number of calls. ' \
+           'The result cache is disabled so that the rules are evaluated on each call.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', help='User whose permission is checked')
+        parser.add_argument('perm', help='Permission checked, ex: base.can_access_catalog')
+        parser.add_argument('--calls', type=int, default=100000, help='Number of has_perm calls')
+        parser.add_argument('--batch', type=int, default=10000, help='Number of calls per reported batch')
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.select_related('person').get(username=options['username'])
+        backend = ObjectPermissionBackend()
+
+        with override_settings(PERMISSION_RESULT_CACHE_ENABLED=False):
+            for batch_start in range(0, options['calls'], options['batch']):
+                start = time.perf_counter()
+                for _ in range(options['batch']):
+                    backend.has_perm(user, options['perm'])
+                duration = time.perf_counter() - start
+                self.stdout.write('Calls {} to {} : {:.2f}µs per call'.format(
+                    batch_start + 1,
+                    batch_start + options['batch'],
+                    duration / options['batch'] * 1000000,
+                ))
@@ -2,6 +2,7 @@ from django import template
 from rules.templatetags import rules
 
 from osis_role import errors
+from osis_role.contrib import permissions
 
 register = template.Library()
 
@@ -57,6 +58,15 @@ def has_perm(perm, user, obj=None):
     return rules.has_perm(perm, user, obj)
 
 
+@register.simple_tag
+def has_perms_bulk(perm, user, objects):
+    """
+    Usage: {% has_perms_bulk 'base.change_learningunit' user learning_units as can_change %}
+    then {{ can_change|get_item:learning_unit }} for each row
+    """
+    return permissions.has_perms_bulk(user, perm, objects)
+
+
 @register.simple_tag
 def has_module_perms(user, app_label):
     return user.has_module_perms(app_label)
@@ -29,7 +29,11 @@ from django.contrib.auth.models import Group
 from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase
 
+from base.tests.factories.entity import EntityFactory
+from base.tests.factories.entity_version import EntityVersionFactory
 from base.tests.factories.person import PersonFactory
+from education_group.auth.roles.faculty_manager import FacultyManager
+from education_group.tests.factories.auth.faculty_manager import FacultyManagerFactory
 from osis_role.contrib import models
 
 
@@ -106,3 +110,35 @@ class TestEntityRoleModel(TestCase):
     def test_unique_together_person_entity(self):
         instance = models.EntityRoleModel()
         self.assertEqual(instance._meta.unique_together, (('person', 'entity'),))
+
+
+class TestEntityRoleModelQueryset(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.parent_entity = EntityVersionFactory().entity
+        cls.child_entity = EntityVersionFactory(parent=cls.parent_entity).entity
+        cls.other_entity = EntityFactory()
+
+        cls.person = PersonFactory()
+        cls.role_with_child = FacultyManagerFactory(person=cls.person, entity=cls.parent_entity, with_child=True)
+        cls.role_without_child = FacultyManagerFactory(person=cls.person, entity=cls.other_entity, with_child=False)
+
+    def test_get_entities_ids_by_role(self):
+        role_qs = FacultyManager.objects.filter(person=self.person)
+        self.assertDictEqual(
+            role_qs.get_entities_ids_by_role(),
+            {
+                self.role_with_child.pk: {self.parent_entity.pk, self.child_entity.pk},
+                self.role_without_child.pk: {self.other_entity.pk},
+            }
+        )
+
+    def test_entities_ids_are_computed_once_per_queryset(self):
+        role_qs = FacultyManager.objects.filter(person=self.person)
+        role_qs.get_entities_ids_by_role()
+
+        with self.assertNumQueries(0):
+            entities_ids = role_qs.get_entities_ids()
+            role_qs.get_entities_ids_by_role()
+
+        self.assertSetEqual(entities_ids, {self.parent_entity.pk, self.child_entity.pk, self.other_entity.pk})
@@ -27,15 +27,20 @@ import mock
 import rules
 from django.contrib.auth import models
 from django.contrib.auth.models import Group, Permission
+from django.db import connection
 from django.db.models import QuerySet
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rules import RuleSet
 
 from base.tests.factories.person import PersonFactory, PersonWithPermissionsFactory
 from base.tests.factories.user import UserFactory
-from osis_role.contrib.permissions import ObjectPermissionBackend, _add_role_queryset_to_perms_context
+from learning_unit.tests.factories.central_manager import CentralManagerFactory
+from learning_unit.tests.factories.learning_class_year import LearningClassYearFactory
+from osis_role.contrib.permissions import ObjectPermissionBackend, _test_rule, has_perms_bulk
 
 
+@override_settings(PERMISSION_RESULT_CACHE_ENABLED=True)
 class TestObjectPermissionBackend(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -92,7 +97,130 @@ class TestObjectPermissionBackend(TestCase):
         self.assertTrue(self.auth_class.has_perm(self.person.user, perm))
 
 
-class TestAddRoleQuerysetToRuleSet(TestCase):
+    @mock.patch('django.db.models.QuerySet.exists', return_value=True)
+    def test_role_queryset_is_built_once_per_user(self, mock_queryset_exists):
+        self.person.user.groups.add(self.group)
+
+        self.auth_class.has_perm(self.person.user, 'perm_allowed')
+        self.auth_class.has_perm(self.person.user, 'perm_denied')
+
+        self.assertEqual(self.mock_role_model.objects.filter.call_count, 1)
+
+    def test_result_is_cached_per_perm_and_object(self):
+        self.person.user.groups.add(self.group)
+        objects_tested = []
+
+        @rules.predicate
+        def record_object_tested(user, obj):
+            objects_tested.append(obj)
+            return True
+        self.mock_role_model.rule_set.return_value.add_rule('perm_recorded', record_object_tested)
+
+        other_person = PersonFactory()
+        for _ in range(3):
+            self.assertTrue(self.auth_class.has_perm(self.person.user, 'perm_recorded', self.person))
+            self.assertTrue(self.auth_class.has_perm(self.person.user, 'perm_recorded', other_person))
+
+        self.assertListEqual(objects_tested, [self.person, other_person])
+
+    def test_result_is_recomputed_after_a_save(self):
+        self.person.user.groups.add(self.group)
+        allowed = [True]
+
+        @rules.predicate
+        def is_allowed(user, obj):
+            return allowed[0]
+        self.mock_role_model.rule_set.return_value.add_rule('perm_switched', is_allowed)
+
+        self.assertTrue(self.auth_class.has_perm(self.person.user, 'perm_switched', self.person))
+        allowed[0] = False
+        self.assertTrue(self.auth_class.has_perm(self.person.user, 'perm_switched', self.person))
+
+        self.person.save()
+        self.assertFalse(self.auth_class.has_perm(self.person.user, 'perm_switched', self.person))
+
+    @override_settings(PERMISSION_RESULT_CACHE_ENABLED=False)
+    def test_result_is_not_cached_when_disabled(self):
+        self.person.user.groups.add(self.group)
+        objects_tested = []
+
+        @rules.predicate
+        def record_object_tested(user, obj):
+            objects_tested.append(obj)
+            return True
+        self.mock_role_model.rule_set.return_value.add_rule('perm_recorded', record_object_tested)
+
+        for _ in range(2):
+            self.auth_class.has_perm(self.person.user, 'perm_recorded', self.person)
+
+        self.assertListEqual(objects_tested, [self.person, self.person])
+
+
+@override_settings(PERMISSION_RESULT_CACHE_ENABLED=True)
+class TestHasPermsBulk(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group, _ = Group.objects.get_or_create(name="concrete_role")
+        cls.person = PersonFactory()
+        cls.person.user.groups.add(cls.group)
+        cls.objects = [PersonFactory() for _ in range(5)]
+
+    def setUp(self):
+        self.mock_role_model = mock.Mock()
+        type(self.mock_role_model).group_name = mock.PropertyMock(return_value=self.group.name)
+        self.mock_role_model.rule_set = mock.Mock(return_value=rules.RuleSet({
+            'perm_odd_pk': rules.predicate(lambda user, obj: obj.pk % 2 == 1),
+        }))
+        patcher_role_manager = mock.patch("osis_role.role.role_manager", **{'roles': {self.mock_role_model}})
+        patcher_role_manager.start()
+        self.addCleanup(patcher_role_manager.stop)
+
+    def test_should_return_permission_by_object(self):
+        result = has_perms_bulk(self.person.user, 'perm_odd_pk', self.objects)
+        self.assertDictEqual(result, {obj: obj.pk % 2 == 1 for obj in self.objects})
+
+    def test_should_not_have_perms_when_user_is_inactive(self):
+        self.person.user.is_active = False
+        result = has_perms_bulk(self.person.user, 'perm_odd_pk', self.objects)
+        self.assertFalse(any(result.values()))
+
+    def test_role_queryset_is_fetched_once_for_all_objects(self):
+        has_perms_bulk(self.person.user, 'perm_odd_pk', self.objects)
+        self.assertEqual(self.mock_role_model.objects.filter.call_count, 1)
+
+    @mock.patch('django.contrib.auth.models.User.has_perm')
+    def test_should_evaluate_rules_without_checking_each_object_through_backends(self, mock_has_perm):
+        has_perms_bulk(self.person.user, 'perm_odd_pk', self.objects)
+        self.assertFalse(mock_has_perm.called)
+
+
+class TestHasPermsBulkQueries(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.central_manager = CentralManagerFactory()
+        cls.learning_class_years = [LearningClassYearFactory() for _ in range(10)]
+
+    def test_should_run_the_same_number_of_queries_whatever_the_number_of_objects(self):
+        perm = 'learning_unit.view_learningclassyear'
+        with CaptureQueriesContext(connection) as one_object_queries:
+            result = has_perms_bulk(self._get_fresh_user(), perm, self.learning_class_years[:1])
+        self.assertTrue(all(result.values()))
+
+        with self.assertNumQueries(len(one_object_queries)):
+            result = has_perms_bulk(self._get_fresh_user(), perm, self.learning_class_years)
+        self.assertEqual(len(result), 10)
+        self.assertTrue(all(result.values()))
+
+    def _get_fresh_user(self):
+        return models.User.objects.select_related('person').get(pk=self.central_manager.person.user.pk)
+
+
+class TestTestRule(TestCase):
+    def setUp(self):
+        self.rule_set = RuleSet()
+        self.role_mdl = mock.Mock()
+        self.role_mdl.rule_set = mock.Mock(return_value=self.rule_set)
+
     def test_ensure_cache_role_queryset_is_added_to_perms_context(self):
         @rules.predicate(bind=True, name='ensure_role_qs_exist')
         def ensure_role_qs_exist_fn(self, *args, **kwargs):
@@ -100,12 +228,8 @@ class TestAddRoleQuerysetToRuleSet(TestCase):
                 raise Exception
             return True
 
-        qs = QuerySet()
-        rule_set = RuleSet()
-        rule_set.add_rule('perm_allowed', ensure_role_qs_exist_fn)
-
-        _add_role_queryset_to_perms_context(rule_set, 'perm_allowed', qs)
-        self.assertTrue(rule_set.test_rule('perm_allowed', UserFactory()))
+        self.rule_set.add_rule('perm_allowed', ensure_role_qs_exist_fn)
+        self.assertTrue(_test_rule(self.role_mdl, 'perm_allowed', QuerySet(), UserFactory()))
 
     def test_ensure_perm_name_is_added_to_perms_context(self):
         @rules.predicate(bind=True, name='ensure_role_qs_exist')
@@ -114,10 +238,18 @@ class TestAddRoleQuerysetToRuleSet(TestCase):
                 raise Exception
             return True
 
-        rule_set = RuleSet()
-        rule_set.add_rule('perm_allowed', ensure_perm_name_exist_fn)
-        _add_role_queryset_to_perms_context(rule_set, 'perm_allowed', QuerySet())
-        self.assertTrue(rule_set.test_rule('perm_allowed', UserFactory()))
+        self.rule_set.add_rule('perm_allowed', ensure_perm_name_exist_fn)
+        self.assertTrue(_test_rule(self.role_mdl, 'perm_allowed', QuerySet(), UserFactory()))
+
+    def test_ensure_rule_set_is_not_modified(self):
+        self.rule_set.add_rule('perm_allowed', rules.always_allow)
+        user = UserFactory()
+
+        for _ in range(10):
+            _test_rule(self.role_mdl, 'perm_allowed', QuerySet(), user)
+
+        self.assertIs(self.rule_set['perm_allowed'], rules.always_allow)
+        self.assertEqual(self.role_mdl.rule_set.call_count, 1)
 
 
 class TestHasModulePerms(TestCase):
@@ -169,6 +169,17 @@ class TestHasPermTag(SimpleTestCase):
         mock_rules_has_perm.assert_called_once_with("dummy-perm", self.user, self.obj)
 
 
+class TestHasPermsBulkTag(SimpleTestCase):
+    def setUp(self):
+        self.user = UserFactory.build()
+        self.objects = [UserFactory.build(), UserFactory.build()]
+
+    @mock.patch('osis_role.contrib.permissions.has_perms_bulk')
+    def test_ensure_has_perms_bulk_tag_call_has_perms_bulk(self, mock_has_perms_bulk):
+        osis_role.has_perms_bulk("dummy-perm", self.user, self.objects)
+        mock_has_perms_bulk.assert_called_once_with(self.user, "dummy-perm", self.objects)
+
+
 class TestHasModulePermsTag(SimpleTestCase):
     def setUp(self):
         self.user = UserFactory.build()
@@ -151,14 +151,15 @@ def _build_excel_lines(tree: 'ProgramTree') -> List:
                 mandatory_status=mandatory_status if mandatory_status else '',
             )
         )
-        for group_number, group in enumerate(tree.get_prerequisite(node).prerequisite_item_groups, start=1):
+        prerequisite = tree.get_prerequisite(node)
+        for group_number, group in enumerate(prerequisite.prerequisite_item_groups, start=1):
             for position, prerequisite_item in enumerate(group.prerequisite_items, start=1):
                 prerequisite_item_links = tree.search_links_using_node(
                     tree.get_node_by_code_and_year(code=prerequisite_item.code, year=prerequisite_item.year)
                 )
                 prerequisite_line = _prerequisite_item_line(tree,
                                                             prerequisite_item, prerequisite_item_links,
-                                                            tree.get_prerequisite(node), group_number, position,
+                                                            prerequisite, group_number, position,
                                                             len(group.prerequisite_items))
                 content.append(prerequisite_line)
 
@@ -350,17 +351,17 @@ def _build_excel_lines_prerequisited(tree: 'ProgramTree') -> List:
         )
     )
     for child_node in tree.get_nodes_that_are_prerequisites():
-        if tree.is_prerequisite(child_node):
+        is_prerequisite_of = tree.search_is_prerequisite_of(child_node)
+        if is_prerequisite_of:
             credits = set()
             blocks = set()
             mandatory_status = None
-            for prerequisite_node in tree.search_is_prerequisite_of(child_node):
-                if child_node.year == prerequisite_node.year:
-                    for link in tree.search_links_using_node(child_node):
-                        blocks.add(str(link.block))
-                        credits.add(link.relative_credits_repr)
-                        if mandatory_status is None:
-                            mandatory_status = _("Yes") if link.is_mandatory else _("No")
+            if any(child_node.year == prerequisite_node.year for prerequisite_node in is_prerequisite_of):
+                for link in tree.search_links_using_node(child_node):
+                    blocks.add(str(link.block))
+                    credits.add(link.relative_credits_repr)
+                    if mandatory_status is None:
+                        mandatory_status = _("Yes") if link.is_mandatory else _("No")
 
             content.append(
                 LearningUnitYearLinePrerequisiteOf(
@@ -374,7 +375,7 @@ def _build_excel_lines_prerequisited(tree: 'ProgramTree') -> List:
             )
 
             first = True
-            for prerequisite_node in tree.search_is_prerequisite_of(child_node):
+            for prerequisite_node in is_prerequisite_of:
                 if child_node.year == prerequisite_node.year:
                     prerequisite_line = _build_is_prerequisite_for_line(
                         prerequisite_node,
@@ -23,7 +23,7 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
-from typing import List, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 from django.utils.translation import gettext_lazy as _, pgettext_lazy
 from openpyxl.styles import Font
@@ -34,14 +34,21 @@ from base.models.enums.publication_contact_type import PublicationContactType
 from base.utils.excel import get_html_to_text
 from education_group.ddd import command
 from education_group.ddd.domain._funding import Funding
-from education_group.ddd.domain.mini_training import MiniTraining
-from education_group.ddd.domain.training import Training
+from education_group.ddd.domain.exception import GroupNotFoundException, MiniTrainingNotFoundException, \
+    TrainingNotFoundException
+from education_group.ddd.domain.group import GroupIdentity
+from education_group.ddd.domain.mini_training import MiniTraining, MiniTrainingIdentity
+from education_group.ddd.domain.training import Training, TrainingIdentity
+from education_group.ddd.repository.group import GroupRepository
+from education_group.ddd.repository.mini_training import MiniTrainingRepository
+from education_group.ddd.repository.training import TrainingRepository
 from education_group.ddd.service.read import get_group_service, get_training_service, get_mini_training_service
 from education_group.models.group_year import GroupYear
 from education_group.views import serializers
 from osis_common.document import xls_build
 from program_management.ddd.domain import exception
 from program_management.ddd.domain.node import NodeIdentity
+from program_management.ddd.domain.program_tree import ProgramTreeIdentity
 from program_management.ddd.domain.service.identity_search import ProgramTreeVersionIdentitySearch
 from program_management.ddd.repositories.program_tree_version import ProgramTreeVersionRepository
 
@@ -145,22 +152,55 @@ def create_customized_xls(user, found_education_groups_param, filters, order_dat
 def prepare_xls_content_with_parameters(found_education_groups: List[GroupYear], other_params: List['str']) -> List:
     if WITH_ORGANIZATION in other_params and WITH_ACTIVITIES in other_params:
         other_params.remove(WITH_ACTIVITIES)
-    return [extract_xls_data_from_education_group_with_parameters(eg, other_params) for eg in found_education_groups]
+    found_education_groups = list(found_education_groups)
+
+    groups = _search_groups(found_education_groups)
+    trainings = _search_trainings(groups.values())
+    mini_trainings = _search_mini_trainings(groups.values())
+    current_versions = _search_current_versions(found_education_groups)
+    contacts = {}
+    if WITH_RESPONSIBLES_AND_CONTACTS in other_params:
+        contacts = serializers.general_information.get_contacts_by_group(
+            [group for group in groups.values() if group.is_training()]
+        )
+
+    data = []
+    for group_year in found_education_groups:
+        year = group_year.academic_year.year
+        group = _get_from(groups, GroupIdentity(code=group_year.partial_acronym, year=year), GroupNotFoundException)
+        training = None
+        mini_training = None
+        if group.is_training():
+            training = _get_from(
+                trainings, TrainingIdentity(acronym=group_year.acronym, year=year), TrainingNotFoundException
+            )
+        elif group.is_mini_training():
+            mini_training = _get_from(
+                mini_trainings, MiniTrainingIdentity(acronym=group_year.acronym, year=year),
+                MiniTrainingNotFoundException
+            )
+        current_version = current_versions.get(ProgramTreeIdentity(code=group_year.partial_acronym, year=year))
+        data.append(
+            _build_xls_data(
+                group_year, other_params, group, training, mini_training, current_version, contacts.get(group.entity_id)
+            )
+        )
+    return data
 
 
 def extract_xls_data_from_education_group_with_parameters(group_year: GroupYear, other_params: List['str']) -> List:
-    offer = None
     training = None
     mini_training = None
+    contacts = None
 
     group = _get_group(group_year.academic_year.year, group_year.partial_acronym)
 
     if group.is_training():
-        offer = _get_training(group_year.academic_year.year, group_year.acronym)
-        training = offer
+        training = _get_training(group_year.academic_year.year, group_year.acronym)
+        if WITH_RESPONSIBLES_AND_CONTACTS in other_params:
+            contacts = serializers.general_information.get_contacts(group)
     elif group.is_mini_training():
         mini_training = _get_mini_training(group_year.academic_year.year, group_year.acronym)
-        offer = mini_training
 
     node_identity = NodeIdentity(code=group_year.partial_acronym, year=group_year.academic_year.year)
     program_tree_version_identity = ProgramTreeVersionIdentitySearch().get_from_node_identity(node_identity)
@@ -169,6 +209,74 @@ def extract_xls_data_from_education_group_with_parameters(group_year: GroupYear,
     except exception.ProgramTreeVersionNotFoundException:
         current_version = None
 
+    return _build_xls_data(group_year, other_params, group, training, mini_training, current_version, contacts)
+
+
+def _search_groups(group_years: List[GroupYear]) -> Dict['GroupIdentity', 'Group']:
+    if not group_years:
+        return {}
+    entity_ids = [
+        GroupIdentity(code=group_year.partial_acronym, year=group_year.academic_year.year)
+        for group_year in group_years
+    ]
+    return {group.entity_id: group for group in GroupRepository.search(entity_ids=entity_ids)}
+
+
+def _search_trainings(groups: Iterable['Group']) -> Dict['TrainingIdentity', 'Training']:
+    entity_ids = [TrainingIdentity(acronym=group.abbreviated_title, year=group.year)
+                  for group in groups if group.is_training()]
+    if not entity_ids:
+        return {}
+    return {training.entity_id: training for training in TrainingRepository.search(entity_ids=entity_ids)}
+
+
+def _search_mini_trainings(groups: Iterable['Group']) -> Dict['MiniTrainingIdentity', 'MiniTraining']:
+    entity_ids = [MiniTrainingIdentity(acronym=group.abbreviated_title, year=group.year)
+                  for group in groups if group.is_mini_training()]
+    return {
+        mini_training.entity_id: mini_training
+        for mini_training in MiniTrainingRepository.search(entity_ids=entity_ids)
+    }
+
+
+def _search_current_versions(group_years: List[GroupYear]) -> Dict['ProgramTreeIdentity', 'ProgramTreeVersion']:
+    node_identities = [
+        NodeIdentity(code=group_year.partial_acronym, year=group_year.academic_year.year)
+        for group_year in group_years
+    ]
+    try:
+        tree_version_identities = [
+            identity for identity in ProgramTreeVersionIdentitySearch().get_from_node_identities(node_identities)
+            if identity.offer_acronym
+        ]
+    except exception.ProgramTreeVersionNotFoundException:
+        tree_version_identities = []
+    if not tree_version_identities:
+        return {}
+    return {
+        tree_version.program_tree_identity: tree_version
+        for tree_version in ProgramTreeVersionRepository.search(entity_ids=tree_version_identities)
+    }
+
+
+def _get_from(entities_by_identity: Dict, identity, not_found_exception):
+    try:
+        return entities_by_identity[identity]
+    except KeyError:
+        raise not_found_exception
+
+
+def _build_xls_data(
+        group_year: GroupYear,
+        other_params: List['str'],
+        group: 'Group',
+        training: Optional['Training'],
+        mini_training: Optional['MiniTraining'],
+        current_version: Optional['ProgramTreeVersion'],
+        contacts: Optional[dict]
+) -> List:
+    offer = training or mini_training
+
     data = [
         group_year.academic_year.name,
         group_year.complete_title_fr,
@@ -198,7 +306,7 @@ def extract_xls_data_from_education_group_with_parameters(group_year: GroupYear,
 
     if WITH_RESPONSIBLES_AND_CONTACTS in other_params:
         if training:
-            data.append(_get_responsibles_and_contacts(group))
+            data.append(_build_responsibles_and_contacts(contacts or {}))
         else:
             data.extend(_add_empty_characters(len(PARAMETER_HEADERS[WITH_RESPONSIBLES_AND_CONTACTS])))
 
@@ -360,9 +468,12 @@ def management_entity(training: 'Training', group: 'Group', current_version: 'Pr
 
 
 def _get_responsibles_and_contacts(group: 'Group') -> str:
+    return _build_responsibles_and_contacts(serializers.general_information.get_contacts(group))
+
+
+def _build_responsibles_and_contacts(contacts: dict) -> str:
     responsibles_and_contacts = ''
 
-    contacts = serializers.general_information.get_contacts(group)
     academic_responsibles = contacts.get(PublicationContactType.ACADEMIC_RESPONSIBLE.name) or []
     other_academic_responsibles = contacts.get(PublicationContactType.OTHER_ACADEMIC_RESPONSIBLE.name) or []
     jury_members = contacts.get(PublicationContactType.JURY_MEMBER.name) or []
@@ -691,9 +691,9 @@ class GetReportCommand(interface.CommandRequest):
 
 @attr.s(frozen=True, slots=True)
 class PostponeProgramTreesUntilNPlus6Command(interface.CommandRequest):
-    pass
+    codes = attr.ib(type=Optional[List[str]], default=None)
 
 
 @attr.s(frozen=True, slots=True)
 class PostponeProgramTreeVersionsUntilNPlus6Command(interface.CommandRequest):
-    pass
+    offer_acronyms = attr.ib(type=Optional[List[str]], default=None)
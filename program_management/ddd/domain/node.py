@@ -24,7 +24,8 @@
 #
 ##############################################################################
 import collections
-from typing import List, Set, Optional, Iterator, Tuple, Generator, Dict
+import weakref
+from typing import List, Set, Optional, Iterator, Tuple, Generator, Dict, Iterable
 
 import attr
 from _decimal import Decimal
@@ -53,6 +54,63 @@ from program_management.ddd.domain.service.validation_rule import FieldValidatio
 from program_management.models.enums.node_type import NodeType
 
 
+class _ChildrenList(list):
+    """
+    Links of the children of a node. The node is notified each time a link is added or removed, even when the list
+    is modified directly (node.children.append(...)).
+    """
+    __slots__ = ('node',)
+
+    def __init__(self, node: 'Node', links: Iterable['Link'] = ()):
+        super().__init__(links)
+        self.node = node
+
+    def __reduce__(self):
+        # Pickled (ex: program tree cache) as a plain list : Node.children wraps it again when accessed
+        return list, (list(self),)
+
+    def _notify(self):
+        self.node.notify_structure_changed()
+
+    def append(self, link: 'Link') -> None:
+        super().append(link)
+        self._notify()
+
+    def extend(self, links: Iterable['Link']) -> None:
+        super().extend(links)
+        self._notify()
+
+    def insert(self, index: int, link: 'Link') -> None:
+        super().insert(index, link)
+        self._notify()
+
+    def remove(self, link: 'Link') -> None:
+        super().remove(link)
+        self._notify()
+
+    def pop(self, *args) -> 'Link':
+        link = super().pop(*args)
+        self._notify()
+        return link
+
+    def clear(self) -> None:
+        super().clear()
+        self._notify()
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._notify()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._notify()
+
+    def __iadd__(self, links: Iterable['Link']) -> '_ChildrenList':
+        super().__iadd__(links)
+        self._notify()
+        return self
+
+
 class NodeFactory:
 
     @classmethod
@@ -211,6 +269,7 @@ class Node(interface.Entity):
     _academic_year = None
     _has_changed = False
     _is_copied = False  # FIXME dirty solution to fix create or copy node on repo
+    _structure_observers = None  # Neither copied by attr.evolve nor pickled : copies of the node are not observed
 
     @entity_id.default
     def _entity_id(self) -> NodeIdentity:
@@ -235,12 +294,28 @@ class Node(interface.Entity):
 
     @property
     def children(self) -> List['Link']:
+        if type(self._children) is not _ChildrenList:
+            self._children = _ChildrenList(self, self._children)
         self._children.sort(key=lambda link_obj: link_obj.order or 0)
         return self._children
 
     @children.setter
     def children(self, new_children: List['Link']):
-        self._children = new_children
+        self._children = _ChildrenList(self, new_children)
+        self.notify_structure_changed()
+
+    def observe_structure(self, observer) -> None:
+        """
+        Register an object (ex: the index of a tree using this node) whose structure_changed() method must be called
+        when children are added to or removed from this node
+        """
+        if self._structure_observers is None:
+            self._structure_observers = weakref.WeakSet()
+        self._structure_observers.add(observer)
+
+    def notify_structure_changed(self) -> None:
+        for observer in list(self._structure_observers or []):
+            observer.structure_changed()
 
     def is_training_formation_root(self) -> bool:
         return (self.is_training() and not self.is_finality()) or (self.is_mini_training() and not self.is_option())
@@ -459,7 +534,7 @@ class Node(interface.Entity):
     def add_child(self, node: 'Node', **link_attrs) -> 'Link':
         max_order = max((child.order for child in self.children), default=-1)
         child = link_factory.get_link(parent=self, child=node, order=max_order + 1, **link_attrs)
-        self._children.append(child)
+        self.children.append(child)
         child._has_changed = True
         return child
 
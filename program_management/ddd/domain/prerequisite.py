@@ -25,7 +25,7 @@
 ##############################################################################
 import contextlib
 import re
-from typing import List, Dict
+from typing import List, Dict, Optional, Set
 
 import attr
 from django.utils.translation import gettext as _
@@ -33,7 +33,6 @@ from django.utils.translation import gettext as _
 from base.models import learning_unit
 from base.models.enums import prerequisite_operator
 from base.models.enums.prerequisite_operator import OR, AND
-from base.utils.cache import cached_result
 from osis_common.ddd import interface
 from program_management.ddd.business_types import *
 from program_management.ddd.domain.exception import CannotCopyPrerequisiteException
@@ -230,8 +229,17 @@ class PrerequisiteFactory:
 
     @classmethod
     def _detect_main_operator_in_string(cls, prerequisite_string: PrerequisiteExpression) -> str:
-        if re.match(MULTIPLE_PREREQUISITES_REGEX_OR, prerequisite_string):
-            return OR
+        # The main operator is the first one found outside of the parenthesis
+        depth = 0
+        for position, character in enumerate(prerequisite_string):
+            if character == '(':
+                depth += 1
+            elif character == ')':
+                depth -= 1
+            elif depth == 0 and prerequisite_string.startswith(' OU ', position):
+                return OR
+            elif depth == 0 and prerequisite_string.startswith(' ET ', position):
+                return AND
         return AND
 
     @classmethod
@@ -267,21 +275,76 @@ class PrerequisiteFactory:
                 )
             raise CannotCopyPrerequisiteException()
 
-        return cls().from_expression(
-            cls._normalize_expression(to_copy.get_prerequisite_expression(translate=False)),
-            node_having_prerequisite_identity,
-            to_tree.entity_id
+        if not to_copy:
+            return NullPrerequisite(to_tree.entity_id, node_having_prerequisite_identity)
+        result = Prerequisite(
+            main_operator=to_copy.main_operator,
+            context_tree=to_tree.entity_id,
+            node_having_prerequisites=node_having_prerequisite_identity,
+            prerequisite_item_groups=[
+                PrerequisiteItemGroup(
+                    group.operator,
+                    [PrerequisiteItem(item.code, to_tree.entity_id.year) for item in group.prerequisite_items]
+                ) for group in to_copy.prerequisite_item_groups
+            ]
         )
-
-    # FIX: Because the expression varies with translation
-    @classmethod
-    def _normalize_expression(cls, prerequisite_expression: str) -> str:
-        return prerequisite_expression.replace(' AND ', ' ET ').replace(' OR ', ' OU ')
+        result.has_changed = True
+        return result
 
 
 factory = PrerequisiteFactory()
 
 
+class PrerequisiteGraph:
+    """
+    Prerequisites of a tree indexed by node identity : the prerequisite of each node (forward) and the nodes
+    having each node as prerequisite item (reverse).
+    """
+
+    def __init__(self, prerequisites: List['Prerequisite']):
+        self.prerequisites = prerequisites
+        self.prerequisite_by_node = {}  # type: Dict[NodeIdentity, Prerequisite]
+        self.is_prerequisite_of = {}  # type: Dict[NodeIdentity, Set[NodeIdentity]]
+        for prerequisite in prerequisites:
+            self.add(prerequisite)
+        self.size = len(prerequisites)
+
+    def is_up_to_date(self, prerequisites: List['Prerequisite']) -> bool:
+        return self.prerequisites is prerequisites and self.size == len(prerequisites)
+
+    def add(self, prerequisite: 'Prerequisite') -> None:
+        node_having_prerequisites = prerequisite.node_having_prerequisites
+        self.remove(node_having_prerequisites)
+        self.prerequisite_by_node[node_having_prerequisites] = prerequisite
+        for prerequisite_item in prerequisite.get_all_prerequisite_items():
+            item_identity = NodeIdentity(code=prerequisite_item.code, year=prerequisite_item.year)
+            self.is_prerequisite_of.setdefault(item_identity, set()).add(node_having_prerequisites)
+        self.size = len(self.prerequisites)
+
+    def remove(self, node_having_prerequisites: 'NodeIdentity') -> None:
+        previous_prerequisite = self.prerequisite_by_node.pop(node_having_prerequisites, None)
+        if previous_prerequisite is None:
+            return
+        for prerequisite_item in previous_prerequisite.get_all_prerequisite_items():
+            item_identity = NodeIdentity(code=prerequisite_item.code, year=prerequisite_item.year)
+            nodes_having_prerequisites = self.is_prerequisite_of.get(item_identity, set())
+            nodes_having_prerequisites.discard(node_having_prerequisites)
+            if not nodes_having_prerequisites:
+                self.is_prerequisite_of.pop(item_identity, None)
+
+    def get_nodes_having_prerequisites(self) -> List['NodeIdentity']:
+        return [node_identity for node_identity, prerequisite in self.prerequisite_by_node.items() if prerequisite]
+
+    def get_nodes_being_prerequisites(self) -> List['NodeIdentity']:
+        return list(self.is_prerequisite_of.keys())
+
+    def search_is_prerequisite_of(self, node_identity: 'NodeIdentity') -> List['NodeIdentity']:
+        return sorted(
+            self.is_prerequisite_of.get(node_identity) or [],
+            key=lambda node_having_prerequisites: node_having_prerequisites.code
+        )
+
+
 class PrerequisitesBuilder:
     def copy_to_tree(self, from_prerequisites: 'Prerequisites', to_tree: 'ProgramTree') -> 'Prerequisites':
         copy_prerequisites = list()
@@ -298,17 +361,34 @@ class Prerequisites(interface.RootEntity):
     context_tree = attr.ib(type='ProgramTreeIdentity')
     prerequisites = attr.ib(type=List[Prerequisite], factory=list)
 
+    # Built lazily and updated by set_prerequisite
+    _graph = attr.ib(type=Optional[PrerequisiteGraph], default=None, init=False, repr=False, eq=False)
+
+    def _get_graph(self) -> 'PrerequisiteGraph':
+        if self._graph is None or not self._graph.is_up_to_date(self.prerequisites):
+            self._graph = PrerequisiteGraph(self.prerequisites)
+        return self._graph
+
+    def _reset_graph(self) -> None:
+        self._graph = None
+
     def has_prerequisites(self, node: 'NodeLearningUnitYear') -> bool:
         return bool(self.get_prerequisite(node))
 
     def is_prerequisite(self, node: 'NodeLearningUnitYear') -> bool:
-        return bool(self.search_is_prerequisite_of(node))
+        return node.entity_id in self._get_graph().is_prerequisite_of
 
     def search_is_prerequisite_of(self, search_from_node: 'NodeLearningUnitYear') -> List['NodeIdentity']:
-        return self.__map_is_prerequisite_of().get(search_from_node.entity_id) or []
+        return self._get_graph().search_is_prerequisite_of(search_from_node.entity_id)
 
     def get_prerequisite(self, node: 'NodeLearningUnitYear') -> 'Prerequisite':
-        return self._map_node_identity_prerequisite().get(node.entity_id)
+        return self._get_graph().prerequisite_by_node.get(node.entity_id)
+
+    def get_nodes_having_prerequisites(self) -> List['NodeIdentity']:
+        return self._get_graph().get_nodes_having_prerequisites()
+
+    def get_nodes_being_prerequisites(self) -> List['NodeIdentity']:
+        return self._get_graph().get_nodes_being_prerequisites()
 
     def set_prerequisite(
             self,
@@ -328,9 +408,12 @@ class Prerequisites(interface.RootEntity):
                 context_tree=context_tree.entity_id
             )
             new_prerequisite.has_changed = True
-            if new_prerequisite in self.prerequisites:
-                self.prerequisites.remove(new_prerequisite)
+            graph = self._get_graph()
+            previous_prerequisite = graph.prerequisite_by_node.get(new_prerequisite.node_having_prerequisites)
+            if previous_prerequisite is not None:
+                self.prerequisites.remove(previous_prerequisite)
             self.prerequisites.append(new_prerequisite)
+            graph.add(new_prerequisite)
         return messages
 
     @staticmethod
@@ -346,25 +429,6 @@ class Prerequisites(interface.RootEntity):
         )
         return validator.is_valid(), validator.messages
 
-    @cached_result
-    def __map_is_prerequisite_of(self) -> Dict['NodeIdentity', List['NodeIdentity']]:
-        from program_management.ddd.domain.service.identity_search import NodeIdentitySearch
-        result = {}
-        for prerequisite in self.prerequisites:
-            node_having_prerequisites = prerequisite.node_having_prerequisites
-            for prereq_item in prerequisite.get_all_prerequisite_items():
-                prereq_item_as_node_identity = NodeIdentitySearch().get_from_prerequisite_item(prereq_item)
-                result.setdefault(prereq_item_as_node_identity, set()).add(node_having_prerequisites)
-        result = {
-            node_is_prerequisite: sorted(nodes_having_prerequisites, key=lambda node_identity: node_identity.code)
-            for node_is_prerequisite, nodes_having_prerequisites in result.items()
-        }
-        return result
-
-    @cached_result
-    def _map_node_identity_prerequisite(self) -> Dict['NodeIdentity', 'Prerequisite']:
-        return {p.node_having_prerequisites: p for p in self.prerequisites}
-
 
 @attr.s(slots=True)
 class NullPrerequisites(Prerequisites):
@@ -35,14 +35,13 @@ from base.ddd.utils.converters import to_upper_case_converter
 from base.models.authorized_relationship import AuthorizedRelationshipList
 from base.models.enums.education_group_types import EducationGroupTypesEnum, TrainingType, GroupType
 from base.models.enums.link_type import LinkTypes
-from base.utils.cache import cached_result
 from education_group.ddd.business_types import *
 from osis_common.ddd import interface
 from program_management.ddd import command
 from program_management.ddd.business_types import *
 from program_management.ddd.command import DO_NOT_OVERRIDE, UpdateLinkCommand
 from program_management.ddd.domain import exception, report_events
-from program_management.ddd.domain.link import factory as link_factory, LinkBuilder
+from program_management.ddd.domain.link import factory as link_factory, LinkBuilder, LinkIdentity
 from program_management.ddd.domain.node import factory as node_factory, NodeIdentity, Node, NodeNotFoundException
 from program_management.ddd.domain.prerequisite import Prerequisites, \
     PrerequisitesBuilder
@@ -160,7 +159,7 @@ class ProgramTreeBuilder:
             if child_current_year.node_type in mandatory_types and \
                     child_current_year.node_type not in next_year_tree_direct_children_types:
                 child_next_year = node_factory.copy_to_next_year(child_current_year)
-                root_next_year.add_child(child_next_year, is_mandatory=True)
+                program_tree_next_year.add_child_to_node(root_next_year, child_next_year, is_mandatory=True)
         return program_tree_next_year
 
     def copy_prerequisites_from_program_tree(self, from_tree: 'ProgramTree', to_tree: 'ProgramTree') -> 'ProgramTree':
@@ -488,11 +487,91 @@ class ProgramTreeBuilder:
         root_node = program_tree.root_node
         for child_type in program_tree.get_ordered_mandatory_children_types(program_tree.root_node):
             child = node_factory.generate_from_parent(parent_node=root_node, child_type=child_type)
-            root_node.add_child(child, is_mandatory=True)
+            program_tree.add_child_to_node(root_node, child, is_mandatory=True)
             children.append(child)
         return children
 
 
+class _ProgramTreeIndex:
+    """
+    Lookup tables of the nodes, links and paths of a tree, built in a single pass from the root node.
+    A link (and its whole subtree) is registered once per path where its parent is used, like _links_from_root.
+    The index observes the nodes of the tree : it becomes outdated as soon as children are added to or removed from
+    one of them, except through add_link/remove_link which update it in place.
+    """
+
+    def __init__(self, root_node: 'Node'):
+        self.root_node = root_node
+        self.is_outdated = False
+        root_node.observe_structure(self)
+        self.nodes_by_identity = {root_node.entity_id: root_node}  # type: Dict[NodeIdentity, Node]
+        self.nodes_by_path = {str(root_node.pk): root_node}  # type: Dict[Path, Node]
+        self.paths_by_node = collections.defaultdict(list)  # type: Dict[Node, List[Path]]
+        self.links_by_child = collections.defaultdict(list)  # type: Dict[Node, List[Link]]
+        self.links_by_identity = {}  # type: Dict[LinkIdentity, Link]
+        self._all_links = None  # type: Optional[List[Link]]
+        for link in root_node.children:
+            self._register_link(link, str(root_node.pk))
+
+    def is_up_to_date(self, root_node: 'Node') -> bool:
+        return self.root_node is root_node and not self.is_outdated
+
+    def structure_changed(self) -> None:
+        self.is_outdated = True
+
+    @property
+    def all_links(self) -> List['Link']:
+        if self._all_links is None:
+            self._all_links = _links_from_root(self.root_node)
+        return self._all_links
+
+    def search_paths_of_parent(self, parent_node: 'Node') -> List['Path']:
+        if parent_node == self.root_node:
+            return [str(self.root_node.pk)]
+        return list(self.paths_by_node.get(parent_node) or [])
+
+    def add_link(self, link: 'Link') -> None:
+        for parent_path in self.search_paths_of_parent(link.parent):
+            self._register_link(link, parent_path)
+        self._all_links = None
+        self.is_outdated = False
+
+    def remove_link(self, link: 'Link') -> None:
+        for parent_path in self.search_paths_of_parent(link.parent):
+            self._unregister_link(link, parent_path)
+        self._all_links = None
+        self.is_outdated = False
+
+    def _register_link(self, link: 'Link', parent_path: 'Path') -> None:
+        child_node = link.child
+        child_path = PATH_SEPARATOR.join((parent_path, str(child_node.pk)))
+        self.links_by_child[child_node].append(link)
+        self.paths_by_node[child_node].append(child_path)
+        self.nodes_by_identity.setdefault(child_node.entity_id, child_node)
+        self.nodes_by_path.setdefault(child_path, child_node)
+        self.links_by_identity.setdefault(link.entity_id, link)
+        child_node.observe_structure(self)
+        for child_link in child_node.children:
+            self._register_link(child_link, child_path)
+
+    def _unregister_link(self, link: 'Link', parent_path: 'Path') -> None:
+        child_node = link.child
+        child_path = PATH_SEPARATOR.join((parent_path, str(child_node.pk)))
+        for child_link in child_node.children:
+            self._unregister_link(child_link, child_path)
+
+        self.links_by_child[child_node].remove(link)
+        self.paths_by_node[child_node].remove(child_path)
+        if self.nodes_by_path.get(child_path) is child_node:
+            del self.nodes_by_path[child_path]
+        if link not in self.links_by_child[child_node]:
+            self.links_by_identity.pop(link.entity_id, None)
+        if not self.paths_by_node[child_node]:
+            del self.paths_by_node[child_node]
+            del self.links_by_child[child_node]
+            self.nodes_by_identity.pop(child_node.entity_id, None)
+
+
 @attr.s(slots=True, hash=False, eq=False)
 class ProgramTree(interface.RootEntity):
     root_node = attr.ib(type=Node)
@@ -501,10 +580,22 @@ class ProgramTree(interface.RootEntity):
     prerequisites = attr.ib(type='Prerequisites')
     report = attr.ib(type=Optional[Report], default=None)  # type: Report
 
+    # Built lazily and rebuilt when children of a node of the tree are modified outside of add_child_to_node and
+    # remove_child_from_node
+    _index = attr.ib(type=Optional[_ProgramTreeIndex], default=None, init=False, repr=False)
+
     @property
     def year(self) -> int:
         return self.entity_id.year
 
+    def _get_index(self) -> '_ProgramTreeIndex':
+        if self._index is None or not self._index.is_up_to_date(self.root_node):
+            self._index = _ProgramTreeIndex(self.root_node)
+        return self._index
+
+    def _reset_index(self) -> None:
+        self._index = None
+
     @prerequisites.default
     def _default_prerequisite(self) -> 'Prerequisites':
         from program_management.ddd.domain.prerequisite import NullPrerequisites
@@ -543,12 +634,12 @@ class ProgramTree(interface.RootEntity):
             return False
 
     def get_parents_node_with_respect_to_reference(self, parent_node: 'Node') -> List['Node']:
-        links = _links_from_root(self.root_node)
+        links_by_child = self._get_index().links_by_child
 
         def _get_parents(child_node: 'Node') -> List['Node']:
             result = []
-            reference_links = [link_obj for link_obj in links
-                               if link_obj.child == child_node and link_obj.is_reference()]
+            reference_links = [link_obj for link_obj in links_by_child.get(child_node, [])
+                               if link_obj.is_reference()]
             for link_obj in reference_links:
                 reference_parents = _get_parents(link_obj.parent)
                 if reference_parents:
@@ -557,8 +648,8 @@ class ProgramTree(interface.RootEntity):
                     result.append(link_obj.parent)
             return result
 
-        non_reference_links = [link_obj for link_obj in links
-                               if link_obj.child == parent_node and not link_obj.is_reference()]
+        non_reference_links = [link_obj for link_obj in links_by_child.get(parent_node, [])
+                               if not link_obj.is_reference()]
         if non_reference_links or self.root_node == parent_node:
             return [parent_node] + _get_parents(parent_node)
         return _get_parents(parent_node)
@@ -594,7 +685,7 @@ class ProgramTree(interface.RootEntity):
         ]
 
     def search_links_using_node(self, child_node: 'Node') -> List['Link']:
-        return [link_obj for link_obj in self.get_all_links() if link_obj.child == child_node]
+        return list(self._get_index().links_by_child.get(child_node) or [])
 
     def get_first_link_occurence_using_node(self, child_node: 'Node') -> 'Link':
         links = self.search_links_using_node(child_node)
@@ -608,19 +699,9 @@ class ProgramTree(interface.RootEntity):
         :return: Node
         """
 
-        def _get_node(root_node: 'Node', path: 'Path') -> 'Node':
-            direct_child_id, separator, remaining_path = path.partition(PATH_SEPARATOR)
-            direct_child = next(child for child in root_node.children_as_nodes if str(child.pk) == direct_child_id)
-
-            if not remaining_path:
-                return direct_child
-            return _get_node(direct_child, remaining_path)
-
         try:
-            if path == str(self.root_node.pk):
-                return self.root_node
-            return _get_node(self.root_node, path.split(PATH_SEPARATOR, maxsplit=1)[1])
-        except (StopIteration, IndexError):
+            return self._get_index().nodes_by_path[path]
+        except KeyError:
             raise NodeNotFoundException
 
     def get_node_by_code_and_year(self, code: str, year: int) -> 'Node':
@@ -630,20 +711,14 @@ class ProgramTree(interface.RootEntity):
         :param year: int
         :return: Node
         """
-        return next(
-            (
-                node for node in self.get_all_nodes()
-                if node.code == code and node.academic_year.year == year
-            ),
-            None
-        )
+        return self._get_index().nodes_by_identity.get(NodeIdentity(code=code, year=year))
 
     def get_all_nodes(self, types: Set[EducationGroupTypesEnum] = None) -> Set['Node']:
         """
         Return a flat set of all nodes present in the tree
         :return: list of Node
         """
-        all_nodes = set([self.root_node] + _nodes_from_root(self.root_node))
+        all_nodes = set(self._get_index().nodes_by_identity.values())
         if types:
             return set(n for n in all_nodes if n.node_type in types)
         return all_nodes
@@ -660,22 +735,21 @@ class ProgramTree(interface.RootEntity):
         return list(sorted(nodes_permitted, key=lambda n: n.code))
 
     def get_nodes_that_have_prerequisites(self) -> List['NodeLearningUnitYear']:
-        return list(
-            sorted(
-                (
-                    node_obj for node_obj in set(self.get_all_learning_unit_nodes())
-                    if self.has_prerequisites(node_obj)
-                ),
-                key=lambda node_obj: node_obj.code
-            )
-        )
+        return self._get_learning_unit_nodes_by_identities(self.prerequisites.get_nodes_having_prerequisites())
 
     def get_nodes_that_are_prerequisites(self) -> List['NodeLearningUnitYear']:  # TODO :: unit test
+        return self._get_learning_unit_nodes_by_identities(self.prerequisites.get_nodes_being_prerequisites())
+
+    def _get_learning_unit_nodes_by_identities(
+            self,
+            node_identities: List['NodeIdentity']
+    ) -> List['NodeLearningUnitYear']:
+        nodes_by_identity = self._get_index().nodes_by_identity
         return list(
             sorted(
                 (
-                    node_obj for node_obj in self.get_all_nodes()
-                    if node_obj.is_learning_unit() and self.is_prerequisite(node_obj)
+                    node_obj for node_obj in (nodes_by_identity.get(identity) for identity in node_identities)
+                    if node_obj is not None and node_obj.is_learning_unit()
                 ),
                 key=lambda node_obj: node_obj.code
             )
@@ -696,23 +770,19 @@ class ProgramTree(interface.RootEntity):
         return max(link_obj.block_max_value for link_obj in all_links)
 
     def get_all_links(self) -> List['Link']:
-        return _links_from_root(self.root_node)
-
-    def _links_mapped_by_child_and_parent(self) -> Dict:
-        return {
-            str(link.child.entity_id) + str(link.parent.entity_id): link
-            for link in self.get_all_links()
-        }
+        return list(self._get_index().all_links)
 
     def get_link(self, parent: 'Node', child: 'Node') -> 'Link':
-        my_map = self._links_mapped_by_child_and_parent()
-        return my_map.get(str(child.entity_id) + str(parent.entity_id))
+        link_id = LinkIdentity(
+            parent_code=parent.code,
+            child_code=child.code,
+            parent_year=parent.year,
+            child_year=child.year
+        )
+        return self.get_link_from_identity(link_id)
 
     def get_link_from_identity(self, link_id: 'LinkIdentity') -> Optional['Link']:
-        return next(
-            filter(lambda link: link.entity_id == link_id, self.get_all_links()),
-            None
-        )
+        return self._get_index().links_by_identity.get(link_id)
 
     def prune(self, ignore_children_from: Set[EducationGroupTypesEnum] = None) -> 'ProgramTree':
         copied_root_node = copy.deepcopy(self.root_node)
@@ -763,7 +833,8 @@ class ProgramTree(interface.RootEntity):
         )
         validator.validate()
 
-        return node_to_paste_to.add_child(
+        return self.add_child_to_node(
+            node_to_paste_to,
             node_to_paste,
             access_condition=paste_command.access_condition,
             is_mandatory=is_mandatory,
@@ -817,7 +888,19 @@ class ProgramTree(interface.RootEntity):
             prerequisite_repository
         ).validate()
 
-        return parent.detach_child(node_to_detach)
+        return self.remove_child_from_node(parent, node_to_detach)
+
+    def add_child_to_node(self, parent_node: 'Node', node_to_add: 'Node', **link_attrs) -> 'Link':
+        index = self._get_index()
+        link_created = parent_node.add_child(node_to_add, **link_attrs)
+        index.add_link(link_created)
+        return link_created
+
+    def remove_child_from_node(self, parent_node: 'Node', node_to_remove: 'Node') -> 'Link':
+        index = self._get_index()
+        link_removed = parent_node.detach_child(node_to_remove)
+        index.remove_link(link_removed)
+        return link_removed
 
     def __copy__(self) -> 'ProgramTree':
         return self.__deepcopy__(memodict={})
@@ -894,15 +977,8 @@ class ProgramTree(interface.RootEntity):
         ).validate()
         return link_updated
 
-    @cached_result
-    def _paths_by_node(self) -> Dict['Node', List['Path']]:
-        paths_by_node = collections.defaultdict(list)
-        for path, child_node in self.root_node.descendents:
-            paths_by_node[child_node].append(path)
-        return paths_by_node
-
     def search_paths_using_node(self, node: 'Node') -> List['Path']:
-        return self._paths_by_node().get(node) or []
+        return list(self._get_index().paths_by_node.get(node) or [])
 
     def search_indirect_parents(self, node: 'Node') -> List['NodeGroupYear']:
         paths = self.search_paths_using_node(node)
@@ -915,10 +991,10 @@ class ProgramTree(interface.RootEntity):
         return indirect_parents
 
     def contains(self, node: Node) -> bool:
-        return node in self.get_all_nodes()
+        return node.entity_id in self._get_index().nodes_by_identity
 
     def contains_identity(self, node_identity: 'NodeIdentity') -> bool:
-        return any(node for node in self.get_all_nodes() if node.entity_id == node_identity)
+        return node_identity in self._get_index().nodes_by_identity
 
     def get_all_prerequisites(self) -> List['Prerequisite']:
         return self.prerequisites.prerequisites
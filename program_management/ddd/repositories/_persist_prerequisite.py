@@ -25,6 +25,7 @@ from base.models import learning_unit_year, prerequisite_item, learning_unit
 from base.models import prerequisite as prerequisite_model
 from program_management.ddd.business_types import *
 from program_management.ddd.domain.node import NodeLearningUnitYear, NodeGroupYear
+from program_management.ddd.repositories import program_tree_cache
 from program_management.models.education_group_version import EducationGroupVersion
 from program_management.models.enums.node_type import NodeType
 
@@ -33,6 +34,8 @@ def persist(tree: 'ProgramTree'):
     prerequisites_changed = [prerequisite for prerequisite in tree.get_all_prerequisites() if prerequisite.has_changed]
     for prerequisite in prerequisites_changed:
         _persist(tree.root_node, prerequisite)
+    if prerequisites_changed:
+        program_tree_cache.invalidate_tree(tree.root_node.node_id)
 
 
 def _persist(
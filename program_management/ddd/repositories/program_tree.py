@@ -46,7 +46,7 @@ from program_management.ddd.domain.prerequisite import NullPrerequisites
 from program_management.ddd.repositories import _persist_prerequisite
 from program_management.ddd.repositories import load_node, load_authorized_relationship, \
     tree_prerequisites
-from program_management.ddd.repositories import persist_tree, node
+from program_management.ddd.repositories import persist_tree, node, program_tree_cache
 from program_management.models.element import Element
 
 # Typing
@@ -173,7 +173,7 @@ class ProgramTreeRepository(interface.AbstractRepository):
         return [program_tree.ProgramTreeIdentity(code=row[0], year=row[1]) for row in qs]
 
     @classmethod
-    def search_last_occurence(cls, from_year: int) -> List['ProgramTree']:
+    def search_last_occurence(cls, from_year: int, codes: List[str] = None) -> List['ProgramTree']:
         subquery_max_existing_year_for_group = GroupYear.objects.filter(
             academic_year__year__gte=from_year,
             group=OuterRef("group_year__group"),
@@ -187,13 +187,25 @@ class ProgramTreeRepository(interface.AbstractRepository):
 
         qs = Element.objects.filter(
             group_year__academic_year__year=Subquery(subquery_max_existing_year_for_group[:1])
-        ).values_list(
-            "id", flat=True
         )
-        return _load_trees(list(qs))
+        if codes is not None:
+            qs = qs.filter(group_year__partial_acronym__in=codes)
+        return _load_trees(list(qs.values_list("id", flat=True)))
 
 
 def _load(tree_root_id: int) -> 'ProgramTree':
+    if not program_tree_cache.is_enabled():
+        return _load_from_database(tree_root_id)
+
+    tree_cache = program_tree_cache.ProgramTreeCache(tree_root_id)
+    tree = tree_cache.cached_data
+    if tree is None:
+        tree = _load_from_database(tree_root_id)
+        tree_cache.set_cached_data(tree)
+    return tree
+
+
+def _load_from_database(tree_root_id: int) -> 'ProgramTree':
     trees = _load_trees([tree_root_id])
     if not trees:
         raise ProgramTreeNotFoundException
@@ -201,22 +213,42 @@ def _load(tree_root_id: int) -> 'ProgramTree':
 
 
 def _load_trees(tree_root_ids: List[int]) -> List['ProgramTree']:
-    trees = []
+    """
+    Load all trees in bulk : the structure, nodes, links, prerequisites and authorized relationships are fetched once
+    for all trees. A Node is shared by all trees using the same element (as root or as child).
+    """
+    tree_root_ids = list(dict.fromkeys(tree_root_ids))
     structure = group_element_year.GroupElementYear.objects.get_adjacency_list(tree_root_ids)
+    structure_by_root = _group_structure_by_root(structure)
     nodes = _load_tree_nodes(structure)
     links = _load_tree_links(structure)
-    prerequisites_of_all_trees = tree_prerequisites.TreePrerequisitesRepository().search(
-        tree_root_ids=tree_root_ids
-    )
-    root_nodes = load_node.load_multiple(tree_root_ids)
-    nodes.update({n.pk: n for n in root_nodes})
-    for root_node in root_nodes:
-        tree_root_id = root_node.pk
-        structure_for_current_root_node = [s for s in structure if s['starting_node_id'] == tree_root_id]
-        tree = _build_tree(root_node, structure_for_current_root_node, nodes, links,
-                           prerequisites_of_all_trees)
-        trees.append(tree)
-    return trees
+    prerequisites_by_tree = {
+        prerequisites.context_tree: prerequisites
+        for prerequisites in tree_prerequisites.TreePrerequisitesRepository().search(tree_root_ids=tree_root_ids)
+    }
+    authorized_relationships = load_authorized_relationship.load()
+
+    root_ids_to_load = [root_id for root_id in tree_root_ids if root_id not in nodes]
+    if root_ids_to_load:
+        nodes.update({n.pk: n for n in load_node.load_multiple(root_ids_to_load)})
+    return [
+        _build_tree(
+            nodes[tree_root_id],
+            structure_by_root.get(tree_root_id, []),
+            nodes,
+            links,
+            prerequisites_by_tree,
+            authorized_relationships,
+        )
+        for tree_root_id in tree_root_ids if tree_root_id in nodes
+    ]
+
+
+def _group_structure_by_root(tree_structure: TreeStructure) -> Dict[NodeKey, TreeStructure]:
+    structure_by_root = {}
+    for s_dict in tree_structure:
+        structure_by_root.setdefault(s_dict['starting_node_id'], []).append(s_dict)
+    return structure_by_root
 
 
 def _delete_node_content(parent_node: 'Node', delete_node_service: interface.ApplicationService) -> None:
@@ -253,13 +285,17 @@ def _build_where_clause(node_identity: 'ProgramTreeIdentity') -> Q:
 
 
 def _load_tree_nodes(tree_structure: TreeStructure) -> Dict[NodeKey, 'Node']:
-    element_ids = [link['child_id'] for link in tree_structure]
+    element_ids = list({link['child_id'] for link in tree_structure})
+    if not element_ids:
+        return {}
     nodes_list = load_node.load_multiple(element_ids)
     return {n.pk: n for n in nodes_list}
 
 
 def _load_tree_links(tree_structure: TreeStructure) -> Dict[LinkKey, 'Link']:
-    group_element_year_ids = [link['id'] for link in tree_structure]
+    group_element_year_ids = list({link['id'] for link in tree_structure})
+    if not group_element_year_ids:
+        return {}
     group_element_year_qs = group_element_year.GroupElementYear.objects.filter(pk__in=group_element_year_ids).values(
         'pk',
         'relative_credits',
@@ -296,7 +332,8 @@ def _build_tree(
         tree_structure: TreeStructure,
         nodes: Dict[NodeKey, 'Node'],
         links: Dict[LinkKey, 'Link'],
-        prerequisites_of_all_trees: List['Prerequisites']
+        prerequisites_by_tree: Dict['ProgramTreeIdentity', 'Prerequisites'],
+        authorized_relationships: 'AuthorizedRelationshipList'
 ) -> 'ProgramTree':
     structure_by_parent = {}  # For performance
     for s_dict in tree_structure:
@@ -306,10 +343,10 @@ def _build_tree(
     root_node.children = __build_children(str(root_node.pk), structure_by_parent, nodes, links)
     tree = program_tree.ProgramTree(
         root_node,
-        authorized_relationships=load_authorized_relationship.load(),
+        authorized_relationships=authorized_relationships,
     )
-    tree.prerequisites = next(
-        (prereq for prereq in prerequisites_of_all_trees if prereq.context_tree == tree.entity_id),
+    tree.prerequisites = prerequisites_by_tree.get(
+        tree.entity_id,
         NullPrerequisites(context_tree=tree.entity_id)
     )
     return tree
@@ -0,0 +1,154 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import logging
+import pickle
+import uuid
+import zlib
+from typing import Iterable, Optional, Set, Dict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from base.models.group_element_year import GroupElementYear
+from base.utils.cache import OsisCache
+from base.utils.db import call_once_on_commit
+from program_management.ddd.business_types import *
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+ElementId = int
+
+
+class ProgramTreeCache(OsisCache):
+    """
+    Serialized ProgramTree shared between processes through the configured Django cache.
+
+    The key of a tree carries the current version of its root element. Bumping this version (see
+    invalidate_trees_using_elements) makes every previously cached tree unreachable, so readers never get a stale
+    structure ; the orphan entries simply expire.
+    """
+    PREFIX_KEY = 'program_tree_{root_id}_{version}'
+    VERSION_PREFIX_KEY = 'program_tree_version_{root_id}'
+    HITS_KEY = 'program_tree_cache_hits'
+    MISSES_KEY = 'program_tree_cache_misses'
+
+    def __init__(self, root_id: ElementId, version: str = None):
+        self.root_id = root_id
+        self.version = version or get_version(root_id)
+
+    @property
+    def key(self):
+        return self.PREFIX_KEY.format(root_id=self.root_id, version=self.version)
+
+    @property
+    def cached_data(self) -> Optional['ProgramTree']:
+        serialized_tree = super().cached_data
+        if serialized_tree is None:
+            _increment_counter(self.MISSES_KEY)
+            return None
+        _increment_counter(self.HITS_KEY)
+        return pickle.loads(zlib.decompress(serialized_tree))
+
+    def set_cached_data(self, tree: 'ProgramTree', timeout=None):
+        # The lookup index and the prerequisite graph are rebuilt lazily on the first query, no need to store them
+        tree._reset_index()
+        tree.prerequisites._reset_graph()
+        serialized_tree = zlib.compress(pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL))
+        super().set_cached_data(serialized_tree, timeout=timeout or settings.PROGRAM_TREE_CACHE_TIMEOUT)
+
+    @classmethod
+    def get_statistics(cls) -> Dict[str, int]:
+        counters = cache.get_many([cls.HITS_KEY, cls.MISSES_KEY])
+        return {
+            'hits': counters.get(cls.HITS_KEY, 0),
+            'misses': counters.get(cls.MISSES_KEY, 0),
+        }
+
+
+def is_enabled() -> bool:
+    return settings.PROGRAM_TREE_CACHE_ENABLED
+
+
+def get_version(root_id: ElementId) -> str:
+    version_key = ProgramTreeCache.VERSION_PREFIX_KEY.format(root_id=root_id)
+    version = cache.get(version_key)
+    if version is None:
+        # A random version (instead of a counter starting at 0) prevents an evicted version key from making
+        # an old tree reachable again
+        cache.add(version_key, _new_version(), timeout=None)
+        version = cache.get(version_key)
+    return version
+
+
+def invalidate_trees_using_elements(element_ids: Iterable[ElementId]) -> None:
+    """
+    Bump the version of the trees whose root is one of the elements or one of their ancestors.
+    The elements touched during the transaction are collected and their ancestors are searched once, when it is
+    committed, so that a concurrent reader cannot cache the former structure under the new version.
+    A tree which lost an element in the transaction is still found: it contains the parent of the deleted link.
+    """
+    if is_enabled():
+        call_once_on_commit(_invalidate_trees_using_elements, element_ids)
+
+
+def invalidate_tree(root_id: ElementId) -> None:
+    """Bump the version of a single tree, for changes which does not affect the trees using it (ex: prerequisites)"""
+    if is_enabled():
+        transaction.on_commit(lambda: _bump_versions({root_id}))
+
+
+def _invalidate_trees_using_elements(element_ids: Set[ElementId]) -> None:
+    root_ids = _search_root_ids_using_elements(element_ids)
+    if root_ids:
+        _bump_versions(root_ids)
+
+
+def _search_root_ids_using_elements(element_ids: Iterable[ElementId]) -> Set[ElementId]:
+    element_ids = list({element_id for element_id in element_ids if element_id})
+    ancestors = GroupElementYear.objects.get_reverse_adjacency_list(child_element_ids=element_ids)
+    return set(element_ids) | {ancestor['parent_id'] for ancestor in ancestors}
+
+
+def _bump_versions(root_ids: Set[ElementId]) -> None:
+    cache.set_many(
+        {ProgramTreeCache.VERSION_PREFIX_KEY.format(root_id=root_id): _new_version() for root_id in root_ids},
+        timeout=None
+    )
+    logger.debug("Program tree cache invalidated for root elements %s", sorted(root_ids))
+
+
+def _new_version() -> str:
+    return uuid.uuid4().hex
+
+
+def _increment_counter(key: str) -> None:
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Counter evicted between add() and incr()
+        pass
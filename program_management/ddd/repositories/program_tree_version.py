@@ -24,6 +24,8 @@
 #
 ##############################################################################
 import contextlib
+import functools
+import operator
 import warnings
 from _decimal import Decimal
 from typing import Optional, List
@@ -172,6 +174,20 @@ class ProgramTreeVersionRepository(interface.AbstractRepository):
             **kwargs
     ) -> List['ProgramTreeVersion']:
         qs = _get_common_queryset()
+        if entity_ids:
+            qs = qs.filter(
+                functools.reduce(
+                    operator.or_,
+                    (
+                        Q(
+                            version_name=entity_id.version_name,
+                            offer__acronym=entity_id.offer_acronym,
+                            offer__academic_year__year=entity_id.year,
+                            transition_name=entity_id.transition_name,
+                        ) for entity_id in entity_ids
+                    )
+                )
+            )
         if "element_ids" in kwargs:
             qs = qs.filter(root_group__element__in=kwargs['element_ids'])
 
@@ -236,7 +252,7 @@ class ProgramTreeVersionRepository(interface.AbstractRepository):
         return result
 
     @classmethod
-    def search_last_occurence(cls, from_year: int) -> List['ProgramTreeVersion']:
+    def search_last_occurence(cls, from_year: int, offer_acronyms: List[str] = None) -> List['ProgramTreeVersion']:
         subquery_max_existing_year_for_offer = EducationGroupVersion.objects.filter(
             offer__academic_year__year__gte=from_year,
             offer__education_group=OuterRef("offer__education_group"),
@@ -253,6 +269,8 @@ class ProgramTreeVersionRepository(interface.AbstractRepository):
         qs = _get_common_queryset().filter(
             offer__academic_year__year=Subquery(subquery_max_existing_year_for_offer[:1])
         )
+        if offer_acronyms is not None:
+            qs = qs.filter(offer__acronym__in=offer_acronyms)
 
         results = []
         for record_dict in qs:
@@ -43,7 +43,10 @@ def postpone_program_tree_versions_until_n_plus_6(
 
     )
 
-    tree_versions_to_postpone = repo.search_last_occurence(current_academic_year.year)
+    tree_versions_to_postpone = repo.search_last_occurence(
+        current_academic_year.year,
+        offer_acronyms=cmd.offer_acronyms
+    )
 
     result = []
     for tree_version in tree_versions_to_postpone:
@@ -44,7 +44,7 @@ def postpone_program_trees_until_n_plus_6(cmd: PostponeProgramTreesUntilNPlus6Co
 
     trees_to_postpone = [
         tree
-        for tree in repo.search_last_occurence(current_academic_year.year)
+        for tree in repo.search_last_occurence(current_academic_year.year, codes=cmd.codes)
         if not tree.root_node.is_group()
     ]
 
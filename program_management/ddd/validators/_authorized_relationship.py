@@ -50,7 +50,7 @@ class PasteAuthorizedRelationshipValidator(business_validator.BusinessValidator)
     def __init__(self, tree: 'ProgramTree', node_to_paste: 'Node', parent_node: 'Node', link_type: LinkTypes = None):
         self.tree = copy.deepcopy(tree)
         self.parent_node = self.tree.get_node_by_code_and_year(parent_node.code, parent_node.year)
-        self.link_created = self.parent_node.add_child(node_to_paste, link_type=link_type)
+        self.link_created = self.tree.add_child_to_node(self.parent_node, node_to_paste, link_type=link_type)
 
         super().__init__()
 
@@ -69,7 +69,7 @@ class DetachAuthorizedRelationshipValidator(business_validator.BusinessValidator
         tree_copy = copy.copy(self.tree)
         parent_node = tree_copy.get_node_by_code_and_year(self.detach_from.code, self.detach_from.year)
         child_node_to_detach = tree_copy.get_node_by_code_and_year(self.node_to_detach.code, self.node_to_detach.year)
-        parent_node.detach_child(child_node_to_detach)
+        tree_copy.remove_child_from_node(parent_node, child_node_to_detach)
 
         MinimumChildrenTypeAuthorizedValidator(tree_copy, parent_node).validate()
 
@@ -0,0 +1,68 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import time
+
+from django.core.management import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from base.models.enums import education_group_categories
+from program_management.ddd.repositories import program_tree as program_tree_repository
+from program_management.models.element import Element
+
+
+class Command(BaseCommand):
+    help = 'Load all the program trees of the trainings of an academic year, in bulk and one by one'
+
+    def add_arguments(self, parser):
+        parser.add_argument('year', type=int, help='Academic year of the trainings to load')
+        parser.add_argument('--skip-one-by-one', action='store_true', help='Only load the trees in bulk')
+
+    def handle(self, *args, **options):
+        root_ids = list(
+            Element.objects.filter(
+                group_year__academic_year__year=options['year'],
+                group_year__education_group_type__category=education_group_categories.TRAINING,
+            ).values_list('pk', flat=True)
+        )
+        self.stdout.write('{} trainings found for {}'.format(len(root_ids), options['year']))
+
+        if not options['skip_one_by_one']:
+            duration, queries = self._measure(
+                lambda: [program_tree_repository._load_from_database(root_id) for root_id in root_ids]
+            )
+            self.stdout.write('One by one : {:.2f}s - {} queries'.format(duration, queries))
+
+        duration, queries = self._measure(lambda: program_tree_repository._load_trees(root_ids))
+        self.stdout.write(self.style.SUCCESS('In bulk : {:.2f}s - {} queries'.format(duration, queries)))
+
+    @staticmethod
+    def _measure(load_trees):
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            load_trees()
+            duration = time.perf_counter() - start
+        return duration, len(context.captured_queries)
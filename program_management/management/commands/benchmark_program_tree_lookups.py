@@ -0,0 +1,159 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2021 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import time
+
+from django.core.management import BaseCommand
+
+from base.models.authorized_relationship import AuthorizedRelationshipList, AuthorizedRelationshipObject
+from base.models.enums.education_group_types import TrainingType, GroupType
+from program_management.ddd.domain import program_tree
+from program_management.ddd.domain.link import factory as link_factory
+from program_management.ddd.domain.node import factory as node_factory
+from program_management.ddd.validators._authorized_relationship import PasteAuthorizedRelationshipValidator, \
+    DetachAuthorizedRelationshipValidator
+from program_management.models.enums.node_type import NodeType
+
+YEAR = 2020
+
+
+class Command(BaseCommand):
+    help = 'Compare the time spent by the program tree lookups used by the validators on a large in-memory tree, ' \
+           'with the indexes of ProgramTree and with full walks of the tree (former implementation)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--groups', type=int, default=40, help='Number of groups inside the common core')
+        parser.add_argument('--learning-units', type=int, default=20, help='Number of learning units by group')
+        parser.add_argument(
+            '--validations', type=int, default=50, help='Number of paste and detach validations of learning units'
+        )
+
+    def handle(self, *args, **options):
+        tree = _build_large_tree(options['groups'], options['learning_units'])
+        learning_units = tree.get_all_learning_unit_nodes()
+        self.stdout.write(
+            '{} nodes, {} links, {} learning units'.format(
+                len(tree.get_all_nodes()), len(tree.get_all_links()), len(learning_units)
+            )
+        )
+
+        start = time.perf_counter()
+        _validate_with_tree_walks(tree, learning_units)
+        time_with_tree_walks = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _validate_with_indexes(tree, learning_units)
+        time_with_indexes = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _validate_paste_and_detach(tree, learning_units[:options['validations']])
+        time_with_validators = time.perf_counter() - start
+
+        self.stdout.write('Full walks of the tree : {:.3f}s'.format(time_with_tree_walks))
+        self.stdout.write(self.style.SUCCESS('Indexed tree : {:.3f}s'.format(time_with_indexes)))
+        self.stdout.write(
+            'Paste and detach authorized relationship validators ({} learning units) : {:.3f}s'.format(
+                min(len(learning_units), options['validations']), time_with_validators
+            )
+        )
+
+
+def _validate_with_indexes(tree: 'ProgramTree', learning_units: list) -> None:
+    for node in learning_units:
+        tree.get_node_by_code_and_year(node.code, node.year)
+        tree.contains_identity(node.entity_id)
+        for link in tree.search_links_using_node(node):
+            tree.get_link(link.parent, node)
+        tree.search_paths_using_node(node)
+
+
+def _validate_paste_and_detach(tree: 'ProgramTree', learning_units: list) -> None:
+    # Both validators work on a copy of the tree, so the tree itself keeps its index between the validations
+    for node in learning_units:
+        parent_node = tree.search_links_using_node(node)[0].parent
+        node_to_paste = node_factory.get_node(
+            type=NodeType.LEARNING_UNIT, node_id=None, code='{}P'.format(node.code), year=YEAR
+        )
+        PasteAuthorizedRelationshipValidator(tree, node_to_paste, parent_node).validate()
+        DetachAuthorizedRelationshipValidator(tree, node, parent_node).validate()
+
+
+def _validate_with_tree_walks(tree: 'ProgramTree', learning_units: list) -> None:
+    for node in learning_units:
+        all_nodes = set([tree.root_node] + program_tree._nodes_from_root(tree.root_node))
+        next((n for n in all_nodes if n.code == node.code and n.year == node.year), None)
+        any(n for n in all_nodes if n.entity_id == node.entity_id)
+        links_using_node = [link for link in program_tree._links_from_root(tree.root_node) if link.child == node]
+        for link in links_using_node:
+            links_mapped = {
+                str(link_obj.child.entity_id) + str(link_obj.parent.entity_id): link_obj
+                for link_obj in program_tree._links_from_root(tree.root_node)
+            }
+            links_mapped.get(str(node.entity_id) + str(link.parent.entity_id))
+        [path for path, child in tree.root_node.descendents if child == node]
+
+
+def _build_large_tree(number_of_groups: int, learning_units_by_group: int) -> 'ProgramTree':
+    element_ids = iter(range(1, 1000000))
+    root_node = node_factory.get_node(
+        type=NodeType.GROUP, node_id=next(element_ids), node_type=TrainingType.BACHELOR, code='LBENC100B', year=YEAR
+    )
+    common_core = node_factory.get_node(
+        type=NodeType.GROUP, node_id=next(element_ids), node_type=GroupType.COMMON_CORE, code='LBENC100T', year=YEAR
+    )
+    root_node.children = [link_factory.get_link(parent=root_node, child=common_core, order=0)]
+
+    groups = []
+    for group_index in range(number_of_groups):
+        group = node_factory.get_node(
+            type=NodeType.GROUP,
+            node_id=next(element_ids),
+            node_type=GroupType.SUB_GROUP,
+            code='LBENC{:03d}R'.format(group_index),
+            year=YEAR
+        )
+        group.children = [
+            link_factory.get_link(
+                parent=group,
+                child=node_factory.get_node(
+                    type=NodeType.LEARNING_UNIT,
+                    node_id=next(element_ids),
+                    code='LBENC{:03d}{:02d}'.format(group_index, learning_unit_index),
+                    year=YEAR
+                ),
+                order=learning_unit_index,
+                block=1
+            ) for learning_unit_index in range(learning_units_by_group)
+        ]
+        groups.append(group)
+    common_core.children = [
+        link_factory.get_link(parent=common_core, child=group, order=order) for order, group in enumerate(groups)
+    ]
+    authorized_relationships = AuthorizedRelationshipList([
+        AuthorizedRelationshipObject(TrainingType.BACHELOR, GroupType.COMMON_CORE, 1, 1),
+        AuthorizedRelationshipObject(GroupType.COMMON_CORE, GroupType.SUB_GROUP, 0, None),
+        AuthorizedRelationshipObject(GroupType.SUB_GROUP, NodeType.LEARNING_UNIT, 0, None),
+    ])
+    return program_tree.ProgramTree(root_node=root_node, authorized_relationships=authorized_relationships)
@@ -23,13 +23,19 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from django.db.models.signals import post_save, pre_delete, post_delete
 from django.dispatch import receiver
 from django.core.cache import cache
 
+from base.models.group_element_year import GroupElementYear
+from base.models.learning_component_year import LearningComponentYear
+from base.models.learning_container_year import LearningContainerYear
 from base.models.learning_unit_year import LearningUnitYear
 from base.utils.cache import ElementCache
 from education_group import publisher
 from education_group.models.group_year import GroupYear
+from program_management.ddd.repositories import program_tree_cache
+from program_management.models.education_group_version import EducationGroupVersion
 from program_management.models.element import Element
 from program_management import publisher as publisher_pgrm_management
 
@@ -54,6 +60,14 @@ def create_element_of_learning_unit_year(sender, learning_unit_identity, **kwarg
     )
 
 
+@receiver(publisher.learning_unit_years_created)
+def create_elements_of_learning_unit_years(sender, learning_unit_year_ids, **kwargs):
+    Element.objects.bulk_create(
+        [Element(learning_unit_year_id=learning_unit_year_id) for learning_unit_year_id in learning_unit_year_ids],
+        ignore_conflicts=True
+    )
+
+
 @receiver(publisher.learning_unit_year_deleted)
 def delete_element_of_learning_unit_year(sender, learning_unit_identity, **kwargs):
     Element.objects.filter(
@@ -95,3 +109,56 @@ def delete_element_in_cache_from_element_deleted(sender, **kwargs):
         cache.delete(key) for key, cached in cached_items.items()
         if cached.get('element_code') == identity.code and cached.get('element_year') == identity.year
     ]
+
+
+@receiver(post_save, sender=GroupElementYear)
+@receiver(pre_delete, sender=GroupElementYear)
+def invalidate_program_trees_cache_from_link(sender, instance, **kwargs):
+    program_tree_cache.invalidate_trees_using_elements([instance.parent_element_id])
+
+
+@receiver(post_save, sender=Element)
+@receiver(pre_delete, sender=Element)
+def invalidate_program_trees_cache_from_element(sender, instance, **kwargs):
+    program_tree_cache.invalidate_trees_using_elements([instance.pk])
+
+
+@receiver(post_save, sender=GroupYear)
+@receiver(post_save, sender=LearningUnitYear)
+def invalidate_program_trees_cache_from_node(sender, instance, created=False, **kwargs):
+    if created or not program_tree_cache.is_enabled():
+        return
+    element_filter = {'group_year': instance} if sender == GroupYear else {'learning_unit_year': instance}
+    program_tree_cache.invalidate_trees_using_elements(
+        Element.objects.filter(**element_filter).values_list('pk', flat=True)
+    )
+
+
+@receiver(post_save, sender=EducationGroupVersion)
+def invalidate_program_trees_cache_from_version(sender, instance, **kwargs):
+    if not program_tree_cache.is_enabled():
+        return
+    program_tree_cache.invalidate_trees_using_elements(
+        Element.objects.filter(group_year_id=instance.root_group_id).values_list('pk', flat=True)
+    )
+
+
+@receiver(post_save, sender=LearningComponentYear)
+@receiver(post_delete, sender=LearningComponentYear)
+def invalidate_program_trees_cache_from_learning_component(sender, instance, **kwargs):
+    # The volumes of the learning units are part of the cached trees and formations
+    if not program_tree_cache.is_enabled():
+        return
+    program_tree_cache.invalidate_trees_using_elements(
+        Element.objects.filter(learning_unit_year_id=instance.learning_unit_year_id).values_list('pk', flat=True)
+    )
+
+
+@receiver(post_save, sender=LearningContainerYear)
+def invalidate_program_trees_cache_from_learning_container(sender, instance, created=False, **kwargs):
+    # The common title of the learning units is part of the cached trees and formations
+    if created or not program_tree_cache.is_enabled():
+        return
+    program_tree_cache.invalidate_trees_using_elements(
+        Element.objects.filter(learning_unit_year__learning_container_year=instance).values_list('pk', flat=True)
+    )
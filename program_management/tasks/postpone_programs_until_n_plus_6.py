@@ -23,20 +23,28 @@
 #
 ##############################################################################
 
+import logging
+from typing import List, Callable, Tuple
+
+from celery import chord
+from django.conf import settings
+
 from backoffice.celery import app as celery_app
+from base.business import postponement_jobs
 from base.business.education_groups.access_requirements import bulk_postpone_access_requirements, \
     bulk_postpone_access_requirements_line
 from base.business.education_groups.achievement import bulk_postpone_achievements
 from base.business.education_groups.organizations import bulk_postpone_organizations
 from base.business.education_groups.publication_contact import bulk_postpone_publication_contact, \
     bulk_postpone_publication_entity
+from base.models.academic_year import starting_academic_year
 from base.models.education_group_year import EducationGroupYear
+from base.models.enums.education_group_categories import Categories
 from education_group.cms import postpone_commons
-
-from education_group.ddd.command import PostponeGroupsUntilNPlus6Command, PostponeTrainingsUntilNPlus6Command, \
-    PostponeMiniTrainingsUntilNPlus6Command
+from education_group.ddd.command import PostponeTrainingsUntilNPlus6Command, PostponeMiniTrainingsUntilNPlus6Command
+from education_group.ddd.domain.service.postpone_until_n_plus_6 import DEFAULT_YEARS_TO_POSTPONE
 from education_group.ddd.service.write import postpone_trainings_until_n_plus_6_service, \
-    postpone_groups_until_n_plus_6_service, postpone_mini_trainings_until_n_plus_6_service
+    postpone_mini_trainings_until_n_plus_6_service
 from education_group.cms.postponement import bulk_postpone_cms_for_education_group_year, \
     bulk_postpone_cms_for_group_year
 from education_group.models.group_year import GroupYear
@@ -44,33 +52,124 @@ from program_management.ddd.command import PostponeProgramTreesUntilNPlus6Comman
     PostponeProgramTreeVersionsUntilNPlus6Command
 from program_management.ddd.service.write import postpone_program_trees_until_n_plus_6_service, \
     postpone_program_tree_versions_until_n_plus_6_service
+from program_management.models.education_group_version import EducationGroupVersion
+
+logger = logging.getLogger(settings.DEFAULT_LOGGER)
+
+PUBLICATION_DATAS_JOB = 'publication_datas_until_n_plus_6'
 
 
 @celery_app.task
 def run() -> dict:
-    programs_created = postpone_program_trees_until_n_plus_6_service.postpone_program_trees_until_n_plus_6(
-        PostponeProgramTreesUntilNPlus6Command()
+    """
+    Postpone the program trees, trainings, mini-trainings and versions one stage after the other, each stage being
+    split in chunks spread across the workers, then the publication datas. A chunk already postponed by a previous
+    run is skipped ; a failing chunk stops the run, which can be started again.
+    """
+    from_year = starting_academic_year().year
+    run_stage.delay(from_year, 0)
+    return {'from_year': from_year}
+
+
+@celery_app.task
+def run_stage(from_year: int, stage_index: int) -> dict:
+    if stage_index == len(STAGES):
+        return postpone_publication_datas(from_year)
+
+    job, load_keys, _ = STAGES[stage_index]
+    pending_keys = postponement_jobs.get_pending_keys(job, from_year, load_keys(from_year))
+    chunks = postponement_jobs.split_in_chunks(pending_keys)
+    logger.info("Postponement {} : {} roots in {} chunks".format(job, len(pending_keys), len(chunks)))
+
+    next_stage = run_stage.si(from_year, stage_index + 1)
+    if chunks:
+        chord(postpone_stage_chunk.si(from_year, stage_index, chunk) for chunk in chunks)(next_stage)
+    else:
+        next_stage.delay()
+    return {job: len(pending_keys)}
+
+
+@celery_app.task
+def postpone_stage_chunk(from_year: int, stage_index: int, keys: List[str]) -> List[str]:
+    job, _, postpone = STAGES[stage_index]
+    return postponement_jobs.postpone_chunk(job, from_year, keys, postpone)
+
+
+def postpone_publication_datas(from_year: int) -> dict:
+    highest_year = from_year + DEFAULT_YEARS_TO_POSTPONE
+
+    def _postpone(keys: List[str]):
+        postpone_to_n_publication_datas(highest_year)
+        postpone_coorganizations_data(highest_year - 1)
+
+    postponement_jobs.postpone_chunk(PUBLICATION_DATAS_JOB, from_year, [str(highest_year)], _postpone)
+    return {PUBLICATION_DATAS_JOB: highest_year}
+
+
+def _load_program_tree_codes(from_year: int) -> List[str]:
+    return list(
+        GroupYear.objects.filter(
+            academic_year__year__gte=from_year
+        ).exclude(
+            education_group_type__category=Categories.GROUP.name
+        ).values_list('partial_acronym', flat=True).order_by('partial_acronym').distinct()
     )
-    trainings_created = postpone_trainings_until_n_plus_6_service.postpone_trainings_until_n_plus_6(
-        PostponeTrainingsUntilNPlus6Command()
+
+
+def _load_education_group_acronyms(category: Categories) -> Callable[[int], List[str]]:
+    def _load(from_year: int) -> List[str]:
+        return list(
+            EducationGroupYear.objects.filter(
+                academic_year__year__gte=from_year,
+                education_group_type__category=category.name
+            ).values_list('acronym', flat=True).order_by('acronym').distinct()
+        )
+    return _load
+
+
+def _load_offer_acronyms(from_year: int) -> List[str]:
+    return list(
+        EducationGroupVersion.objects.filter(
+            offer__academic_year__year__gte=from_year
+        ).values_list('offer__acronym', flat=True).order_by('offer__acronym').distinct()
     )
-    mini_trainings_created = postpone_mini_trainings_until_n_plus_6_service.postpone_minitrainings_until_n_plus_6(
-        PostponeMiniTrainingsUntilNPlus6Command()
+
+
+def _postpone_program_trees(codes: List[str]):
+    postpone_program_trees_until_n_plus_6_service.postpone_program_trees_until_n_plus_6(
+        PostponeProgramTreesUntilNPlus6Command(codes=codes)
     )
-    program_versions_created = postpone_program_tree_versions_until_n_plus_6_service. \
-        postpone_program_tree_versions_until_n_plus_6(
-            PostponeProgramTreeVersionsUntilNPlus6Command()
-        )
 
-    highest_year = max([program.year for program in programs_created])
-    postpone_to_n_publication_datas(highest_year)
-    postpone_coorganizations_data(highest_year-1)
-    return {
-        "trainings": [str(training_identity) for training_identity in trainings_created],
-        "mini_trainings": [str(mini_training_identity) for mini_training_identity in mini_trainings_created],
-        "program": [str(program_identity) for program_identity in programs_created],
-        "program_versions": [str(program_version_identity) for program_version_identity in program_versions_created],
-    }
+
+def _postpone_trainings(acronyms: List[str]):
+    postpone_trainings_until_n_plus_6_service.postpone_trainings_until_n_plus_6(
+        PostponeTrainingsUntilNPlus6Command(acronyms=acronyms)
+    )
+
+
+def _postpone_mini_trainings(acronyms: List[str]):
+    postpone_mini_trainings_until_n_plus_6_service.postpone_minitrainings_until_n_plus_6(
+        PostponeMiniTrainingsUntilNPlus6Command(acronyms=acronyms)
+    )
+
+
+def _postpone_program_tree_versions(offer_acronyms: List[str]):
+    postpone_program_tree_versions_until_n_plus_6_service.postpone_program_tree_versions_until_n_plus_6(
+        PostponeProgramTreeVersionsUntilNPlus6Command(offer_acronyms=offer_acronyms)
+    )
+
+
+# (job, keys of the roots to postpone from a year, postponement of a chunk of keys), in the order of postponement
+STAGES = [
+    ('program_trees_until_n_plus_6', _load_program_tree_codes, _postpone_program_trees),
+    ('trainings_until_n_plus_6', _load_education_group_acronyms(Categories.TRAINING), _postpone_trainings),
+    (
+        'mini_trainings_until_n_plus_6',
+        _load_education_group_acronyms(Categories.MINI_TRAINING),
+        _postpone_mini_trainings
+    ),
+    ('program_tree_versions_until_n_plus_6', _load_offer_acronyms, _postpone_program_tree_versions),
+]  # type: List[Tuple[str, Callable[[int], List[str]], Callable[[List[str]], None]]]
 
 
 def postpone_to_n_publication_datas(to_year: int):
@@ -23,17 +23,20 @@
 #    see http://www.gnu.org/licenses/.
 #
 ##############################################################################
+from django.db import connection
+from django.db.models import F
 from django.test import TestCase, SimpleTestCase
-from django.test.utils import override_settings
+from django.test.utils import override_settings, CaptureQueriesContext
 from django.utils.translation import gettext_lazy as _
 
 from base.models.enums import education_group_types
 from base.models.enums.constraint_type import ConstraintTypeEnum
 from base.models.enums.education_group_types import TrainingType, MiniTrainingType, GroupType
 from base.models.enums.publication_contact_type import PublicationContactType
-from base.tests.factories.academic_year import get_current_year
+from base.tests.factories.academic_year import get_current_year, AcademicYearFactory
 from base.tests.factories.education_group_publication_contact import EducationGroupPublicationContactFactory
-from base.tests.factories.education_group_type import MiniTrainingEducationGroupTypeFactory
+from base.tests.factories.education_group_type import MiniTrainingEducationGroupTypeFactory, \
+    TrainingEducationGroupTypeFactory, GroupEducationGroupTypeFactory
 from education_group.ddd.domain.group import GroupIdentity
 from education_group.ddd.domain.mini_training import MiniTrainingIdentity
 from education_group.tests.ddd.factories.domain.academic_partner import AcademicPartnerFactory
@@ -47,6 +50,8 @@ from education_group.tests.ddd.factories.domain.group import GroupFactory
 from education_group.tests.ddd.factories.domain.remark import RemarkFactory
 from education_group.tests.ddd.factories.domain.titles import TitlesFactory
 from education_group.tests.ddd.factories.domain.training import TrainingFactory
+from education_group.models.group_year import GroupYear
+from education_group.tests.factories.group_year import GroupYearFactory
 from education_group.tests.factories.mini_training import MiniTrainingFactory
 from program_management.business.xls_customized import _build_headers, TRAINING_LIST_CUSTOMIZABLE_PARAMETERS, \
     WITH_ACTIVITIES, WITH_ORGANIZATION, WITH_ARES_CODE, WITH_CO_GRADUATION_AND_PARTNERSHIP, \
@@ -54,7 +59,8 @@ from program_management.business.xls_customized import _build_headers, TRAINING_
     _build_organization_data, _get_responsibles_and_contacts, _build_aims_data, _build_keywords_data, \
     _get_co_organizations, _build_duration_data, _build_common_ares_code_data, _title_yes_no_empty, \
     _build_funding_data, _build_diploma_certificat_data, _build_enrollment_data, \
-    _build_other_legal_information_data, _build_title_fr, _build_secondary_domains
+    _build_other_legal_information_data, _build_title_fr, _build_secondary_domains, \
+    prepare_xls_content_with_parameters, extract_xls_data_from_education_group_with_parameters
 from program_management.tests.ddd.factories.node import NodeGroupYearFactory
 from program_management.tests.ddd.factories.program_tree import ProgramTreeFactory
 from program_management.tests.ddd.factories.program_tree_version import ProgramTreeVersionFactory
@@ -671,3 +677,57 @@ def _build_person_detail(person):
                 person.role_en,
             )
 
+
+class XlsCustomizedContentQueriesTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.academic_year = AcademicYearFactory(current=True)
+        cls.training_type = TrainingEducationGroupTypeFactory(name=TrainingType.PGRM_MASTER_120.name)
+        cls.mini_training_type = MiniTrainingEducationGroupTypeFactory(name=MiniTrainingType.OPTION.name)
+        cls.group_type = GroupEducationGroupTypeFactory(name=GroupType.COMMON_CORE.name)
+
+    def _create_education_groups(self, number: int):
+        group_year_ids = []
+        for _ in range(number):
+            for education_group_type in (self.training_type, self.mini_training_type):
+                version = StandardEducationGroupVersionFactory(
+                    root_group__academic_year=self.academic_year,
+                    root_group__education_group_type=education_group_type,
+                )
+                EducationGroupPublicationContactFactory(
+                    education_group_year=version.offer,
+                    type=PublicationContactType.ACADEMIC_RESPONSIBLE.name,
+                )
+                group_year_ids.append(version.root_group.pk)
+            group_year_ids.append(
+                GroupYearFactory(academic_year=self.academic_year, education_group_type=self.group_type).pk
+            )
+        return list(
+            GroupYear.objects.filter(
+                pk__in=group_year_ids
+            ).select_related('academic_year').annotate(complete_title_fr=F('acronym')).order_by('pk')
+        )
+
+    def test_number_of_queries_should_not_depend_on_number_of_education_groups(self):
+        few_education_groups = self._create_education_groups(1)
+        with CaptureQueriesContext(connection) as few_education_groups_queries:
+            prepare_xls_content_with_parameters(few_education_groups, list(TRAINING_LIST_CUSTOMIZABLE_PARAMETERS))
+
+        many_education_groups = self._create_education_groups(5)
+        with CaptureQueriesContext(connection) as many_education_groups_queries:
+            prepare_xls_content_with_parameters(many_education_groups, list(TRAINING_LIST_CUSTOMIZABLE_PARAMETERS))
+
+        self.assertEqual(len(few_education_groups_queries), len(many_education_groups_queries))
+
+    def test_should_build_same_rows_as_extraction_of_each_education_group(self):
+        education_groups = self._create_education_groups(2)
+
+        rows = prepare_xls_content_with_parameters(education_groups, list(TRAINING_LIST_CUSTOMIZABLE_PARAMETERS))
+
+        other_params = list(TRAINING_LIST_CUSTOMIZABLE_PARAMETERS)
+        other_params.remove(WITH_ACTIVITIES)
+        self.assertListEqual(
+            rows,
+            [extract_xls_data_from_education_group_with_parameters(group_year, other_params)
+             for group_year in education_groups]
+        )
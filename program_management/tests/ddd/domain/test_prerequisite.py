@@ -28,7 +28,8 @@ from django.utils.translation import gettext_lazy as _
 
 from base.models.enums import prerequisite_operator
 from program_management.ddd.domain import prerequisite
-from program_management.ddd.domain.prerequisite import NullPrerequisite
+from program_management.ddd.domain.node import NodeIdentity
+from program_management.ddd.domain.prerequisite import NullPrerequisite, Prerequisites
 from program_management.tests.ddd.factories.link import LinkFactory
 from program_management.tests.ddd.factories.node import NodeLearningUnitYearFactory
 from program_management.tests.ddd.factories.prerequisite import PrerequisiteItemFactory, PrerequisiteFactory, \
@@ -250,3 +251,56 @@ class TestConstructPrerequisiteFromExpression(SimpleTestCase):
             prerequisite_expression,
             str(prerequisite_obj)
         )
+
+    def test_main_operator_is_the_first_operator_outside_of_parenthesis(self):
+        tree = ProgramTreeFactory()
+        node_having_prerequisites = NodeLearningUnitYearFactory()
+        for prerequisite_expression, main_operator in [
+            ("LOSIS4525 OU (LMARC5823 ET BRABD6985)", prerequisite_operator.OR),
+            ("(LMARC5823 ET BRABD6985) OU LOSIS4525", prerequisite_operator.OR),
+            ("LOSIS4525 ET (LMARC5823 OU BRABD6985)", prerequisite_operator.AND),
+            ("(LMARC5823 OU BRABD6985)", prerequisite_operator.AND),
+        ]:
+            with self.subTest(prerequisite_expression=prerequisite_expression):
+                prerequisite_obj = prerequisite.factory.from_expression(
+                    prerequisite_expression=prerequisite_expression,
+                    node_having_prerequisites=node_having_prerequisites,
+                    context_tree=tree.entity_id
+                )
+                self.assertEqual(prerequisite_obj.main_operator, main_operator)
+
+
+class TestPrerequisiteGraph(SimpleTestCase):
+    def setUp(self):
+        self.tree = ProgramTreeFactory()
+        self.node_having_prerequisites = NodeIdentity(code='LDROI1001', year=self.tree.entity_id.year)
+        self.prerequisites = Prerequisites(
+            context_tree=self.tree.entity_id,
+            prerequisites=[
+                prerequisite.factory.from_expression(
+                    "LOSIS4525 OU LMARC5823",
+                    self.node_having_prerequisites,
+                    self.tree.entity_id
+                )
+            ]
+        )
+        self.prerequisite_item_node = NodeLearningUnitYearFactory(code='LOSIS4525', year=self.tree.entity_id.year)
+
+    def test_should_index_nodes_being_prerequisite(self):
+        self.assertTrue(self.prerequisites.is_prerequisite(self.prerequisite_item_node))
+        self.assertListEqual(
+            self.prerequisites.search_is_prerequisite_of(self.prerequisite_item_node),
+            [self.node_having_prerequisites]
+        )
+
+    def test_should_update_reverse_index_when_prerequisite_replaced(self):
+        self.prerequisites._get_graph().add(
+            prerequisite.factory.from_expression("LMARC5823", self.node_having_prerequisites, self.tree.entity_id)
+        )
+        self.assertFalse(self.prerequisites.is_prerequisite(self.prerequisite_item_node))
+        self.assertListEqual(self.prerequisites.get_nodes_having_prerequisites(), [self.node_having_prerequisites])
+
+    def test_should_rebuild_graph_when_prerequisites_list_changed(self):
+        self.prerequisites._get_graph()
+        self.prerequisites.prerequisites.clear()
+        self.assertFalse(self.prerequisites.is_prerequisite(self.prerequisite_item_node))
@@ -355,3 +355,84 @@ class TestGetIndirectParents(DDDTestCase):
             expected_result,
             "The learning unit Node is used in the common core (which is in the master 2M) AND in the finality"
         )
+
+
+class TestAddAndRemoveChildToNode(SimpleTestCase):
+    def setUp(self):
+        self.tree = ProgramTreeFactory()
+        self.link_with_root = LinkFactory(parent=self.tree.root_node)
+        self.link_with_child = LinkFactory(parent=self.link_with_root.child, child=NodeLearningUnitYearFactory())
+        self.node_to_add = NodeGroupYearFactory()
+        self.child_of_node_to_add = NodeLearningUnitYearFactory()
+        LinkFactory(parent=self.node_to_add, child=self.child_of_node_to_add)
+
+    def test_should_find_added_nodes_when_tree_has_already_been_queried(self):
+        self.assertFalse(self.tree.contains(self.child_of_node_to_add))
+
+        link = self.tree.add_child_to_node(self.link_with_root.child, self.node_to_add)
+
+        self.assertTrue(self.tree.contains(self.node_to_add))
+        self.assertEqual(
+            self.tree.get_node_by_code_and_year(self.child_of_node_to_add.code, self.child_of_node_to_add.year),
+            self.child_of_node_to_add
+        )
+        self.assertEqual(self.tree.get_link(self.link_with_root.child, self.node_to_add), link)
+        self.assertEqual(
+            self.tree.get_node(build_path(self.tree.root_node, self.link_with_root.child, self.node_to_add)),
+            self.node_to_add
+        )
+
+    def test_should_register_added_node_once_by_path_of_its_parent(self):
+        reused_node = self.link_with_root.child
+        LinkFactory(parent=self.tree.root_node, child=LinkFactory(child=reused_node).parent)
+        self.assertEqual(len(self.tree.search_paths_using_node(reused_node)), 2)
+
+        link = self.tree.add_child_to_node(reused_node, self.node_to_add)
+
+        self.assertListEqual(self.tree.search_links_using_node(self.node_to_add), [link, link])
+        self.assertEqual(len(self.tree.search_paths_using_node(self.child_of_node_to_add)), 2)
+        self.assertEqual(self.tree.count_usages_distinct(self.node_to_add), 1)
+
+    def test_should_forget_removed_nodes_when_tree_has_already_been_queried(self):
+        self.assertTrue(self.tree.contains(self.link_with_child.child))
+
+        self.tree.remove_child_from_node(self.tree.root_node, self.link_with_root.child)
+
+        self.assertFalse(self.tree.contains(self.link_with_root.child))
+        self.assertFalse(self.tree.contains_identity(self.link_with_child.child.entity_id))
+        self.assertIsNone(self.tree.get_link_from_identity(self.link_with_child.entity_id))
+        self.assertListEqual(self.tree.get_all_links(), [])
+
+    def test_should_keep_node_still_used_elsewhere_when_removing_one_of_its_usages(self):
+        learning_unit = self.link_with_child.child
+        other_link = LinkFactory(parent=self.tree.root_node, child=learning_unit)
+        self.assertEqual(len(self.tree.search_links_using_node(learning_unit)), 2)
+
+        self.tree.remove_child_from_node(self.tree.root_node, self.link_with_root.child)
+
+        self.assertTrue(self.tree.contains(learning_unit))
+        self.assertListEqual(self.tree.search_links_using_node(learning_unit), [other_link])
+
+    def test_should_take_into_account_children_added_on_nodes_outside_of_the_tree(self):
+        self.assertFalse(self.tree.contains(self.node_to_add))
+
+        self.link_with_root.child.add_child(self.node_to_add)
+
+        self.assertTrue(self.tree.contains(self.node_to_add))
+
+    def test_should_take_into_account_links_appended_directly_to_children(self):
+        self.assertFalse(self.tree.contains(self.node_to_add))
+
+        LinkFactory(parent=self.link_with_root.child, child=self.node_to_add)
+
+        self.assertTrue(self.tree.contains(self.child_of_node_to_add))
+
+    def test_should_keep_index_when_tree_is_copied_and_copy_is_modified(self):
+        index = self.tree._get_index()
+
+        tree_copy = copy.deepcopy(self.tree)
+        tree_copy.add_child_to_node(tree_copy.root_node, self.node_to_add)
+
+        self.assertIs(self.tree._get_index(), index)
+        self.assertFalse(self.tree.contains(self.node_to_add))
+        self.assertTrue(tree_copy.contains(self.node_to_add))
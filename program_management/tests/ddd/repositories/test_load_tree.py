@@ -229,3 +229,12 @@ class TestLoadTree(TestCase):
         ]
 
         self.assertCountEqual(actual_identities, expected_identities)
+
+    def test_should_share_nodes_between_trees_loaded_together(self):
+        other_root_node = ElementGroupYearFactory(group_year__academic_year=self.academic_year)
+        GroupElementYearFactory(parent_element=other_root_node, child_element=self.link_level_1.child_element)
+
+        tree, other_tree = ProgramTreeRepository.search(root_ids=[self.root_node.pk, other_root_node.pk])
+
+        self.assertIs(tree.root_node.children[0].child, other_tree.root_node.children[0].child)
+        self.assertIs(tree.authorized_relationships, other_tree.authorized_relationships)
@@ -0,0 +1,142 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from base.tests.factories.academic_year import AcademicYearFactory
+from base.tests.factories.group_element_year import GroupElementYearFactory, GroupElementYearChildLeafFactory
+from base.tests.factories.learning_component_year import LecturingLearningComponentYearFactory
+from program_management.ddd.domain.program_tree import ProgramTreeIdentity
+from program_management.ddd.repositories import program_tree_cache
+from program_management.ddd.repositories.program_tree import ProgramTreeRepository
+from program_management.ddd.repositories.program_tree_cache import ProgramTreeCache
+from program_management.tests.factories.element import ElementGroupYearFactory
+
+
+@override_settings(PROGRAM_TREE_CACHE_ENABLED=True)
+@mock.patch(
+    'program_management.ddd.repositories.program_tree_cache.transaction.on_commit',
+    side_effect=lambda func: func()
+)
+class TestProgramTreeCache(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """
+            root_node
+            |-link_level_1
+              |-link_level_2
+                |-- leaf
+        """
+        cls.academic_year = AcademicYearFactory(current=True)
+        cls.root_node = ElementGroupYearFactory(group_year__academic_year=cls.academic_year)
+        cls.link_level_1 = GroupElementYearFactory(
+            parent_element=cls.root_node,
+            child_element__group_year__academic_year=cls.academic_year,
+        )
+        cls.link_level_2 = GroupElementYearChildLeafFactory(
+            parent_element=cls.link_level_1.child_element,
+            child_element__learning_unit_year__academic_year=cls.academic_year
+        )
+        cls.tree_identity = ProgramTreeIdentity(
+            code=cls.root_node.group_year.partial_acronym,
+            year=cls.academic_year.year
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_should_load_tree_from_cache_when_already_loaded(self, *mocks):
+        tree = ProgramTreeRepository.get(self.tree_identity)
+
+        with self.assertNumQueries(1):
+            cached_tree = ProgramTreeRepository.get(self.tree_identity)
+
+        self.assertIsNot(cached_tree, tree)
+        self.assertEqual(cached_tree.root_node.entity_id, tree.root_node.entity_id)
+        self.assertEqual(cached_tree.get_all_links(), tree.get_all_links())
+        self.assertDictEqual(ProgramTreeCache.get_statistics(), {'hits': 1, 'misses': 1})
+
+    def test_should_invalidate_trees_using_parent_when_link_saved(self, *mocks):
+        ProgramTreeRepository.get(self.tree_identity)
+
+        GroupElementYearChildLeafFactory(
+            parent_element=self.link_level_1.child_element,
+            child_element__learning_unit_year__academic_year=self.academic_year
+        )
+
+        tree = ProgramTreeRepository.get(self.tree_identity)
+        self.assertEqual(len(tree.get_all_learning_unit_nodes()), 2)
+
+    def test_should_invalidate_trees_using_parent_when_link_deleted(self, *mocks):
+        ProgramTreeRepository.get(self.tree_identity)
+
+        self.link_level_2.delete()
+
+        tree = ProgramTreeRepository.get(self.tree_identity)
+        self.assertEqual(tree.get_all_learning_unit_nodes(), [])
+
+    def test_should_invalidate_trees_using_learning_unit_when_component_saved(self, *mocks):
+        version = program_tree_cache.get_version(self.root_node.pk)
+
+        LecturingLearningComponentYearFactory(learning_unit_year=self.link_level_2.child_element.learning_unit_year)
+
+        self.assertNotEqual(program_tree_cache.get_version(self.root_node.pk), version)
+
+    def test_should_invalidate_trees_using_learning_unit_when_container_saved(self, *mocks):
+        version = program_tree_cache.get_version(self.root_node.pk)
+        learning_container_year = self.link_level_2.child_element.learning_unit_year.learning_container_year
+
+        learning_container_year.common_title = 'Common title'
+        learning_container_year.save()
+
+        self.assertNotEqual(program_tree_cache.get_version(self.root_node.pk), version)
+
+    @override_settings(PROGRAM_TREE_CACHE_ENABLED=False)
+    def test_should_not_use_cache_when_disabled(self, *mocks):
+        ProgramTreeRepository.get(self.tree_identity)
+        ProgramTreeRepository.get(self.tree_identity)
+
+        self.assertDictEqual(ProgramTreeCache.get_statistics(), {'hits': 0, 'misses': 0})
+
+
+@override_settings(PROGRAM_TREE_CACHE_ENABLED=True)
+class TestInvalidateTreesUsingElements(TestCase):
+    @mock.patch(
+        'program_management.ddd.repositories.program_tree_cache._search_root_ids_using_elements',
+        return_value=set()
+    )
+    def test_should_search_ancestors_once_when_transaction_is_committed(self, mock_search):
+        program_tree_cache.invalidate_trees_using_elements([1, 2])
+        program_tree_cache.invalidate_trees_using_elements([2, 3])
+        mock_search.assert_not_called()
+
+        for _, callback in transaction.get_connection().run_on_commit:
+            callback()
+
+        mock_search.assert_called_once_with({1, 2, 3})
@@ -76,6 +76,43 @@ class TestQuickSearchLearningUnitYearView(TestCase):
         response = self.client.get(self.url, data={'title': 'asgard', 'path': self.path})
         self.assertNotIn(self.luy_to_find, response.context['page_obj'])
 
+    def test_learning_unit_search_filter_should_ignore_accents(self):
+        luy_with_accents = LearningUnitYearFactory(
+            academic_year=self.luy_to_find.academic_year,
+            specific_title='Économie politique',
+        )
+
+        response = self.client.get(self.url, data={
+            'title': 'economie',
+            'path': self.path,
+            'academic_year': self.luy_to_find.academic_year.year
+        })
+
+        self.assertIn(luy_with_accents, response.context['page_obj'])
+
+    def test_learning_unit_search_should_order_by_relevance(self):
+        farther_luy = self._create_learning_unit_year_with_title('Dead or alive in the end')
+        closer_luy = self._create_learning_unit_year_with_title('Dead')
+
+        response = self.client.get(self.url, data={
+            'title': 'dead',
+            'relevance': 'true',
+            'path': self.path,
+            'academic_year': self.luy_to_find.academic_year.year
+        })
+
+        results = list(response.context['page_obj'])
+        self.assertLess(results.index(closer_luy), results.index(farther_luy))
+
+    def _create_learning_unit_year_with_title(self, title: str):
+        return LearningUnitYearFactory(
+            academic_year=self.luy_to_find.academic_year,
+            specific_title=title,
+            specific_title_english='',
+            learning_container_year__common_title='',
+            learning_container_year__common_title_english='',
+        )
+
     def test_return_json_when_accept_header_set_to_json(self):
         response = self.client.get(self.url, data={'title': 'dead', 'path': self.path}, HTTP_ACCEPT="application/json")
 
@@ -120,6 +157,20 @@ class TestQuickSearchGroupYearView(TestCase):
         response = self.client.get(self.url, data={'title': 'Yggdrasil', 'path': self.path})
         self.assertNotIn(self.group_to_find, response.context['page_obj'])
 
+    def test_education_group_search_filter_should_ignore_accents(self):
+        group_with_accents = GroupYearFactory(
+            academic_year=self.group_to_find.academic_year,
+            title_fr='Études européennes',
+        )
+
+        response = self.client.get(self.url, data={
+            'title': 'europeennes',
+            'path': self.path,
+            'academic_year': self.group_to_find.academic_year.year
+        })
+
+        self.assertIn(group_with_accents, response.context['page_obj'])
+
     def test_return_json_when_accept_header_set_to_json(self):
         response = self.client.get(self.url, data={'title': 'dead', 'path': self.path}, HTTP_ACCEPT="application/json")
 
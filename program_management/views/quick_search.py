@@ -29,6 +29,7 @@ from django_filters import FilterSet, filters, OrderingFilter
 from django_filters.views import FilterView
 
 from base.forms.learning_unit.search.quick_search import QuickLearningUnitYearFilter
+from base.forms.utils.filter_field import filter_field_by_regex, filter_field_by_search_title, order_by_similarity
 from base.models.academic_year import AcademicYear
 from base.models.learning_unit_year import LearningUnitYear
 from base.utils.cache import CacheFilterMixin
@@ -52,25 +53,31 @@ class QuickGroupYearFilter(FilterSet):
     )
     acronym = filters.CharFilter(
         field_name="acronym",
-        lookup_expr='icontains',
+        method=filter_field_by_regex,
         max_length=40,
         required=False,
         label=_('Acronym/Short title'),
     )
     partial_acronym = filters.CharFilter(
         field_name="partial_acronym",
-        lookup_expr='icontains',
+        method=filter_field_by_regex,
         max_length=40,
         required=False,
         label=_('Code'),
     )
     title = filters.CharFilter(
         field_name="title_fr",
-        lookup_expr='icontains',
+        method=filter_field_by_search_title,
         max_length=255,
         required=False,
         label=_('Title')
     )
+    relevance = filters.BooleanFilter(
+        method="order_by_relevance",
+        widget=forms.HiddenInput,
+        required=False,
+        label=_('Relevance'),
+    )
 
     ordering = OrderingFilter(
         fields=(
@@ -97,6 +104,18 @@ class QuickGroupYearFilter(FilterSet):
         if initial:
             self.form.fields["academic_year"].initial = initial["academic_year"]
 
+    def order_by_relevance(self, queryset, name, value):
+        if not value:
+            return queryset
+        return order_by_similarity(
+            queryset,
+            {
+                'acronym': self.form.cleaned_data['acronym'],
+                'partial_acronym': self.form.cleaned_data['partial_acronym'],
+                'search_title': self.form.cleaned_data['title'],
+            }
+        )
+
     def get_queryset(self):
         # Need this close so as to return empty query by default when form is unbound
         # 'changed_data' has been used instead of 'has_changed' here because the hidden field 'academic_year'
@@ -0,0 +1,2 @@
+# Do not remove because signal will not be registered
+default_app_config = 'webservices.apps.WebservicesConfig'
@@ -25,9 +25,13 @@
 ##############################################################################
 import functools
 
+from django.conf import settings
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework import generics
+from rest_framework.response import Response
 
 from base.business.education_groups import general_information_sections
 from education_group.ddd import command
@@ -38,6 +42,7 @@ from program_management.ddd.domain.program_tree import ProgramTreeIdentity
 from program_management.ddd.domain.program_tree_version import NOT_A_TRANSITION
 from program_management.ddd.repositories.program_tree import ProgramTreeRepository
 from program_management.models.education_group_version import EducationGroupVersion
+from webservices import publication
 from webservices.api.serializers.general_information import GeneralInformationSerializer
 
 
@@ -48,6 +53,25 @@ class GeneralInformation(generics.RetrieveAPIView):
     name = 'generalinformations_read'
     serializer_class = GeneralInformationSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        if not settings.GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED:
+            return super().retrieve(request, *args, **kwargs)
+
+        general_information = publication.get_publication(
+            self.kwargs['acronym'],
+            int(self.kwargs['year']),
+            self.kwargs['language']
+        )
+        response = Response(general_information.data)
+        response['ETag'] = general_information.etag
+        response['Last-Modified'] = http_date(general_information.last_modified.timestamp())
+        return get_conditional_response(
+            request,
+            etag=general_information.etag,
+            last_modified=int(general_information.last_modified.timestamp()),
+            response=response,
+        )
+
     def get_object(self):
         group = self.get_group()
         identity = ProgramTreeIdentity(code=group.code, year=group.year)
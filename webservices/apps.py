@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class WebservicesConfig(AppConfig):
     name = 'webservices'
+
+    def ready(self):
+        from webservices import signals  # noqa: F401
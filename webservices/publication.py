@@ -0,0 +1,209 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+import datetime
+import hashlib
+import json
+import uuid
+from typing import Iterable, Set, Tuple
+
+import attr
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+from base.utils.db import call_once_on_commit
+
+GENERATION_CACHE_KEY = 'general_information_generation_{year}'
+GLOBAL_GENERATION_CACHE_KEY = 'general_information_generation'
+PUBLICATION_CACHE_KEY = 'general_information_{generation}_{year}_{language}_{acronym}'
+PUBLICATION_LANGUAGES = [settings.LANGUAGE_CODE_FR[:2], settings.LANGUAGE_CODE_EN[:2]]
+
+PublicationKey = Tuple[int, str]  # (year, acronym)
+
+
+@attr.s(frozen=True, slots=True)
+class Publication:
+    data = attr.ib(type=dict)
+    etag = attr.ib(type=str)
+    last_modified = attr.ib(type=datetime.datetime)
+
+
+def get_publication(acronym: str, year: int, language: str) -> Publication:
+    """
+    Serialized general information of the offer, built and kept in the cache on the first call.
+    Raise Http404 when the offer is not published.
+    """
+    language = language.lower()
+    cache_key = _get_cache_key(acronym, year, language)
+    publication = cache.get(cache_key)
+    if publication is None:
+        publication = _build_publication(acronym, year, language)
+        cache.set(cache_key, publication, timeout=settings.GENERAL_INFORMATION_PUBLICATION_CACHE_TIMEOUT)
+    return publication
+
+
+def publish(acronym: str, year: int, language: str) -> None:
+    language = language.lower()
+    cache_key = _get_cache_key(acronym, year, language)
+    try:
+        publication = _build_publication(acronym, year, language, previous=cache.get(cache_key))
+    except Http404:
+        cache.delete(cache_key)
+        return
+    cache.set(cache_key, publication, timeout=settings.GENERAL_INFORMATION_PUBLICATION_CACHE_TIMEOUT)
+
+
+def invalidate_education_group_years(education_group_year_ids: Iterable[int]) -> None:
+    call_once_on_commit(_republish_education_group_years, education_group_year_ids)
+
+
+def invalidate_group_years(group_year_ids: Iterable[int]) -> None:
+    call_once_on_commit(_republish_group_years, group_year_ids)
+
+
+def invalidate_elements(element_ids: Iterable[int]) -> None:
+    call_once_on_commit(_republish_elements, element_ids)
+
+
+def invalidate_year(year: int) -> None:
+    """
+    Drop all the publications of the year: they are built again on their next request
+    """
+    transaction.on_commit(lambda: cache.set(GENERATION_CACHE_KEY.format(year=year), uuid.uuid4().hex, timeout=None))
+
+
+def invalidate_all() -> None:
+    """
+    Drop the publications of all the years: they are built again on their next request
+    """
+    transaction.on_commit(lambda: cache.set(GLOBAL_GENERATION_CACHE_KEY, uuid.uuid4().hex, timeout=None))
+
+
+def _republish_education_group_years(education_group_year_ids: Set[int]) -> None:
+    from base.models.education_group_year import EducationGroupYear
+    from program_management.ddd.domain.program_tree_version import NOT_A_TRANSITION
+    from program_management.models.education_group_version import EducationGroupVersion
+
+    publication_keys = set()
+    for acronym, partial_acronym, year in EducationGroupYear.objects.filter(
+            pk__in=education_group_year_ids
+    ).values_list('acronym', 'partial_acronym', 'academic_year__year'):
+        if acronym.startswith('common'):
+            # Common texts are part of all the publications of the year
+            invalidate_year(year)
+        else:
+            publication_keys |= {(year, acronym.upper()), (year, (partial_acronym or acronym).upper())}
+
+    group_year_ids = set(
+        EducationGroupVersion.standard.filter(
+            offer_id__in=education_group_year_ids,
+            transition_name=NOT_A_TRANSITION,
+        ).values_list('root_group_id', flat=True)
+    )
+    _republish(publication_keys | _get_publication_keys_of_group_years(group_year_ids))
+
+
+def _republish_group_years(group_year_ids: Set[int]) -> None:
+    _republish(_get_publication_keys_of_group_years(group_year_ids))
+
+
+def _republish_elements(element_ids: Set[int]) -> None:
+    from program_management.models.element import Element
+
+    group_year_ids = set(
+        Element.objects.filter(pk__in=element_ids, group_year__isnull=False).values_list('group_year_id', flat=True)
+    )
+    _republish(_get_publication_keys_of_group_years(group_year_ids))
+
+
+def _get_publication_keys_of_group_years(group_year_ids: Set[int]) -> Set[PublicationKey]:
+    """
+    The publication of a group and of the trainings which include its introduction (finalities, options and
+    common core).
+    """
+    from education_group.models.group_year import GroupYear
+    from program_management.ddd.repositories.find_roots import find_roots_for_element_ids
+    from program_management.models.element import Element
+
+    if not group_year_ids:
+        return set()
+    element_ids = list(Element.objects.filter(group_year_id__in=group_year_ids).values_list('pk', flat=True))
+    root_element_ids = {row['root_id'] for row in find_roots_for_element_ids(element_ids)} if element_ids else set()
+    group_year_ids = group_year_ids | set(
+        Element.objects.filter(pk__in=root_element_ids).values_list('group_year_id', flat=True)
+    )
+
+    publication_keys = set()
+    for partial_acronym, year, offer_acronym in GroupYear.objects.filter(pk__in=group_year_ids).values_list(
+            'partial_acronym', 'academic_year__year', 'educationgroupversion__offer__acronym'
+    ):
+        publication_keys.add((year, partial_acronym.upper()))
+        if offer_acronym:
+            publication_keys.add((year, offer_acronym.upper()))
+    return publication_keys
+
+
+def _republish(publication_keys: Set[PublicationKey]) -> None:
+    if not publication_keys:
+        return
+    from webservices.tasks import publish_general_information
+    transaction.on_commit(
+        lambda: publish_general_information.run.delay([list(key) for key in sorted(publication_keys)])
+    )
+
+
+def _build_publication(acronym: str, year: int, language: str, previous: Publication = None) -> Publication:
+    from webservices.api.views.general_information import GeneralInformation
+
+    view = GeneralInformation(
+        kwargs={'acronym': acronym, 'year': str(year), 'language': language},
+        request=None,
+        format_kwarg=None,
+    )
+    content = json.dumps(view.get_serializer(view.get_object()).data, cls=JSONEncoder)
+    etag = '"{}"'.format(hashlib.sha1(content.encode()).hexdigest())
+    if previous and previous.etag == etag:
+        return previous
+    return Publication(data=json.loads(content), etag=etag, last_modified=timezone.now().replace(microsecond=0))
+
+
+def _get_cache_key(acronym: str, year: int, language: str) -> str:
+    generation = '{}-{}'.format(
+        _get_generation(GLOBAL_GENERATION_CACHE_KEY),
+        _get_generation(GENERATION_CACHE_KEY.format(year=year))
+    )
+    return PUBLICATION_CACHE_KEY.format(generation=generation, year=year, language=language, acronym=acronym.upper())
+
+
+def _get_generation(generation_key: str) -> str:
+    generation = cache.get(generation_key)
+    if generation is None:
+        cache.add(generation_key, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(generation_key)
+    return generation
@@ -0,0 +1,101 @@
+##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2020 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+##############################################################################
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from base.models.admission_condition import AdmissionCondition, AdmissionConditionLine
+from base.models.education_group_achievement import EducationGroupAchievement
+from base.models.education_group_detailed_achievement import EducationGroupDetailedAchievement
+from base.models.education_group_publication_contact import EducationGroupPublicationContact
+from base.models.education_group_year import EducationGroupYear
+from base.models.group_element_year import GroupElementYear
+from cms.enums.entity_name import OFFER_YEAR, GROUP_YEAR
+from cms.models.translated_text import TranslatedText
+from cms.models.translated_text_label import TranslatedTextLabel
+from education_group.models.group_year import GroupYear
+from webservices import publication
+
+
+@receiver([post_save, post_delete], sender=TranslatedText)
+def republish_translated_text(sender, instance, **kwargs):
+    if not settings.GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED:
+        return
+    if instance.entity == OFFER_YEAR:
+        publication.invalidate_education_group_years([instance.reference])
+    elif instance.entity == GROUP_YEAR:
+        publication.invalidate_group_years([instance.reference])
+
+
+@receiver([post_save, post_delete], sender=EducationGroupAchievement)
+@receiver([post_save, post_delete], sender=EducationGroupPublicationContact)
+@receiver([post_save, post_delete], sender=AdmissionCondition)
+def republish_education_group_year_data(sender, instance, **kwargs):
+    if settings.GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED:
+        publication.invalidate_education_group_years([instance.education_group_year_id])
+
+
+@receiver([post_save, post_delete], sender=EducationGroupDetailedAchievement)
+def republish_detailed_achievement(sender, instance, **kwargs):
+    if settings.GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED:
+        publication.invalidate_education_group_years(
+            [instance.education_group_achievement.education_group_year_id]
+        )
+
+
+@receiver([post_save, post_delete], sender=AdmissionConditionLine)
+def republish_admission_condition_line(sender, instance, **kwargs):
+    if settings.GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED:
+        publication.invalidate_education_group_years([instance.admission_condition.education_group_year_id])
+
+
+@receiver([post_save, post_delete], sender=TranslatedTextLabel)
+def republish_translated_text_label(sender, instance, **kwargs):
+    if not settings.GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED:
+        return
+    if instance.text_label.entity in (OFFER_YEAR, GROUP_YEAR):
+        # Section titles are part of all the publications
+        publication.invalidate_all()
+
+
+@receiver(post_save, sender=EducationGroupYear)
+def republish_education_group_year(sender, instance, **kwargs):
+    if settings.GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED:
+        publication.invalidate_education_group_years([instance.pk])
+
+
+@receiver(post_save, sender=GroupYear)
+def republish_group_year(sender, instance, **kwargs):
+    if settings.GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED:
+        publication.invalidate_group_years([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=GroupElementYear)
+def republish_group_element_year(sender, instance, **kwargs):
+    if settings.GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED:
+        publication.invalidate_elements(
+            element_id for element_id in (instance.parent_element_id, instance.child_element_id) if element_id
+        )
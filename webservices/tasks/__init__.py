@@ -0,0 +1,2 @@
+# Import .py file which contains tasks to be executed
+from . import publish_general_information
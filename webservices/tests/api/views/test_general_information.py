@@ -26,6 +26,8 @@
 from unittest import mock
 
 from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -34,6 +36,7 @@ from base.business.education_groups.general_information_sections import DETAILED
     SKILLS_AND_ACHIEVEMENTS, COMMON_DIDACTIC_PURPOSES
 from base.models.enums.education_group_types import TrainingType
 from base.tests.factories.education_group_year import EducationGroupYearFactory, EducationGroupYearCommonFactory
+from base.tests.factories.group_element_year import GroupElementYearFactory
 from base.tests.factories.person import PersonFactory
 from cms.enums.entity_name import OFFER_YEAR
 from cms.tests.factories.translated_text import TranslatedTextFactory
@@ -45,6 +48,7 @@ from program_management.ddd import command
 from program_management.ddd.service.read import get_program_tree_service
 from program_management.tests.factories.education_group_version import StandardEducationGroupVersionFactory
 from program_management.tests.factories.element import ElementFactory
+from webservices import publication
 from webservices.api.serializers.general_information import GeneralInformationSerializer
 from webservices.business import EVALUATION_KEY, SKILLS_AND_ACHIEVEMENTS_INTRO, SKILLS_AND_ACHIEVEMENTS_EXTRA
 
@@ -60,7 +64,7 @@ class GeneralInformationTestCase(APITestCase):
             partial_acronym=cls.egy.partial_acronym,
             education_group_type__name=cls.egy.education_group_type.name
         )
-        element = ElementFactory(group_year=cls.group)
+        cls.element = element = ElementFactory(group_year=cls.group)
         StandardEducationGroupVersionFactory(offer=cls.egy, root_group=cls.group)
         tree = get_program_tree_service.get_program_tree_from_root_element_id(
             command.GetProgramTreeFromRootElementIdCommand(root_element_id=element.id)
@@ -180,3 +184,82 @@ class GeneralInformationTestCase(APITestCase):
             }
         )
         self.assertEqual(response.data, serializer.data)
+
+
+@override_settings(GENERAL_INFORMATION_PUBLICATION_CACHE_ENABLED=True)
+class GeneralInformationPublicationTestCase(GeneralInformationTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        on_commit_patcher = mock.patch(
+            "webservices.publication.transaction.on_commit",
+            side_effect=lambda func: func()
+        )
+        on_commit_patcher.start()
+        self.addCleanup(on_commit_patcher.stop)
+        call_once_on_commit_patcher = mock.patch(
+            "webservices.publication.call_once_on_commit",
+            side_effect=lambda func, items: func(set(items))
+        )
+        call_once_on_commit_patcher.start()
+        self.addCleanup(call_once_on_commit_patcher.stop)
+
+    def test_get_should_return_etag_and_last_modified(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'])
+        self.assertTrue(response['Last-Modified'])
+
+    def test_get_should_return_not_modified_when_etag_matches(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @mock.patch("webservices.tasks.publish_general_information.run.delay")
+    def test_should_republish_when_translated_text_changes(self, mock_delay):
+        TranslatedTextFactory(
+            reference=self.egy.id,
+            entity=OFFER_YEAR,
+            language=self.language,
+            text_label__entity=OFFER_YEAR
+        )
+
+        republished_keys = mock_delay.call_args[0][0]
+        self.assertIn([self.egy.academic_year.year, self.egy.acronym.upper()], republished_keys)
+
+    @mock.patch("webservices.tasks.publish_general_information.run.delay")
+    def test_should_republish_when_child_is_attached(self, mock_delay):
+        GroupElementYearFactory(
+            parent_element=self.element,
+            child_element__group_year__academic_year=self.egy.academic_year
+        )
+
+        republished_keys = mock_delay.call_args[0][0]
+        self.assertIn([self.egy.academic_year.year, self.egy.acronym.upper()], republished_keys)
+
+    def test_get_should_share_publication_whatever_the_case_of_the_language(self):
+        self.client.get(self.url)
+        url = reverse('generalinformations_read', kwargs={
+            'acronym': self.egy.acronym,
+            'year': self.egy.academic_year.year,
+            'language': self.language.upper()
+        })
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_should_drop_publications_when_section_title_changes(self):
+        self.client.get(self.url)
+
+        TranslatedTextLabelFactory(language=self.language, text_label__entity=OFFER_YEAR)
+
+        cached_publication = cache.get(
+            publication._get_cache_key(self.egy.acronym, self.egy.academic_year.year, self.language)
+        )
+        self.assertIsNone(cached_publication)